@@ -24,11 +24,14 @@
 // EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 //*****************************************************************************
 
+#include <algorithm>
 #include <cmath>
 #include <cstring>
 #include <iostream>
 #include <string>
 
+#include "../sdc/_hpat_common.h"
+
 #if _MSC_VER >= 1900
 #undef timezone
 #endif
@@ -58,20 +61,20 @@ extern "C"
 
     int64_t pq_read_string_single_file(std::shared_ptr<FileReader> arrow_reader,
                                        int64_t column_idx,
-                                       uint32_t** out_offsets,
+                                       offset_t** out_offsets,
                                        uint8_t** out_data,
                                        uint8_t** out_nulls,
-                                       std::vector<uint32_t>* offset_vec = NULL,
+                                       std::vector<offset_t>* offset_vec = NULL,
                                        std::vector<uint8_t>* data_vec = NULL,
                                        std::vector<bool>* null_vec = NULL);
     int pq_read_string_parallel_single_file(std::shared_ptr<FileReader> arrow_reader,
                                             int64_t column_idx,
-                                            uint32_t** out_offsets,
+                                            offset_t** out_offsets,
                                             uint8_t** out_data,
                                             uint8_t** out_nulls,
                                             int64_t start,
                                             int64_t count,
-                                            std::vector<uint32_t>* offset_vec = NULL,
+                                            std::vector<offset_t>* offset_vec = NULL,
                                             std::vector<uint8_t>* data_vec = NULL,
                                             std::vector<bool>* null_vec = NULL);
 
@@ -408,10 +411,10 @@ inline void copy_data(uint8_t* out_data,
 
 int64_t pq_read_string_single_file(std::shared_ptr<FileReader> arrow_reader,
                                    int64_t column_idx,
-                                   uint32_t** out_offsets,
+                                   offset_t** out_offsets,
                                    uint8_t** out_data,
                                    uint8_t** out_nulls,
-                                   std::vector<uint32_t>* offset_vec,
+                                   std::vector<offset_t>* offset_vec,
                                    std::vector<uint8_t>* data_vec,
                                    std::vector<bool>* null_vec)
 {
@@ -440,16 +443,18 @@ int64_t pq_read_string_single_file(std::shared_ptr<FileReader> arrow_reader,
     int64_t data_size = buffers[2]->size();
     // std::cout << "offsets: " << offsets_size << " chars: " << data_size << std::endl;
 
-    const uint32_t* offsets_buff = (const uint32_t*)buffers[1]->data();
+    // Arrow string arrays have 32-bit offsets, they are widened to 64-bit StringArray offsets
+    const int32_t* offsets_buff = (const int32_t*)buffers[1]->data();
     const uint8_t* data_buff = buffers[2]->data();
     const uint8_t* null_buff = arr->null_bitmap_data();
+    int64_t num_offsets = offsets_size / sizeof(int32_t);
 
     if (offset_vec == NULL)
     {
         if (data_vec != NULL)
             std::cerr << "parquet read string input error" << '\n';
 
-        *out_offsets = new uint32_t[offsets_size / sizeof(uint32_t)];
+        *out_offsets = new offset_t[num_offsets];
         *out_data = new uint8_t[data_size];
 
         // printf("null size %p %d\n", null_buff, null_size);
@@ -462,12 +467,12 @@ int64_t pq_read_string_single_file(std::shared_ptr<FileReader> arrow_reader,
         else
             *out_nulls = nullptr;
 
-        memcpy(*out_offsets, offsets_buff, offsets_size);
+        std::copy(offsets_buff, offsets_buff + num_offsets, *out_offsets);
         memcpy(*out_data, data_buff, data_size);
     }
     else
     {
-        offset_vec->insert(offset_vec->end(), offsets_buff, offsets_buff + offsets_size / sizeof(uint32_t));
+        offset_vec->insert(offset_vec->end(), offsets_buff, offsets_buff + num_offsets);
         data_vec->insert(data_vec->end(), data_buff, data_buff + data_size);
         append_bits_to_vec(null_vec, null_buff, null_size, 0, num_values);
     }
@@ -477,12 +482,12 @@ int64_t pq_read_string_single_file(std::shared_ptr<FileReader> arrow_reader,
 
 int pq_read_string_parallel_single_file(std::shared_ptr<FileReader> arrow_reader,
                                         int64_t column_idx,
-                                        uint32_t** out_offsets,
+                                        offset_t** out_offsets,
                                         uint8_t** out_data,
                                         uint8_t** out_nulls,
                                         int64_t start,
                                         int64_t count,
-                                        std::vector<uint32_t>* offset_vec,
+                                        std::vector<offset_t>* offset_vec,
                                         std::vector<uint8_t>* data_vec,
                                         std::vector<bool>* null_vec)
 {
@@ -502,7 +507,7 @@ int pq_read_string_parallel_single_file(std::shared_ptr<FileReader> arrow_reader
 
     if (offset_vec == NULL)
     {
-        *out_offsets = new uint32_t[count + 1];
+        *out_offsets = new offset_t[count + 1];
         data_vec = new std::vector<uint8_t>();
         null_vec = new std::vector<bool>();
     }
@@ -529,7 +534,7 @@ int pq_read_string_parallel_single_file(std::shared_ptr<FileReader> arrow_reader
 
     // printf("first row group: %d skipped_rows: %lld nrows_in_group: %lld\n", row_group_index, skipped_rows, nrows_in_group);
 
-    uint32_t curr_offset = 0;
+    offset_t curr_offset = 0;
 
     /* ------- read offsets and data ------ */
     while (read_rows < count)
@@ -554,7 +559,7 @@ int pq_read_string_parallel_single_file(std::shared_ptr<FileReader> arrow_reader
         }
 
         int64_t null_size = buffers[0]->size();
-        const uint32_t* offsets_buff = (const uint32_t*)buffers[1]->data();
+        const int32_t* offsets_buff = (const int32_t*)buffers[1]->data();
         const uint8_t* data_buff = buffers[2]->data();
         const uint8_t* null_buff = arr->null_bitmap_data();
 
@@ -566,7 +571,7 @@ int pq_read_string_parallel_single_file(std::shared_ptr<FileReader> arrow_reader
 
         for (int64_t i = 0; i < rows_to_read; i++)
         {
-            uint32_t str_size = offsets_buff[rows_to_skip + i + 1] - offsets_buff[rows_to_skip + i];
+            int64_t str_size = offsets_buff[rows_to_skip + i + 1] - offsets_buff[rows_to_skip + i];
             if (offset_vec == NULL)
                 (*out_offsets)[read_rows + i] = curr_offset;
             else
@@ -574,7 +579,7 @@ int pq_read_string_parallel_single_file(std::shared_ptr<FileReader> arrow_reader
             curr_offset += str_size;
         }
 
-        int data_size = offsets_buff[rows_to_skip + rows_to_read] - offsets_buff[rows_to_skip];
+        int64_t data_size = offsets_buff[rows_to_skip + rows_to_read] - offsets_buff[rows_to_skip];
 
         data_vec->insert(data_vec->end(),
                          data_buff + offsets_buff[rows_to_skip],
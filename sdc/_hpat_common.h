@@ -27,6 +27,8 @@
 #ifndef SDC_COMMON_H_
 #define SDC_COMMON_H_
 
+#include <stdint.h>
+
 #if defined(__GNUC__)
 #define __UNUSED__ __attribute__((unused))
 #else
@@ -50,4 +52,7 @@ struct SDC_CTypes
     };
 };
 
+// type of StringArray offsets, must match offset_typ in str_arr_type.py
+typedef uint64_t offset_t;
+
 #endif /* SDC_COMMON_H_ */
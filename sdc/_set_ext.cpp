@@ -30,12 +30,14 @@
 #include <string>
 #include <unordered_set>
 
+#include "_hpat_common.h"
+
 std::unordered_set<std::string>* init_set_string();
 void insert_set_string(std::unordered_set<std::string>* str_set, char* val);
 int64_t len_set_string(std::unordered_set<std::string>* str_set);
 bool set_in_string(char* val, std::unordered_set<std::string>* str_set);
 int64_t num_total_chars_set_string(std::unordered_set<std::string>* str_set);
-void populate_str_arr_from_set(std::unordered_set<std::string>* str_set, uint32_t* offsets, char* data);
+void populate_str_arr_from_set(std::unordered_set<std::string>* str_set, offset_t* offsets, char* data);
 void* set_iterator_string(std::unordered_set<std::string>* str_set);
 bool set_itervalid_string(std::unordered_set<std::string>::iterator* itp, std::unordered_set<std::string>* str_set);
 std::string* set_nextval_string(std::unordered_set<std::string>::iterator* itp);
@@ -99,13 +101,13 @@ int64_t num_total_chars_set_string(std::unordered_set<std::string>* str_set)
     return total_len;
 }
 
-void populate_str_arr_from_set(std::unordered_set<std::string>* str_set, uint32_t* offsets, char* data)
+void populate_str_arr_from_set(std::unordered_set<std::string>* str_set, offset_t* offsets, char* data)
 {
-    uint32_t curr_data_ind = 0;
-    uint32_t index = 0;
+    offset_t curr_data_ind = 0;
+    int64_t index = 0;
     for (auto it = str_set->cbegin(); it != str_set->cend(); ++it)
     {
-        uint32_t len = (*it).length();
+        size_t len = (*it).length();
         // std::cout << "start " << start << " len " << len << std::endl;
         memcpy(&data[curr_data_ind], (*it).c_str(), len);
         offsets[index] = curr_data_ind;
@@ -30,8 +30,13 @@
 #include <numpy/arrayobject.h>
 #include <string>
 #include <vector>
+#include <cfloat>
 #include <cmath>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
 
+#include "_hpat_common.h"
 #include "_str_decode.cpp"
 
 #include <regex>
@@ -47,7 +52,7 @@ extern "C"
     // XXX: equivalent to payload data model in str_arr_ext.py
     struct str_arr_payload
     {
-        uint32_t* offsets;
+        offset_t* offsets;
         char* data;
         uint8_t* null_bitmap;
     };
@@ -55,8 +60,8 @@ extern "C"
     // XXX: equivalent to payload data model in split_impl.py
     struct str_arr_split_view_payload
     {
-        uint32_t* index_offsets;
-        uint32_t* data_offsets;
+        offset_t* index_offsets;
+        offset_t* data_offsets;
         // uint8_t* null_bitmap;
     };
 
@@ -70,7 +75,7 @@ extern "C"
     void dtor_str_arr_split_view(str_arr_split_view_payload* in_str_arr, int64_t size, void* in);
     void str_arr_split_view_alloc(str_arr_split_view_payload* out_view, int64_t num_items, int64_t num_offsets);
     void str_arr_split_view_impl(
-        str_arr_split_view_payload* out_view, int64_t n_strs, uint32_t* offsets, char* data, char sep);
+        str_arr_split_view_payload* out_view, int64_t n_strs, offset_t* offsets, char* data, char sep);
     const char* get_c_str(std::string* s);
     const char* get_char_ptr(char c);
     void* str_concat(std::string* s1, std::string* s2);
@@ -84,34 +89,34 @@ extern "C"
     double str_to_float64(std::string* str);
     int64_t get_str_len(std::string* str);
     void string_array_from_sequence(
-        PyObject* obj, int64_t* no_strings, uint32_t** offset_table, char** buffer, uint8_t** null_bitmap);
+        PyObject* obj, int64_t* no_strings, offset_t** offset_table, char** buffer, uint8_t** null_bitmap);
     void* np_array_from_string_array(int64_t no_strings,
-                                     const uint32_t* offset_table,
+                                     const offset_t* offset_table,
                                      const char* buffer,
                                      const uint8_t* null_bitmap);
     void allocate_string_array(
-        uint32_t** offsets, char** data, uint8_t** null_bitmap, int64_t num_strings, int64_t total_size);
+        offset_t** offsets, char** data, uint8_t** null_bitmap, int64_t num_strings, int64_t total_size);
 
     void setitem_string_array(
-        uint32_t* offsets, char* data, int64_t n_bytes, char* str, int64_t len, int kind, int is_ascii, int64_t index);
+        offset_t* offsets, char* data, int64_t n_bytes, char* str, int64_t len, int kind, int is_ascii, int64_t index);
     int64_t get_utf8_size(char* str, int64_t len, int kind);
 
-    void set_string_array_range(uint32_t* out_offsets,
+    void set_string_array_range(offset_t* out_offsets,
                                 char* out_data,
-                                uint32_t* in_offsets,
+                                offset_t* in_offsets,
                                 char* in_data,
                                 int64_t start_str_ind,
                                 int64_t start_chars_ind,
                                 int64_t num_strs,
                                 int64_t num_chars);
-    void convert_len_arr_to_offset(uint32_t* offsets, int64_t num_strs);
-    char* getitem_string_array(uint32_t* offsets, char* data, int64_t index);
-    void* getitem_string_array_std(uint32_t* offsets, char* data, int64_t index);
+    void convert_len_arr_to_offset(offset_t* offsets, int64_t num_strs);
+    char* getitem_string_array(offset_t* offsets, char* data, int64_t index);
+    void* getitem_string_array_std(offset_t* offsets, char* data, int64_t index);
     void print_str(std::string* str);
     void print_char(char c);
     void print_int(int64_t val);
-    int str_arr_to_int64(int64_t* out, uint32_t* offsets, char* data, int64_t index);
-    int str_arr_to_float64(double* out, uint32_t* offsets, char* data, int64_t index);
+    int str_arr_to_int64(int64_t* out, offset_t* offsets, char* data, int64_t index);
+    int str_arr_to_float64(double* out, offset_t* offsets, char* data, int64_t index);
     void* compile_regex(std::string* pat);
     bool str_contains_regex(std::string* str, regex* e);
     bool str_contains_noregex(std::string* str, std::string* pat);
@@ -122,10 +127,12 @@ extern "C"
     void* str_from_int64(int64_t in);
     void* str_from_float32(float in);
     void* str_from_float64(double in);
+    int64_t str_format_float64(char* out, double in);
+    int64_t str_format_float32(char* out, float in);
     bool is_na(const uint8_t* bull_bitmap, int64_t ind);
     void del_str(std::string* in_str);
     int64_t hash_str(std::string* in_str);
-    void c_glob(uint32_t** offsets, char** data, uint8_t** null_bitmap, int64_t* num_strings, char* path);
+    void c_glob(offset_t** offsets, char** data, uint8_t** null_bitmap, int64_t* num_strings, char* path);
     npy_intp array_size(PyArrayObject* arr);
     void* array_getptr1(PyArrayObject* arr, npy_intp ind);
     void array_setitem(PyArrayObject* arr, char* p, PyObject* s);
@@ -192,6 +199,8 @@ extern "C"
         PyObject_SetAttrString(m, "str_from_int64", PyLong_FromVoidPtr((void*)(&str_from_int64)));
         PyObject_SetAttrString(m, "str_from_float32", PyLong_FromVoidPtr((void*)(&str_from_float32)));
         PyObject_SetAttrString(m, "str_from_float64", PyLong_FromVoidPtr((void*)(&str_from_float64)));
+        PyObject_SetAttrString(m, "str_format_float64", PyLong_FromVoidPtr((void*)(&str_format_float64)));
+        PyObject_SetAttrString(m, "str_format_float32", PyLong_FromVoidPtr((void*)(&str_format_float32)));
         PyObject_SetAttrString(m, "is_na", PyLong_FromVoidPtr((void*)(&is_na)));
         PyObject_SetAttrString(m, "del_str", PyLong_FromVoidPtr((void*)(&del_str)));
         PyObject_SetAttrString(m, "hash_str", PyLong_FromVoidPtr((void*)(&hash_str)));
@@ -263,8 +272,8 @@ extern "C"
 
     void str_arr_split_view_alloc(str_arr_split_view_payload* out_view, int64_t num_items, int64_t num_offsets)
     {
-        out_view->index_offsets = new uint32_t[num_items + 1];
-        out_view->data_offsets = new uint32_t[num_offsets];
+        out_view->index_offsets = new offset_t[num_items + 1];
+        out_view->data_offsets = new offset_t[num_offsets];
         return;
     }
 
@@ -273,19 +282,19 @@ extern "C"
     // data_offsets [-1, 2, 5,   4, 6, 10, 12,  11, 13,   12, 13,   12, 14, 16]
     // index_offsets [0, 3, 7, 9, 11, 14]
     void str_arr_split_view_impl(
-        str_arr_split_view_payload* out_view, int64_t n_strs, uint32_t* offsets, char* data, char sep)
+        str_arr_split_view_payload* out_view, int64_t n_strs, offset_t* offsets, char* data, char sep)
     {
-        uint32_t total_chars = offsets[n_strs];
+        offset_t total_chars = offsets[n_strs];
         // printf("n_strs %d sep %c total chars:%d\n", n_strs, sep, total_chars);
-        uint32_t* index_offsets = new uint32_t[n_strs + 1];
-        std::vector<uint32_t> data_offs;
+        offset_t* index_offsets = new offset_t[n_strs + 1];
+        std::vector<offset_t> data_offs;
 
         data_offs.push_back(-1);
         index_offsets[0] = 0;
         // uint32_t curr_data_off = 0;
 
-        int data_ind = offsets[0];
-        int str_ind = 0;
+        offset_t data_ind = offsets[0];
+        int64_t str_ind = 0;
         // while there are chars to consume, equal since the first if will consume it
         while (data_ind <= total_chars)
         {
@@ -310,7 +319,7 @@ extern "C"
             data_ind++;
         }
         out_view->index_offsets = index_offsets;
-        out_view->data_offsets = new uint32_t[data_offs.size()];
+        out_view->data_offsets = new offset_t[data_offs.size()];
         // TODO: avoid copy
         std::copy(data_offs.cbegin(), data_offs.cend(), out_view->data_offsets);
 
@@ -404,14 +413,14 @@ extern "C"
     }
 
     void allocate_string_array(
-        uint32_t** offsets, char** data, uint8_t** null_bitmap, int64_t num_strings, int64_t total_size)
+        offset_t** offsets, char** data, uint8_t** null_bitmap, int64_t num_strings, int64_t total_size)
     {
         // std::cout << "allocating string array: " << num_strings << " " <<
         //                                                 total_size << std::endl;
-        *offsets = new uint32_t[num_strings + 1];
+        *offsets = new offset_t[num_strings + 1];
         *data = new char[total_size];
         (*offsets)[0] = 0;
-        (*offsets)[num_strings] = (uint32_t)total_size; // in case total chars is read from here
+        (*offsets)[num_strings] = (offset_t)total_size; // in case total chars is read from here
         // allocate nulls
         int64_t n_bytes = (num_strings + sizeof(uint8_t) - 1) / sizeof(uint8_t);
         *null_bitmap = new uint8_t[n_bytes];
@@ -422,7 +431,7 @@ extern "C"
     }
 
     void setitem_string_array(
-        uint32_t* offsets, char* data, int64_t n_bytes, char* str, int64_t len, int kind, int is_ascii, int64_t index)
+        offset_t* offsets, char* data, int64_t n_bytes, char* str, int64_t len, int kind, int is_ascii, int64_t index)
     {
 #define CHECK(expr, msg)                                                                                               \
     if (!(expr))                                                                                                       \
@@ -435,7 +444,7 @@ extern "C"
         {
             offsets[index] = 0;
         }
-        uint32_t start = offsets[index];
+        offset_t start = offsets[index];
         int64_t utf8_len = -1;
         // std::cout << "start " << start << " len " << len << std::endl;
 
@@ -449,18 +458,18 @@ extern "C"
             utf8_len = unicode_to_utf8(&data[start], str, len, kind);
         }
 
-        CHECK(utf8_len < std::numeric_limits<uint32_t>::max(), "string array too large");
+        CHECK(utf8_len < std::numeric_limits<offset_t>::max(), "string array too large");
         CHECK(start + utf8_len <= n_bytes, "out of bounds string array setitem");
-        offsets[index + 1] = start + (uint32_t)utf8_len;
+        offsets[index + 1] = start + (offset_t)utf8_len;
         return;
 #undef CHECK
     }
 
     int64_t get_utf8_size(char* str, int64_t len, int kind) { return unicode_to_utf8(NULL, str, len, kind); }
 
-    void set_string_array_range(uint32_t* out_offsets,
+    void set_string_array_range(offset_t* out_offsets,
                                 char* out_data,
-                                uint32_t* in_offsets,
+                                offset_t* in_offsets,
                                 char* in_data,
                                 int64_t start_str_ind,
                                 int64_t start_chars_ind,
@@ -468,7 +477,7 @@ extern "C"
                                 int64_t num_chars)
     {
         // printf("%d %d\n", start_str_ind, start_chars_ind); fflush(stdout);
-        uint32_t curr_offset = 0;
+        offset_t curr_offset = 0;
         if (start_str_ind != 0)
         {
             curr_offset = out_offsets[start_str_ind];
@@ -478,7 +487,7 @@ extern "C"
         for (size_t i = 0; i < (size_t)num_strs; i++)
         {
             out_offsets[start_str_ind + i] = curr_offset;
-            int32_t len = in_offsets[i + 1] - in_offsets[i];
+            offset_t len = in_offsets[i + 1] - in_offsets[i];
             curr_offset += len;
         }
         out_offsets[start_str_ind + num_strs] = curr_offset;
@@ -487,24 +496,24 @@ extern "C"
         return;
     }
 
-    void convert_len_arr_to_offset(uint32_t* offsets, int64_t num_strs)
+    void convert_len_arr_to_offset(offset_t* offsets, int64_t num_strs)
     {
-        uint32_t curr_offset = 0;
+        offset_t curr_offset = 0;
         for (int64_t i = 0; i < num_strs; i++)
         {
-            uint32_t val = offsets[i];
+            offset_t val = offsets[i];
             offsets[i] = curr_offset;
             curr_offset += val;
         }
         offsets[num_strs] = curr_offset;
     }
 
-    char* getitem_string_array(uint32_t* offsets, char* data, int64_t index)
+    char* getitem_string_array(offset_t* offsets, char* data, int64_t index)
     {
         // printf("getitem string arr index: %d offsets: %d %d", index,
         //                                  offsets[index], offsets[index+1]);
-        uint32_t size = offsets[index + 1] - offsets[index] + 1;
-        uint32_t start = offsets[index];
+        offset_t size = offsets[index + 1] - offsets[index] + 1;
+        offset_t start = offsets[index];
         char* res = new char[size];
         res[size - 1] = '\0';
         memcpy(res, &data[start], size - 1);
@@ -512,19 +521,19 @@ extern "C"
         return res;
     }
 
-    void* getitem_string_array_std(uint32_t* offsets, char* data, int64_t index)
+    void* getitem_string_array_std(offset_t* offsets, char* data, int64_t index)
     {
         // printf("getitem string arr index: %d offsets: %d %d", index,
         //                                  offsets[index], offsets[index+1]);
-        uint32_t size = offsets[index + 1] - offsets[index];
-        uint32_t start = offsets[index];
+        offset_t size = offsets[index + 1] - offsets[index];
+        offset_t start = offsets[index];
         return new std::string(&data[start], size);
     }
 
-    int str_arr_to_int64(int64_t* out, uint32_t* offsets, char* data, int64_t index)
+    int str_arr_to_int64(int64_t* out, offset_t* offsets, char* data, int64_t index)
     {
-        uint32_t size = offsets[index + 1] - offsets[index];
-        uint32_t start = offsets[index];
+        offset_t size = offsets[index + 1] - offsets[index];
+        offset_t start = offsets[index];
         try
         {
             *out = stoll(std::string(data + start, (std::size_t)size));
@@ -538,10 +547,10 @@ extern "C"
         return -1;
     }
 
-    int str_arr_to_float64(double* out, uint32_t* offsets, char* data, int64_t index)
+    int str_arr_to_float64(double* out, offset_t* offsets, char* data, int64_t index)
     {
-        uint32_t size = offsets[index + 1] - offsets[index];
-        uint32_t start = offsets[index];
+        offset_t size = offsets[index + 1] - offsets[index];
+        offset_t start = offsets[index];
         try
         {
             *out = stod(std::string(data + start, (std::size_t)size));
@@ -616,6 +625,121 @@ extern "C"
 
     void* str_from_float64(double in) { return new std::string(std::to_string(in)); }
 
+    /// @brief writes the shortest representation of a value that reads back to the same double
+    ///        (or float if is_float32 is set), formatted as Python repr() does, e.g. 1.0, 0.1, 1e-05, 1e+16
+    /// @note out should have space for at least 24 characters, no terminating zero is written
+    /// @return number of written characters
+    static int64_t format_float_shortest(char* out, double in, bool is_float32)
+    {
+        char* pos = out;
+        if (std::isnan(in))
+        {
+            memcpy(pos, "nan", 3);
+            return 3;
+        }
+        if (std::signbit(in))
+        {
+            *pos++ = '-';
+            in = -in;
+        }
+        if (std::isinf(in))
+        {
+            memcpy(pos, "inf", 3);
+            return pos - out + 3;
+        }
+
+        // a normal value that reads back with 15 significant digits (6 for float) has the shortest representation
+        // among 15 digits with trailing zeros removed, otherwise up to 17 digits (9 for float) are needed,
+        // subnormal values have less precision so that all lengths are tried
+        int min_precision = is_float32 ? 6 : 15;
+        int max_precision = is_float32 ? 9 : 17;
+        if (in < (is_float32 ? FLT_MIN : DBL_MIN))
+        {
+            min_precision = 1;
+        }
+        char buf[32];
+        for (int precision = min_precision; precision <= max_precision; ++precision)
+        {
+            snprintf(buf, sizeof(buf), "%.*e", precision - 1, in);
+            bool reads_back = is_float32 ? strtof(buf, nullptr) == static_cast<float>(in) : strtod(buf, nullptr) == in;
+            if (precision == max_precision || reads_back)
+            {
+                break;
+            }
+        }
+
+        // buf is d.ddde[+-]xx
+        char digits[20];
+        int n_digits = 0;
+        char* p = buf;
+        for (; *p != 'e'; ++p)
+        {
+            if (*p != '.')
+            {
+                digits[n_digits++] = *p;
+            }
+        }
+        int exponent = atoi(p + 1);
+        while (n_digits > 1 && digits[n_digits - 1] == '0')
+        {
+            --n_digits;
+        }
+
+        if (exponent < -4 || exponent >= 16)
+        {
+            *pos++ = digits[0];
+            if (n_digits > 1)
+            {
+                *pos++ = '.';
+                memcpy(pos, digits + 1, n_digits - 1);
+                pos += n_digits - 1;
+            }
+            // exponent is written by hand as sprintf would write the terminating zero
+            int abs_exponent = std::abs(exponent);
+            *pos++ = 'e';
+            *pos++ = exponent < 0 ? '-' : '+';
+            if (abs_exponent >= 100)
+            {
+                *pos++ = '0' + abs_exponent / 100;
+            }
+            *pos++ = '0' + abs_exponent / 10 % 10;
+            *pos++ = '0' + abs_exponent % 10;
+            return pos - out;
+        }
+
+        if (exponent < 0)
+        {
+            *pos++ = '0';
+            *pos++ = '.';
+            memset(pos, '0', -exponent - 1);
+            pos += -exponent - 1;
+            memcpy(pos, digits, n_digits);
+            return pos - out + n_digits;
+        }
+
+        int n_int_digits = exponent + 1;
+        for (int i = 0; i < n_int_digits; ++i)
+        {
+            *pos++ = i < n_digits ? digits[i] : '0';
+        }
+        *pos++ = '.';
+        if (n_digits > n_int_digits)
+        {
+            memcpy(pos, digits + n_int_digits, n_digits - n_int_digits);
+            pos += n_digits - n_int_digits;
+        }
+        else
+        {
+            *pos++ = '0';
+        }
+
+        return pos - out;
+    }
+
+    int64_t str_format_float64(char* out, double in) { return format_float_shortest(out, in, false); }
+
+    int64_t str_format_float32(char* out, float in) { return format_float_shortest(out, in, true); }
+
     bool is_na(const uint8_t* null_bitmap, int64_t i)
     {
         // printf("%d\n", *null_bitmap);
@@ -630,7 +754,7 @@ extern "C"
     ///                          first no_strings entries denote offsets, last entry indicates size of output array
     /// @param[in]  obj Python Sequence object, intended to be a pandas series of string
     void string_array_from_sequence(
-        PyObject* obj, int64_t* no_strings, uint32_t** offset_table, char** buffer, uint8_t** null_bitmap)
+        PyObject* obj, int64_t* no_strings, offset_t** offset_table, char** buffer, uint8_t** null_bitmap)
     {
 #define CHECK(expr, msg)                                                                                               \
     if (!(expr))                                                                                                       \
@@ -644,7 +768,7 @@ extern "C"
         return;                                                                                                        \
     }
 
-        uint32_t* offsets = NULL;
+        offset_t* offsets = NULL;
 
         auto gilstate = PyGILState_Ensure();
 
@@ -668,7 +792,7 @@ extern "C"
             PyGILState_Release(gilstate);
             *no_strings = 0;
             *null_bitmap = new uint8_t[0];
-            *offset_table = new uint32_t[1];
+            *offset_table = new offset_t[1];
             (*offset_table)[0] = 0;
             *buffer = new char[0];
             return;
@@ -686,7 +810,7 @@ extern "C"
             obj = PyObject_GetAttrString(obj, "values");
         }
 
-        offsets = new uint32_t[n + 1];
+        offsets = new offset_t[n + 1];
         std::vector<const char*> tmp_store(n);
         size_t len = 0;
         for (Py_ssize_t i = 0; i < n; ++i)
@@ -738,7 +862,7 @@ extern "C"
     /// @param[in] offset_table offsets for strings in buffer
     /// @param[in] buffer with concatenated strings (from StringArray)
     void* np_array_from_string_array(int64_t no_strings,
-                                     const uint32_t* offset_table,
+                                     const offset_t* offset_table,
                                      const char* buffer,
                                      const uint8_t* null_bitmap)
     {
@@ -814,7 +938,7 @@ extern "C"
     }
 
     // glob support
-    void c_glob(uint32_t** offsets, char** data, uint8_t** null_bitmap, int64_t* num_strings, char* path)
+    void c_glob(offset_t** offsets, char** data, uint8_t** null_bitmap, int64_t* num_strings, char* path)
     {
         // std::cout << "glob: " << std::string(path) << std::endl;
         *num_strings = 0;
@@ -838,16 +962,16 @@ extern "C"
         // std::cout << "num glob: " << globBuf.gl_pathc << std::endl;
 
         *num_strings = globBuf.gl_pathc;
-        *offsets = new uint32_t[globBuf.gl_pathc + 1];
+        *offsets = new offset_t[globBuf.gl_pathc + 1];
         size_t total_size = 0;
 
         for (unsigned int i = 0; i < globBuf.gl_pathc; i++)
         {
-            (*offsets)[i] = (uint32_t)total_size;
+            (*offsets)[i] = (offset_t)total_size;
             size_t curr_size = strlen(globBuf.gl_pathv[i]);
             total_size += curr_size;
         }
-        (*offsets)[globBuf.gl_pathc] = (uint32_t)total_size;
+        (*offsets)[globBuf.gl_pathc] = (offset_t)total_size;
 
         *data = new char[total_size];
         for (unsigned int i = 0; i < globBuf.gl_pathc; i++)
@@ -0,0 +1,192 @@
+// *****************************************************************************
+// Copyright (c) 2020, Intel Corporation All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+//     Redistributions of source code must retain the above copyright notice,
+//     this list of conditions and the following disclaimer.
+//
+//     Redistributions in binary form must reproduce the above copyright notice,
+//     this list of conditions and the following disclaimer in the documentation
+//     and/or other materials provided with the distribution.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+// OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+// WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+// OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+// EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// *****************************************************************************
+
+#include <Python.h>
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+#include <mutex>
+#include <vector>
+
+namespace
+{
+    struct method_stats
+    {
+        uint64_t calls;
+        uint64_t time_ns;
+        uint64_t allocs;
+        uint64_t alloc_bytes;
+    };
+
+    std::mutex stats_mutex;
+    std::vector<method_stats> stats;
+
+    std::atomic<uint64_t> alloc_count(0);
+    std::atomic<uint64_t> alloc_bytes(0);
+
+    // original NRT allocation functions wrapped by counting ones below
+    typedef void* (*alloc_safe_t)(size_t);
+    typedef void* (*alloc_safe_aligned_t)(size_t, unsigned);
+    typedef void* (*alloc_dtor_safe_t)(size_t, void*);
+
+    alloc_safe_t nrt_alloc_safe = nullptr;
+    alloc_safe_aligned_t nrt_alloc_safe_aligned = nullptr;
+    alloc_dtor_safe_t nrt_alloc_dtor_safe = nullptr;
+    alloc_safe_t nrt_new_varsize = nullptr;
+    alloc_dtor_safe_t nrt_new_varsize_dtor = nullptr;
+
+    inline void count_alloc(size_t size)
+    {
+        alloc_count.fetch_add(1, std::memory_order_relaxed);
+        alloc_bytes.fetch_add(size, std::memory_order_relaxed);
+    }
+}
+
+extern "C"
+{
+    uint64_t trace_now()
+    {
+        auto now = std::chrono::steady_clock::now().time_since_epoch();
+        return std::chrono::duration_cast<std::chrono::nanoseconds>(now).count();
+    }
+
+    uint64_t trace_alloc_count() { return alloc_count.load(std::memory_order_relaxed); }
+
+    uint64_t trace_alloc_bytes() { return alloc_bytes.load(std::memory_order_relaxed); }
+
+    void trace_record(uint64_t method_id, uint64_t time_ns, uint64_t allocs, uint64_t bytes)
+    {
+        std::lock_guard<std::mutex> lock(stats_mutex);
+        if (method_id >= stats.size())
+        {
+            stats.resize(method_id + 1, method_stats{0, 0, 0, 0});
+        }
+
+        method_stats& entry = stats[method_id];
+        entry.calls += 1;
+        entry.time_ns += time_ns;
+        entry.allocs += allocs;
+        entry.alloc_bytes += bytes;
+    }
+
+    // copies stats of the method_id into out array of 4 elements, returns false for unknown method
+    bool trace_get_stats(uint64_t method_id, uint64_t* out)
+    {
+        std::lock_guard<std::mutex> lock(stats_mutex);
+        if (method_id >= stats.size() || stats[method_id].calls == 0)
+        {
+            return false;
+        }
+
+        const method_stats& entry = stats[method_id];
+        out[0] = entry.calls;
+        out[1] = entry.time_ns;
+        out[2] = entry.allocs;
+        out[3] = entry.alloc_bytes;
+        return true;
+    }
+
+    void trace_reset()
+    {
+        std::lock_guard<std::mutex> lock(stats_mutex);
+        stats.clear();
+    }
+
+    void trace_set_nrt_allocators(void* alloc_safe, void* alloc_safe_aligned, void* alloc_dtor_safe,
+                                  void* new_varsize, void* new_varsize_dtor)
+    {
+        nrt_alloc_safe = reinterpret_cast<alloc_safe_t>(alloc_safe);
+        nrt_alloc_safe_aligned = reinterpret_cast<alloc_safe_aligned_t>(alloc_safe_aligned);
+        nrt_alloc_dtor_safe = reinterpret_cast<alloc_dtor_safe_t>(alloc_dtor_safe);
+        nrt_new_varsize = reinterpret_cast<alloc_safe_t>(new_varsize);
+        nrt_new_varsize_dtor = reinterpret_cast<alloc_dtor_safe_t>(new_varsize_dtor);
+    }
+
+    void* trace_MemInfo_alloc_safe(size_t size)
+    {
+        count_alloc(size);
+        return nrt_alloc_safe(size);
+    }
+
+    void* trace_MemInfo_alloc_safe_aligned(size_t size, unsigned align)
+    {
+        count_alloc(size);
+        return nrt_alloc_safe_aligned(size, align);
+    }
+
+    void* trace_MemInfo_alloc_dtor_safe(size_t size, void* dtor)
+    {
+        count_alloc(size);
+        return nrt_alloc_dtor_safe(size, dtor);
+    }
+
+    void* trace_MemInfo_new_varsize(size_t size)
+    {
+        count_alloc(size);
+        return nrt_new_varsize(size);
+    }
+
+    void* trace_MemInfo_new_varsize_dtor(size_t size, void* dtor)
+    {
+        count_alloc(size);
+        return nrt_new_varsize_dtor(size, dtor);
+    }
+}
+
+PyMODINIT_FUNC PyInit_htrace_ext(void)
+{
+    PyObject* m;
+    static struct PyModuleDef moduledef = {
+        PyModuleDef_HEAD_INIT,
+        "htrace_ext",
+        "No docs",
+        -1,
+        NULL,
+    };
+
+    m = PyModule_Create(&moduledef);
+    if (m == NULL)
+    {
+        return NULL;
+    }
+
+#define REGISTER(func) PyObject_SetAttrString(m, #func, PyLong_FromVoidPtr((void*)(&func)));
+    REGISTER(trace_now)
+    REGISTER(trace_alloc_count)
+    REGISTER(trace_alloc_bytes)
+    REGISTER(trace_record)
+    REGISTER(trace_get_stats)
+    REGISTER(trace_reset)
+    REGISTER(trace_set_nrt_allocators)
+    REGISTER(trace_MemInfo_alloc_safe)
+    REGISTER(trace_MemInfo_alloc_safe_aligned)
+    REGISTER(trace_MemInfo_alloc_dtor_safe)
+    REGISTER(trace_MemInfo_new_varsize)
+    REGISTER(trace_MemInfo_new_varsize_dtor)
+#undef REGISTER
+
+    return m;
+}
@@ -27,22 +27,17 @@
 
 from llvmlite import binding
 import sdc
-import sdc.hiframes
-import sdc.hiframes.hiframes_untyped
-import sdc.hiframes.hiframes_typed
-from sdc.hiframes.hiframes_untyped import HiFramesPass
-from sdc.hiframes.hiframes_typed import HiFramesTypedPass
-from sdc.hiframes.dataframe_pass import DataFramePass
 import numba
 import numba.core.compiler
 from numba.core.compiler import DefaultPassBuilder
-from numba import ir_utils, ir, postproc
+from numba.core import ir_utils, ir, postproc
 from numba.core.registry import CPUDispatcher
-from numba.core.ir_utils import guard, get_definition
+from numba.core.ir_utils import guard, get_definition, mk_unique_var
 from numba.core.inline_closurecall import inline_closure_call
-from numba.typed_passes import (NopythonTypeInference, AnnotateTypes, ParforPass, IRLegalization)
-from numba.untyped_passes import (DeadBranchPrune, InlineInlinables, InlineClosureLikes)
+from numba.core.typed_passes import (NopythonTypeInference, AnnotateTypes, ParforPass, IRLegalization)
+from numba.core.untyped_passes import (DeadBranchPrune, InlineInlinables, InlineClosureLikes)
 from sdc import config
+from sdc import distributed_api
 from sdc.distributed import DistributedPass
 
 from numba.core.compiler_machinery import FunctionPass, register_pass
@@ -143,25 +138,85 @@ class PostprocessorPass(FunctionPass):
         return True
 
 
+@register_pass(mutates_CFG=True, analysis_only=False)
+class DistributedReturnPass(FunctionPass):
+    """Wraps returned variables which names are listed as distributed or threaded
+    into dist_return() and threaded_return() calls, so that the distributed pass keeps them parallel
+    """
+    _name = "sdc_extention_distributed_return_pass"
+
+    def __init__(self):
+        pass
+
+    def run_pass(self, state):
+        return_funcs = {name: distributed_api.threaded_return for name in state.metadata['threaded']}
+        return_funcs.update({name: distributed_api.dist_return for name in state.metadata['distributed']})
+
+        changed = False
+        for block in state.func_ir.blocks.values():
+            ret = block.terminator
+            if not isinstance(ret, ir.Return):
+                continue
+
+            # return statement is preceded by $ret = cast(value=var)
+            for stmt in block.body:
+                if not (isinstance(stmt, ir.Assign) and stmt.target.name == ret.value.name
+                        and isinstance(stmt.value, ir.Expr) and stmt.value.op == 'cast'):
+                    continue
+
+                value = stmt.value.value
+                # versioned names like A.1 are given to redefined variables
+                func = return_funcs.get(value.name.split('.')[0])
+                if func is None:
+                    break
+
+                scope, loc = block.scope, stmt.loc
+                func_var = ir.Var(scope, mk_unique_var('$dist_return_func'), loc)
+                res_var = ir.Var(scope, mk_unique_var('$dist_return'), loc)
+                call = ir.Expr.call(func_var, [value], (), loc)
+                nodes = [ir.Assign(ir.Global(func.__name__, func, loc), func_var, loc),
+                         ir.Assign(call, res_var, loc)]
+                index = block.body.index(stmt)
+                block.body[index:index] = nodes
+                stmt.value.value = res_var
+                state.func_ir._definitions[res_var.name] = [call]
+                changed = True
+                break
+
+        return changed
+
+
 class SDCPipeline(numba.core.compiler.CompilerBase):
-    """SDC compiler pipeline
+    """SDC compiler pipeline running the distributed pass after Numba parfor pass,
+    arguments and returned variables listed in distributed and threaded class attributes
+    are treated as parts of data split among processes and threads
     """
 
+    distributed = frozenset()
+    threaded = frozenset()
+
     def define_pipelines(self):
         name = 'sdc_extention_pipeline_distributed'
-        pm = DefaultPassBuilder.define_nopython_pipeline(self.state)
+        self.state.metadata['distributed'] = set(self.distributed)
+        self.state.metadata['threaded'] = set(self.threaded)
 
-        add_pass_before(pm, InlinePass, InlineClosureLikes)
-        pm.add_pass_after(HiFramesPass, InlinePass)
-        pm.add_pass_after(DataFramePass, AnnotateTypes)
-        pm.add_pass_after(PostprocessorPass, AnnotateTypes)
-        pm.add_pass_after(HiFramesTypedPass, DataFramePass)
+        pm = DefaultPassBuilder.define_nopython_pipeline(self.state, name)
+
+        add_pass_before(pm, DistributedReturnPass, NopythonTypeInference)
         pm.add_pass_after(DistributedPass, ParforPass)
         pm.finalize()
 
         return [pm]
 
 
+def get_distributed_pipeline(distributed=(), threaded=()):
+    """Returns SDCPipeline subclass treating listed variables as distributed or threaded"""
+    distributed = (distributed, ) if isinstance(distributed, str) else distributed
+    threaded = (threaded, ) if isinstance(threaded, str) else threaded
+    attrs = {'distributed': frozenset(distributed), 'threaded': frozenset(threaded)}
+    return type('SDCPipelineDistributed', (SDCPipeline, ), attrs)
+
+
 @register_pass(mutates_CFG=True, analysis_only=False)
 class ParforSeqPass(FunctionPass):
     _name = "sdc_extention_parfor_seq_pass"
@@ -176,19 +231,14 @@ class ParforSeqPass(FunctionPass):
         return True
 
 
-class SDCPipelineSeq(SDCPipeline):
+class SDCPipelineSeq(numba.core.compiler.CompilerBase):
     """SDC pipeline without the distributed pass (used in rolling kernels)
     """
 
     def define_pipelines(self):
         name = 'sdc_extention_pipeline_seq'
-        pm = DefaultPassBuilder.define_nopython_pipeline(self.state)
+        pm = DefaultPassBuilder.define_nopython_pipeline(self.state, name)
 
-        add_pass_before(pm, InlinePass, InlineClosureLikes)
-        pm.add_pass_after(HiFramesPass, InlinePass)
-        pm.add_pass_after(DataFramePass, AnnotateTypes)
-        pm.add_pass_after(PostprocessorPass, AnnotateTypes)
-        pm.add_pass_after(HiFramesTypedPass, DataFramePass)
         add_pass_before(pm, ParforSeqPass, IRLegalization)
         pm.finalize()
 
@@ -56,6 +56,12 @@ Current value for transport controlled by decorator need to initialize this here
 because decorator called later then modules have been initialized
 '''
 
+config_transport_shm = strtobool(os.getenv('SDC_TRANSPORT_SHM', 'False'))
+'''
+Default value used to select whether distributed functions communicate through shared memory
+with other processes started by sdc.launch instead of using single process transport
+'''
+
 config_use_parallel_overloads = strtobool(os.getenv('SDC_AUTO_PARALLEL', 'True'))
 '''
 Default value used to select whether auto parallel would be applied to sdc functions
@@ -70,3 +76,23 @@ test_expected_failure = strtobool(os.getenv('SDC_TEST_EXPECTED_FAILURE', 'False'
 '''
 If True then replaces skip decorators to expectedFailure decorator.
 '''
+
+config_compile_cache = strtobool(os.getenv('SDC_COMPILE_CACHE', 'False'))
+'''
+Default value used to select whether compiled sdc functions would be cached on disk
+'''
+
+config_compile_cache_dir = os.getenv('SDC_COMPILE_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'sdc'))
+'''
+Directory where compiled sdc functions and generated sources are cached
+'''
+
+config_compile_cache_size = int(os.getenv('SDC_COMPILE_CACHE_SIZE', str(1024 ** 3)))
+'''
+Maximum size of the compilation cache in bytes, least recently used entries are evicted above it
+'''
+
+config_trace_overloads = strtobool(os.getenv('SDC_TRACE_OVERLOADS', 'False'))
+'''
+Default value used to select whether calls of sdc overload methods would be timed and their allocations counted
+'''
@@ -37,23 +37,16 @@ from pandas.core.indexing import IndexingError
 import numba
 from numba.misc import quicksort
 from numba import types
-from numba.core.errors import TypingError
-from numba.extending import register_jitable
-from numba.np import numpy_support
 from numba.typed import Dict
 
 import sdc
-from sdc.hiframes.api import isna
-from sdc.hiframes.pd_series_type import SeriesType
 from sdc.functions import numpy_like
 from sdc.str_arr_type import string_array_type, StringArrayType
 from sdc.datatypes.range_index_type import RangeIndexType
 from sdc.datatypes.int64_index_type import Int64IndexType
-from sdc.str_arr_ext import (num_total_chars, append_string_array_to,
-                             str_arr_is_na, pre_alloc_string_array, str_arr_set_na, string_array_type,
-                             cp_str_list_to_array, create_str_arr_from_list, get_utf8_size,
-                             str_arr_set_na_by_mask)
-from sdc.utilities.prange_utils import parallel_chunks
+from sdc.functions.str_arr_kernels import str_arr_concat, str_arr_from_list, str_arr_take
+from sdc.functions.join import join_indexers, take_join_keys
+from sdc.extensions.indexes.index_engine import index_engine_get_indexer
 from sdc.utilities.utils import sdc_overload, sdc_register_jitable
 from sdc.utilities.sdc_typing_utils import (
                             find_common_dtype_from_numpy_dtypes,
@@ -111,31 +104,12 @@ def hpat_arrays_append_overload(A, B):
     elif A == string_array_type:
         if B == string_array_type:
             def _append_single_string_array_impl(A, B):
-                total_size = len(A) + len(B)
-                total_chars = num_total_chars(A) + num_total_chars(B)
-                new_data = sdc.str_arr_ext.pre_alloc_string_array(total_size, total_chars)
-
-                pos = 0
-                pos += append_string_array_to(new_data, pos, A)
-                pos += append_string_array_to(new_data, pos, B)
-
-                return new_data
+                return str_arr_concat((A, B))
 
             return _append_single_string_array_impl
         elif (isinstance(B, (types.UniTuple, types.List)) and B.dtype == string_array_type):
             def _append_list_string_array_impl(A, B):
-                array_list = [A] + list(B)
-                total_size = numpy.array([len(arr) for arr in array_list]).sum()
-                total_chars = numpy.array([num_total_chars(arr) for arr in array_list]).sum()
-
-                new_data = sdc.str_arr_ext.pre_alloc_string_array(total_size, total_chars)
-
-                pos = 0
-                pos += append_string_array_to(new_data, pos, A)
-                for arr in B:
-                    pos += append_string_array_to(new_data, pos, arr)
-
-                return new_data
+                return str_arr_concat([A] + list(B))
 
             return _append_list_string_array_impl
 
@@ -160,67 +134,26 @@ def fill_str_array(data, size, push_back=True):
 
     string_array_size = len(data)
     nan_array_size = size - string_array_size
-    num_chars = sdc.str_arr_ext.num_total_chars(data)
+    start = 0 if push_back else nan_array_size
 
-    result_data = sdc.str_arr_ext.pre_alloc_string_array(size, num_chars)
+    # NaN values of initial array are kept and new elements are NaNs
+    positions = numpy.full(size, -1, dtype=numpy.int64)
+    for i in numba.prange(string_array_size):
+        positions[start + i] = i
 
-    # Keep NaN values of initial array
-    arr_is_na_mask = numpy.array([sdc.hiframes.api.isna(data, i) for i in range(string_array_size)])
-    data_str_list = sdc.str_arr_ext.to_string_list(data)
-    nan_list = [''] * nan_array_size
-
-    result_list = data_str_list + nan_list if push_back else nan_list + data_str_list
-    cp_str_list_to_array(result_data, result_list)
-
-    # Batch=64 iteration to avoid threads competition
-    batch_size = 64
-    if push_back:
-        for i in numba.prange(size//batch_size + 1):
-            for j in range(i*batch_size, min((i+1)*batch_size, size)):
-                if j < string_array_size:
-                    if arr_is_na_mask[j]:
-                        str_arr_set_na(result_data, j)
-                else:
-                    str_arr_set_na(result_data, j)
-
-    else:
-        for i in numba.prange(size//batch_size + 1):
-            for j in range(i*batch_size, min((i+1)*batch_size, size)):
-                if j < nan_array_size:
-                    str_arr_set_na(result_data, j)
-                else:
-                    str_arr_j = j - nan_array_size
-                    if arr_is_na_mask[str_arr_j]:
-                        str_arr_set_na(result_data, j)
-
-    return result_data
-
-
-@numba.njit
-def _hpat_ensure_array_capacity(new_size, arr):
-    """ Function ensuring that the size of numpy array is at least as specified
-        Returns newly allocated array of bigger size with copied elements if existing size is less than requested
-    """
-
-    k = len(arr)
-    if k >= new_size:
-        return arr
-
-    n = k
-    while n < new_size:
-        n = 2 * n
-    res = numpy.empty(n, arr.dtype)
-    res[:k] = arr[:k]
-    return res
+    return str_arr_take(data, positions)
 
 
 def sdc_join_series_indexes(left, right):
     pass
 
 
-@sdc_overload(sdc_join_series_indexes, jit_options={'parallel': False})
+@sdc_overload(sdc_join_series_indexes)
 def sdc_join_series_indexes_overload(left, right):
-    """Function for joining arrays left and right in a way similar to pandas.join 'outer' algorithm"""
+    """
+    Function for joining arrays left and right in a way similar to pandas.join 'outer' algorithm,
+    arrays are joined with a parallel hash join (see :func:`sdc.functions.join.join_indexers`)
+    """
 
     # check that both operands are of types used for representing Pandas indexes
     if not (isinstance(left, sdc_pandas_index_types) and isinstance(right, sdc_pandas_index_types)
@@ -254,226 +187,32 @@ def sdc_join_series_indexes_overload(left, right):
           and not (isinstance(left, types.Array) and isinstance(right, types.Array))):
         return _convert_to_arrays_impl
 
-    # TODO: remove code duplication below and merge numeric and StringArray impls into one
-    # needs equivalents of numpy.arsort and _hpat_ensure_array_capacity for StringArrays
     elif isinstance(left, types.Array) and isinstance(right, types.Array):
 
         numba_common_dtype = find_common_dtype_from_numpy_dtypes([left.dtype, right.dtype], [])
-        if isinstance(numba_common_dtype, types.Number):
-
-            def sdc_join_series_indexes_impl(left, right):
-
-                # allocate result arrays
-                lsize = len(left)
-                rsize = len(right)
-                est_total_size = int(1.1 * (lsize + rsize))
-
-                lidx = numpy.empty(est_total_size, numpy.int64)
-                ridx = numpy.empty(est_total_size, numpy.int64)
-                joined = numpy.empty(est_total_size, numba_common_dtype)
-
-                left_nan = []
-                right_nan = []
-                for i in range(lsize):
-                    if numpy.isnan(left[i]):
-                        left_nan.append(i)
-                for i in range(rsize):
-                    if numpy.isnan(right[i]):
-                        right_nan.append(i)
-
-                # sort arrays saving the old positions
-                sorted_left = numpy_like.argsort(left, kind='mergesort')
-                sorted_right = numpy_like.argsort(right, kind='mergesort')
-                # put the position of the nans in an increasing sequence
-                sorted_left[lsize-len(left_nan):] = left_nan
-                sorted_right[rsize-len(right_nan):] = right_nan
-
-                i, j, k = 0, 0, 0
-                while (i < lsize and j < rsize):
-                    joined = _hpat_ensure_array_capacity(k + 1, joined)
-                    lidx = _hpat_ensure_array_capacity(k + 1, lidx)
-                    ridx = _hpat_ensure_array_capacity(k + 1, ridx)
-
-                    left_index = left[sorted_left[i]]
-                    right_index = right[sorted_right[j]]
-
-                    if (left_index < right_index) or numpy.isnan(right_index):
-                        joined[k] = left_index
-                        lidx[k] = sorted_left[i]
-                        ridx[k] = -1
-                        i += 1
-                        k += 1
-                    elif (left_index > right_index) or numpy.isnan(left_index):
-                        joined[k] = right_index
-                        lidx[k] = -1
-                        ridx[k] = sorted_right[j]
-                        j += 1
-                        k += 1
-                    else:
-                        # find ends of sequences of equal index values in left and right
-                        ni, nj = i, j
-                        while (ni < lsize and left[sorted_left[ni]] == left_index):
-                            ni += 1
-                        while (nj < rsize and right[sorted_right[nj]] == right_index):
-                            nj += 1
-
-                        # join the blocks found into results
-                        for s in numpy.arange(i, ni, 1):
-                            block_size = nj - j
-                            to_joined = numpy.repeat(left_index, block_size)
-                            to_lidx = numpy.repeat(sorted_left[s], block_size)
-                            to_ridx = numpy.array([sorted_right[k] for k in numpy.arange(j, nj, 1)], numpy.int64)
-
-                            joined = _hpat_ensure_array_capacity(k + block_size, joined)
-                            lidx = _hpat_ensure_array_capacity(k + block_size, lidx)
-                            ridx = _hpat_ensure_array_capacity(k + block_size, ridx)
-
-                            joined[k:k + block_size] = to_joined
-                            lidx[k:k + block_size] = to_lidx
-                            ridx[k:k + block_size] = to_ridx
-                            k += block_size
-                        i = ni
-                        j = nj
-
-                # fill the end of joined with remaining part of left or right
-                if i < lsize:
-                    block_size = lsize - i
-                    joined = _hpat_ensure_array_capacity(k + block_size, joined)
-                    lidx = _hpat_ensure_array_capacity(k + block_size, lidx)
-                    ridx = _hpat_ensure_array_capacity(k + block_size, ridx)
-                    ridx[k: k + block_size] = numpy.repeat(-1, block_size)
-                    while i < lsize:
-                        joined[k] = left[sorted_left[i]]
-                        lidx[k] = sorted_left[i]
-                        i += 1
-                        k += 1
-
-                elif j < rsize:
-                    block_size = rsize - j
-                    joined = _hpat_ensure_array_capacity(k + block_size, joined)
-                    lidx = _hpat_ensure_array_capacity(k + block_size, lidx)
-                    ridx = _hpat_ensure_array_capacity(k + block_size, ridx)
-                    lidx[k: k + block_size] = numpy.repeat(-1, block_size)
-                    while j < rsize:
-                        joined[k] = right[sorted_right[j]]
-                        ridx[k] = sorted_right[j]
-                        j += 1
-                        k += 1
-
-                return joined[:k], lidx[:k], ridx[:k]
-
-            return sdc_join_series_indexes_impl
-
-        else:
+        if not isinstance(numba_common_dtype, types.Number):
             return None
 
-    elif (left == string_array_type and right == string_array_type):
+        convert_left_dtype = left.dtype != numba_common_dtype
+        convert_right_dtype = right.dtype != numba_common_dtype
 
         def sdc_join_series_indexes_impl(left, right):
+            _left = numpy_like.astype(left, numba_common_dtype) if convert_left_dtype == True else left  # noqa
+            _right = numpy_like.astype(right, numba_common_dtype) if convert_right_dtype == True else right  # noqa
 
-            # allocate result arrays
-            lsize = len(left)
-            rsize = len(right)
-            est_total_size = int(1.1 * (lsize + rsize))
-
-            lidx = numpy.empty(est_total_size, numpy.int64)
-            ridx = numpy.empty(est_total_size, numpy.int64)
-
-            # use Series.sort_values since argsort for StringArrays not implemented
-            original_left_series = pandas.Series(left)
-            original_right_series = pandas.Series(right)
-
-            # sort arrays saving the old positions
-            left_series = original_left_series.sort_values(kind='mergesort')
-            right_series = original_right_series.sort_values(kind='mergesort')
-            sorted_left = left_series._index
-            sorted_right = right_series._index
-
-            i, j, k = 0, 0, 0
-            while (i < lsize and j < rsize):
-                lidx = _hpat_ensure_array_capacity(k + 1, lidx)
-                ridx = _hpat_ensure_array_capacity(k + 1, ridx)
-
-                left_index = left[sorted_left[i]]
-                right_index = right[sorted_right[j]]
-
-                if (left_index < right_index):
-                    lidx[k] = sorted_left[i]
-                    ridx[k] = -1
-                    i += 1
-                    k += 1
-                elif (left_index > right_index):
-                    lidx[k] = -1
-                    ridx[k] = sorted_right[j]
-                    j += 1
-                    k += 1
-                else:
-                    # find ends of sequences of equal index values in left and right
-                    ni, nj = i, j
-                    while (ni < lsize and left[sorted_left[ni]] == left_index):
-                        ni += 1
-                    while (nj < rsize and right[sorted_right[nj]] == right_index):
-                        nj += 1
-
-                    # join the blocks found into results
-                    for s in numpy.arange(i, ni, 1):
-                        block_size = nj - j
-                        to_lidx = numpy.repeat(sorted_left[s], block_size)
-                        to_ridx = numpy.array([sorted_right[k] for k in numpy.arange(j, nj, 1)], numpy.int64)
-
-                        lidx = _hpat_ensure_array_capacity(k + block_size, lidx)
-                        ridx = _hpat_ensure_array_capacity(k + block_size, ridx)
-
-                        lidx[k:k + block_size] = to_lidx
-                        ridx[k:k + block_size] = to_ridx
-                        k += block_size
-                    i = ni
-                    j = nj
-
-            # fill the end of joined with remaining part of left or right
-            if i < lsize:
-                block_size = lsize - i
-                lidx = _hpat_ensure_array_capacity(k + block_size, lidx)
-                ridx = _hpat_ensure_array_capacity(k + block_size, ridx)
-                ridx[k: k + block_size] = numpy.repeat(-1, block_size)
-                while i < lsize:
-                    lidx[k] = sorted_left[i]
-                    i += 1
-                    k += 1
-
-            elif j < rsize:
-                block_size = rsize - j
-                lidx = _hpat_ensure_array_capacity(k + block_size, lidx)
-                ridx = _hpat_ensure_array_capacity(k + block_size, ridx)
-                lidx[k: k + block_size] = numpy.repeat(-1, block_size)
-                while j < rsize:
-                    ridx[k] = sorted_right[j]
-                    j += 1
-                    k += 1
-
-            # count total number of characters and allocate joined array
-            total_joined_size = k
-            num_chars_in_joined = 0
-            for i in numpy.arange(total_joined_size):
-                if lidx[i] != -1:
-                    num_chars_in_joined += len(left[lidx[i]])
-                elif ridx[i] != -1:
-                    num_chars_in_joined += len(right[ridx[i]])
-
-            joined = pre_alloc_string_array(total_joined_size, num_chars_in_joined)
-
-            # iterate over joined and fill it with indexes using lidx and ridx indexers
-            for i in numpy.arange(total_joined_size):
-                if lidx[i] != -1:
-                    joined[i] = left[lidx[i]]
-                    if (str_arr_is_na(left, lidx[i])):
-                        str_arr_set_na(joined, i)
-                elif ridx[i] != -1:
-                    joined[i] = right[ridx[i]]
-                    if (str_arr_is_na(right, ridx[i])):
-                        str_arr_set_na(joined, i)
-                else:
-                    str_arr_set_na(joined, i)
+            # outer join with sorted result is how pandas aligns indexes, NaNs are placed at the end
+            lidx, ridx = join_indexers((_left, ), (_right, ), 'outer', True)
+            joined = take_join_keys(_left, _right, lidx, ridx)
+
+            return joined, lidx, ridx
+
+        return sdc_join_series_indexes_impl
+
+    elif (left == string_array_type and right == string_array_type):
+
+        def sdc_join_series_indexes_impl(left, right):
+            lidx, ridx = join_indexers((left, ), (right, ), 'outer', True)
+            joined = take_join_keys(left, right, lidx, ridx)
 
             return joined, lidx, ridx
 
@@ -596,7 +335,7 @@ def _sdc_asarray_overload(data):
 
     if isinstance(data.dtype, types.UnicodeType):
         def _sdc_asarray_impl(data):
-            return create_str_arr_from_list(data)
+            return str_arr_from_list(data)
 
         return _sdc_asarray_impl
 
@@ -654,34 +393,17 @@ def _sdc_take_overload(data, indexes):
 
     elif isinstance(indexes.dtype, types.ListType) and data == string_array_type:
         def _sdc_take_list_str_impl(data, indexes):
-            res_size = 0
-            for i in numba.prange(len(indexes)):
-                res_size += len(indexes[i])
-            nan_mask = numpy.zeros(res_size, dtype=numpy.bool_)
-            num_total_bytes = 0
+            starts = numpy.zeros(len(indexes) + 1, dtype=numpy.int64)
             for i in numba.prange(len(indexes)):
-                start = 0
-                for l in range(len(indexes[0:i])):
-                    start += len(indexes[l])
-                current_pos = start
-                for j in range(len(indexes[i])):
-                    num_total_bytes += get_utf8_size(data[indexes[i][j]])
-                    if isna(data, indexes[i][j]):
-                        nan_mask[current_pos] = True
-                    current_pos += 1
-            res_arr = pre_alloc_string_array(res_size, num_total_bytes)
+                starts[i + 1] = len(indexes[i])
+            starts = numpy.cumsum(starts)
+
+            positions = numpy.empty(starts[-1], dtype=numpy.int64)
             for i in numba.prange(len(indexes)):
-                start = 0
-                for l in range(len(indexes[0:i])):
-                    start += len(indexes[l])
-                current_pos = start
                 for j in range(len(indexes[i])):
-                    res_arr[current_pos] = data[indexes[i][j]]
-                    if nan_mask[current_pos]:
-                        str_arr_set_na(res_arr, current_pos)
-                    current_pos += 1
+                    positions[starts[i] + j] = indexes[i][j]
 
-            return res_arr
+            return str_arr_take(data, positions)
 
         return _sdc_take_list_str_impl
 
@@ -699,21 +421,7 @@ def _sdc_take_overload(data, indexes):
 
     elif isinstance(data, StringArrayType):
         def _sdc_take_str_arr_impl(data, indexes):
-            res_size = len(indexes)
-            nan_mask = numpy.zeros(res_size, dtype=numpy.bool_)
-            num_total_bytes = 0
-            for i in numba.prange(res_size):
-                num_total_bytes += get_utf8_size(data[indexes[i]])
-                if isna(data, indexes[i]):
-                    nan_mask[i] = True
-
-            res_arr = pre_alloc_string_array(res_size, num_total_bytes)
-            for i in numpy.arange(res_size):
-                res_arr[i] = data[indexes[i]]
-                if nan_mask[i]:
-                    str_arr_set_na(res_arr, i)
-
-            return res_arr
+            return str_arr_take(data, indexes)
 
         return _sdc_take_str_arr_impl
 
@@ -751,6 +459,9 @@ def sdc_reindex_series_overload(arr, index, name, by_index):
     int64_indexes = isinstance(index, Int64IndexType) and isinstance(by_index, Int64IndexType)
     data_dtype, index_dtype = arr.dtype, index.dtype
     data_is_str_arr = isinstance(arr.dtype, types.UnicodeType)
+    use_index_engine = (isinstance(index, Int64IndexType)
+                        and isinstance(by_index, (types.Array, RangeIndexType, Int64IndexType))
+                        and isinstance(by_index.dtype, types.Integer))
 
     def sdc_reindex_series_impl(arr, index, name, by_index):
 
@@ -764,32 +475,34 @@ def sdc_reindex_series_overload(arr, index, name, by_index):
         if (index is by_index or equal_indexes):
             return pandas.Series(data=arr, index=by_index, name=name)
 
-        if data_is_str_arr == True:  # noqa
-            _res_data = [''] * len(by_index)
-            res_data_nan_mask = numpy.zeros(len(by_index), dtype=types.bool_)
-        else:
+        if data_is_str_arr == False:  # noqa
             _res_data = numpy.empty(len(by_index), dtype=data_dtype)
 
-        # build a dict of self.index values to their positions:
-        map_index_to_position = Dict.empty(
-            key_type=index_dtype,
-            value_type=types.int32
-        )
+        if use_index_engine == True:  # noqa
+            indexer = index_engine_get_indexer(index, by_index)
+        else:
+            # build a dict of self.index values to their positions:
+            map_index_to_position = Dict.empty(
+                key_type=index_dtype,
+                value_type=types.int64
+            )
+
+            for i, value in enumerate(index):
+                if value in map_index_to_position:
+                    raise ValueError("cannot reindex from a duplicate axis")
+                else:
+                    map_index_to_position[value] = i
 
-        for i, value in enumerate(index):
-            if value in map_index_to_position:
-                raise ValueError("cannot reindex from a duplicate axis")
-            else:
-                map_index_to_position[value] = i
+            indexer = numpy.empty(len(by_index), dtype=numpy.int64)
+            for i in numba.prange(len(by_index)):
+                indexer[i] = map_index_to_position.get(by_index[i], -1)
 
         index_mismatch = 0
         for i in numba.prange(len(by_index)):
-            val = by_index[i]
-            if val in map_index_to_position:
-                pos_in_self = map_index_to_position[val]
-                _res_data[i] = arr[pos_in_self]
-                if data_is_str_arr == True:  # noqa
-                    res_data_nan_mask[i] = isna(arr, i)
+            pos_in_self = indexer[i]
+            if pos_in_self >= 0:
+                if data_is_str_arr == False:  # noqa
+                    _res_data[i] = arr[pos_in_self]
             else:
                 index_mismatch += 1
         if index_mismatch:
@@ -798,8 +511,7 @@ def sdc_reindex_series_overload(arr, index, name, by_index):
             raise IndexingError(msg)
 
         if data_is_str_arr == True:  # noqa
-            res_data = create_str_arr_from_list(_res_data)
-            str_arr_set_na_by_mask(res_data, res_data_nan_mask)
+            res_data = str_arr_take(arr, indexer)
         else:
             res_data = _res_data
 
@@ -48,7 +48,7 @@ from sdc.hiframes.pd_series_type import SeriesType
 from sdc.utilities.sdc_typing_utils import (TypeChecker, check_index_is_numeric,
                                             check_types_comparable, kwsparams2list,
                                             gen_impl_generator, find_common_dtype_from_numpy_dtypes)
-from sdc.str_arr_ext import StringArrayType
+from sdc.str_arr_ext import StringArrayType, get_offsets_array, get_chars_array, get_null_bitmap_array
 from sdc.datatypes.range_index_type import RangeIndexType
 from sdc.datatypes.int64_index_type import Int64IndexType
 
@@ -59,16 +59,24 @@ from sdc.hiframes.pd_series_type import SeriesType
 from sdc.datatypes.hpat_pandas_dataframe_getitem_types import (DataFrameGetitemAccessorType,
                                                                dataframe_getitem_accessor_init)
 from sdc.datatypes.common_functions import SDCLimitation
-from sdc.datatypes.hpat_pandas_dataframe_rolling_types import _hpat_pandas_df_rolling_init
+from sdc.datatypes.hpat_pandas_dataframe_rolling_types import (
+    _hpat_pandas_df_rolling_init, _hpat_pandas_df_time_rolling_init)
 from sdc.datatypes.hpat_pandas_rolling_types import (
     gen_sdc_pandas_rolling_overload_body, sdc_pandas_rolling_docstring_tmpl)
-from sdc.datatypes.hpat_pandas_groupby_functions import init_dataframe_groupby, merge_groupby_dicts_inplace
+from sdc.datatypes.hpat_pandas_groupby_functions import init_dataframe_groupby
+from sdc.functions.groupby import factorize_keys
+from sdc.functions.join import join_indexers, take_join_keys, take_with_na
+from sdc.extensions.indexes.index_engine import index_engine_get_locs
 from sdc.hiframes.pd_dataframe_ext import get_dataframe_data
 from sdc.utilities.utils import sdc_overload, sdc_overload_method, sdc_overload_attribute
+from sdc.utilities.compile_cache import exec_func_text
 from sdc.hiframes.api import isna
-from sdc.functions.numpy_like import getitem_by_mask, find_idx
+from sdc.functions.numpy_like import getitem_by_mask, selection_by_mask, take_by_selection
 from sdc.datatypes.common_functions import _sdc_take, sdc_reindex_series
 from sdc.utilities.prange_utils import parallel_chunks
+from sdc.io.parquet_pio import pyarrow_write_parquet
+from sdc.io.csv_write import (gen_index_field, gen_to_csv_func_text, get_to_csv_params, is_csv_writable_type,
+                              to_csv_signature)
 
 
 @sdc_overload_attribute(DataFrameType, 'index')
@@ -258,11 +266,9 @@ def hpat_pandas_dataframe_values(self):
     numba_common_dtype = find_common_dtype_from_numpy_dtypes([column.dtype for column in self.data], [])
 
     def hpat_pandas_df_values_impl(self, numba_common_dtype):
-        loc_vars = {}
         func_text, global_vars = sdc_pandas_dataframe_values_codegen(self, numba_common_dtype)
 
-        exec(func_text, global_vars, loc_vars)
-        _values_impl = loc_vars['sdc_pandas_dataframe_values_impl']
+        _values_impl = exec_func_text(func_text, global_vars, 'sdc_pandas_dataframe_values_impl')
         return _values_impl
 
     return hpat_pandas_df_values_impl(self, numba_common_dtype)
@@ -432,11 +438,9 @@ def sdc_pandas_dataframe_append(df, other, ignore_index=False, verify_integrity=
     args = {'ignore_index': False, 'verify_integrity': False, 'sort': None}
 
     def sdc_pandas_dataframe_append_impl(df, other, _func_name, ignore_index, indexes_comparable, args):
-        loc_vars = {}
         func_def, global_vars = sdc_pandas_dataframe_append_codegen(df, other, _func_name, ignore_index,
                                                                     indexes_comparable, args)
-        exec(func_def, global_vars, loc_vars)
-        _append_impl = loc_vars['sdc_pandas_dataframe_append_impl']
+        _append_impl = exec_func_text(func_def, global_vars, 'sdc_pandas_dataframe_append_impl')
         return _append_impl
 
     return sdc_pandas_dataframe_append_impl(df, other, _func_name, ignore_index, indexes_comparable, args)
@@ -488,9 +492,7 @@ def sdc_pandas_dataframe_reduce_columns(df, func_name, params, ser_params):
 
     func_text, global_vars = _dataframe_reduce_columns_codegen(func_name, all_params, s_par, df.columns,
                                                                df.column_loc)
-    loc_vars = {}
-    exec(func_text, global_vars, loc_vars)
-    _reduce_impl = loc_vars[df_func_name]
+    _reduce_impl = exec_func_text(func_text, global_vars, df_func_name)
 
     return _reduce_impl
 
@@ -535,9 +537,7 @@ def sdc_pandas_dataframe_head_codegen(df, func_name, params, ser_params):
 
     df_func_name = f'_df_{func_name}_impl'
     func_text, global_vars = _dataframe_reduce_columns_codegen_head(func_name, all_params, s_par, df)
-    loc_vars = {}
-    exec(func_text, global_vars, loc_vars)
-    _reduce_impl = loc_vars[df_func_name]
+    _reduce_impl = exec_func_text(func_text, global_vars, df_func_name)
 
     return _reduce_impl
 
@@ -626,9 +626,7 @@ def _dataframe_codegen_copy(func_params, series_params, df):
 
 def sdc_pandas_dataframe_copy_codegen(df, params, series_params):
     func_text, global_vars = _dataframe_codegen_copy(params, series_params, df)
-    loc_vars = {}
-    exec(func_text, global_vars, loc_vars)
-    _reduce_impl = loc_vars['_df_copy_impl']
+    _reduce_impl = exec_func_text(func_text, global_vars, '_df_copy_impl')
 
     return _reduce_impl
 
@@ -712,9 +710,7 @@ def sdc_pandas_dataframe_apply_columns(df, func_name, params, ser_params):
 
     func_text, global_vars = _dataframe_apply_columns_codegen(func_name, all_params, s_par,
                                                               df.columns, df.column_loc)
-    loc_vars = {}
-    exec(func_text, global_vars, loc_vars)
-    _apply_impl = loc_vars[df_func_name]
+    _apply_impl = exec_func_text(func_text, global_vars, df_func_name)
 
     return _apply_impl
 
@@ -837,7 +833,8 @@ def mean_overload(df, axis=None, skipna=None, level=None, numeric_only=None):
 
 
 sdc_pandas_dataframe_rolling = sdc_overload_method(DataFrameType, 'rolling')(
-    gen_sdc_pandas_rolling_overload_body(_hpat_pandas_df_rolling_init, DataFrameType))
+    gen_sdc_pandas_rolling_overload_body(_hpat_pandas_df_rolling_init, DataFrameType,
+                                         time_initializer=_hpat_pandas_df_time_rolling_init))
 sdc_pandas_dataframe_rolling.__doc__ = sdc_pandas_rolling_docstring_tmpl.format(
     ty='DataFrame', ty_lower='dataframe')
 
@@ -1288,9 +1285,7 @@ def _dataframe_codegen_isna(func_name, columns, df):
 def sdc_pandas_dataframe_isna_codegen(df, func_name):
     df_func_name = f'_df_{func_name}_impl'
     func_text, global_vars = _dataframe_codegen_isna(func_name, df.columns, df)
-    loc_vars = {}
-    exec(func_text, global_vars, loc_vars)
-    _reduce_impl = loc_vars[df_func_name]
+    _reduce_impl = exec_func_text(func_text, global_vars, df_func_name)
 
     return _reduce_impl
 
@@ -1528,9 +1523,7 @@ def sdc_pandas_dataframe_drop(df, labels=None, axis=0, index=None, columns=None,
 
         func_name = 'sdc_pandas_dataframe_drop_impl'
         func_def, global_vars = sdc_pandas_dataframe_drop_codegen(func_name, func_args, df, drop_cols)
-        loc_vars = {}
-        exec(func_def, global_vars, loc_vars)
-        _drop_impl = loc_vars[func_name]
+        _drop_impl = exec_func_text(func_def, global_vars, func_name)
         return _drop_impl
 
     return sdc_pandas_dataframe_drop_impl(df, args, columns)
@@ -1603,6 +1596,56 @@ def df_getitem_tuple_idx_main_codelines(self, literal_idx):
     return func_lines
 
 
+def df_getitem_by_selection_codelines(self, positions):
+    """
+    Generate code lines creating DF from rows of self at given positions,
+    numeric columns and index are gathered in a single parallel loop
+    """
+    gather_lines = []
+    if isinstance(self.index, types.NoneType):
+        func_lines = [f'  res_index = {positions}']
+    elif isinstance(self.index, RangeIndexType):
+        func_lines = [f'  index_start, index_step = self._index.start, self._index.step',
+                      f'  res_index = numpy.empty(len({positions}), dtype=numpy.int64)']
+        gather_lines.append(f'    res_index[i] = index_start + pos * index_step')
+    elif isinstance(self.index, (Int64IndexType, types.Array)):
+        index_data = 'self._index._data' if isinstance(self.index, Int64IndexType) else 'self._index'
+        func_lines = [f'  index_data = {index_data}',
+                      f'  res_index = numpy.empty(len({positions}), dtype=index_data.dtype)']
+        gather_lines.append(f'    res_index[i] = index_data[pos]')
+    elif isinstance(self.index, StringArrayType):
+        func_lines = [f'  res_index = take_by_selection(self._index, {positions})']
+    else:
+        func_lines = [f'  res_index = sdc_take(self._index, {positions})']
+
+    results = []
+    for i, col in enumerate(self.columns):
+        col_loc = self.column_loc[col]
+        type_id, col_id = col_loc.type_id, col_loc.col_id
+        res_data = f'res_data_{i}'
+        func_lines.append(f'  data_{i} = self._data[{type_id}][{col_id}]')
+        if isinstance(self.data[type_id], types.Array):
+            func_lines.append(f'  {res_data} = numpy.empty(len({positions}), dtype=data_{i}.dtype)')
+            gather_lines.append(f'    {res_data}[i] = data_{i}[pos]')
+        elif isinstance(self.data[type_id], StringArrayType):
+            func_lines.append(f'  {res_data} = take_by_selection(data_{i}, {positions})')
+        else:
+            func_lines.append(f'  {res_data} = sdc_take(data_{i}, {positions})')
+        results.append((col, res_data))
+
+    if gather_lines:
+        func_lines += [f'  for i in prange(len({positions})):',
+                       f'    pos = {positions}[i]']
+        func_lines += gather_lines
+
+    data = ', '.join(f'"{col}": {data}' for col, data in results)
+    func_lines += [
+        f'  return pandas.DataFrame({{{data}}}, index=res_index)'
+    ]
+
+    return func_lines
+
+
 def df_getitem_bool_series_idx_main_codelines(self, idx):
     """Generate main code lines for df.getitem"""
     length_expr = df_length_expr(self)
@@ -1610,52 +1653,21 @@ def df_getitem_bool_series_idx_main_codelines(self, idx):
     # optimization for default indexes in df and idx when index alignment is trivial
     if (isinstance(self.index, types.NoneType) and isinstance(idx.index, types.NoneType)):
         func_lines = [f'  length = {length_expr}',
-                      f'  self_index = self.index',
                       f'  if length > len(idx):',
                       f'    msg = "Unalignable boolean Series provided as indexer " + \\',
                       f'          "(index of the boolean Series and of the indexed object do not match)."',
                       f'    raise IndexingError(msg)',
-                      f'  # do not trim idx._data to length as getitem_by_mask handles such case',
-                      f'  res_index = getitem_by_mask(self_index, idx._data)',
-                      f'  # df index is default, same as positions so it can be used in take']
-        results = []
-        for i, col in enumerate(self.columns):
-            col_loc = self.column_loc[col]
-            type_id, col_id = col_loc.type_id, col_loc.col_id
-            res_data = f'res_data_{i}'
-            func_lines += [
-                f'  data_{i} = self._data[{type_id}][{col_id}]',
-                f'  {res_data} = sdc_take(data_{i}, res_index)'
-            ]
-            results.append((col, res_data))
-
-        data = ', '.join(f'"{col}": {data}' for col, data in results)
-        func_lines += [
-            f'  return pandas.DataFrame({{{data}}}, index=res_index)'
-        ]
+                      f'  # do not trim idx._data to length as selection_by_mask handles such case',
+                      f'  selected_pos = selection_by_mask(idx._data, length)']
     else:
         func_lines = [
             f'  length = {length_expr}',
             f'  self_index = self.index',
             f'  reindexed_idx = sdc_reindex_series(idx._data, idx.index, idx._name, self_index)',
-            f'  res_index = getitem_by_mask(self_index, reindexed_idx._data)',
-            f'  selected_pos = getitem_by_mask(numpy.arange(length), reindexed_idx._data)'
+            f'  selected_pos = selection_by_mask(reindexed_idx._data, length)'
         ]
-        results = []
-        for i, col in enumerate(self.columns):
-            col_loc = self.column_loc[col]
-            type_id, col_id = col_loc.type_id, col_loc.col_id
-            res_data = f'res_data_{i}'
-            func_lines += [
-                f'  data_{i} = self._data[{type_id}][{col_id}]',
-                f'  {res_data} = sdc_take(data_{i}, selected_pos)'
-            ]
-            results.append((col, res_data))
 
-        data = ', '.join(f'"{col}": {data}' for col, data in results)
-        func_lines += [
-            f'  return pandas.DataFrame({{{data}}}, index=res_index)'
-        ]
+    func_lines += df_getitem_by_selection_codelines(self, 'selected_pos')
 
     return func_lines
 
@@ -1666,24 +1678,8 @@ def df_getitem_bool_array_idx_main_codelines(self, idx):
     func_lines = [f'  length = {df_length_expr(self)}',
                   f'  if length != len(idx):',
                   f'    raise ValueError("Item wrong length.")',
-                  f'  self_index = self.index',
-                  f'  taken_pos = getitem_by_mask(self_index, idx)',
-                  f'  res_index = sdc_take(self_index, taken_pos)']
-    results = []
-    for i, col in enumerate(self.columns):
-        col_loc = self.column_loc[col]
-        type_id, col_id = col_loc.type_id, col_loc.col_id
-        res_data = f'res_data_{i}'
-        func_lines += [
-            f'  data_{i} = self._data[{type_id}][{col_id}]',
-            f'  {res_data} = sdc_take(data_{i}, taken_pos)'
-        ]
-        results.append((col, res_data))
-
-    data = ', '.join(f'"{col}": {data}' for col, data in results)
-    func_lines += [
-        f'  return pandas.DataFrame({{{data}}}, index=res_index)'
-    ]
+                  f'  selected_pos = selection_by_mask(idx, length)']
+    func_lines += df_getitem_by_selection_codelines(self, 'selected_pos')
 
     return func_lines
 
@@ -1759,28 +1755,31 @@ def df_getitem_tuple_idx_codegen(self, idx):
 
 def df_getitem_bool_series_idx_codegen(self, idx):
     """
-    Example of generated implementation with provided index:
+    Example of generated implementation with default indexes:
         def _df_getitem_bool_series_idx_impl(self, idx):
           length = len(self._data[0][0])
-          self_index = range(len(self._data[0][0]))
           if length > len(idx):
             msg = "Unalignable boolean Series provided as indexer " + \
                   "(index of the boolean Series and of the indexed object do not match)."
             raise IndexingError(msg)
-          # do not trim idx._data to length as getitem_by_mask handles such case
-          res_index = getitem_by_mask(self_index, idx._data)
-          # df index is default, same as positions so it can be used in take
+          # do not trim idx._data to length as selection_by_mask handles such case
+          selected_pos = selection_by_mask(idx._data, length)
+          res_index = selected_pos
           data_0 = self._data[0][0]
-          res_data_0 = sdc_take(data_0, res_index)
+          res_data_0 = numpy.empty(len(selected_pos), dtype=data_0.dtype)
           data_1 = self._data[1][0]
-          res_data_1 = sdc_take(data_1, res_index)
+          res_data_1 = take_by_selection(data_1, selected_pos)
+          for i in prange(len(selected_pos)):
+            pos = selected_pos[i]
+            res_data_0[i] = data_0[pos]
           return pandas.DataFrame({"A": res_data_0, "B": res_data_1}, index=res_index)
     """
     func_lines = ['def _df_getitem_bool_series_idx_impl(self, idx):']
     func_lines += df_getitem_bool_series_idx_main_codelines(self, idx)
     func_text = '\n'.join(func_lines)
-    global_vars = {'pandas': pandas, 'numpy': numpy,
-                   'getitem_by_mask': getitem_by_mask,
+    global_vars = {'pandas': pandas, 'numpy': numpy, 'prange': numba.prange,
+                   'selection_by_mask': selection_by_mask,
+                   'take_by_selection': take_by_selection,
                    'sdc_take': _sdc_take,
                    'sdc_reindex_series': sdc_reindex_series,
                    'IndexingError': IndexingError}
@@ -1790,25 +1789,31 @@ def df_getitem_bool_series_idx_codegen(self, idx):
 
 def df_getitem_bool_array_idx_codegen(self, idx):
     """
-    Example of generated implementation with provided index:
+    Example of generated implementation with range index:
         def _df_getitem_bool_array_idx_impl(self, idx):
           length = len(self._data[0][0])
           if length != len(idx):
             raise ValueError("Item wrong length.")
-          self_index = range(len(self._data[0][0]))
-          taken_pos = getitem_by_mask(self_index, idx)
-          res_index = sdc_take(self_index, taken_pos)
+          selected_pos = selection_by_mask(idx, length)
+          index_start, index_step = self._index.start, self._index.step
+          res_index = numpy.empty(len(selected_pos), dtype=numpy.int64)
           data_0 = self._data[0][0]
-          res_data_0 = sdc_take(data_0, taken_pos)
+          res_data_0 = numpy.empty(len(selected_pos), dtype=data_0.dtype)
           data_1 = self._data[1][0]
-          res_data_1 = sdc_take(data_1, taken_pos)
+          res_data_1 = numpy.empty(len(selected_pos), dtype=data_1.dtype)
+          for i in prange(len(selected_pos)):
+            pos = selected_pos[i]
+            res_index[i] = index_start + pos * index_step
+            res_data_0[i] = data_0[pos]
+            res_data_1[i] = data_1[pos]
           return pandas.DataFrame({"A": res_data_0, "B": res_data_1}, index=res_index)
     """
     func_lines = ['def _df_getitem_bool_array_idx_impl(self, idx):']
     func_lines += df_getitem_bool_array_idx_main_codelines(self, idx)
     func_text = '\n'.join(func_lines)
-    global_vars = {'pandas': pandas, 'numpy': numpy,
-                   'getitem_by_mask': getitem_by_mask,
+    global_vars = {'pandas': pandas, 'numpy': numpy, 'prange': numba.prange,
+                   'selection_by_mask': selection_by_mask,
+                   'take_by_selection': take_by_selection,
                    'sdc_take': _sdc_take}
 
     return func_text, global_vars
@@ -2033,7 +2038,7 @@ def df_getitem_single_label_loc_codegen(self, idx):
     """
     Example of generated implementation:
         def _df_getitem_single_label_loc_impl(self, idx):
-            idx_list = find_idx(self._dataframe._index, idx)
+            idx_list = index_engine_get_locs(self._dataframe._index, idx)
             data_0 = _sdc_take(self._dataframe._data[0][0], idx_list)
             res_data_0 = pandas.Series(data_0)
             data_1 = _sdc_take(self._dataframe._data[1][0], idx_list)
@@ -2048,7 +2053,7 @@ def df_getitem_single_label_loc_codegen(self, idx):
         new_index = ['  new_index = numpy.array([idx])']
 
     else:
-        fill_list = ['  idx_list = find_idx(self._dataframe._index, idx)']
+        fill_list = ['  idx_list = index_engine_get_locs(self._dataframe._index, idx)']
         new_index = ['  new_index = _sdc_take(self._dataframe._index, idx_list)']
 
     fill_list_text = '\n'.join(fill_list)
@@ -2076,7 +2081,7 @@ def df_getitem_single_label_loc_codegen(self, idx):
     global_vars = {'pandas': pandas, 'numpy': numpy,
                    'numba': numba,
                    '_sdc_take': _sdc_take,
-                   'find_idx': find_idx,
+                   'index_engine_get_locs': index_engine_get_locs,
                    'KeyError': KeyError}
 
     return func_text, global_vars
@@ -2226,9 +2231,7 @@ def df_getitem_list_bool_iloc_codegen(self, idx):
 
 def gen_df_getitem_tuple_at_impl(self, row, col):
     func_text, global_vars = df_getitem_tuple_at_codegen(self, row, col)
-    loc_vars = {}
-    exec(func_text, global_vars, loc_vars)
-    _reduce_impl = loc_vars['_df_getitem_tuple_at_impl']
+    _reduce_impl = exec_func_text(func_text, global_vars, '_df_getitem_tuple_at_impl')
 
     return _reduce_impl
 
@@ -2927,9 +2930,7 @@ def sdc_pandas_dataframe_isin_df_codegen(func_name, df_type, in_df, all_params):
 
 def gen_codegen(func, name, df, values, all_params):
     func_text, global_vars = func(name, df, values, all_params)
-    loc_vars = {}
-    exec(func_text, global_vars, loc_vars)
-    _apply_impl = loc_vars[f'_df_{name}_impl']
+    _apply_impl = exec_func_text(func_text, global_vars, f'_df_{name}_impl')
 
     return _apply_impl
 
@@ -2948,9 +2949,7 @@ def sdc_pandas_dataframe_isin_dict(name, df, values, all_params):
 
 def sdc_pandas_dataframe_isin_iter(name, all_params, ser_par, columns, column_loc):
     func_text, global_vars = _dataframe_apply_columns_codegen(name, all_params, ser_par, columns, column_loc)
-    loc_vars = {}
-    exec(func_text, global_vars, loc_vars)
-    _apply_impl = loc_vars[f'_df_{name}_impl']
+    _apply_impl = exec_func_text(func_text, global_vars, f'_df_{name}_impl')
 
     return _apply_impl
 
@@ -3110,8 +3109,6 @@ are currently unsupported by Intel Scalable Dataframe Compiler
         return None
 
     column_id = self.columns.index(by.literal_value)
-    list_type = types.ListType(types.int64)
-    by_type = self.data[column_id].dtype
 
     col_loc = self.column_loc[by.literal_value]
     type_id, col_id = col_loc.type_id, col_loc.col_id
@@ -3120,35 +3117,264 @@ are currently unsupported by Intel Scalable Dataframe Compiler
                                           group_keys=True, squeeze=False, observed=False):
 
         by_column_data = self._data[type_id][col_id]
-        chunks = parallel_chunks(len(by_column_data))
-        dict_parts = [Dict.empty(by_type, list_type) for _ in range(len(chunks))]
-
-        # filling separate dict of by_value -> positions for each chunk of initial array
-        for i in numba.prange(len(chunks)):
-            chunk = chunks[i]
-            res = dict_parts[i]
-            for j in range(chunk.start, chunk.stop):
-                if isna(by_column_data, j):
-                    continue
-                value = by_column_data[j]
-                group_list = res.get(value)
-                if group_list is None:
-                    new_group_list = List.empty_list(types.int64)
-                    new_group_list.append(j)
-                    res[value] = new_group_list
-                else:
-                    group_list.append(j)
-
-        # merging all dict parts into a single resulting dict
-        res_dict = dict_parts[0]
-        for i in range(1, len(chunks)):
-            res_dict = merge_groupby_dicts_inplace(res_dict, dict_parts[i])
-
-        return init_dataframe_groupby(self, column_id, res_dict, sort)
+        grouped = factorize_keys(by_column_data)
+
+        return init_dataframe_groupby(self, column_id, grouped, sort)
 
     return sdc_pandas_dataframe_groupby_impl
 
 
+def _dataframe_merge_key_names(param, param_name, func_name):
+    """Returns tuple of column names given by literal on, left_on or right_on parameter, None if not given"""
+
+    if param is None or isinstance(param, (types.NoneType, types.Omitted)):
+        return None
+
+    if isinstance(param, types.StringLiteral):
+        return (param.literal_value, )
+
+    if (isinstance(param, types.BaseTuple)
+            and all(isinstance(name, types.StringLiteral) for name in param)):
+        return tuple(name.literal_value for name in param)
+
+    if isinstance(param, types.List) and param.initial_value is not None:
+        return tuple(param.initial_value)
+
+    raise TypingError('{} Unsupported parameter {}: expected constant string, '
+                      'tuple or list of constant strings. Given: {}'.format(func_name, param_name, param))
+
+
+def sdc_pandas_dataframe_merge_codegen(self, right, how, left_on, right_on, suffixes, args):
+    """
+    Example of generated implementation for how='left', on='key', when both frames have column 'A':
+        def _df_merge_impl(self, right, how="inner", on=None, left_on=None, right_on=None, left_index=False,
+                           right_index=False, sort=False, suffixes=('_x', '_y'), copy=True, indicator=False,
+                           validate=None):
+          left_keys = (self._data[0][0], )
+          right_keys = (right._data[0][0], )
+          left_indexer, right_indexer = join_indexers(left_keys, right_keys, "left", sort)
+          result_0 = _sdc_take(self._data[0][0], left_indexer)
+          result_1 = _sdc_take(self._data[1][0], left_indexer)
+          result_2 = take_with_na(right._data[1][0], right_indexer)
+          return pandas.DataFrame({"key": result_0, "A_x": result_1, "A_y": result_2})
+    """
+
+    func_args = ['self', 'right'] + kwsparams2list(args)
+
+    # keys with equal names are put into the result only once, taking values from either side
+    common_keys = set(left_key for left_key, right_key in zip(left_on, right_on) if left_key == right_key)
+    left_columns = list(self.columns)
+    right_columns = [col_name for col_name in right.columns if col_name not in common_keys]
+    overlapping_columns = set(left_columns) & set(right_columns)
+
+    left_suffix, right_suffix = suffixes
+    if overlapping_columns and not (left_suffix or right_suffix):
+        raise ValueError('columns overlap but no suffix specified: {}'.format(sorted(overlapping_columns)))
+
+    def result_name(col_name, suffix):
+        if col_name in overlapping_columns and suffix is not None:
+            return f'{col_name}{suffix}'
+        return col_name
+
+    def column_data(df, df_name, col_name):
+        col_loc = df.column_loc[col_name]
+        return f'{df_name}._data[{col_loc.type_id}][{col_loc.col_id}]'
+
+    left_keys = ', '.join(column_data(self, 'self', key) for key in left_on)
+    right_keys = ', '.join(column_data(right, 'right', key) for key in right_on)
+    func_lines = [
+        f'def _df_merge_impl({", ".join(func_args)}):',
+        f'  left_keys = ({left_keys}, )',
+        f'  right_keys = ({right_keys}, )',
+        f'  left_indexer, right_indexer = join_indexers(left_keys, right_keys, "{how}", sort)',
+    ]
+
+    left_has_missing_rows = how in ('right', 'outer')
+    right_has_missing_rows = how in ('left', 'outer')
+    results = []
+    for col_name in left_columns:
+        left_data = column_data(self, 'self', col_name)
+        if col_name in common_keys and left_has_missing_rows:
+            right_data = column_data(right, 'right', col_name)
+            take_expr = f'take_join_keys({left_data}, {right_data}, left_indexer, right_indexer)'
+        elif left_has_missing_rows:
+            take_expr = f'take_with_na({left_data}, left_indexer)'
+        else:
+            take_expr = f'_sdc_take({left_data}, left_indexer)'
+        results.append((take_expr, result_name(col_name, left_suffix)))
+
+    for col_name in right_columns:
+        right_data = column_data(right, 'right', col_name)
+        if right_has_missing_rows:
+            take_expr = f'take_with_na({right_data}, right_indexer)'
+        else:
+            take_expr = f'_sdc_take({right_data}, right_indexer)'
+        results.append((take_expr, result_name(col_name, right_suffix)))
+
+    for i, (take_expr, _) in enumerate(results):
+        func_lines.append(f'  result_{i} = {take_expr}')
+
+    data = ', '.join(f'"{col_name}": result_{i}' for i, (_, col_name) in enumerate(results))
+    func_lines.append(f'  return pandas.DataFrame({{{data}}})')
+
+    func_text = '\n'.join(func_lines)
+    global_vars = {'pandas': pandas,
+                   'join_indexers': join_indexers,
+                   'take_with_na': take_with_na,
+                   'take_join_keys': take_join_keys,
+                   '_sdc_take': _sdc_take}
+
+    return func_text, global_vars
+
+
+@sdc_overload_method(DataFrameType, 'merge')
+def sdc_pandas_dataframe_merge(self, right, how='inner', on=None, left_on=None, right_on=None, left_index=False,
+                               right_index=False, sort=False, suffixes=('_x', '_y'), copy=True, indicator=False,
+                               validate=None):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.DataFrame.merge
+
+    Limitations
+    -----------
+    - Parameters ``left_index``, ``right_index``, ``indicator`` and ``validate`` are currently unsupported \
+by Intel Scalable Dataframe Compiler
+    - Parameter ``copy`` is ignored, resulting columns are always copied
+    - Parameter ``suffixes`` is supported as a tuple of literal values only
+    - Parameters ``on``, ``left_on`` and ``right_on`` are supported as literal column name, \
+tuple or constant list of literal column names only
+    - Key columns that are joined must have equal dtypes
+    - Rows with NA keys never match each other, they are kept in the result of left, right and outer joins \
+and placed after all matched rows for outer join
+    - Integer and boolean columns of a side that may have missing rows are converted to float64
+    - Index of the result is always a default :class:`pandas.RangeIndex`
+
+    Examples
+    --------
+    .. literalinclude:: ../../../examples/dataframe/dataframe_merge.py
+       :language: python
+       :lines: 35-
+       :caption: Merge DataFrame objects with a database-style join on a common key column.
+       :name: ex_dataframe_merge
+
+    .. command-output:: python ./dataframe/dataframe_merge.py
+       :cwd: ../../../examples
+
+    .. seealso::
+        :ref:`DataFrame.append <pandas.DataFrame.append>`
+            Append rows of other to the end of caller, returning a new object.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Pandas DataFrame method :meth:`pandas.DataFrame.merge` implementation.
+
+    Rows of both frames are matched with a parallel hash join (see :func:`sdc.functions.join.join_indexers`),
+    then each resulting column is taken from its source column by the computed indexers in parallel.
+
+    .. only:: developer
+       Test: python -m sdc.runtests -k sdc.tests.test_join.TestJoin.test_merge*
+    """
+
+    _func_name = 'Method merge().'
+
+    ty_checker = TypeChecker(_func_name)
+    ty_checker.check(self, DataFrameType)
+    ty_checker.check(right, DataFrameType)
+
+    if isinstance(how, types.UnicodeType) and not isinstance(how, types.StringLiteral):
+        def _df_merge_unicode_how_impl(self, right, how='inner', on=None, left_on=None, right_on=None,
+                                       left_index=False, right_index=False, sort=False, suffixes=('_x', '_y'),
+                                       copy=True, indicator=False, validate=None):
+            # resulting DataFrame type depends on how, so it's needed as a literal value
+            return literally(how)
+
+        return _df_merge_unicode_how_impl
+
+    if isinstance(how, types.Omitted):
+        how_value = how.value
+    elif isinstance(how, types.StringLiteral):
+        how_value = how.literal_value
+    elif isinstance(how, str):
+        how_value = how
+    else:
+        ty_checker.raise_exc(how, 'str', 'how')
+
+    if how_value not in ('inner', 'left', 'right', 'outer'):
+        raise ValueError('{} Unrecognized parameter how: {}'.format(_func_name, how_value))
+
+    if not (left_index is False or isinstance(left_index, types.Omitted)
+            or (isinstance(left_index, types.BooleanLiteral) and left_index.literal_value is False)):
+        raise TypingError('{} Unsupported parameter left_index. Given: {}'.format(_func_name, left_index))
+
+    if not (right_index is False or isinstance(right_index, types.Omitted)
+            or (isinstance(right_index, types.BooleanLiteral) and right_index.literal_value is False)):
+        raise TypingError('{} Unsupported parameter right_index. Given: {}'.format(_func_name, right_index))
+
+    if not (indicator is False or isinstance(indicator, types.Omitted)
+            or (isinstance(indicator, types.BooleanLiteral) and indicator.literal_value is False)):
+        raise TypingError('{} Unsupported parameter indicator. Given: {}'.format(_func_name, indicator))
+
+    if not (validate is None or isinstance(validate, (types.Omitted, types.NoneType))):
+        raise TypingError('{} Unsupported parameter validate. Given: {}'.format(_func_name, validate))
+
+    if not isinstance(sort, (bool, types.Boolean, types.Omitted)):
+        ty_checker.raise_exc(sort, 'bool', 'sort')
+
+    if not isinstance(copy, (bool, types.Boolean, types.Omitted)):
+        ty_checker.raise_exc(copy, 'bool', 'copy')
+
+    if isinstance(suffixes, types.Omitted):
+        suffixes_value = suffixes.value
+    elif isinstance(suffixes, tuple):
+        suffixes_value = suffixes
+    elif (isinstance(suffixes, types.BaseTuple) and len(suffixes) == 2
+            and all(isinstance(s, (types.StringLiteral, types.NoneType)) for s in suffixes)):
+        suffixes_value = tuple(getattr(s, 'literal_value', None) for s in suffixes)
+    else:
+        raise SDCLimitation('{} Parameter suffixes is only supported as a tuple of two literals.'.format(_func_name))
+
+    on_names = _dataframe_merge_key_names(on, 'on', _func_name)
+    left_on_names = _dataframe_merge_key_names(left_on, 'left_on', _func_name)
+    right_on_names = _dataframe_merge_key_names(right_on, 'right_on', _func_name)
+    if on_names is not None:
+        if left_on_names is not None or right_on_names is not None:
+            raise TypingError('{} Parameter on can not be used with left_on or right_on.'.format(_func_name))
+        left_on_names = right_on_names = on_names
+    elif left_on_names is None and right_on_names is None:
+        # pandas merges on common columns if no keys are given
+        left_on_names = right_on_names = tuple(col for col in self.columns if col in right.columns)
+        if not left_on_names:
+            raise TypingError('{} No common columns to perform merge on.'.format(_func_name))
+    elif left_on_names is None or right_on_names is None:
+        raise TypingError('{} Both left_on and right_on must be given.'.format(_func_name))
+
+    if len(left_on_names) != len(right_on_names):
+        raise ValueError('{} len(right_on) must equal len(left_on)'.format(_func_name))
+
+    for left_key, right_key in zip(left_on_names, right_on_names):
+        if left_key not in self.columns:
+            raise KeyError('{} Column {} not found in left DataFrame'.format(_func_name, left_key))
+        if right_key not in right.columns:
+            raise KeyError('{} Column {} not found in right DataFrame'.format(_func_name, right_key))
+
+        left_key_type = self.data[self.columns.index(left_key)]
+        right_key_type = right.data[right.columns.index(right_key)]
+        if left_key_type != right_key_type:
+            raise TypingError('{} Key columns must have equal types. Given: left[{}]={}, right[{}]={}'.format(
+                _func_name, left_key, left_key_type, right_key, right_key_type))
+
+    args = {'how': '"inner"', 'on': None, 'left_on': None, 'right_on': None, 'left_index': False,
+            'right_index': False, 'sort': False, 'suffixes': ('_x', '_y'), 'copy': True, 'indicator': False,
+            'validate': None}
+
+    func_text, global_vars = sdc_pandas_dataframe_merge_codegen(self, right, how_value, left_on_names,
+                                                                right_on_names, suffixes_value, args)
+    _impl = exec_func_text(func_text, global_vars, '_df_merge_impl')
+
+    return _impl
+
+
 def df_set_column_index_codelines(self):
     """Generate code lines with definition of resulting index for DF set_column"""
     func_lines = []
@@ -3403,9 +3629,7 @@ def sdc_pandas_dataframe_reset_index_impl(self, drop=False):
     all_params = ['self', 'level=None', 'drop=False', 'inplace=False', 'col_level=0', 'col_fill=""']
     func_text, global_vars = sdc_pandas_dataframe_reset_index_codegen(drop, all_params,
                                                                       self.columns, self.column_loc)
-    loc_vars = {}
-    exec(func_text, global_vars, loc_vars)
-    _apply_impl = loc_vars[f'_df_reset_index_impl']
+    _apply_impl = exec_func_text(func_text, global_vars, f'_df_reset_index_impl')
 
     return _apply_impl
 
@@ -3483,3 +3707,190 @@ def sdc_pandas_dataframe_reset_index(self, level=None, drop=False, inplace=False
 
     raise SDCLimitation('Method {}(). Parameter drop is only supported as a literal.'.format(func_name))
 
+
+def sdc_pandas_dataframe_to_parquet_codegen(self, compression, index, partition_cols):
+    """
+    Example of generated implementation:
+        def _df_to_parquet_impl(self, path, engine='auto', compression='snappy', index=None, partition_cols=None):
+          col_0 = self._data[0][0]
+          col_1_offsets = get_offsets_array(self._data[1][0])
+          col_1_data = get_chars_array(self._data[1][0])
+          col_1_null_bitmap = get_null_bitmap_array(self._data[1][0])
+          df_index = self._index
+          with objmode():
+            pyarrow_write_parquet(path, column_names, (col_0, (col_1_offsets, col_1_data, col_1_null_bitmap), ),
+                                  df_index, None, 'snappy', None)
+    """
+    func_lines = ["def _df_to_parquet_impl(self, path, engine='auto', compression='snappy', index=None, "
+                  "partition_cols=None):"]
+    columns = []
+    for i, name in enumerate(self.columns):
+        col_loc = self.column_loc[name]
+        data = f'self._data[{col_loc.type_id}][{col_loc.col_id}]'
+        if isinstance(self.data[col_loc.type_id], StringArrayType):
+            buffers = [f'col_{i}_offsets', f'col_{i}_data', f'col_{i}_null_bitmap']
+            func_lines += [f'  {buffers[0]} = get_offsets_array({data})',
+                           f'  {buffers[1]} = get_chars_array({data})',
+                           f'  {buffers[2]} = get_null_bitmap_array({data})']
+            columns.append(f"({', '.join(buffers)})")
+        else:
+            func_lines.append(f'  col_{i} = {data}')
+            columns.append(f'col_{i}')
+
+    # index is not needed when it is not stored
+    df_index = 'None' if index is False else 'self._index'
+    func_lines += [f'  df_index = {df_index}',
+                   f'  with objmode():',
+                   f"    pyarrow_write_parquet(path, column_names, ({''.join(c + ', ' for c in columns)}),",
+                   f"                          df_index, {index!r}, {compression}, {partition_cols!r})"]
+
+    global_vars = {'objmode': sdc.objmode,
+                   'pyarrow_write_parquet': pyarrow_write_parquet,
+                   'get_offsets_array': get_offsets_array,
+                   'get_chars_array': get_chars_array,
+                   'get_null_bitmap_array': get_null_bitmap_array,
+                   'column_names': tuple(self.columns)}
+
+    return '\n'.join(func_lines), global_vars
+
+
+@sdc_overload_method(DataFrameType, 'to_parquet')
+def sdc_pandas_dataframe_to_parquet(self, path, engine='auto', compression='snappy', index=None,
+                                    partition_cols=None):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.DataFrame.to_parquet
+
+    Limitations
+    -----------
+    - Parameter ``engine`` is ignored, the file is always written with pyarrow.
+    - Parameters ``index`` and ``partition_cols`` should be constants. ``partition_cols`` is supported \
+        only as an empty tuple, in this case ``path`` is a directory and a file per thread is written in parallel.
+    - Columns of numeric, boolean and datetime dtypes and string columns are supported. \
+        String columns are passed to pyarrow as buffers without creating Python strings.
+    - The DataFrame is split into ``NUMBA_NUM_THREADS`` row groups.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Pandas DataFrame method :meth:`pandas.DataFrame.to_parquet` implementation.
+
+    .. only:: developer
+        Test: python -m sdc.runtests -k sdc.tests.test_io.TestParquet.test_df_to_parquet*
+    """
+
+    func_name = 'to_parquet'
+
+    ty_checker = TypeChecker('Method {}().'.format(func_name))
+    ty_checker.check(self, DataFrameType)
+
+    if not isinstance(path, (types.UnicodeType, types.StringLiteral)):
+        ty_checker.raise_exc(path, 'str', 'path')
+
+    for name in self.columns:
+        col_type = self.data[self.column_loc[name].type_id]
+        if not isinstance(col_type, (types.Array, StringArrayType)):
+            raise TypingError('{} Unsupported type of column {}. Given: {}'.format(func_name, name, col_type))
+
+    if isinstance(compression, (types.Omitted, types.NoneType)) or compression is None:
+        compression = repr(getattr(compression, 'value', None))
+    elif isinstance(compression, types.StringLiteral):
+        compression = repr(compression.literal_value)
+    elif isinstance(compression, types.UnicodeType):
+        compression = 'compression'
+    else:
+        ty_checker.raise_exc(compression, 'str or None', 'compression')
+
+    if isinstance(index, types.Omitted):
+        index = index.value
+    elif isinstance(index, types.BooleanLiteral):
+        index = index.literal_value
+    elif not (index is None or isinstance(index, types.NoneType)):
+        raise SDCLimitation('Method {}(). Parameter index is only supported as a literal.'.format(func_name))
+    else:
+        index = None
+
+    if isinstance(partition_cols, types.Omitted) or partition_cols is None:
+        partition_cols = None
+    elif isinstance(partition_cols, types.NoneType):
+        partition_cols = None
+    elif isinstance(partition_cols, types.BaseTuple) and len(partition_cols) == 0:
+        partition_cols = []
+    else:
+        raise SDCLimitation('Method {}(). Parameter partition_cols is only supported '
+                            'as None or empty tuple. Given: {}'.format(func_name, partition_cols))
+
+    func_text, global_vars = sdc_pandas_dataframe_to_parquet_codegen(self, compression, index, partition_cols)
+
+    return exec_func_text(func_text, global_vars, '_df_to_parquet_impl')
+
+
+@sdc_overload_method(DataFrameType, 'to_csv')
+def sdc_pandas_dataframe_to_csv(self, path_or_buf=None, sep=',', na_rep='', float_format=None, columns=None,
+                                header=True, index=True, index_label=None, mode='w', encoding=None,
+                                compression='infer', quoting=None, quotechar='"', line_terminator=None,
+                                chunksize=None, date_format=None, doublequote=True, escapechar=None, decimal='.'):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.DataFrame.to_csv
+
+    Limitations
+    -----------
+    - Parameters ``sep``, ``na_rep``, ``header``, ``index``, ``index_label``, ``quotechar`` and \
+        ``line_terminator`` should be constants, ``header`` is supported only as bool.
+    - Parameters ``float_format``, ``columns``, ``mode``, ``encoding``, ``compression``, ``quoting``, \
+        ``chunksize``, ``date_format``, ``doublequote``, ``escapechar`` and ``decimal`` are supported \
+        only with default values.
+    - Columns of numeric and boolean dtypes and string columns are supported.
+    - Rows are formatted in parallel, the file is written in parallel by parts at their offsets.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Pandas DataFrame method :meth:`pandas.DataFrame.to_csv` implementation.
+
+    .. only:: developer
+        Test: python -m sdc.runtests -k sdc.tests.test_io.TestCSV.test_df_to_csv*
+    """
+
+    func_name = 'to_csv'
+
+    ty_checker = TypeChecker('Method {}().'.format(func_name))
+    ty_checker.check(self, DataFrameType)
+
+    params = get_to_csv_params(func_name, {
+        'path_or_buf': path_or_buf, 'sep': sep, 'na_rep': na_rep, 'float_format': float_format,
+        'columns': columns, 'header': header, 'index': index, 'index_label': index_label, 'mode': mode,
+        'encoding': encoding, 'compression': compression, 'quoting': quoting, 'quotechar': quotechar,
+        'line_terminator': line_terminator, 'chunksize': chunksize, 'date_format': date_format,
+        'doublequote': doublequote, 'escapechar': escapechar, 'decimal': decimal})
+
+    init_lines, fields, names, name_exprs = [], [], [], {}
+    if params['index']:
+        index_field = gen_index_field(self.index, 'self._index')
+        if index_field is None:
+            raise TypingError('{} Unsupported type of index. Given: {}'.format(func_name, self.index))
+        index_lines, field, index_name_expr = index_field
+        init_lines += index_lines
+        fields.append(field)
+        names.append(params['index_label'] or '')
+        if params['index_label'] is None and index_name_expr is not None:
+            name_exprs[0] = index_name_expr
+
+    for i, name in enumerate(self.columns):
+        col_loc = self.column_loc[name]
+        col_type = self.data[col_loc.type_id]
+        if not is_csv_writable_type(col_type):
+            raise TypingError('{} Unsupported type of column {}. Given: {}'.format(func_name, name, col_type))
+        init_lines.append(f'  col_{i} = self._data[{col_loc.type_id}][{col_loc.col_id}]')
+        fields.append((f'col_{i}', col_type, None))
+        names.append(name)
+
+    if not fields:
+        raise SDCLimitation('Method {}(). DataFrame without columns is supported only with index=True'.format(
+            func_name))
+
+    func_text, global_vars = gen_to_csv_func_text('_df_to_csv_impl', f'self, {to_csv_signature}', init_lines,
+                                                  fields, 'len(self)', names, params, name_exprs)
+
+    return exec_func_text(func_text, global_vars, '_df_to_csv_impl')
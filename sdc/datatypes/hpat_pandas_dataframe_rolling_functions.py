@@ -30,10 +30,13 @@ from numba.core.types import (float64, Boolean, Integer, Number, Omitted,
                          NoneType, StringLiteral, UnicodeType)
 from sdc.utilities.sdc_typing_utils import TypeChecker, kwsparams2list
 from sdc.datatypes.hpat_pandas_dataframe_rolling_types import DataFrameRollingType
+from sdc.datatypes.hpat_pandas_series_rolling_functions import check_int_window
+from sdc.datatypes.hpat_pandas_series_rolling_types import _hpat_pandas_series_time_rolling_init
 from sdc.hiframes.pd_dataframe_ext import get_dataframe_data
 from sdc.hiframes.pd_dataframe_type import DataFrameType
 from sdc.hiframes.pd_series_type import SeriesType
 from sdc.utilities.utils import sdc_overload_method
+from sdc.utilities.compile_cache import exec_func_text
 
 
 sdc_pandas_dataframe_rolling_docstring_tmpl = """
@@ -164,27 +167,49 @@ def df_rolling_method_other_df_codegen(method_name, self, other, args=None, kws=
     return func_text, global_vars
 
 
-def df_rolling_method_main_codegen(method_params, df_columns, column_loc, method_name):
+def df_rolling_method_main_codegen(method_params, self, method_name):
     rolling_params = df_rolling_params_codegen()
     method_params_as_str = ', '.join(method_params)
+    df_columns, column_loc = self.data.columns, self.data.column_loc
 
     results = []
     func_lines = []
+    if self.time_window:
+        # columns share the times, so the windows are calculated on Series with the same datetime index
+        if self.time_on is None:
+            func_lines += ['  times = self._data._index']
+        else:
+            time_loc = column_loc[self.time_on]
+            func_lines += [f'  times = self._data._data[{time_loc.type_id}][{time_loc.col_id}]']
+
     for idx, col in enumerate(df_columns):
         col_loc = column_loc[col]
         type_id, col_id = col_loc.type_id, col_loc.col_id
         res_data = f'result_data_{col}'
-        func_lines += [
-            f'  data_{col} = self._data._data[{type_id}][{col_id}]',
-            f'  series_{col} = pandas.Series(data_{col})',
-            f'  rolling_{col} = series_{col}.rolling({rolling_params})',
-            f'  result_{col} = rolling_{col}.{method_name}({method_params_as_str})',
-            f'  {res_data} = result_{col}._data[:len(data_{col})]'
-        ]
+        func_lines += [f'  data_{col} = self._data._data[{type_id}][{col_id}]']
+        if col == self.time_on:
+            func_lines += [f'  {res_data} = data_{col}']
+        elif self.time_window:
+            func_lines += [
+                f'  series_{col} = pandas.Series(data_{col}, index=times)',
+                f'  rolling_{col} = _hpat_pandas_series_time_rolling_init(series_{col}, {rolling_params})',
+                f'  result_{col} = rolling_{col}.{method_name}({method_params_as_str})',
+                f'  {res_data} = result_{col}._data'
+            ]
+        else:
+            func_lines += [
+                f'  series_{col} = pandas.Series(data_{col})',
+                f'  rolling_{col} = series_{col}.rolling({rolling_params})',
+                f'  result_{col} = rolling_{col}.{method_name}({method_params_as_str})',
+                f'  {res_data} = result_{col}._data[:len(data_{col})]'
+            ]
         results.append((col, res_data))
 
     data = ', '.join(f'"{col}": {data}' for col, data in results)
-    func_lines += [f'  return pandas.DataFrame({{{data}}})']
+    if self.time_window:
+        func_lines += [f'  return pandas.DataFrame({{{data}}}, index=self._data._index)']
+    else:
+        func_lines += [f'  return pandas.DataFrame({{{data}}})']
 
     return func_lines
 
@@ -212,12 +237,12 @@ def gen_df_rolling_method_other_none_codegen(rewrite_name=None):
                 f'    raise ValueError("Method rolling.{_method_name}(). The object pairwise\\n expected: False")'
             ]
         method_params = args + ['{}={}'.format(k, k) for k in kwargs if k != 'other']
-        func_lines += df_rolling_method_main_codegen(method_params, self.data.columns, self.data.column_loc,
-                                                     method_name)
+        func_lines += df_rolling_method_main_codegen(method_params, self, method_name)
 
         func_text = '\n'.join(func_lines)
 
-        global_vars = {'pandas': pandas}
+        global_vars = {'pandas': pandas,
+                       '_hpat_pandas_series_time_rolling_init': _hpat_pandas_series_time_rolling_init}
 
         return func_text, global_vars
 
@@ -239,11 +264,11 @@ def df_rolling_method_codegen(method_name, self, args=None, kws=None):
     func_lines = [f'def {impl_name}({impl_params_as_str}):']
 
     method_params = args + ['{}={}'.format(k, k) for k in kwargs]
-    func_lines += df_rolling_method_main_codegen(method_params, self.data.columns,
-                                                 self.data.column_loc, method_name)
+    func_lines += df_rolling_method_main_codegen(method_params, self, method_name)
     func_text = '\n'.join(func_lines)
 
-    global_vars = {'pandas': pandas}
+    global_vars = {'pandas': pandas,
+                   '_hpat_pandas_series_time_rolling_init': _hpat_pandas_series_time_rolling_init}
 
     return func_text, global_vars
 
@@ -251,9 +276,7 @@ def df_rolling_method_codegen(method_name, self, args=None, kws=None):
 def gen_df_rolling_method_other_df_impl(method_name, self, other, args=None, kws=None):
     func_text, global_vars = df_rolling_method_other_df_codegen(method_name, self, other,
                                                                 args=args, kws=kws)
-    loc_vars = {}
-    exec(func_text, global_vars, loc_vars)
-    _impl = loc_vars[f'_df_rolling_{method_name}_other_df_impl']
+    _impl = exec_func_text(func_text, global_vars, f'_df_rolling_{method_name}_other_df_impl')
 
     return _impl
 
@@ -261,9 +284,7 @@ def gen_df_rolling_method_other_df_impl(method_name, self, other, args=None, kws
 def gen_df_rolling_method_other_none_impl(method_name, self, args=None, kws=None):
     func_text, global_vars = df_rolling_method_other_none_codegen(method_name, self,
                                                                   args=args, kws=kws)
-    loc_vars = {}
-    exec(func_text, global_vars, loc_vars)
-    _impl = loc_vars[f'_df_rolling_{method_name}_other_none_impl']
+    _impl = exec_func_text(func_text, global_vars, f'_df_rolling_{method_name}_other_none_impl')
 
     return _impl
 
@@ -271,9 +292,7 @@ def gen_df_rolling_method_other_none_impl(method_name, self, args=None, kws=None
 def gen_df_rolling_cov_other_none_impl(method_name, self, args=None, kws=None):
     func_text, global_vars = df_rolling_cov_other_none_codegen(method_name, self,
                                                                args=args, kws=kws)
-    loc_vars = {}
-    exec(func_text, global_vars, loc_vars)
-    _impl = loc_vars[f'_df_rolling_cov_other_none_impl']
+    _impl = exec_func_text(func_text, global_vars, f'_df_rolling_cov_other_none_impl')
 
     return _impl
 
@@ -281,9 +300,7 @@ def gen_df_rolling_cov_other_none_impl(method_name, self, args=None, kws=None):
 def gen_df_rolling_method_impl(method_name, self, args=None, kws=None):
     func_text, global_vars = df_rolling_method_codegen(method_name, self,
                                                        args=args, kws=kws)
-    loc_vars = {}
-    exec(func_text, global_vars, loc_vars)
-    _impl = loc_vars[f'_df_rolling_{method_name}_impl']
+    _impl = exec_func_text(func_text, global_vars, f'_df_rolling_{method_name}_impl')
 
     return _impl
 
@@ -293,6 +310,7 @@ def sdc_pandas_dataframe_rolling_apply(self, func, raw=None):
 
     ty_checker = TypeChecker('Method rolling.apply().')
     ty_checker.check(self, DataFrameRollingType)
+    check_int_window(ty_checker, self)
 
     raw_accepted = (Omitted, NoneType, Boolean)
     if not isinstance(raw, raw_accepted) and raw is not None:
@@ -307,6 +325,7 @@ def sdc_pandas_dataframe_rolling_corr(self, other=None, pairwise=None):
 
     ty_checker = TypeChecker('Method rolling.corr().')
     ty_checker.check(self, DataFrameRollingType)
+    check_int_window(ty_checker, self)
 
     accepted_other = (Omitted, NoneType, DataFrameType, SeriesType)
     if not isinstance(other, accepted_other) and other is not None:
@@ -342,6 +361,7 @@ def sdc_pandas_dataframe_rolling_cov(self, other=None, pairwise=None, ddof=1):
 
     ty_checker = TypeChecker('Method rolling.cov().')
     ty_checker.check(self, DataFrameRollingType)
+    check_int_window(ty_checker, self)
 
     accepted_other = (Omitted, NoneType, DataFrameType, SeriesType)
     if not isinstance(other, accepted_other) and other is not None:
@@ -373,6 +393,7 @@ def sdc_pandas_dataframe_rolling_kurt(self):
 
     ty_checker = TypeChecker('Method rolling.kurt().')
     ty_checker.check(self, DataFrameRollingType)
+    check_int_window(ty_checker, self)
 
     return gen_df_rolling_method_impl('kurt', self)
 
@@ -400,6 +421,7 @@ def sdc_pandas_dataframe_rolling_median(self):
 
     ty_checker = TypeChecker('Method rolling.median().')
     ty_checker.check(self, DataFrameRollingType)
+    check_int_window(ty_checker, self)
 
     return gen_df_rolling_method_impl('median', self)
 
@@ -418,6 +440,7 @@ def sdc_pandas_dataframe_rolling_quantile(self, quantile, interpolation='linear'
 
     ty_checker = TypeChecker('Method rolling.quantile().')
     ty_checker.check(self, DataFrameRollingType)
+    check_int_window(ty_checker, self)
 
     if not isinstance(quantile, Number):
         ty_checker.raise_exc(quantile, 'float', 'quantile')
@@ -435,6 +458,7 @@ def sdc_pandas_dataframe_rolling_skew(self):
 
     ty_checker = TypeChecker('Method rolling.skew().')
     ty_checker.check(self, DataFrameRollingType)
+    check_int_window(ty_checker, self)
 
     return gen_df_rolling_method_impl('skew', self)
 
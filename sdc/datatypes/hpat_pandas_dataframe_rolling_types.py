@@ -31,10 +31,11 @@ from sdc.datatypes.hpat_pandas_rolling_types import (
 
 class DataFrameRollingType(RollingType):
     """Type definition for pandas.DataFrame.rolling functions handling."""
-    def __init__(self, data, win_type=None, on=None, closed=None):
+    def __init__(self, data, win_type=None, on=None, closed=None, time_window=False, time_on=None):
         super(DataFrameRollingType, self).__init__('DataFrameRollingType',
                                                    data, win_type=win_type,
-                                                   on=on, closed=closed)
+                                                   on=on, closed=closed,
+                                                   time_window=time_window, time_on=time_on)
 
 
 @register_model(DataFrameRollingType)
@@ -46,3 +47,5 @@ class DataFrameRollingTypeModel(RollingTypeModel):
 
 _hpat_pandas_df_rolling_init = intrinsic(gen_hpat_pandas_rolling_init(
     DataFrameRollingType))
+_hpat_pandas_df_time_rolling_init = intrinsic(gen_hpat_pandas_rolling_init(
+    DataFrameRollingType, time_window=True))
@@ -40,8 +40,14 @@ from numba.extending import overload
 from sdc.io.csv_ext import (
     _gen_csv_reader_py_pyarrow_py_func,
     _gen_pandas_read_csv_func_text,
+    is_native_csv_column_type,
 )
+from sdc.io.parquet_pio import gen_read_parquet_impl, get_parquet_filters, get_read_parquet_columns
 from sdc.str_arr_ext import string_array_type
+from sdc.hiframes.pd_dataframe_type import DataFrameType
+from sdc.utilities.utils import sdc_overload
+from sdc.utilities.sdc_typing_utils import kwsparams2list
+from sdc.utilities.compile_cache import exec_func_text
 
 from sdc.hiframes import join, aggregate, sort
 from sdc.types import CategoricalDtypeType, Categorical
@@ -227,6 +233,11 @@ def sdc_pandas_read_csv(
         msg = "Cannot infer resulting DataFrame from constant file or parameters."
         raise TypingError(msg)
 
+    # with chunksize an iterator over DataFrames of chunksize rows is returned
+    chunked = not isinstance(chunksize, (types.Omitted, types.NoneType)) and chunksize is not None
+    if chunked and not isinstance(chunksize, types.Integer):
+        raise TypingError(f"read_csv: chunksize should be an integer. Given: {chunksize}")
+
     if infer_from_file:
         # parameters should be constants and are important only for inference from file
 
@@ -313,9 +324,13 @@ def sdc_pandas_read_csv(
 
     py_col_dtypes = {cname: _get_py_col_dtype(ctype) for cname, ctype in zip(col_names, col_types)}
 
-    # generate function text with signature and returning DataFrame
+    if chunked and not all(is_native_csv_column_type(ctype) for ctype in col_types):
+        raise TypingError("read_csv: chunksize is supported for numeric and string columns only. "
+                          f"Given column types: {col_types}")
+
+    # generate function text with signature and returning DataFrame (or iterator over DataFrames if chunked)
     func_text, func_name, global_vars = _gen_pandas_read_csv_func_text(
-        col_names, col_types, py_col_dtypes, usecols, signature)
+        col_names, col_types, py_col_dtypes, usecols, signature, chunked=chunked)
 
     # compile with Python
     csv_reader_py = _gen_csv_reader_py_pyarrow_py_func(func_text, func_name, global_vars)
@@ -356,7 +371,6 @@ sdc_pandas_read_csv.__doc__ = r"""
         ``dayfirst``, \
         ``cache_dates``, \
         ``iterator``, \
-        ``chunksize``, \
         ``compression``, \
         ``thousands``, \
         ``decimal``, \
@@ -383,6 +397,8 @@ sdc_pandas_read_csv.__doc__ = r"""
     - For inferring from file ``sep``, ``delimiter`` and ``skiprows`` should be constants or omitted.
     - ``names`` and ``usecols`` should be constants or omitted for both types of inferrencing.
     - ``usecols`` with list of ints is unsupported by Intel Scalable Dataframe Compiler.
+    - ``chunksize`` is supported for DataFrames of numeric and string columns only, \
+        the result is an iterator over DataFrames that can be used in ``for`` loops only.
 
     Examples
     --------
@@ -403,4 +419,99 @@ sdc_pandas_read_csv.__doc__ = r"""
 
     >>> pd.read_csv(file_name, names=['A','B'], usecols=['A'], dtype={'A': np.float64}, \
                     delimiter=some_char, skiprows=some_int)  # doctest: +SKIP
+
+    Reading by chunks. File is read by DataFrames of at most 10000 rows, \
+    so that memory used by the loop does not depend on the size of the file.
+
+    >>> for chunk in pd.read_csv(file_name, names=['A','B'], dtype={'A': np.float64, 'B': str}, \
+                                 chunksize=10000):  # doctest: +SKIP
+    ...     total += chunk['A'].sum()
 """
+
+
+@overload(pd.read_parquet)
+def sdc_pandas_read_parquet(path, engine='auto', columns=None, filters=None):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+
+    Pandas API: pandas.read_parquet
+
+    Limitations
+    -----------
+    - ``path`` should be a constant, resulting DataFrame type is inferred from the dataset schema \
+        at the moment of compilation.
+    - ``columns`` should be a constant list of column names or omitted.
+    - Only numeric, boolean and string columns are supported, index stored in the dataset is not restored.
+    - Parameter ``engine`` is ignored, the dataset is always read with pyarrow.
+    - ``filters`` are given as in pyarrow: a list of ``(column, op, value)`` tuples combined with AND \
+        or a list of such lists combined with OR, where ``op`` is one of ``==``, ``=``, ``!=``, \
+        ``<``, ``<=``, ``>``, ``>=`` and ``value`` is a scalar. Row groups which statistics show \
+        no matching rows are not read and other rows are filtered as in pyarrow datasets API.
+    - Row groups are read in parallel by ``NUMBA_NUM_THREADS`` threads.
+    - When DataFrame returned by ``read_parquet`` is only used to select columns \
+        or rows by a mask comparing its columns with constants or function arguments, \
+        only used columns are read and the mask is pushed down as ``filters``.
+
+    Examples
+    --------
+    Only columns ``A`` and ``B`` are read and row groups where all values of ``A`` are below 0 are skipped.
+
+    >>> df = pd.read_parquet('data.pq')  # doctest: +SKIP
+    >>> df[df.A > 0]['B'].sum()  # doctest: +SKIP
+
+    The same with explicit parameters.
+
+    >>> pd.read_parquet('data.pq', columns=['A', 'B'], filters=[('A', '>', 0)])  # doctest: +SKIP
+    """
+
+    col_names, col_types = get_read_parquet_columns(path, columns)
+    pq_filters = get_parquet_filters(filters)
+
+    return gen_read_parquet_impl('_read_parquet_impl', "path, engine='auto', columns=None, filters=None",
+                                 col_names, col_types, pq_filters)
+
+
+@sdc_overload(pd.merge)
+def sdc_pandas_merge(left, right, how='inner', on=None, left_on=None, right_on=None, left_index=False,
+                     right_index=False, sort=False, suffixes=('_x', '_y'), copy=True, indicator=False,
+                     validate=None):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.merge
+
+    Limitations
+    -----------
+    - Parameter ``left`` is supported as :obj:`pandas.DataFrame` only
+    - Limitations of :ref:`DataFrame.merge <pandas.DataFrame.merge>` apply
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Pandas function :func:`pandas.merge` implementation, it is a thin wrapper over
+    :meth:`pandas.DataFrame.merge`.
+
+    .. only:: developer
+       Test: python -m sdc.runtests -k sdc.tests.test_join.TestJoin.test_merge*
+    """
+
+    if not isinstance(left, DataFrameType):
+        return None
+
+    # omitted parameters are not passed, so that DataFrame.merge gets their default values as literals
+    params = {'how': how, 'on': on, 'left_on': left_on, 'right_on': right_on, 'left_index': left_index,
+              'right_index': right_index, 'sort': sort, 'suffixes': suffixes, 'copy': copy, 'indicator': indicator,
+              'validate': validate}
+    defaults = {'how': '"inner"', 'on': None, 'left_on': None, 'right_on': None, 'left_index': False,
+                'right_index': False, 'sort': False, 'suffixes': ('_x', '_y'), 'copy': True, 'indicator': False,
+                'validate': None}
+    passed_params = ''.join(f', {name}={name}' for name, value in params.items()
+                            if not isinstance(value, types.Omitted))
+
+    func_lines = [
+        f'def _pd_merge_impl(left, right, {", ".join(kwsparams2list(defaults))}):',
+        f'  return left.merge(right{passed_params})'
+    ]
+    func_text = '\n'.join(func_lines)
+
+    return exec_func_text(func_text, {}, '_pd_merge_impl')
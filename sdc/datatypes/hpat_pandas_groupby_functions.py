@@ -42,9 +42,11 @@ from numba.core.typing import signature
 from numba import literally
 
 from sdc.datatypes.common_functions import sdc_arrays_argsort, _sdc_asarray, _sdc_take
+from sdc.functions.groupby import groupby_aggregations
 from sdc.datatypes.hpat_pandas_groupby_types import DataFrameGroupByType, SeriesGroupByType
 from sdc.utilities.sdc_typing_utils import TypeChecker, kwsparams2list, sigparams2list
-from sdc.utilities.utils import (sdc_overload, sdc_overload_method, sdc_register_jitable)
+from sdc.utilities.utils import sdc_overload, sdc_overload_method
+from sdc.utilities.compile_cache import exec_func_text
 from sdc.hiframes.pd_series_type import SeriesType
 from sdc.str_ext import string_type
 
@@ -54,24 +56,6 @@ performance_limitation = "This function may reveal slower performance than Panda
     going back to interpreter mode."
 
 
-@sdc_register_jitable
-def merge_groupby_dicts_inplace(left, right):
-    """ Merges one internal groupby dictionary (right) into another one (left) and returns
-    the merging result. Used for aggregating partial dicts into single result. """
-
-    if not right:
-        return left
-
-    for key, right_group_list in right.items():
-        left_group_list = left.get(key)
-        if left_group_list is None:
-            left[key] = right_group_list
-        else:
-            left_group_list.extend(right_group_list)
-
-    return left
-
-
 @intrinsic
 def init_dataframe_groupby(typingctx, parent, column_id, data, sort, target_columns=None):
 
@@ -193,34 +177,34 @@ def sdc_pandas_dataframe_getitem(self, idx):
 def _sdc_pandas_groupby_generic_func_codegen(func_name, columns, column_loc,
                                              func_params, defaults, impl_params):
     all_params_as_str = ', '.join(sigparams2list(func_params, defaults))
-    extra_impl_params = ', '.join(kwsparams2list(impl_params))
+    extra_impl_params = ''.join(f', {p}' for p in kwsparams2list(impl_params))
 
     groupby_obj = f'{func_params[0]}'
     df = f'{groupby_obj}._parent'
-    groupby_dict = f'{groupby_obj}._data'
+    groupby_data = f'{groupby_obj}._data'
     groupby_param_sort = f'{groupby_obj}._sort'
     column_names, column_ids = tuple(zip(*columns))
 
     func_lines = [
         f'def _dataframe_groupby_{func_name}_impl({all_params_as_str}):',
-        f'  group_keys = _sdc_asarray([key for key in {groupby_dict}])',
+        f'  key_to_code, group_codes = {groupby_data}',
+        f'  group_keys = _sdc_asarray([key for key in key_to_code])',
         f'  res_index_len = len(group_keys)',
         f'  if {groupby_param_sort}:',
         f'    argsorted_index = sdc_arrays_argsort(group_keys, kind=\'mergesort\')',
     ]
 
-    # TODO: remove conversion from Numba typed.List to reflected one while creating group_arr_{i}
     for i in range(len(columns)):
         col_loc = column_loc[column_names[i]]
         type_id, col_id = col_loc.type_id, col_loc.col_id
         func_lines += [
-            f'  result_data_{i} = numpy.empty(res_index_len, dtype=res_arrays_dtypes[{i}])',
             f'  column_data_{i} = {df}._data[{type_id}][{col_id}]',
-            f'  for j in numpy.arange(res_index_len):',
-            f'    idx = argsorted_index[j] if {groupby_param_sort} else j',
-            f'    group_arr_{i} = _sdc_take(column_data_{i}, list({groupby_dict}[group_keys[idx]]))',
-            f'    group_series_{i} = pandas.Series(group_arr_{i})',
-            f'    result_data_{i}[j] = group_series_{i}.{func_name}({extra_impl_params})',
+            f'  group_results_{i} = numpy.empty(res_index_len, dtype=res_arrays_dtypes[{i}])',
+            f'  groupby_aggregate(column_data_{i}, group_codes, group_results_{i}{extra_impl_params})',
+            f'  if {groupby_param_sort}:',
+            f'    result_data_{i} = _sdc_take(group_results_{i}, argsorted_index)',
+            f'  else:',
+            f'    result_data_{i} = group_results_{i}',
         ]
 
     data = ', '.join(f'\'{column_names[i]}\': result_data_{i}' for i in range(len(columns)))
@@ -237,7 +221,8 @@ def _sdc_pandas_groupby_generic_func_codegen(func_name, columns, column_loc,
                    'numpy': numpy,
                    '_sdc_asarray': _sdc_asarray,
                    '_sdc_take': _sdc_take,
-                   'sdc_arrays_argsort': sdc_arrays_argsort}
+                   'sdc_arrays_argsort': sdc_arrays_argsort,
+                   'groupby_aggregate': groupby_aggregations[func_name]}
 
     return func_text, global_vars
 
@@ -245,29 +230,26 @@ def _sdc_pandas_groupby_generic_func_codegen(func_name, columns, column_loc,
 def _sdc_pandas_series_groupby_generic_func_codegen(func_name, func_params, defaults, impl_params):
 
     all_params_as_str = ', '.join(sigparams2list(func_params, defaults))
-    extra_impl_params = ', '.join(kwsparams2list(impl_params))
+    extra_impl_params = ''.join(f', {p}' for p in kwsparams2list(impl_params))
 
     groupby_obj = f'{func_params[0]}'
     series = f'{groupby_obj}._parent'
-    groupby_dict = f'{groupby_obj}._data'
+    groupby_data = f'{groupby_obj}._data'
     groupby_param_sort = f'{groupby_obj}._sort'
 
-    # TODO: remove conversion from Numba typed.List to reflected one while creating group_arr_{i}
     func_lines = [
         f'def _series_groupby_{func_name}_impl({all_params_as_str}):',
-        f'  group_keys = _sdc_asarray([key for key in {groupby_dict}])',
+        f'  key_to_code, group_codes = {groupby_data}',
+        f'  group_keys = _sdc_asarray([key for key in key_to_code])',
         f'  res_index_len = len(group_keys)',
+        f'  group_results = numpy.empty(res_index_len, dtype=res_dtype)',
+        f'  groupby_aggregate({series}._data, group_codes, group_results{extra_impl_params})',
         f'  if {groupby_param_sort}:',
         f'    argsorted_index = sdc_arrays_argsort(group_keys, kind=\'mergesort\')',
-        f'  result_data = numpy.empty(res_index_len, dtype=res_dtype)',
-        f'  for j in numpy.arange(res_index_len):',
-        f'    idx = argsorted_index[j] if {groupby_param_sort} else j',
-        f'    group_arr = _sdc_take({series}._data, list({groupby_dict}[group_keys[idx]]))',
-        f'    group_series = pandas.Series(group_arr)',
-        f'    result_data[j] = group_series.{func_name}({extra_impl_params})',
-        f'  if {groupby_param_sort}:',
+        f'    result_data = _sdc_take(group_results, argsorted_index)',
         f'    res_index = _sdc_take(group_keys, argsorted_index)',
         f'  else:',
+        f'    result_data = group_results',
         f'    res_index = group_keys',
         f'  return pandas.Series(data=result_data, index=res_index, name={series}._name)'
     ]
@@ -277,7 +259,8 @@ def _sdc_pandas_series_groupby_generic_func_codegen(func_name, func_params, defa
                    'numpy': numpy,
                    '_sdc_asarray': _sdc_asarray,
                    '_sdc_take': _sdc_take,
-                   'sdc_arrays_argsort': sdc_arrays_argsort}
+                   'sdc_arrays_argsort': sdc_arrays_argsort,
+                   'groupby_aggregate': groupby_aggregations[func_name]}
 
     return func_text, global_vars
 
@@ -328,9 +311,7 @@ def sdc_pandas_dataframe_groupby_apply_func(self, func_name, func_args, defaults
     # capture result column types into generated func context
     global_vars['res_arrays_dtypes'] = res_arrays_dtypes
 
-    loc_vars = {}
-    exec(func_text, global_vars, loc_vars)
-    _groupby_method_impl = loc_vars[groupby_func_name]
+    _groupby_method_impl = exec_func_text(func_text, global_vars, groupby_func_name)
 
     return _groupby_method_impl
 
@@ -350,9 +331,7 @@ def sdc_pandas_series_groupby_apply_func(self, func_name, func_args, defaults=No
     # capture result column types into generated func context
     global_vars['res_dtype'] = res_dtype
 
-    loc_vars = {}
-    exec(func_text, global_vars, loc_vars)
-    _groupby_method_impl = loc_vars[groupby_func_name]
+    _groupby_method_impl = exec_func_text(func_text, global_vars, groupby_func_name)
 
     return _groupby_method_impl
 
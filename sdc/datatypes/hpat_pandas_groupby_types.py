@@ -31,6 +31,17 @@ from numba.extending import (models, register_model, make_attribute_wrapper)
 from sdc.str_ext import string_type
 
 
+def groupby_data_type(by_dtype):
+    """
+    Type of the grouping data stored in groupby objects: a dict mapping each key to its dense
+    group code (in order of first appearance) and an array of group codes of all rows (-1 for NA keys).
+    """
+    return types.Tuple([
+        types.containers.DictType(by_dtype, types.int64),
+        types.Array(types.int64, 1, 'C')
+    ])
+
+
 class DataFrameGroupByType(types.Type):
     """
     Type definition for DataFrameGroupBy functions handling.
@@ -52,10 +63,7 @@ class DataFrameGroupByType(types.Type):
 class DataFrameGroupByModel(models.StructModel):
     def __init__(self, dmm, fe_type):
         by_series_dtype = fe_type.parent.data[fe_type.col_id.literal_value].dtype
-        ty_data = types.containers.DictType(
-            by_series_dtype,
-            types.containers.ListType(types.int64)
-        )
+        ty_data = groupby_data_type(by_series_dtype)
 
         n_target_cols = len(fe_type.target_columns)
         members = [
@@ -97,10 +105,7 @@ class SeriesGroupByType(types.Type):
 class SeriesGroupByModel(models.StructModel):
     def __init__(self, dmm, fe_type):
         by_dtype = fe_type.by_data.dtype
-        ty_data = types.containers.DictType(
-            by_dtype,
-            types.containers.ListType(types.int64)
-        )
+        ty_data = groupby_data_type(by_dtype)
 
         members = [
             ('parent', fe_type.parent),
@@ -24,23 +24,33 @@
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 # *****************************************************************************
 
+from pandas.tseries.frequencies import to_offset
+
+from numba import literally
 from numba.core import cgutils, types
 from numba.core.datamodel import StructModel
+from numba.core.errors import TypingError
 from numba.extending import make_attribute_wrapper, models
 from numba.core.typing.templates import signature
 from sdc.utilities.sdc_typing_utils import TypeChecker
 
 
 class RollingType(types.Type):
-    """Type definition for pandas.rolling functions handling."""
-    def __init__(self, ty, data, win_type=None, on=None, closed=None):
+    """
+    Type definition for pandas.rolling functions handling.
+    For time-based windows the window is stored in nanoseconds and
+    time_on is the name of the datetime column the window is calculated on (None for the index).
+    """
+    def __init__(self, ty, data, win_type=None, on=None, closed=None, time_window=False, time_on=None):
         self.data = data
         self.win_type = win_type or types.none
         self.on = on or types.none
         self.closed = closed or types.none
+        self.time_window = time_window
+        self.time_on = time_on
 
-        name_tmpl = '{}({}, win_type={}, on={}, closed={})'
-        name = name_tmpl.format(ty, data, self.win_type, self.on, self.closed)
+        name_tmpl = '{}({}, win_type={}, on={}, closed={}, time_window={}, time_on={})'
+        name = name_tmpl.format(ty, data, self.win_type, self.on, self.closed, self.time_window, self.time_on)
         super(RollingType, self).__init__(name)
 
 
@@ -72,13 +82,16 @@ make_attribute_wrapper(RollingType, 'axis', '_axis')
 make_attribute_wrapper(RollingType, 'closed', '_closed')
 
 
-def gen_hpat_pandas_rolling_init(ty):
+def gen_hpat_pandas_rolling_init(ty, time_window=False):
     """Generate rolling initializer based on data type"""
     def _hpat_pandas_rolling_init(typingctx, self, window, min_periods=None,
                                   center=False, win_type=None,
                                   on=None, axis=0, closed=None):
         """Internal Numba required function to register RollingType."""
-        ret_typ = ty(self, win_type, on, closed)
+        # name of the datetime column is needed at compile time only, so it's kept in the type
+        time_on = on.literal_value if time_window and isinstance(on, types.StringLiteral) else None
+        ret_typ = ty(self, win_type, types.none if time_on else on, closed,
+                     time_window=time_window, time_on=time_on)
         sig = signature(ret_typ, self, window, min_periods,
                         center, win_type, on, axis, closed)
 
@@ -91,7 +104,8 @@ def gen_hpat_pandas_rolling_init(ty):
             rolling.min_periods = min_periods
             rolling.center = center
             rolling.win_type = win_type
-            rolling.on = on
+            if time_on is None:
+                rolling.on = on
             rolling.axis = axis
             rolling.closed = closed
 
@@ -105,15 +119,46 @@ def gen_hpat_pandas_rolling_init(ty):
     return _hpat_pandas_rolling_init
 
 
-def gen_sdc_pandas_rolling_overload_body(initializer, ty):
-    """Generate code of the overloaded method using associated DataType and constructor."""
+def get_rolling_time_window(ty_checker, self, window, on):
+    """
+    Get width of the time-based window in nanoseconds and validate
+    the datetime index or the column the window is calculated on.
+    """
+    offset = window.literal_value
+    try:
+        win = to_offset(offset).nanos
+    except ValueError:
+        raise TypingError('{} Unsupported window: {}. Expected: int or fixed frequency offset'.format(
+            ty_checker.func_name, offset))
+
+    time_on = on.literal_value if isinstance(on, types.StringLiteral) else None
+    if time_on is None:
+        times, name = self.index, 'index'
+    elif time_on in getattr(self, 'columns', ()):
+        times, name = self.data[self.columns.index(time_on)], 'column {}'.format(time_on)
+    else:
+        raise TypingError('{} Invalid on specified as {}, must be a column of DataFrame or None'.format(
+            ty_checker.func_name, time_on))
+
+    if not (isinstance(times, types.Array) and isinstance(times.dtype, types.NPDatetime)):
+        ty_checker.raise_exc(times, 'array of datetime64', name)
+
+    return win
+
+
+def gen_sdc_pandas_rolling_overload_body(initializer, ty, time_initializer=None):
+    """
+    Generate code of the overloaded method using associated DataType and constructor.
+    Offset windows (e.g. '2s') are handled with time_initializer.
+    """
     def sdc_pandas_rolling(self, window, min_periods=None, center=False,
                            win_type=None, on=None, axis=0, closed=None):
         ty_checker = TypeChecker('Method rolling().')
         ty_checker.check(self, ty)
 
-        if not isinstance(window, types.Integer):
-            ty_checker.raise_exc(window, 'int', 'window')
+        time_window = time_initializer is not None and isinstance(window, types.UnicodeType)
+        if not isinstance(window, types.Integer) and not time_window:
+            ty_checker.raise_exc(window, 'int, str', 'window')
 
         minp_accepted = (types.Omitted, types.NoneType, types.Integer)
         if not isinstance(min_periods, minp_accepted) and min_periods is not None:
@@ -139,6 +184,9 @@ def gen_sdc_pandas_rolling_overload_body(initializer, ty):
 
         nan_minp = isinstance(min_periods, (types.Omitted, types.NoneType)) or min_periods is None
 
+        if time_window:
+            return gen_sdc_pandas_time_rolling_impl(time_initializer, ty_checker, self, window, on, nan_minp)
+
         def sdc_pandas_rolling_impl(self, window, min_periods=None, center=False,
                                     win_type=None, on=None, axis=0, closed=None):
             if window < 0:
@@ -176,6 +224,57 @@ def gen_sdc_pandas_rolling_overload_body(initializer, ty):
     return sdc_pandas_rolling
 
 
+def gen_sdc_pandas_time_rolling_impl(initializer, ty_checker, self, window, on, nan_minp):
+    """Generate implementation of rolling() with the time-based window."""
+    # window is converted to nanoseconds and on is resolved to a column at compile time,
+    # so both are needed as literal values
+    if not isinstance(window, types.StringLiteral):
+        def sdc_pandas_rolling_unicode_window_impl(self, window, min_periods=None, center=False,
+                                                   win_type=None, on=None, axis=0, closed=None):
+            return literally(window)
+
+        return sdc_pandas_rolling_unicode_window_impl
+
+    if isinstance(on, types.UnicodeType) and not isinstance(on, types.StringLiteral):
+        def sdc_pandas_rolling_unicode_on_impl(self, window, min_periods=None, center=False,
+                                               win_type=None, on=None, axis=0, closed=None):
+            return literally(on)
+
+        return sdc_pandas_rolling_unicode_on_impl
+
+    win = get_rolling_time_window(ty_checker, self, window, on)
+
+    def sdc_pandas_time_rolling_impl(self, window, min_periods=None, center=False,
+                                     win_type=None, on=None, axis=0, closed=None):
+        if win < 0:
+            raise ValueError('window must be non-negative')
+
+        # time-based windows have variable width, so min_periods is 1 by default
+        if nan_minp == True:  # noqa
+            minp = 1
+        else:
+            minp = min_periods
+
+        if minp < 0:
+            raise ValueError('min_periods must be >= 0')
+
+        if center != False:  # noqa
+            raise ValueError('Method rolling(). The object center\n expected: False')
+
+        if win_type is not None:
+            raise ValueError('Method rolling(). The object win_type\n expected: None')
+
+        if axis != 0:
+            raise ValueError('Method rolling(). The object axis\n expected: 0')
+
+        if closed is not None:
+            raise ValueError('Method rolling(). The object closed\n expected: None')
+
+        return initializer(self, win, minp, center, win_type, on, axis, closed)
+
+    return sdc_pandas_time_rolling_impl
+
+
 sdc_pandas_rolling_docstring_tmpl = """
     Intel Scalable Dataframe Compiler User Guide
     ********************************************
@@ -185,6 +284,10 @@ sdc_pandas_rolling_docstring_tmpl = """
     -----------
     Parameters ``center``, ``win_type``, ``on``, ``axis`` and ``closed`` are supported only with default values.
 
+    Offset ``window`` (e.g. ``'2s'``) is supported for fixed frequencies only and requires
+    datetime64 index or ``on`` column (DataFrame only) sorted in ascending order.
+    Methods ``count``, ``sum``, ``mean``, ``std``, ``var``, ``min`` and ``max`` support such windows.
+
     Examples
     --------
     .. literalinclude:: ../../../examples/{ty_lower}/rolling/{ty_lower}_rolling_min.py
@@ -228,7 +331,7 @@ sdc_pandas_rolling_docstring_tmpl = """
         *unsupported*
     on: :obj:`str`
         Column on which to calculate the rolling window.
-        *unsupported*
+        *supported for offset window only*
     axis: :obj:`int`, :obj:`str`
         Axis along which the operation acts
         0/None/'index' - row-wise operation
@@ -43,7 +43,7 @@ from numba import types
 from numba.core import cgutils
 from numba.np import numpy_support
 from numba.typed import List, Dict
-from numba import prange
+from numba import literally, prange
 from numba.np.arraymath import get_isnan
 from pandas.core.indexing import IndexingError
 
@@ -54,24 +54,30 @@ from sdc.utilities.sdc_typing_utils import (TypeChecker, check_index_is_numeric,
                                             has_python_value)
 from sdc.datatypes.range_index_type import RangeIndexType
 from sdc.datatypes.int64_index_type import Int64IndexType
-from sdc.datatypes.common_functions import (sdc_join_series_indexes, sdc_arrays_argsort, sdc_reindex_series)
+from sdc.datatypes.common_functions import (sdc_join_series_indexes, sdc_arrays_argsort, sdc_reindex_series,
+                                            _sdc_take)
 from sdc.datatypes.hpat_pandas_rolling_types import (
     gen_sdc_pandas_rolling_overload_body, sdc_pandas_rolling_docstring_tmpl)
-from sdc.datatypes.hpat_pandas_series_rolling_types import _hpat_pandas_series_rolling_init
+from sdc.datatypes.hpat_pandas_series_rolling_types import (
+    _hpat_pandas_series_rolling_init, _hpat_pandas_series_time_rolling_init)
 from sdc.datatypes.hpat_pandas_stringmethods_types import StringMethodsType
 from sdc.datatypes.hpat_pandas_getitem_types import SeriesGetitemAccessorType
 from sdc.hiframes.pd_series_type import SeriesType
 from sdc.str_arr_type import (StringArrayType, string_array_type)
-from sdc.str_arr_ext import (str_arr_is_na, str_arr_set_na, num_total_chars,
-                             pre_alloc_string_array, cp_str_list_to_array,
-                             create_str_arr_from_list, str_arr_set_na_by_mask,
-                             str_list_to_array)
-from sdc.utilities.utils import to_array, sdc_overload, sdc_overload_method, sdc_overload_attribute
+from sdc.str_arr_ext import str_arr_set_na, str_list_to_array
+from sdc.functions.str_arr_kernels import str_arr_add_by_indexers, str_arr_from_list, str_arr_mul_by_indexers
+from sdc.utilities.utils import (to_array, sdc_overload, sdc_overload_method, sdc_overload_attribute,
+                                 sdc_register_jitable)
 from sdc import sdc_autogenerated
 from sdc.functions import numpy_like
 from sdc.hiframes.api import isna
 from sdc.datatypes.hpat_pandas_groupby_functions import init_series_groupby
+from sdc.functions.groupby import count_codes, factorize_keys
 from sdc.utilities.prange_utils import parallel_chunks
+from sdc.extensions.indexes.index_engine import index_engine_get_locs
+from sdc.io.csv_write import (gen_index_field, gen_to_csv_func_text, get_to_csv_params, is_csv_writable_type,
+                              to_csv_signature)
+from sdc.utilities.compile_cache import exec_func_text
 
 from .pandas_series_functions import apply
 from .pandas_series_functions import map as _map
@@ -102,6 +108,9 @@ def hpat_pandas_series_accessor_getitem(self, idx):
         return None
 
     accessor = self.accessor.literal_value
+    # lookups by integer labels in Int64Index use its cached engine instead of full scan
+    use_index_engine = (isinstance(self.series.index, Int64IndexType)
+                        and isinstance(self.series.data, (types.Array, StringArrayType)))
 
     if accessor == 'iloc':
         if isinstance(idx, (types.List, types.Array, types.SliceType)):
@@ -233,6 +242,16 @@ def hpat_pandas_series_accessor_getitem(self, idx):
 
             return hpat_pandas_series_loc_array_impl
 
+        if isinstance(idx, types.Integer) and use_index_engine:
+            def hpat_pandas_series_loc_int64_index_impl(self, idx):
+                index = self._series.index
+                positions = index_engine_get_locs(index, idx)
+                return pandas.Series(data=_sdc_take(self._series._data, positions),
+                                     index=index[positions],
+                                     name=self._series._name)
+
+            return hpat_pandas_series_loc_int64_index_impl
+
         if isinstance(idx, (int, types.Integer, types.UnicodeType, types.StringLiteral)):
             def hpat_pandas_series_loc_impl(self, idx):
                 index = self._series.index
@@ -247,6 +266,15 @@ def hpat_pandas_series_accessor_getitem(self, idx):
                           Given: {}'.format(_func_name, idx))
 
     if accessor == 'at':
+        if isinstance(idx, types.Integer) and use_index_engine:
+            def hpat_pandas_series_at_int64_index_impl(self, idx):
+                positions = index_engine_get_locs(self._series.index, idx)
+                if len(positions) == 0:
+                    raise ValueError("Index is not in the Series")
+                return _sdc_take(self._series._data, positions)
+
+            return hpat_pandas_series_at_int64_index_impl
+
         if isinstance(idx, (int, types.Integer, types.UnicodeType, types.StringLiteral)):
             def hpat_pandas_series_at_impl(self, idx):
                 index = self._series.index
@@ -1366,6 +1394,55 @@ def hpat_pandas_series_values(self):
     return hpat_pandas_series_values_impl
 
 
+@sdc_register_jitable
+def _value_counts_order(counts, sort, ascending):
+    """Get order of the value_counts() result"""
+    indexes_order = numpy.arange(len(counts))
+    if sort:
+        indexes_order = numpy_like.argsort(counts)
+        if not ascending:
+            indexes_order = indexes_order[::-1]
+
+    return indexes_order
+
+
+@sdc_register_jitable
+def _value_counts_normalize(counts, total):
+    return counts / total
+
+
+@sdc_register_jitable
+def _value_counts_as_is(counts, total):
+    return counts
+
+
+@sdc_register_jitable
+def _value_counts_bins_codes(data, bins):
+    """Split the data range into equal-width bins and find bin of each element the same way as pandas.cut"""
+    mn, mx = numpy.float64(numpy.nanmin(data)), numpy.float64(numpy.nanmax(data))
+    if numpy.isinf(mn) or numpy.isinf(mx):
+        raise ValueError('cannot specify integer `bins` when input data contains infinity')
+
+    if mn == mx:
+        mn -= 0.001 * abs(mn) if mn != 0 else 0.001
+        mx += 0.001 * abs(mx) if mx != 0 else 0.001
+        edges = numpy.linspace(mn, mx, bins + 1)
+    else:
+        edges = numpy.linspace(mn, mx, bins + 1)
+        # bins are closed on the right, so the first one is extended to include the minimum
+        edges[0] -= (mx - mn) * 0.001
+
+    codes = numpy.empty(len(data), dtype=numpy.int64)
+    for i in prange(len(data)):
+        value = data[i]
+        if numpy.isnan(value):
+            codes[i] = -1
+        else:
+            codes[i] = numpy.searchsorted(edges, value) - 1
+
+    return edges, codes
+
+
 @sdc_overload_method(SeriesType, 'value_counts')
 def hpat_pandas_series_value_counts(self, normalize=False, sort=True, ascending=False, bins=None, dropna=True):
     """
@@ -1376,8 +1453,8 @@ def hpat_pandas_series_value_counts(self, normalize=False, sort=True, ascending=
 
     Limitations
     -----------
-    - Parameters ``normalize`` and ``bins`` are currently unsupported.
-    - Parameter ``dropna`` is unsupported for String Series.
+    - Parameter ``bins`` is supported as an integer number of equal-width bins for numeric Series only.
+    The resulting index holds right edges of the bins instead of :class:`pandas.IntervalIndex`.
     - Elements with the same count might appear in result in a different order than in Pandas.
     - This function may reveal slower performance than Pandas* on user system. Users should exercise a tradeoff
     between staying in JIT-region with that function or going back to interpreter mode.
@@ -1403,6 +1480,8 @@ def hpat_pandas_series_value_counts(self, normalize=False, sort=True, ascending=
 
     .. only:: developer
         Test: python -m sdc.runtests -k sdc.tests.test_series.TestSeries.test_series_value_counts*
+
+    Values are factorized with per-chunk hash tables merged at the end and then counted in parallel.
     """
 
     _func_name = 'Method value_counts().'
@@ -1410,7 +1489,7 @@ def hpat_pandas_series_value_counts(self, normalize=False, sort=True, ascending=
     ty_checker = TypeChecker('Method value_counts().')
     ty_checker.check(self, SeriesType)
 
-    if not isinstance(normalize, (types.Omitted, types.Boolean, bool)) and normalize is True:
+    if not isinstance(normalize, (types.Omitted, types.Boolean, bool)):
         ty_checker.raise_exc(normalize, 'boolean', 'normalize')
 
     if not isinstance(sort, (types.Omitted, types.Boolean, bool)):
@@ -1419,59 +1498,80 @@ def hpat_pandas_series_value_counts(self, normalize=False, sort=True, ascending=
     if not isinstance(ascending, (types.Omitted, types.Boolean, bool)):
         ty_checker.raise_exc(ascending, 'boolean', 'ascending')
 
-    if not isinstance(bins, (types.Omitted, types.NoneType)) and bins is not None:
-        ty_checker.raise_exc(bins, 'boolean', 'bins')
+    if not isinstance(bins, (types.Omitted, types.NoneType, types.Integer)) and bins is not None:
+        ty_checker.raise_exc(bins, 'int', 'bins')
 
     if not isinstance(dropna, (types.Omitted, types.Boolean, bool)):
         ty_checker.raise_exc(dropna, 'boolean', 'dropna')
 
-    if isinstance(self.data, StringArrayType):
-        def hpat_pandas_series_value_counts_str_impl(
+    if isinstance(normalize, types.Boolean) and not isinstance(normalize, types.Literal):
+        def hpat_pandas_series_value_counts_normalize_impl(
                 self, normalize=False, sort=True, ascending=False, bins=None, dropna=True):
+            # resulting Series dtype depends on normalize, so it's needed as a literal value
+            return literally(normalize)
 
-            value_counts_dict = Dict.empty(
-                key_type=types.unicode_type,
-                value_type=types.intp
-            )
+        return hpat_pandas_series_value_counts_normalize_impl
+
+    if isinstance(normalize, types.Omitted):
+        normalize_value = normalize.value
+    elif isinstance(normalize, types.Literal):
+        normalize_value = normalize.literal_value
+    else:
+        normalize_value = normalize
+    get_counts = _value_counts_normalize if normalize_value else _value_counts_as_is
+
+    use_bins = not (isinstance(bins, (types.Omitted, types.NoneType)) or bins is None)
+    if use_bins:
+        if not isinstance(self.dtype, types.Number):
+            raise TypingError('{} Parameter bins is supported for numeric Series only. Given: {}'.format(
+                _func_name, self.dtype))
 
-            nan_counts = 0
-            for i, value in enumerate(self._data):
-                if str_arr_is_na(self._data, i):
-                    if not dropna:
-                        nan_counts += 1
-                    continue
+        def hpat_pandas_series_value_counts_bins_impl(
+                self, normalize=False, sort=True, ascending=False, bins=None, dropna=True):
+            if bins < 1:
+                raise ValueError('`bins` should be a positive integer.')
 
-                value_counts_dict[value] = value_counts_dict.get(value, 0) + 1
+            edges, codes = _value_counts_bins_codes(self._data, bins)
+            # like pandas, elements out of the bins (i.e. NaNs) are dropped anyway
+            # and are not counted in the total used by normalize
+            counts = count_codes(codes, bins)[:bins]
+            labels = edges[1:]
 
-            need_add_nan_count = not dropna and nan_counts
+            indexes_order = _value_counts_order(counts, sort, ascending)
+            counts_sorted = get_counts(numpy.take(counts, indexes_order), counts.sum())
 
-            values = [key for key in value_counts_dict]
-            counts_as_list = [value_counts_dict[key] for key in value_counts_dict.keys()]
-            values_len = len(values)
+            return pandas.Series(counts_sorted, index=numpy.take(labels, indexes_order), name=self._name)
 
-            if need_add_nan_count:
-                # append a separate empty string for NaN elements
-                values_len += 1
-                values.append('')
-                counts_as_list.append(nan_counts)
-
-            counts = numpy.asarray(counts_as_list, dtype=numpy.intp)
-            indexes_order = numpy.arange(values_len)
-            if sort:
-                indexes_order = numpy_like.argsort(counts)
-                if not ascending:
-                    indexes_order = indexes_order[::-1]
-
-            counts_sorted = numpy.take(counts, indexes_order)
+        return hpat_pandas_series_value_counts_bins_impl
+
+    if isinstance(self.data, StringArrayType):
+        def hpat_pandas_series_value_counts_str_impl(
+                self, normalize=False, sort=True, ascending=False, bins=None, dropna=True):
+
+            key_to_code, codes = factorize_keys(self._data)
+            n_keys = len(key_to_code)
+            counts = count_codes(codes, n_keys)
+
+            # the last count is the number of NaN elements, it's kept only if they are counted
+            need_add_nan_count = not dropna and counts[n_keys] > 0
+            values_len = n_keys + 1 if need_add_nan_count else n_keys
+            counts = counts[:values_len]
+
+            # append a separate empty string for NaN elements
+            values = [''] * values_len
+            for value, code in key_to_code.items():
+                values[code] = value
+
+            indexes_order = _value_counts_order(counts, sort, ascending)
+            counts_sorted = get_counts(numpy.take(counts, indexes_order), counts.sum())
             values_sorted_by_count = [values[i] for i in indexes_order]
 
             # allocate the result index as a StringArray and copy values to it
-            result_index = create_str_arr_from_list(values_sorted_by_count)
+            result_index = str_arr_from_list(values_sorted_by_count)
             if need_add_nan_count:
                 # set null bit for StringArray element corresponding to NaN element (was added as last in values)
-                index_previous_nan_pos = values_len - 1
                 for i in numpy.arange(values_len):
-                    if indexes_order[i] == index_previous_nan_pos:
+                    if indexes_order[i] == n_keys:
                         str_arr_set_na(result_index, i)
                         break
 
@@ -1481,53 +1581,31 @@ def hpat_pandas_series_value_counts(self, normalize=False, sort=True, ascending=
 
     elif isinstance(self.dtype, (types.Number, types.Boolean)):
 
-        series_dtype = self.dtype
+        # only float values can be NaN, which are counted separately
+        can_be_nan = isinstance(self.dtype, types.Float)
         def hpat_pandas_series_value_counts_number_impl(
                 self, normalize=False, sort=True, ascending=False, bins=None, dropna=True):
 
-            value_counts_dict = Dict.empty(
-                key_type=series_dtype,
-                value_type=types.intp
-            )
+            # Pandas hash-based value_count_float64 function doesn't distinguish between
+            # positive and negative zeros, so does the dict, hence the first zero found in the Series is the key
+            key_to_code, codes = factorize_keys(self._data)
+            n_keys = len(key_to_code)
+            counts = count_codes(codes, n_keys)
 
-            zero_counts = 0
-            is_zero_found = False
-            for value in self._data:
-                if (dropna and numpy.isnan(value)):
-                    continue
-
-                # Pandas hash-based value_count_float64 function doesn't distinguish between
-                # positive and negative zeros, hence we count zero values separately and store
-                # as a key the first zero value found in the Series
-                if not value:
-                    zero_counts += 1
-                    if not is_zero_found:
-                        zero_value = value
-                        is_zero_found = True
-                    continue
-
-                value_counts_dict[value] = value_counts_dict.get(value, 0) + 1
-
-            if zero_counts:
-                value_counts_dict[zero_value] = zero_counts
-
-            unique_values = numpy.asarray(
-                list(value_counts_dict),
-                dtype=self._data.dtype
-            )
-            value_counts = numpy.asarray(
-                [value_counts_dict[key] for key in value_counts_dict],
-                dtype=numpy.intp
-            )
+            need_add_nan_count = not dropna and counts[n_keys] > 0
+            values_len = n_keys + 1 if need_add_nan_count else n_keys
+            counts = counts[:values_len]
 
-            indexes_order = numpy.arange(len(value_counts))
-            if sort:
-                indexes_order = numpy_like.argsort(value_counts)
-                if not ascending:
-                    indexes_order = indexes_order[::-1]
+            unique_values = numpy.empty(values_len, dtype=self._data.dtype)
+            for value, code in key_to_code.items():
+                unique_values[code] = value
+            if can_be_nan == True:  # noqa
+                if need_add_nan_count:
+                    unique_values[n_keys] = numpy.nan
 
+            indexes_order = _value_counts_order(counts, sort, ascending)
             sorted_unique_values = numpy.take(unique_values, indexes_order)
-            sorted_value_counts = numpy.take(value_counts, indexes_order)
+            sorted_value_counts = get_counts(numpy.take(counts, indexes_order), counts.sum())
 
             return pandas.Series(sorted_value_counts, index=sorted_unique_values, name=self._name)
 
@@ -1666,7 +1744,8 @@ def hpat_pandas_series_index(self):
 
 
 hpat_pandas_series_rolling = sdc_overload_method(SeriesType, 'rolling')(
-    gen_sdc_pandas_rolling_overload_body(_hpat_pandas_series_rolling_init, SeriesType))
+    gen_sdc_pandas_rolling_overload_body(_hpat_pandas_series_rolling_init, SeriesType,
+                                         time_initializer=_hpat_pandas_series_time_rolling_init))
 hpat_pandas_series_rolling.__doc__ = sdc_pandas_rolling_docstring_tmpl.format(
     ty='Series', ty_lower='series')
 
@@ -4566,18 +4645,10 @@ def sdc_pandas_str_series_operator_add(self, other):
                     min_data_size = min(left_size, right_size)
                     max_data_size = max(left_size, right_size)
 
-                    result_data_as_list = []
-                    result_nan_mask = numpy.zeros(max_data_size, dtype=numpy.bool_)
-                    result_nan_mask[min_data_size:] = True
-                    for i in numpy.arange(min_data_size):
-                        if str_arr_is_na(self._data, i) or str_arr_is_na(other._data, i):
-                            result_nan_mask[i] = True
-                            result_data_as_list.append('')
-                        else:
-                            result_data_as_list.append(self._data[i] + other._data[i])
-                    result_data_as_list.extend([''] * (max_data_size - min_data_size))
-                    result_data = create_str_arr_from_list(result_data_as_list)
-                    str_arr_set_na_by_mask(result_data, result_nan_mask)
+                    # elements missing in the shorter series produce NaNs
+                    indexer = numpy.arange(max_data_size)
+                    indexer[min_data_size:] = -1
+                    result_data = str_arr_add_by_indexers(self._data, other._data, indexer, indexer)
 
                     return pandas.Series(result_data, self._index)
 
@@ -4610,21 +4681,7 @@ def sdc_pandas_str_series_operator_add(self, other):
                 # TODO: replace below with core join(how='outer', return_indexers=True) when implemented
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
 
-                result_size = len(joined_index)
-                result_nan_mask = numpy.zeros(result_size, dtype=numpy.bool_)
-                result_data_as_list = []
-                for i in numpy.arange(result_size):
-                    if (left_indexer[i] == -1
-                            or right_indexer[i] == -1
-                            or str_arr_is_na(self._data, left_indexer[i])
-                            or str_arr_is_na(other._data, right_indexer[i])):
-                        result_nan_mask[i] = True
-                        result_data_as_list.append('')
-                    else:
-                        result_data_as_list.append(self._data[left_indexer[i]] + other._data[right_indexer[i]])
-
-                result_data = create_str_arr_from_list(result_data_as_list)
-                str_arr_set_na_by_mask(result_data, result_nan_mask)
+                result_data = str_arr_add_by_indexers(self._data, other._data, left_indexer, right_indexer)
 
                 return pandas.Series(result_data, joined_index)
 
@@ -4688,12 +4745,9 @@ def sdc_pandas_str_series_operator_mul(self, other):
         return _series_operator_mul_scalar_impl
     else:   # both operands are series (one is integer and other is string)
 
-        self_is_series = isinstance(self, SeriesType)
         # optimization for series with default indexes, that can be aligned differently
         if (isinstance(self.index, types.NoneType) and isinstance(other.index, types.NoneType)):
             def _series_operator_mul_none_indexes_impl(self, other):
-
-                series_operand = self if self_is_series == True else other  # noqa
                 if (len(self._data) == len(other._data)):
                     result_data = self._data * other._data
                     return pandas.Series(result_data)
@@ -4702,17 +4756,13 @@ def sdc_pandas_str_series_operator_mul(self, other):
                     min_data_size = min(left_size, right_size)
                     max_data_size = max(left_size, right_size)
 
-                    result_data_as_list = []
-                    result_nan_mask = numpy.zeros(max_data_size, dtype=numpy.bool_)
-                    result_nan_mask[min_data_size:] = True
-                    for i in numpy.arange(min_data_size):
-                        if str_arr_is_na(series_operand._data, i):
-                            result_nan_mask[i] = True
-                            result_data_as_list.append('')
-                        result_data_as_list.append(self._data[i] * other._data[i])
-                    result_data_as_list.extend([''] * (max_data_size - min_data_size))
-                    result_data = create_str_arr_from_list(result_data_as_list)
-                    str_arr_set_na_by_mask(result_data, result_nan_mask)
+                    # elements missing in the shorter series produce NaNs
+                    indexer = numpy.arange(max_data_size)
+                    indexer[min_data_size:] = -1
+                    if self_is_string_series == True:  # noqa
+                        result_data = str_arr_mul_by_indexers(self._data, other._data, indexer, indexer)
+                    else:
+                        result_data = str_arr_mul_by_indexers(other._data, self._data, indexer, indexer)
 
                     return pandas.Series(result_data, self._index)
 
@@ -4744,22 +4794,10 @@ def sdc_pandas_str_series_operator_mul(self, other):
                 # TODO: replace below with core join(how='outer', return_indexers=True) when implemented
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
 
-                str_series_operand = self if self_is_string_series == True else other  # noqa
-                str_series_indexer = left_indexer if self_is_string_series == True else right_indexer  # noqa
-                result_size = len(joined_index)
-                result_nan_mask = numpy.zeros(result_size, dtype=numpy.bool_)
-                result_data_as_list = []
-                for i in numpy.arange(result_size):
-                    if (left_indexer[i] == -1
-                            or right_indexer[i] == -1
-                            or str_arr_is_na(str_series_operand._data, str_series_indexer[i])):
-                        result_nan_mask[i] = True
-                        result_data_as_list.append('')
-                    else:
-                        result_data_as_list.append(self._data[left_indexer[i]] * other._data[right_indexer[i]])
-
-                result_data = create_str_arr_from_list(result_data_as_list)
-                str_arr_set_na_by_mask(result_data, result_nan_mask)
+                if self_is_string_series == True:  # noqa
+                    result_data = str_arr_mul_by_indexers(self._data, other._data, left_indexer, right_indexer)
+                else:
+                    result_data = str_arr_mul_by_indexers(other._data, self._data, right_indexer, left_indexer)
 
                 return pandas.Series(result_data, joined_index)
 
@@ -4838,22 +4876,13 @@ are currently unsupported by Intel Scalable Dataframe Compiler
     if not (observed is False or isinstance(observed, types.Omitted)):
         raise TypingError('{} Unsupported parameters. Given inplace: {}'.format(_func_name, observed))
 
-    by_type = by.dtype
-    list_type = types.ListType(types.int64)
     def sdc_pandas_series_groupby_impl(self, by=None, axis=0, level=None, as_index=True, sort=True,
                                        group_keys=True, squeeze=False, observed=False):
 
         if len(self) != len(by):
             raise ValueError("Series.groupby(). Grouper and axis must be same length")
 
-        grouped = Dict.empty(by_type, list_type)
-        for i in numpy.arange(len(by)):
-            if isna(by, i):
-                continue
-            value = by[i]
-            group_list = grouped.get(value, List.empty_list(types.int64))
-            group_list.append(i)
-            grouped[value] = group_list
+        grouped = factorize_keys(by)
 
         return init_series_groupby(self, by, grouped, sort)
 
@@ -4922,3 +4951,71 @@ def sdc_pandas_series_skew(self, axis=None, skipna=None, level=None, numeric_onl
         return numpy_like.skew(self._data)
 
     return sdc_pandas_series_skew_impl
+
+
+@sdc_overload_method(SeriesType, 'to_csv')
+def hpat_pandas_series_to_csv(self, path_or_buf=None, sep=',', na_rep='', float_format=None, columns=None,
+                              header=True, index=True, index_label=None, mode='w', encoding=None,
+                              compression='infer', quoting=None, quotechar='"', line_terminator=None,
+                              chunksize=None, date_format=None, doublequote=True, escapechar=None, decimal='.'):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.Series.to_csv
+
+    Limitations
+    -----------
+    - Parameters ``sep``, ``na_rep``, ``header``, ``index``, ``index_label``, ``quotechar`` and \
+        ``line_terminator`` should be constants, ``header`` is supported only as bool.
+    - Parameters ``float_format``, ``columns``, ``mode``, ``encoding``, ``compression``, ``quoting``, \
+        ``chunksize``, ``date_format``, ``doublequote``, ``escapechar`` and ``decimal`` are supported \
+        only with default values.
+    - Series of numeric and boolean dtypes and string Series are supported.
+    - Rows are formatted in parallel, the file is written in parallel by parts at their offsets.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Pandas Series method :meth:`pandas.Series.to_csv` implementation.
+
+    .. only:: developer
+        Test: python -m sdc.runtests -k sdc.tests.test_io.TestCSV.test_series_to_csv*
+    """
+
+    _func_name = 'to_csv'
+
+    ty_checker = TypeChecker('Method {}().'.format(_func_name))
+    ty_checker.check(self, SeriesType)
+
+    if not is_csv_writable_type(self.data):
+        ty_checker.raise_exc(self.data, 'array of numbers, booleans or strings', 'self.data')
+
+    params = get_to_csv_params(_func_name, {
+        'path_or_buf': path_or_buf, 'sep': sep, 'na_rep': na_rep, 'float_format': float_format,
+        'columns': columns, 'header': header, 'index': index, 'index_label': index_label, 'mode': mode,
+        'encoding': encoding, 'compression': compression, 'quoting': quoting, 'quotechar': quotechar,
+        'line_terminator': line_terminator, 'chunksize': chunksize, 'date_format': date_format,
+        'doublequote': doublequote, 'escapechar': escapechar, 'decimal': decimal})
+
+    init_lines, fields, names, name_exprs = [], [], [], {}
+    if params['index']:
+        index_field = gen_index_field(self.index, 'self._index')
+        if index_field is None:
+            ty_checker.raise_exc(self.index, 'supported index', 'self.index')
+        index_lines, field, index_name_expr = index_field
+        init_lines += index_lines
+        fields.append(field)
+        names.append(params['index_label'] or '')
+        if params['index_label'] is None and index_name_expr is not None:
+            name_exprs[0] = index_name_expr
+
+    # unnamed Series is written as a column named 0 like pandas does
+    if self.is_named:
+        name_exprs[len(names)] = 'self._name'
+    names.append('0')
+    init_lines.append('  data = self._data')
+    fields.append(('data', self.data, None))
+
+    func_text, global_vars = gen_to_csv_func_text('_series_to_csv_impl', f'self, {to_csv_signature}', init_lines,
+                                                  fields, 'len(self)', names, params, name_exprs)
+
+    return exec_func_text(func_text, global_vars, '_series_to_csv_impl')
@@ -30,7 +30,7 @@ import pandas
 from functools import partial
 
 from numba import prange
-from numba.extending import register_jitable
+from numba.core.errors import TypingError
 from numba.core.types import (float64, Boolean, Integer, NoneType, Number,
                          Omitted, StringLiteral, UnicodeType)
 
@@ -118,24 +118,6 @@ def arr_mean(arr):
     return arr.mean()
 
 
-@sdc_register_jitable
-def arr_median(arr):
-    """Calculate median of values"""
-    if len(arr) == 0:
-        return numpy.nan
-
-    return numpy.median(arr)
-
-
-@sdc_register_jitable
-def arr_quantile(arr, q):
-    """Calculate quantile of values"""
-    if len(arr) == 0:
-        return numpy.nan
-
-    return numpy.quantile(arr, q)
-
-
 def gen_hpat_pandas_series_rolling_impl(rolling_func):
     """Generate series rolling methods implementations based on input func"""
     def impl(self):
@@ -200,10 +182,6 @@ def gen_hpat_pandas_series_rolling_ddof_impl(rolling_func):
     return impl
 
 
-hpat_pandas_rolling_series_median_impl = register_jitable(
-    gen_hpat_pandas_series_rolling_impl(arr_median))
-
-
 @sdc_register_jitable
 def pop_corr(x, y, nfinite, result):
     """Calculate the window sums for corr without old value."""
@@ -330,79 +308,67 @@ def pop_kurt(value, nfinite, result):
 
 
 @sdc_register_jitable
-def calc_max(arr, idx, win_size):
-    """Recalculate the window max based on data, index and window size."""
-    start = max(0, idx - win_size + 1)
-    nfinite = 0
-    result = numpy.nan
-    for i in range(start, idx + 1):
-        value = arr[i]
-        nfinite, result = put_max(value, nfinite, result)
-
-    return nfinite, result
+def max_dominates(value, new_value):
+    """Check the new value makes the old one never be the window max."""
+    return value <= new_value
 
 
 @sdc_register_jitable
-def pop_max(value, nfinite, result, arr, idx, win_size):
-    """Calculate the window max without old value."""
-    if numpy.isfinite(value):
-        nfinite -= 1
-        if nfinite:
-            if value == result:
-                return calc_max(arr, idx, win_size)
-        else:
-            result = numpy.nan
-
-    return nfinite, result
+def min_dominates(value, new_value):
+    """Check the new value makes the old one never be the window min."""
+    return value >= new_value
 
 
 @sdc_register_jitable
-def put_max(value, nfinite, result):
-    """Calculate the window max with new value."""
-    if numpy.isfinite(value):
-        nfinite += 1
-        if numpy.isnan(result) or value > result:
-            result = value
-
-    return nfinite, result
+def fenwick_add(tree, pos, delta):
+    """Add delta to the count of position in the Fenwick tree."""
+    idx = pos + 1
+    while idx < len(tree):
+        tree[idx] += delta
+        idx += idx & -idx
 
 
 @sdc_register_jitable
-def calc_min(arr, idx, win_size):
-    """Recalculate the window min based on data, index and window size."""
-    start = max(0, idx - win_size + 1)
-    nfinite = 0
-    result = numpy.nan
-    for i in range(start, idx + 1):
-        value = arr[i]
-        nfinite, result = put_min(value, nfinite, result)
+def fenwick_find(tree, k):
+    """Find position of the k-th (0-based) counted item in the Fenwick tree."""
+    pos = 0
+    step = 1
+    while step * 2 < len(tree):
+        step *= 2
 
-    return nfinite, result
+    while step:
+        next_pos = pos + step
+        if next_pos < len(tree) and tree[next_pos] <= k:
+            pos = next_pos
+            k -= tree[next_pos]
+        step //= 2
+
+    return pos
 
 
 @sdc_register_jitable
-def pop_min(value, nfinite, result, arr, idx, win_size):
-    """Calculate the window min without old value."""
-    if numpy.isfinite(value):
-        nfinite -= 1
-        if nfinite:
-            if value == result:
-                return calc_min(arr, idx, win_size)
-        else:
-            result = numpy.nan
+def order_stat_median(tree, sorted_values, nfinite, q):
+    """Calculate the window median based on Fenwick tree of value ranks."""
+    mid = nfinite // 2
+    high = sorted_values[fenwick_find(tree, mid)]
+    if nfinite % 2:
+        return float64(high)
 
-    return nfinite, result
+    low = sorted_values[fenwick_find(tree, mid - 1)]
+    return (low + high) / 2
 
 
 @sdc_register_jitable
-def put_min(value, nfinite, result):
-    """Calculate the window min with new value."""
-    if numpy.isfinite(value):
-        nfinite += 1
-        if numpy.isnan(result) or value < result:
-            result = value
+def order_stat_quantile(tree, sorted_values, nfinite, q):
+    """Calculate the window quantile with linear interpolation based on Fenwick tree of value ranks."""
+    pos = q * (nfinite - 1)
+    low_pos = int(pos)
+    low = sorted_values[fenwick_find(tree, low_pos)]
+    if low_pos == pos:
+        return float64(low)
 
-    return nfinite, result
+    high = sorted_values[fenwick_find(tree, low_pos + 1)]
+    return low + (high - low) * (pos - low_pos)
 
 
 @sdc_register_jitable
@@ -536,6 +502,15 @@ def kurt_result_or_nan(nfinite, minp, result):
     return res
 
 
+@sdc_register_jitable
+def count_result_or_nan(nfinite, minp, result):
+    """Get result count taking into account min periods."""
+    if result < minp:
+        return numpy.nan
+
+    return result
+
+
 @sdc_register_jitable
 def mean_result_or_nan(nfinite, minp, result):
     """Get result mean taking into account min periods."""
@@ -633,8 +608,13 @@ def gen_sdc_pandas_series_rolling_impl(pop, put, get_result=result_or_nan,
     return impl
 
 
-def gen_sdc_pandas_series_rolling_minmax_impl(pop, put, init_result=numpy.nan):
-    """Generate series rolling min/max implementations based on pop/put funcs"""
+def gen_sdc_pandas_series_rolling_minmax_impl(dominates):
+    """
+    Generate series rolling min/max implementations based on monotonic deque:
+    indices of the window values are kept in a ring buffer in the order of their positions
+    dropping values dominated by the new ones, so that the front one is the result
+    and each value is put and popped at most once
+    """
     def impl(self):
         win = self._window
         minp = self._min_periods
@@ -648,41 +628,105 @@ def gen_sdc_pandas_series_rolling_minmax_impl(pop, put, init_result=numpy.nan):
         for i in prange(len(chunks)):
             chunk = chunks[i]
             nfinite = 0
-            result = init_result
 
             if win == 0:
                 for idx in range(chunk.start, chunk.stop):
-                    output_arr[idx] = result_or_nan(nfinite, minp, result)
+                    output_arr[idx] = result_or_nan(nfinite, minp, numpy.nan)
                 continue
 
             prelude_start = max(0, chunk.start - win + 1)
-            prelude_stop = chunk.start
 
-            interlude_start = prelude_stop
-            interlude_stop = min(prelude_start + win, chunk.stop)
+            deque_size = min(win, chunk.stop - prelude_start)
+            deque = numpy.empty(deque_size, dtype=numpy.int64)
+            head, size = 0, 0
+            for idx in range(prelude_start, chunk.stop):
+                pop_idx = idx - win
+                if pop_idx >= prelude_start:
+                    if numpy.isfinite(input_arr[pop_idx]):
+                        nfinite -= 1
+                    if size and deque[head] == pop_idx:
+                        head = (head + 1) % deque_size
+                        size -= 1
 
-            for idx in range(prelude_start, prelude_stop):
                 value = input_arr[idx]
-                nfinite, result = put(value, nfinite, result)
-
-            for idx in range(interlude_start, interlude_stop):
-                value = input_arr[idx]
-                nfinite, result = put(value, nfinite, result)
-                output_arr[idx] = result_or_nan(nfinite, minp, result)
-
-            for idx in range(interlude_stop, chunk.stop):
-                put_value = input_arr[idx]
-                pop_value = input_arr[idx - win]
-                nfinite, result = put(put_value, nfinite, result)
-                nfinite, result = pop(pop_value, nfinite, result,
-                                      input_arr, idx, win)
-                output_arr[idx] = result_or_nan(nfinite, minp, result)
+                if numpy.isfinite(value):
+                    nfinite += 1
+                    while size and dominates(input_arr[deque[(head + size - 1) % deque_size]], value):
+                        size -= 1
+                    deque[(head + size) % deque_size] = idx
+                    size += 1
+
+                if idx >= chunk.start:
+                    result = input_arr[deque[head]] if size else numpy.nan
+                    output_arr[idx] = result_or_nan(nfinite, minp, result)
 
         return pandas.Series(output_arr, input_series._index,
                              name=input_series._name)
     return impl
 
 
+def gen_sdc_rolling_order_stat_kernel(order_stat):
+    """
+    Generate rolling order statistic kernel: values of the chunk and its prelude are sorted once
+    and counts of their ranks in the window are kept in Fenwick tree, so that
+    putting, popping and searching the k-th window value take O(log(chunk + window)) time
+    """
+    def kernel(input_arr, win, minp, q):
+        length = len(input_arr)
+        output_arr = numpy.empty(length, dtype=float64)
+
+        chunks = parallel_chunks(length)
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+
+            if win == 0:
+                for idx in range(chunk.start, chunk.stop):
+                    output_arr[idx] = numpy.nan
+                continue
+
+            prelude_start = max(0, chunk.start - win + 1)
+            span = input_arr[prelude_start:chunk.stop]
+            span_size = len(span)
+            order = numpy.argsort(span)
+            sorted_values = span[order]
+            ranks = numpy.empty(span_size, dtype=numpy.int64)
+            for j in range(span_size):
+                ranks[order[j]] = j
+
+            tree = numpy.zeros(span_size + 1, dtype=numpy.int64)
+            nfinite = 0
+            for idx in range(prelude_start, chunk.stop):
+                pop_idx = idx - win
+                if pop_idx >= prelude_start and numpy.isfinite(input_arr[pop_idx]):
+                    fenwick_add(tree, ranks[pop_idx - prelude_start], -1)
+                    nfinite -= 1
+
+                if numpy.isfinite(input_arr[idx]):
+                    fenwick_add(tree, ranks[idx - prelude_start], 1)
+                    nfinite += 1
+
+                if idx >= chunk.start:
+                    if nfinite == 0 or nfinite < minp:
+                        output_arr[idx] = numpy.nan
+                    else:
+                        output_arr[idx] = order_stat(tree, sorted_values, nfinite, q)
+
+        return output_arr
+
+    return kernel
+
+
+sdc_rolling_median_kernel = sdc_register_jitable(gen_sdc_rolling_order_stat_kernel(order_stat_median))
+sdc_rolling_quantile_kernel = sdc_register_jitable(gen_sdc_rolling_order_stat_kernel(order_stat_quantile))
+
+
+def sdc_pandas_series_rolling_median_impl(self):
+    input_series = self._data
+    output_arr = sdc_rolling_median_kernel(input_series._data, self._window, self._min_periods, 0.5)
+
+    return pandas.Series(output_arr, input_series._index, name=input_series._name)
+
+
 def gen_sdc_pandas_series_rolling_ddof_impl(pop, put, get_result=ddof_result,
                                             init_result=numpy.nan):
     """Generate series rolling ddof implementations based on pop/put funcs"""
@@ -733,17 +777,161 @@ def gen_sdc_pandas_series_rolling_ddof_impl(pop, put, get_result=ddof_result,
     return impl
 
 
+def gen_ddof_ignoring_result(get_result):
+    """Adapt result func to the signature of the ddof result funcs"""
+    def ddof_ignoring_result(nfinite, minp, result, ddof):
+        return get_result(nfinite, minp, result)
+
+    return sdc_register_jitable(ddof_ignoring_result)
+
+
+def gen_sdc_rolling_time_kernel(pop, put, get_result, init_result=numpy.nan):
+    """
+    Generate rolling kernel for time-based windows based on pop/put funcs:
+    window bounds move forward through the sorted times as two pointers,
+    so that each value is put and popped at most once regardless of the window width
+    """
+    def kernel(input_arr, times, win, minp, ddof):
+        length = len(input_arr)
+        output_arr = numpy.empty(length, dtype=float64)
+        times_ns = times.view(numpy.int64)
+
+        chunks = parallel_chunks(length)
+        chunk_is_monotonic = numpy.ones(len(chunks), dtype=numpy.bool_)
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+            nfinite = 0
+            result = init_result
+            if chunk.start == chunk.stop:
+                continue
+
+            # window of the first chunk value is (time - win, time]
+            start = numpy.searchsorted(times_ns[:chunk.start], times_ns[chunk.start] - win, side='right')
+            for idx in range(start, chunk.start):
+                nfinite, result = put(input_arr[idx], nfinite, result)
+
+            for idx in range(chunk.start, chunk.stop):
+                if idx > 0 and times_ns[idx - 1] > times_ns[idx]:
+                    chunk_is_monotonic[i] = False
+
+                nfinite, result = put(input_arr[idx], nfinite, result)
+                bound = times_ns[idx] - win
+                while start <= idx and times_ns[start] <= bound:
+                    nfinite, result = pop(input_arr[start], nfinite, result)
+                    start += 1
+                output_arr[idx] = get_result(nfinite, minp, result, ddof)
+
+        if not chunk_is_monotonic.all():
+            raise ValueError('index must be monotonic')
+
+        return output_arr
+
+    return kernel
+
+
+def gen_sdc_rolling_time_minmax_kernel(dominates):
+    """
+    Generate rolling min/max kernel for time-based windows based on monotonic deque,
+    the front of the deque is popped when it leaves the window
+    """
+    def kernel(input_arr, times, win, minp, ddof):
+        length = len(input_arr)
+        output_arr = numpy.empty(length, dtype=float64)
+        times_ns = times.view(numpy.int64)
+
+        chunks = parallel_chunks(length)
+        chunk_is_monotonic = numpy.ones(len(chunks), dtype=numpy.bool_)
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+            nfinite = 0
+            if chunk.start == chunk.stop:
+                continue
+
+            prelude_start = numpy.searchsorted(times_ns[:chunk.start], times_ns[chunk.start] - win, side='right')
+            start = prelude_start
+
+            # each index is put once, so the deque doesn't need to be a ring buffer
+            deque = numpy.empty(chunk.stop - prelude_start, dtype=numpy.int64)
+            head, tail = 0, 0
+            for idx in range(prelude_start, chunk.stop):
+                value = input_arr[idx]
+                if numpy.isfinite(value):
+                    nfinite += 1
+                    while tail > head and dominates(input_arr[deque[tail - 1]], value):
+                        tail -= 1
+                    deque[tail] = idx
+                    tail += 1
+
+                if idx < chunk.start:
+                    continue
+
+                if idx > 0 and times_ns[idx - 1] > times_ns[idx]:
+                    chunk_is_monotonic[i] = False
+
+                bound = times_ns[idx] - win
+                while start <= idx and times_ns[start] <= bound:
+                    if numpy.isfinite(input_arr[start]):
+                        nfinite -= 1
+                    if tail > head and deque[head] == start:
+                        head += 1
+                    start += 1
+
+                result = input_arr[deque[head]] if tail > head else numpy.nan
+                output_arr[idx] = result_or_nan(nfinite, minp, result)
+
+        if not chunk_is_monotonic.all():
+            raise ValueError('index must be monotonic')
+
+        return output_arr
+
+    return kernel
+
+
+sdc_rolling_time_count_kernel = sdc_register_jitable(gen_sdc_rolling_time_kernel(
+    pop_count, put_count, gen_ddof_ignoring_result(count_result_or_nan), init_result=0.))
+sdc_rolling_time_max_kernel = sdc_register_jitable(gen_sdc_rolling_time_minmax_kernel(max_dominates))
+sdc_rolling_time_mean_kernel = sdc_register_jitable(gen_sdc_rolling_time_kernel(
+    pop_sum, put_sum, gen_ddof_ignoring_result(mean_result_or_nan), init_result=0.))
+sdc_rolling_time_min_kernel = sdc_register_jitable(gen_sdc_rolling_time_minmax_kernel(min_dominates))
+sdc_rolling_time_std_kernel = sdc_register_jitable(gen_sdc_rolling_time_kernel(
+    pop_sum2, put_sum2, std_result_or_nan, init_result=(0., 0.)))
+sdc_rolling_time_sum_kernel = sdc_register_jitable(gen_sdc_rolling_time_kernel(
+    pop_sum, put_sum, gen_ddof_ignoring_result(result_or_nan), init_result=0.))
+sdc_rolling_time_var_kernel = sdc_register_jitable(gen_sdc_rolling_time_kernel(
+    pop_sum2, put_sum2, var_result_or_nan, init_result=(0., 0.)))
+
+
+def gen_sdc_pandas_series_time_rolling_impl(kernel):
+    """Generate series rolling methods implementations for time-based windows"""
+    def impl(self):
+        input_series = self._data
+        output_arr = kernel(input_series._data, input_series._index, self._window, self._min_periods, 0)
+
+        return pandas.Series(output_arr, input_series._index, name=input_series._name)
+
+    return impl
+
+
+def gen_sdc_pandas_series_time_rolling_ddof_impl(kernel):
+    """Generate series rolling ddof implementations for time-based windows"""
+    def impl(self, ddof=1):
+        input_series = self._data
+        output_arr = kernel(input_series._data, input_series._index, self._window, self._min_periods, ddof)
+
+        return pandas.Series(output_arr, input_series._index, name=input_series._name)
+
+    return impl
+
+
 sdc_pandas_series_rolling_count_impl = gen_sdc_pandas_series_rolling_impl(
     pop_count, put_count, init_result=0.)
 sdc_pandas_series_rolling_kurt_impl = gen_sdc_pandas_series_rolling_impl(
     pop_kurt, put_kurt, get_result=kurt_result_or_nan,
     init_result=(0., 0., 0., 0.))
-sdc_pandas_series_rolling_max_impl = gen_sdc_pandas_series_rolling_minmax_impl(
-    pop_max, put_max)
+sdc_pandas_series_rolling_max_impl = gen_sdc_pandas_series_rolling_minmax_impl(max_dominates)
 sdc_pandas_series_rolling_mean_impl = gen_sdc_pandas_series_rolling_impl(
     pop_sum, put_sum, get_result=mean_result_or_nan, init_result=0.)
-sdc_pandas_series_rolling_min_impl = gen_sdc_pandas_series_rolling_minmax_impl(
-    pop_min, put_min)
+sdc_pandas_series_rolling_min_impl = gen_sdc_pandas_series_rolling_minmax_impl(min_dominates)
 sdc_pandas_series_rolling_skew_impl = gen_sdc_pandas_series_rolling_impl(
     pop_skew, put_skew, get_result=skew_result_or_nan, init_result=(0., 0., 0.))
 sdc_pandas_series_rolling_sum_impl = gen_sdc_pandas_series_rolling_impl(
@@ -753,12 +941,28 @@ sdc_pandas_series_rolling_var_impl = gen_sdc_pandas_series_rolling_ddof_impl(
 sdc_pandas_series_rolling_std_impl = gen_sdc_pandas_series_rolling_ddof_impl(
     pop_sum2, put_sum2, get_result=std_result_or_nan, init_result=(0., 0.))
 
+sdc_pandas_series_time_rolling_count_impl = gen_sdc_pandas_series_time_rolling_impl(sdc_rolling_time_count_kernel)
+sdc_pandas_series_time_rolling_max_impl = gen_sdc_pandas_series_time_rolling_impl(sdc_rolling_time_max_kernel)
+sdc_pandas_series_time_rolling_mean_impl = gen_sdc_pandas_series_time_rolling_impl(sdc_rolling_time_mean_kernel)
+sdc_pandas_series_time_rolling_min_impl = gen_sdc_pandas_series_time_rolling_impl(sdc_rolling_time_min_kernel)
+sdc_pandas_series_time_rolling_sum_impl = gen_sdc_pandas_series_time_rolling_impl(sdc_rolling_time_sum_kernel)
+sdc_pandas_series_time_rolling_var_impl = gen_sdc_pandas_series_time_rolling_ddof_impl(sdc_rolling_time_var_kernel)
+sdc_pandas_series_time_rolling_std_impl = gen_sdc_pandas_series_time_rolling_ddof_impl(sdc_rolling_time_std_kernel)
+
+
+def check_int_window(ty_checker, self):
+    """Raise TypingError for rolling methods which support integer windows only"""
+    if self.time_window:
+        raise TypingError('{} Unsupported offset window. Only integer window is supported'.format(
+            ty_checker.func_name))
+
 
 @sdc_rolling_overload(SeriesRollingType, 'apply')
 def hpat_pandas_series_rolling_apply(self, func, raw=None):
 
     ty_checker = TypeChecker('Method rolling.apply().')
     ty_checker.check(self, SeriesRollingType)
+    check_int_window(ty_checker, self)
 
     raw_accepted = (Omitted, NoneType, Boolean)
     if not isinstance(raw, raw_accepted) and raw is not None:
@@ -799,6 +1003,7 @@ def hpat_pandas_series_rolling_corr(self, other=None, pairwise=None):
 
     ty_checker = TypeChecker('Method rolling.corr().')
     ty_checker.check(self, SeriesRollingType)
+    check_int_window(ty_checker, self)
 
     accepted_other = (bool, Omitted, NoneType, SeriesType)
     if not isinstance(other, accepted_other) and other is not None:
@@ -889,6 +1094,9 @@ def hpat_pandas_series_rolling_count(self):
     ty_checker = TypeChecker('Method rolling.count().')
     ty_checker.check(self, SeriesRollingType)
 
+    if self.time_window:
+        return sdc_pandas_series_time_rolling_count_impl
+
     return sdc_pandas_series_rolling_count_impl
 
 
@@ -897,6 +1105,7 @@ def _hpat_pandas_series_rolling_cov_check_types(self, other=None,
     """Check types of parameters of series.rolling.cov()"""
     ty_checker = TypeChecker('Method rolling.cov().')
     ty_checker.check(self, SeriesRollingType)
+    check_int_window(ty_checker, self)
 
     accepted_other = (bool, Omitted, NoneType, SeriesType)
     if not isinstance(other, accepted_other) and other is not None:
@@ -1013,6 +1222,7 @@ def hpat_pandas_series_rolling_kurt(self):
 
     ty_checker = TypeChecker('Method rolling.kurt().')
     ty_checker.check(self, SeriesRollingType)
+    check_int_window(ty_checker, self)
 
     return sdc_pandas_series_rolling_kurt_impl
 
@@ -1023,6 +1233,9 @@ def hpat_pandas_series_rolling_max(self):
     ty_checker = TypeChecker('Method rolling.max().')
     ty_checker.check(self, SeriesRollingType)
 
+    if self.time_window:
+        return sdc_pandas_series_time_rolling_max_impl
+
     return sdc_pandas_series_rolling_max_impl
 
 
@@ -1032,16 +1245,20 @@ def hpat_pandas_series_rolling_mean(self):
     ty_checker = TypeChecker('Method rolling.mean().')
     ty_checker.check(self, SeriesRollingType)
 
+    if self.time_window:
+        return sdc_pandas_series_time_rolling_mean_impl
+
     return sdc_pandas_series_rolling_mean_impl
 
 
-@sdc_rolling_overload(SeriesRollingType, 'median')
+@sdc_overload_method(SeriesRollingType, 'median')
 def hpat_pandas_series_rolling_median(self):
 
     ty_checker = TypeChecker('Method rolling.median().')
     ty_checker.check(self, SeriesRollingType)
+    check_int_window(ty_checker, self)
 
-    return hpat_pandas_rolling_series_median_impl
+    return sdc_pandas_series_rolling_median_impl
 
 
 @sdc_overload_method(SeriesRollingType, 'min')
@@ -1050,13 +1267,17 @@ def hpat_pandas_series_rolling_min(self):
     ty_checker = TypeChecker('Method rolling.min().')
     ty_checker.check(self, SeriesRollingType)
 
+    if self.time_window:
+        return sdc_pandas_series_time_rolling_min_impl
+
     return sdc_pandas_series_rolling_min_impl
 
-@sdc_rolling_overload(SeriesRollingType, 'quantile')
+@sdc_overload_method(SeriesRollingType, 'quantile')
 def hpat_pandas_series_rolling_quantile(self, quantile, interpolation='linear'):
 
     ty_checker = TypeChecker('Method rolling.quantile().')
     ty_checker.check(self, SeriesRollingType)
+    check_int_window(ty_checker, self)
 
     if not isinstance(quantile, Number):
         ty_checker.raise_exc(quantile, 'float', 'quantile')
@@ -1071,29 +1292,8 @@ def hpat_pandas_series_rolling_quantile(self, quantile, interpolation='linear'):
         if interpolation != 'linear':
             raise ValueError('interpolation value not "linear"')
 
-        win = self._window
-        minp = self._min_periods
-
         input_series = self._data
-        input_arr = input_series._data
-        length = len(input_arr)
-        output_arr = numpy.empty(length, dtype=float64)
-
-        def calc_quantile(arr, quantile, minp):
-            finite_arr = arr[numpy.isfinite(arr)]
-            if len(finite_arr) < minp:
-                return numpy.nan
-            else:
-                return arr_quantile(finite_arr, quantile)
-
-        boundary = min(win, length)
-        for i in prange(boundary):
-            arr_range = input_arr[:i + 1]
-            output_arr[i] = calc_quantile(arr_range, quantile, minp)
-
-        for i in prange(boundary, length):
-            arr_range = input_arr[i + 1 - win:i + 1]
-            output_arr[i] = calc_quantile(arr_range, quantile, minp)
+        output_arr = sdc_rolling_quantile_kernel(input_series._data, self._window, self._min_periods, quantile)
 
         return pandas.Series(output_arr, input_series._index, name=input_series._name)
 
@@ -1105,6 +1305,7 @@ def hpat_pandas_series_rolling_skew(self):
 
     ty_checker = TypeChecker('Method rolling.skew().')
     ty_checker.check(self, SeriesRollingType)
+    check_int_window(ty_checker, self)
 
     return sdc_pandas_series_rolling_skew_impl
 
@@ -1118,6 +1319,9 @@ def hpat_pandas_series_rolling_std(self, ddof=1):
     if not isinstance(ddof, (int, Integer, Omitted)):
         ty_checker.raise_exc(ddof, 'int', 'ddof')
 
+    if self.time_window:
+        return sdc_pandas_series_time_rolling_std_impl
+
     return sdc_pandas_series_rolling_std_impl
 
 
@@ -1127,6 +1331,9 @@ def hpat_pandas_series_rolling_sum(self):
     ty_checker = TypeChecker('Method rolling.sum().')
     ty_checker.check(self, SeriesRollingType)
 
+    if self.time_window:
+        return sdc_pandas_series_time_rolling_sum_impl
+
     return sdc_pandas_series_rolling_sum_impl
 
 
@@ -1139,6 +1346,9 @@ def hpat_pandas_series_rolling_var(self, ddof=1):
     if not isinstance(ddof, (int, Integer, Omitted)):
         ty_checker.raise_exc(ddof, 'int', 'ddof')
 
+    if self.time_window:
+        return sdc_pandas_series_time_rolling_var_impl
+
     return sdc_pandas_series_rolling_var_impl
 
 
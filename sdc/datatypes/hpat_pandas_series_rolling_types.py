@@ -31,10 +31,11 @@ from sdc.datatypes.hpat_pandas_rolling_types import (
 
 class SeriesRollingType(RollingType):
     """Type definition for pandas.Series.rolling functions handling."""
-    def __init__(self, data, win_type=None, on=None, closed=None):
+    def __init__(self, data, win_type=None, on=None, closed=None, time_window=False, time_on=None):
         super(SeriesRollingType, self).__init__('SeriesRollingType',
                                                 data, win_type=win_type,
-                                                on=on, closed=closed)
+                                                on=on, closed=closed,
+                                                time_window=time_window, time_on=time_on)
 
 
 @register_model(SeriesRollingType)
@@ -46,3 +47,5 @@ class SeriesRollingTypeModel(RollingTypeModel):
 
 _hpat_pandas_series_rolling_init = intrinsic(gen_hpat_pandas_rolling_init(
     SeriesRollingType))
+_hpat_pandas_series_time_rolling_init = intrinsic(gen_hpat_pandas_rolling_init(
+    SeriesRollingType, time_window=True))
@@ -88,8 +88,11 @@ from sdc.utilities.sdc_typing_utils import TypeChecker
 from sdc.datatypes.hpat_pandas_stringmethods_types import StringMethodsType
 from sdc.utilities.utils import sdc_overload_method, sdc_register_jitable
 from sdc.hiframes.api import get_nan_mask
-from sdc.str_arr_ext import str_arr_set_na_by_mask, create_str_arr_from_list
 from sdc.datatypes.common_functions import SDCLimitation
+from sdc.functions.str_arr_kernels import (is_ascii, str_to_utf8, str_arr_ascii_lower, str_arr_ascii_upper,
+                                           str_arr_center, str_arr_contains, str_arr_endswith, str_arr_from_list,
+                                           str_arr_len, str_arr_ljust, str_arr_rjust, str_arr_set_nulls,
+                                           str_arr_startswith, str_arr_zfill)
 
 
 @sdc_overload_method(StringMethodsType, 'center')
@@ -139,13 +142,10 @@ def hpat_pandas_stringmethods_center(self, width, fillchar=' '):
         ty_checker.raise_exc(fillchar, 'str', 'fillchar')
 
     def hpat_pandas_stringmethods_center_impl(self, width, fillchar=' '):
-        mask = get_nan_mask(self._data._data)
-        item_count = len(self._data)
-        res_list = [''] * item_count
-        for idx in numba.prange(item_count):
-            res_list[idx] = self._data._data[idx].center(width, fillchar)
-        str_arr = create_str_arr_from_list(res_list)
-        result = str_arr_set_na_by_mask(str_arr, mask)
+        if len(fillchar) != 1:
+            raise TypeError('The fill character must be exactly one character long')
+
+        result = str_arr_center(self._data._data, (width, str_to_utf8(fillchar)))
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
@@ -223,12 +223,9 @@ def hpat_pandas_stringmethods_contains(self, pat, case=True, flags=0, na=None, r
         else:
             _pat = pat
 
-        len_data = len(self._data)
-        res_list = numpy.empty(len_data, numba.types.boolean)
-        for idx in numba.prange(len_data):
-            res_list[idx] = _pat in self._data._data[idx]
+        result = str_arr_contains(self._data._data, str_to_utf8(_pat))
 
-        return pandas.Series(res_list, self._data._index, name=self._data._name)
+        return pandas.Series(result, self._data._index, name=self._data._name)
 
     return hpat_pandas_stringmethods_contains_impl
 
@@ -292,10 +289,7 @@ def hpat_pandas_stringmethods_endswith(self, pat, na=None):
             msg = 'Method endswith(). The object na\n expected: None'
             raise ValueError(msg)
 
-        item_endswith = len(self._data)
-        result = numpy.empty(item_endswith, numba.types.boolean)
-        for idx, item in enumerate(self._data._data):
-            result[idx] = item.endswith(pat)
+        result = str_arr_endswith(self._data._data, str_to_utf8(pat))
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
@@ -428,10 +422,7 @@ def hpat_pandas_stringmethods_len(self):
     ty_checker.check(self, StringMethodsType)
 
     def hpat_pandas_stringmethods_len_impl(self):
-        item_count = len(self._data)
-        result = numpy.empty(item_count, numba.types.int64)
-        for idx, item in enumerate(self._data._data):
-            result[idx] = len(item)
+        result = str_arr_len(self._data._data)
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
@@ -490,13 +481,10 @@ def hpat_pandas_stringmethods_ljust(self, width, fillchar=' '):
         ty_checker.raise_exc(fillchar, 'str', 'fillchar')
 
     def hpat_pandas_stringmethods_ljust_impl(self, width, fillchar=' '):
-        mask = get_nan_mask(self._data._data)
-        item_count = len(self._data)
-        res_list = [''] * item_count
-        for idx in numba.prange(item_count):
-            res_list[idx] = self._data._data[idx].ljust(width, fillchar)
-        str_arr = create_str_arr_from_list(res_list)
-        result = str_arr_set_na_by_mask(str_arr, mask)
+        if len(fillchar) != 1:
+            raise TypeError('The fill character must be exactly one character long')
+
+        result = str_arr_ljust(self._data._data, (width, str_to_utf8(fillchar)))
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
@@ -550,13 +538,10 @@ def hpat_pandas_stringmethods_rjust(self, width, fillchar=' '):
         ty_checker.raise_exc(fillchar, 'str', 'fillchar')
 
     def hpat_pandas_stringmethods_rjust_impl(self, width, fillchar=' '):
-        mask = get_nan_mask(self._data._data)
-        item_count = len(self._data)
-        res_list = [''] * item_count
-        for idx in numba.prange(item_count):
-            res_list[idx] = self._data._data[idx].rjust(width, fillchar)
-        str_arr = create_str_arr_from_list(res_list)
-        result = str_arr_set_na_by_mask(str_arr, mask)
+        if len(fillchar) != 1:
+            raise TypeError('The fill character must be exactly one character long')
+
+        result = str_arr_rjust(self._data._data, (width, str_to_utf8(fillchar)))
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
@@ -622,10 +607,7 @@ def hpat_pandas_stringmethods_startswith(self, pat, na=None):
             msg = 'Method startswith(). The object na\n expected: None'
             raise ValueError(msg)
 
-        item_startswith = len(self._data)
-        result = numpy.empty(item_startswith, numba.types.boolean)
-        for idx, item in enumerate(self._data._data):
-            result[idx] = item.startswith(pat)
+        result = str_arr_startswith(self._data._data, str_to_utf8(pat))
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
@@ -684,13 +666,7 @@ def hpat_pandas_stringmethods_zfill(self, width):
         ty_checker.raise_exc(width, 'int', 'width')
 
     def hpat_pandas_stringmethods_zfill_impl(self, width):
-        mask = get_nan_mask(self._data._data)
-        item_count = len(self._data)
-        res_list = [''] * item_count
-        for idx in numba.prange(item_count):
-            res_list[idx] = self._data._data[idx].zfill(width)
-        str_arr = create_str_arr_from_list(res_list)
-        result = str_arr_set_na_by_mask(str_arr, mask)
+        result = str_arr_zfill(self._data._data, (width, str_to_utf8('0')))
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
@@ -868,8 +844,8 @@ def hpat_pandas_stringmethods_capitalize(self):
         res_list = [''] * item_count
         for idx in numba.prange(item_count):
             res_list[idx] = self._data._data[idx].capitalize()
-        str_arr = create_str_arr_from_list(res_list)
-        result = str_arr_set_na_by_mask(str_arr, mask)
+        result = str_arr_from_list(res_list)
+        str_arr_set_nulls(result, mask)
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
@@ -887,8 +863,8 @@ def hpat_pandas_stringmethods_title(self):
         res_list = [''] * item_count
         for idx in numba.prange(item_count):
             res_list[idx] = self._data._data[idx].title()
-        str_arr = create_str_arr_from_list(res_list)
-        result = str_arr_set_na_by_mask(str_arr, mask)
+        result = str_arr_from_list(res_list)
+        str_arr_set_nulls(result, mask)
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
@@ -906,8 +882,8 @@ def hpat_pandas_stringmethods_swapcase(self):
         res_list = [''] * item_count
         for idx in numba.prange(item_count):
             res_list[idx] = self._data._data[idx].swapcase()
-        str_arr = create_str_arr_from_list(res_list)
-        result = str_arr_set_na_by_mask(str_arr, mask)
+        result = str_arr_from_list(res_list)
+        str_arr_set_nulls(result, mask)
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
@@ -925,8 +901,8 @@ def hpat_pandas_stringmethods_casefold(self):
         res_list = [''] * item_count
         for idx in numba.prange(item_count):
             res_list[idx] = self._data._data[idx].casefold()
-        str_arr = create_str_arr_from_list(res_list)
-        result = str_arr_set_na_by_mask(str_arr, mask)
+        result = str_arr_from_list(res_list)
+        str_arr_set_nulls(result, mask)
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
@@ -939,19 +915,23 @@ def hpat_pandas_stringmethods_lower(self):
     ty_checker.check(self, StringMethodsType)
 
     def hpat_pandas_stringmethods_lower_impl(self):
+        if is_ascii(self._data._data):
+            result = str_arr_ascii_lower(self._data._data)
+            return pandas.Series(result, self._data._index, name=self._data._name)
+
         mask = get_nan_mask(self._data._data)
         item_count = len(self._data)
         res_list = [''] * item_count
 
-        for it in range(item_count):
+        for it in numba.prange(item_count):
             item = self._data._data[it]
             if len(item) > 0:
                 res_list[it] = item.lower()
             else:
                 res_list[it] = item
 
-        str_arr = create_str_arr_from_list(res_list)
-        result = str_arr_set_na_by_mask(str_arr, mask)
+        result = str_arr_from_list(res_list)
+        str_arr_set_nulls(result, mask)
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
@@ -964,19 +944,23 @@ def hpat_pandas_stringmethods_upper(self):
     ty_checker.check(self, StringMethodsType)
 
     def hpat_pandas_stringmethods_upper_impl(self):
+        if is_ascii(self._data._data):
+            result = str_arr_ascii_upper(self._data._data)
+            return pandas.Series(result, self._data._index, name=self._data._name)
+
         mask = get_nan_mask(self._data._data)
         item_count = len(self._data)
-        result = [''] * item_count
+        res_list = [''] * item_count
 
         for it in numba.prange(item_count):
             item = self._data._data[it]
             if len(item) > 0:
-                result[it] = item.upper()
+                res_list[it] = item.upper()
             else:
-                result[it] = item
+                res_list[it] = item
 
-        str_arr = create_str_arr_from_list(result)
-        result = str_arr_set_na_by_mask(str_arr, mask)
+        result = str_arr_from_list(res_list)
+        str_arr_set_nulls(result, mask)
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
@@ -1005,15 +989,15 @@ def gen_sdc_pandas_series_str_strip_impl(usecase):
         item_count = len(self._data)
         res_list = [''] * item_count
 
-        for it in range(item_count):
+        for it in numba.prange(item_count):
             item = self._data._data[it]
             if len(item) > 0:
                 res_list[it] = usecase(item, to_strip)
             else:
                 res_list[it] = item
 
-        str_arr = create_str_arr_from_list(res_list)
-        result = str_arr_set_na_by_mask(str_arr, mask)
+        result = str_arr_from_list(res_list)
+        str_arr_set_nulls(result, mask)
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
@@ -33,6 +33,12 @@ from numba.extending import (
 )
 
 
+# lazily built lookup engine attached to every Int64Index: a map of index values to group codes
+# and a list of engine arrays, the first of them is the state of the engine (see sdc/extensions/indexes/index_engine.py)
+int64_index_engine_map_type = types.DictType(types.int64, types.int64)
+int64_index_engine_data_type = types.ListType(types.Array(types.int64, 1, 'C'))
+
+
 class Int64IndexType(types.IterableType):
     dtype = types.int64
 
@@ -57,9 +63,13 @@ class Int64IndexModel(models.StructModel):
         members = [
             ('data', data_type),
             ('name', name_type),
+            ('engine_map', int64_index_engine_map_type),
+            ('engine_data', int64_index_engine_data_type),
         ]
         models.StructModel.__init__(self, dmm, fe_type, members)
 
 
 make_attribute_wrapper(Int64IndexType, 'data', '_data')
 make_attribute_wrapper(Int64IndexType, 'name', '_name')
+make_attribute_wrapper(Int64IndexType, 'engine_map', '_engine_map')
+make_attribute_wrapper(Int64IndexType, 'engine_data', '_engine_data')
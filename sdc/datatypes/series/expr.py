@@ -0,0 +1,319 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Lazy element-wise expressions over aligned numeric Series.
+
+Series wrapped with :func:`lazy` are not computed by arithmetic and comparison operators,
+instead these build an expression tree stored in the type of the result (:class:`SeriesExprType`),
+and the values of its leaves (Series and scalars) are kept in a tuple. :func:`evaluate` computes
+the whole tree in one parallel loop, so no temporary arrays are allocated for the intermediate results:
+
+    >>> @sdc.jit
+    ... def f(a, b, c, d, e):
+    ...     return evaluate((lazy(a) * b + c) / d > e)
+"""
+
+import numba
+import numpy
+import operator
+import pandas
+
+from numba import types
+from numba.core import cgutils
+from numba.core.errors import TypingError
+from numba.extending import intrinsic, make_attribute_wrapper, models, register_model
+
+from sdc.functions import numpy_like
+from sdc.hiframes.pd_series_type import SeriesType
+from sdc.utilities.sdc_typing_utils import TypeChecker
+from sdc.utilities.utils import sdc_overload
+from sdc.utilities.compile_cache import exec_func_text
+
+
+arithmetic_binops = {
+    'add': (operator.add, '+'),
+    'sub': (operator.sub, '-'),
+    'mul': (operator.mul, '*'),
+    'truediv': (operator.truediv, '/'),
+    'floordiv': (operator.floordiv, '//'),
+    'mod': (operator.mod, '%'),
+    'pow': (operator.pow, '**'),
+}
+
+division_ufuncs = {
+    'truediv': 'numpy.true_divide',
+    'floordiv': 'numpy.floor_divide',
+    'mod': 'numpy.remainder',
+}
+
+comparison_binops = {
+    'lt': (operator.lt, '<'),
+    'gt': (operator.gt, '>'),
+    'le': (operator.le, '<='),
+    'ge': (operator.ge, '>='),
+    'ne': (operator.ne, '!='),
+    'eq': (operator.eq, '=='),
+}
+
+
+class SeriesExprType(types.Type):
+    """
+    Type of lazy element-wise expression over Series.
+
+    Members
+    ----------
+    tree: :obj:`tuple`
+        expression tree, either ('leaf', position of the leaf) or (operator name, left tree, right tree)
+    leaves: :obj:`tuple`
+        types of the leaves (Series or scalars) in the order of their positions
+    """
+
+    def __init__(self, tree, leaves):
+        self.tree = tree
+        self.leaves = leaves
+        super(SeriesExprType, self).__init__('SeriesExprType({}, {})'.format(tree, leaves))
+
+    @property
+    def leaves_type(self):
+        return types.Tuple(self.leaves)
+
+
+@register_model(SeriesExprType)
+class SeriesExprModel(models.StructModel):
+    def __init__(self, dmm, fe_type):
+        members = [
+            ('leaves', fe_type.leaves_type)
+        ]
+        models.StructModel.__init__(self, dmm, fe_type, members)
+
+
+make_attribute_wrapper(SeriesExprType, 'leaves', '_leaves')
+
+
+def _shift_tree(tree, shift):
+    """Shifts positions of the leaves of the tree"""
+    if tree[0] == 'leaf':
+        return ('leaf', tree[1] + shift)
+
+    op_name, left, right = tree
+    return (op_name, _shift_tree(left, shift), _shift_tree(right, shift))
+
+
+def _operand_tree_and_leaves(operand, shift):
+    """Returns tree and types of the leaves of expression operand placing its leaves after shift ones"""
+    if isinstance(operand, SeriesExprType):
+        return _shift_tree(operand.tree, shift), operand.leaves
+
+    return ('leaf', shift), (types.unliteral(operand), )
+
+
+def _unpack_operand_leaves(context, builder, operand_type, operand):
+    """Returns types and values of the leaves of expression operand"""
+    if isinstance(operand_type, SeriesExprType):
+        expr = cgutils.create_struct_proxy(operand_type)(context, builder, value=operand)
+        values = [builder.extract_value(expr.leaves, i) for i in range(len(operand_type.leaves))]
+        return operand_type.leaves, values
+
+    leaf_type = types.unliteral(operand_type)
+    return (leaf_type, ), [context.cast(builder, operand, operand_type, leaf_type)]
+
+
+def _make_series_expr(context, builder, expr_type, leaves_values):
+    expr = cgutils.create_struct_proxy(expr_type)(context, builder)
+    expr.leaves = context.make_tuple(builder, expr_type.leaves_type, leaves_values)
+    if context.enable_nrt:
+        for leaf_type, leaf in zip(expr_type.leaves, leaves_values):
+            context.nrt.incref(builder, leaf_type, leaf)
+
+    return expr._getvalue()
+
+
+@intrinsic
+def _series_expr_leaf(typingctx, series):
+    ret_type = SeriesExprType(('leaf', 0), (series, ))
+
+    def _series_expr_leaf_codegen(context, builder, sig, args):
+        return _make_series_expr(context, builder, sig.return_type, args)
+
+    return ret_type(series), _series_expr_leaf_codegen
+
+
+@intrinsic
+def _series_expr_binop(typingctx, op_name, left, right):
+    if not isinstance(op_name, types.StringLiteral):
+        return None
+
+    left_tree, left_leaves = _operand_tree_and_leaves(left, 0)
+    right_tree, right_leaves = _operand_tree_and_leaves(right, len(left_leaves))
+    ret_type = SeriesExprType((op_name.literal_value, left_tree, right_tree), left_leaves + right_leaves)
+
+    def _series_expr_binop_codegen(context, builder, sig, args):
+        _, left_val, right_val = args
+        _, left_values = _unpack_operand_leaves(context, builder, left, left_val)
+        _, right_values = _unpack_operand_leaves(context, builder, right, right_val)
+        return _make_series_expr(context, builder, sig.return_type, left_values + right_values)
+
+    return ret_type(op_name, left, right), _series_expr_binop_codegen
+
+
+def _is_numeric_series(ty):
+    return isinstance(ty, SeriesType) and isinstance(ty.dtype, (types.Number, types.Boolean))
+
+
+def lazy(series):
+    """
+    Wraps numeric Series into lazy expression which is computed by :func:`evaluate` only.
+    Returns series as is in the interpreter.
+    """
+    return series
+
+
+def evaluate(expr):
+    """
+    Computes lazy expression into Series in one parallel loop.
+    Returns expr as is in the interpreter.
+    """
+    return expr
+
+
+@sdc_overload(lazy)
+def lazy_ovld(series):
+    ty_checker = TypeChecker('Function lazy().')
+    if not _is_numeric_series(series):
+        ty_checker.raise_exc(series, 'numeric series', 'series')
+
+    def lazy_impl(series):
+        return _series_expr_leaf(series)
+
+    return lazy_impl
+
+
+def _gen_series_expr_binop_ovld(op_name):
+
+    def sdc_series_expr_binop_ovld(self, other):
+        self_is_expr, other_is_expr = isinstance(self, SeriesExprType), isinstance(other, SeriesExprType)
+        if not (self_is_expr or other_is_expr):
+            return None
+
+        operand_types = (SeriesExprType, types.Number, types.Boolean)
+        operands_are_supported = ((isinstance(self, operand_types) or _is_numeric_series(self))
+                                  and (isinstance(other, operand_types) or _is_numeric_series(other)))
+        if not operands_are_supported:
+            raise TypingError('Operator {}(). Not supported for operands of lazy expression. '
+                              'Given: self={}, other={}'.format(op_name, self, other))
+
+        def sdc_series_expr_binop_impl(self, other):
+            return _series_expr_binop(op_name, self, other)
+
+        return sdc_series_expr_binop_impl
+
+    return sdc_series_expr_binop_ovld
+
+
+for op_name, (op, _) in {**arithmetic_binops, **comparison_binops}.items():
+    sdc_overload(op)(_gen_series_expr_binop_ovld(op_name))
+
+
+def _gen_series_expr_element(tree, leaves):
+    """Generates source code of the expression tree computed for i-th element"""
+    if tree[0] == 'leaf':
+        position = tree[1]
+        if isinstance(leaves[position], SeriesType):
+            return 'data_{}[i]'.format(position)
+        return 'value_{}'.format(position)
+
+    op_name, left, right = tree
+    left_code, right_code = _gen_series_expr_element(left, leaves), _gen_series_expr_element(right, leaves)
+    if op_name in comparison_binops:
+        return '({} {} {})'.format(left_code, comparison_binops[op_name][1], right_code)
+
+    # like Series arithmetic operators compute result in float64,
+    # division is made with ufuncs, so that zero divisor gives inf or nan instead of raising ZeroDivisionError
+    if op_name in division_ufuncs:
+        return '{}(numpy.float64({}), numpy.float64({}))'.format(division_ufuncs[op_name], left_code, right_code)
+    return '(numpy.float64({}) {} numpy.float64({}))'.format(left_code, arithmetic_binops[op_name][1], right_code)
+
+
+def _gen_evaluate_impl(expr):
+    """Generates implementation of evaluate() for expression type"""
+    series_positions = [i for i, leaf in enumerate(expr.leaves) if isinstance(leaf, SeriesType)]
+    first = series_positions[0]
+    indexes_are_none = isinstance(expr.leaves[first].index, types.NoneType)
+    result_dtype = 'numpy.bool_' if expr.tree[0] in comparison_binops else 'numpy.float64'
+
+    func_lines = ['def _evaluate_impl(expr):',
+                  '  leaves = expr._leaves']
+    for i, leaf in enumerate(expr.leaves):
+        if i in series_positions:
+            func_lines += [f'  series_{i} = leaves[{i}]',
+                           f'  data_{i} = series_{i}._data']
+        else:
+            func_lines += [f'  value_{i} = leaves[{i}]']
+
+    func_lines += [f'  size = len(data_{first})']
+    for i in series_positions[1:]:
+        func_lines += [f'  if len(data_{i}) != size:',
+                       f'    raise ValueError(not_aligned_msg)']
+        if not indexes_are_none:
+            func_lines += [f'  if not (series_{first}.index is series_{i}.index',
+                           f'          or numpy_like.array_equal(series_{first}.index, series_{i}.index)):',
+                           f'    raise ValueError(not_aligned_msg)']
+
+    func_lines += [f'  result_data = numpy.empty(size, dtype={result_dtype})',
+                   f'  for i in numba.prange(size):',
+                   f'    result_data[i] = {_gen_series_expr_element(expr.tree, expr.leaves)}']
+
+    # like Series operators keep the name when the other operand is scalar
+    name_param = f', name=series_{first}._name' if len(series_positions) == 1 else ''
+    index_param = '' if indexes_are_none else f', index=series_{first}._index'
+    func_lines += [f'  return pandas.Series(result_data{index_param}{name_param})']
+
+    func_text = '\n'.join(func_lines)
+    global_vars = {'numba': numba, 'numpy': numpy, 'pandas': pandas, 'numpy_like': numpy_like,
+                   'not_aligned_msg': 'Can only evaluate expressions of identically-labeled Series objects'}
+
+    return exec_func_text(func_text, global_vars, '_evaluate_impl')
+
+
+@sdc_overload(evaluate)
+def evaluate_ovld(expr):
+    ty_checker = TypeChecker('Function evaluate().')
+    if isinstance(expr, SeriesType):
+        def evaluate_series_impl(expr):
+            return expr
+
+        return evaluate_series_impl
+
+    if not isinstance(expr, SeriesExprType):
+        ty_checker.raise_exc(expr, 'lazy series expression', 'expr')
+
+    index_types = {expr.leaves[i].index for i, leaf in enumerate(expr.leaves) if isinstance(leaf, SeriesType)}
+    if len(index_types) > 1:
+        raise TypingError('{} Not implemented for series with different types of indexes. '
+                          'Given: {}'.format(ty_checker.func_name, index_types))
+
+    return _gen_evaluate_impl(expr)
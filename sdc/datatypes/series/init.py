@@ -32,6 +32,7 @@ from . import types
 from . import boxing
 from . import pdimpl
 from . import rewrites
+from . import expr
 
 import numba
 
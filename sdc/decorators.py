@@ -32,10 +32,23 @@ import numba
 import sdc
 
 from functools import wraps
-from sdc.utilities.utils import print_compile_times
+from sdc.utilities.utils import get_compile_stats, print_compile_times, write_compile_stats
+from sdc.utilities import trace
 
 
-def jit(signature_or_function=None, **options):
+def jit(signature_or_function=None, distributed=None, threaded=None, **options):
+    """ Compiles decorated function with Numba in nopython mode.
+        Usage:
+            @jit(distributed={'df', 'res'})
+            def f(df):
+                res = df[df.A > 0]
+                return res, res.B.sum()
+        Args:
+            distributed: names of arguments and returned variables holding parts of data split
+                         among processes, the function is then compiled with SDC distributed pipeline
+                         and run on each process with its part of data
+            threaded: names of arguments and returned variables holding parts of data split among threads
+    """
 
     if 'nopython' not in options:
         '''
@@ -43,6 +56,15 @@ def jit(signature_or_function=None, **options):
         '''
         options['nopython'] = True
 
+    if distributed is not None or threaded is not None:
+        '''
+        Use SDC distributed pipeline, it partitions parfors so they need to be enabled
+        '''
+        from sdc.compiler import get_distributed_pipeline
+
+        options.setdefault('parallel', True)
+        options['pipeline_class'] = get_distributed_pipeline(distributed or (), threaded or ())
+
     '''
     Use Numba compiler pipeline
     '''
@@ -73,3 +95,61 @@ def debug_compile_time(level=1, func_names=None):
         return wrapper
 
     return get_wrapper
+
+
+def profile_compile_time(file_name, output_format='json', func_names=None):
+    """ Decorates Numba Dispatcher object to write compile stats of it and of all compiled overloads to a file.
+        Usage:
+            @profile_compile_time('compile_stats.json')
+            @numba.njit
+            <decorated function>
+        Args:
+            file_name: name of the file stats are written to after each call
+            output_format: 'json' for stats collected by get_compile_stats or 'folded'
+                           for collapsed stacks to be rendered as a flame graph
+            func_names: filters output to include only functions which names include listed strings,
+    """
+
+    def get_wrapper(disp):
+
+        @wraps(disp)
+        def wrapper(*args, **kwargs):
+            res = disp(*args, **kwargs)
+            stats = get_compile_stats(disp, func_names=func_names)
+            write_compile_stats(stats, file_name, output_format=output_format)
+            return res
+
+        return wrapper
+
+    return get_wrapper
+
+
+def trace_overloads(file_name=None):
+    """ Decorates Numba Dispatcher object to print time and allocations of each sdc overload method
+        called during the call. Requires SDC_TRACE_OVERLOADS=1 to be set before sdc is imported.
+        Usage:
+            @trace_overloads()
+            @numba.njit
+            <decorated function>
+        Args:
+            file_name: name of the file summary is written to after each call, stdout is used if None
+    """
+
+    def get_wrapper(disp):
+
+        @wraps(disp)
+        def wrapper(*args, **kwargs):
+            trace.reset_trace()
+            res = disp(*args, **kwargs)
+            if file_name is None:
+                print('*' * 40, 'OVERLOADS TRACE', '*' * 40)
+                trace.print_trace_summary()
+                print('*' * 97)
+            else:
+                with open(file_name, 'w') as f:
+                    trace.print_trace_summary(file=f)
+            return res
+
+        return wrapper
+
+    return get_wrapper
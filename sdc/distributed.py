@@ -99,9 +99,21 @@ from sdc.utilities.utils import (
     is_const_slice,
     update_globals)
 from sdc.hiframes.pd_dataframe_ext import DataFrameType
+from sdc.hiframes.pd_series_ext import SeriesType
+from sdc.hiframes.sort import dist_sort_series, dist_sort_series_supported
 
 distributed_run_extensions = {}
 
+# Series reductions computed on each process and combined with dist_reduce
+_series_reductions = {
+    'count': Reduce_Type.Sum,
+    'max': Reduce_Type.Max,
+    'mean': Reduce_Type.Sum,
+    'min': Reduce_Type.Min,
+    'prod': Reduce_Type.Prod,
+    'sum': Reduce_Type.Sum,
+}
+
 # analysis data for debugging
 dist_analysis = None
 fir_text = None
@@ -486,6 +498,10 @@ class DistributedPassImpl(object):
         if isinstance(func_mod, ir.Var) and isinstance(self.state.typemap[func_mod.name], DataFrameType):
             return self._run_call_df(lhs, func_mod, func_name, assign, rhs.args)
 
+        # S.func calls
+        if isinstance(func_mod, ir.Var) and isinstance(self.state.typemap[func_mod.name], SeriesType):
+            return self._run_call_series(lhs, func_mod, func_name, assign, rhs.args)
+
         # string_array.func_calls
         if (self._is_1D_arr(lhs) and isinstance(func_mod, ir.Var)
                 and self.state.typemap[func_mod.name] == string_array_type):
@@ -1026,6 +1042,81 @@ class DistributedPassImpl(object):
 
         return [assign]
 
+    def _run_call_series(self, lhs, series, func_name, assign, args):
+        rhs = assign.value
+        if func_name == 'sort_values':
+            return self._run_call_series_sort(lhs, series, assign, args)
+
+        if (func_name not in _series_reductions or args or rhs.kws
+                or not (self._is_1D_arr(series.name) or self._is_1D_Var_arr(series.name))):
+            return [assign]
+
+        if func_name == 'mean':
+            # S.mean() -> sum of values and count of non-NA values on all processes
+            func_text = '\n'.join([
+                "def f(S):",
+                "  total = sdc.distributed_api.dist_reduce(S.sum(), _sum_op)",
+                "  count = sdc.distributed_api.dist_reduce(S.count(), _sum_op)",
+                "  if count == 0:",
+                "    return np.nan",
+                "  return total / count",
+            ])
+            extra_globals = {'_sum_op': np.int32(Reduce_Type.Sum.value)}
+        else:
+            # S.func() -> reduction of results on processes which have non-NA values,
+            # S.min() and S.max() of all NA values remain NA
+            reduce_op = _series_reductions[func_name]
+            res_dtype = numba.np.numpy_support.as_dtype(self.state.typemap[lhs])
+            is_float = res_dtype.kind == 'f'
+            if reduce_op == Reduce_Type.Sum:
+                init_val = empty_val = res_dtype.type(0)
+            elif reduce_op == Reduce_Type.Prod:
+                init_val = empty_val = res_dtype.type(1)
+            elif reduce_op == Reduce_Type.Min:
+                init_val = res_dtype.type(np.inf if is_float else np.iinfo(res_dtype).max)
+                empty_val = res_dtype.type(np.nan) if is_float else init_val
+            else:
+                init_val = res_dtype.type(-np.inf if is_float else np.iinfo(res_dtype).min)
+                empty_val = res_dtype.type(np.nan) if is_float else init_val
+
+            func_text = '\n'.join([
+                "def f(S):",
+                "  count = S.count()",
+                "  val = S.{}() if count > 0 else _init_val".format(func_name),
+                "  val = sdc.distributed_api.dist_reduce(val, _reduce_op)",
+                "  if sdc.distributed_api.dist_reduce(count, _sum_op) == 0:",
+                "    val = _empty_val",
+                "  return val",
+            ])
+            extra_globals = {'_init_val': init_val, '_empty_val': empty_val,
+                             '_reduce_op': np.int32(reduce_op.value), '_sum_op': np.int32(Reduce_Type.Sum.value)}
+
+        loc_vars = {}
+        exec(func_text, {}, loc_vars)
+        f = loc_vars['f']
+
+        return self._replace_func(f, [series], extra_globals=extra_globals)
+
+    def _run_call_series_sort(self, lhs, series, assign, args):
+        # S.sort_values(...) -> distributed sample sort if the result is distributed
+        kw_names = [name for name, _ in assign.value.kws]
+        if (args or not self._is_1D_Var_arr(lhs)
+                or not (self._is_1D_arr(series.name) or self._is_1D_Var_arr(series.name))
+                or not dist_sort_series_supported(self.state.typemap[series.name], kw_names)):
+            return [assign]
+
+        func_text = '\n'.join([
+            "def f(S, {}):".format(', '.join(kw_names)),
+            "  return _dist_sort_series(S, {})".format(', '.join('{0}={0}'.format(name) for name in kw_names)),
+        ])
+
+        loc_vars = {}
+        exec(func_text, {}, loc_vars)
+        f = loc_vars['f']
+
+        return self._replace_func(f, [series] + [var for _, var in assign.value.kws],
+                                  extra_globals={'_dist_sort_series': dist_sort_series})
+
     def _gen_is_root_and_cond(self, cond_var):
         def f(cond):
             return cond & (sdc.distributed_api.get_rank() == 0)
@@ -1729,9 +1820,11 @@ class DistributedPassImpl(object):
         if is_array_container(self.state.typemap, arr.name):
             return None
 
-        # TODO: comprehensive support for Series vars
-        from sdc.hiframes.pd_series_ext import SeriesType
-        if isinstance(typ, (SeriesType, sdc.hiframes.pd_dataframe_ext.DataFrameType)):
+        # parts of Series and DataFrame are used as is, without rebalancing
+        if isinstance(typ, (SeriesType, DataFrameType)):
+            if self._is_REP(arr.name):
+                raise ValueError("distributed argument {} is used in operations"
+                                 " not supported for distributed data".format(rhs.name))
             return None
 
         # gen len() using 1D_Var reduce approach.
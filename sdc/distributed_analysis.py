@@ -45,11 +45,13 @@ import sdc
 import sdc.io
 import sdc.io.np_io
 from sdc.hiframes.pd_series_ext import SeriesType
+from sdc.datatypes.hpat_pandas_stringmethods_types import StringMethodsType
 from sdc.utilities.utils import (get_constant, is_alloc_callname,
                                  is_whole_slice, is_array, is_array_container,
                                  is_np_array, find_build_tuple, debug_prints,
                                  is_const_slice)
 from sdc.hiframes.pd_dataframe_ext import DataFrameType
+from sdc.hiframes.sort import dist_sort_series_supported
 from enum import Enum
 
 
@@ -67,6 +69,27 @@ _dist_analysis_result = namedtuple(
 distributed_analysis_extensions = {}
 auto_rebalance = False
 
+# Series and DataFrame methods computing each row of the result from the same row of self
+# and of Series arguments, their results are distributed the same way as inputs
+_series_rowwise_methods = {'abs', 'add', 'apply', 'astype', 'copy', 'div', 'eq', 'fillna', 'floordiv', 'ge', 'gt',
+                           'isin', 'isna', 'isnull', 'le', 'lt', 'map', 'mod', 'mul', 'ne', 'notna', 'pow', 'rename',
+                           'sub', 'truediv'}
+_df_rowwise_methods = {'copy', 'drop', 'isin', 'isna'}
+
+# methods selecting some rows of self, parts of the result on processes have arbitrary lengths
+_series_filter_methods = {'dropna'}
+
+# methods reordering rows of self, the distributed pass exchanges rows between processes
+# if the call is supported by the distributed sort, parts of the result have arbitrary lengths
+_series_sort_methods = {'sort_values'}
+
+# reductions without arguments are computed on each process and combined by the distributed pass
+_series_reductions = {'count', 'max', 'mean', 'min', 'prod', 'sum'}
+
+# attributes of Series and DataFrame holding their data row by row and attributes not depending on the data
+_series_df_data_attrs = {'index', 'values'}
+_series_df_meta_attrs = {'columns', 'dtype', 'dtypes', 'name', 'ndim'}
+
 
 class DistributedAnalysis(object):
     """Analyze program for distributed transformation"""
@@ -164,6 +187,11 @@ class DistributedAnalysis(object):
             dist = self._meet_array_dists(arg1, lhs, array_dists, dist)
             self._meet_array_dists(arg1, arg2, array_dists, dist)
             return
+        elif (isinstance(rhs, ir.Expr) and rhs.op in ('binop', 'inplace_binop', 'unary')
+                and isinstance(self.typemap[lhs], (SeriesType, DataFrameType))):
+            # operators on Series are element-wise
+            self._meet_rowwise_dists(lhs, rhs.list_vars(), array_dists)
+            return
         elif isinstance(rhs, ir.Expr) and rhs.op in ['getitem', 'static_getitem']:
             self._analyze_getitem(inst, lhs, rhs, array_dists)
             return
@@ -180,8 +208,8 @@ class DistributedAnalysis(object):
             self._T_arrs.add(lhs)
             return
         elif (isinstance(rhs, ir.Expr) and rhs.op == 'getattr'
-                and isinstance(self.typemap[rhs.value.name], DataFrameType)
-                and rhs.attr == 'to_csv'):
+                and isinstance(self.typemap[rhs.value.name], (SeriesType, DataFrameType))):
+            self._analyze_getattr_series_df(lhs, rhs, array_dists)
             return
         elif (isinstance(rhs, ir.Expr) and rhs.op == 'getattr'
                 and rhs.attr in ['shape', 'ndim', 'size', 'strides', 'dtype',
@@ -214,7 +242,11 @@ class DistributedAnalysis(object):
 
             if rhs.name in self.metadata[distributed_key]:
                 if lhs not in array_dists:
-                    array_dists[lhs] = Distribution.OneD
+                    # parts of Series and DataFrame passed to processes can have any length
+                    if isinstance(self.typemap[lhs], (SeriesType, DataFrameType)):
+                        array_dists[lhs] = Distribution.OneD_Var
+                    else:
+                        array_dists[lhs] = Distribution.OneD
 
             elif rhs.name in self.metadata[threaded_key]:
                 if lhs not in array_dists:
@@ -329,7 +361,14 @@ class DistributedAnalysis(object):
         # handle df.func calls
         if isinstance(func_mod, ir.Var) and isinstance(
                 self.typemap[func_mod.name], DataFrameType):
-            self._analyze_call_df(lhs, func_mod, func_name, args, array_dists)
+            self._analyze_call_df(lhs, func_mod, func_name, list(args) + [v for _, v in rhs.kws], array_dists)
+            return
+
+        # handle S.func and S.str.func calls
+        if isinstance(func_mod, ir.Var) and isinstance(
+                self.typemap[func_mod.name], (SeriesType, StringMethodsType)):
+            self._analyze_call_series(lhs, func_mod, func_name, list(args) + [v for _, v in rhs.kws], array_dists,
+                                      [name for name, _ in rhs.kws])
             return
 
         # sdc.distributed_api functions
@@ -600,13 +639,81 @@ class DistributedAnalysis(object):
         # set REP if not found
         self._analyze_call_set_REP(lhs, args, array_dists, 'array.' + func_name)
 
-    def _analyze_call_df(self, lhs, arr, func_name, args, array_dists):
-        # to_csv() can be parallelized
+    def _analyze_call_df(self, lhs, df, func_name, args, array_dists):
+        # to_csv() keeps distribution of df, it is left to DistributedPass._run_call_df
         if func_name == 'to_csv':
             return
 
+        if func_name in _df_rowwise_methods:
+            self._meet_rowwise_dists(lhs, [df] + args, array_dists)
+            return
+
         # set REP if not found
-        self._analyze_call_set_REP(lhs, args, array_dists, 'df.' + func_name)
+        self._analyze_call_set_REP(lhs, [df] + args, array_dists, 'df.' + func_name)
+
+    def _analyze_call_series(self, lhs, series, func_name, args, array_dists, kw_names=()):
+        """analyze distributions of Series methods (S.func_name) and
+        string methods (S.str.func_name), args include values of keyword arguments named kw_names
+        """
+        if isinstance(self.typemap[series.name], StringMethodsType):
+            # all string methods are applied to each element independently
+            self._meet_rowwise_dists(lhs, [series] + args, array_dists)
+            return
+
+        if func_name in _series_reductions and not args:
+            return
+
+        if func_name in _series_rowwise_methods:
+            self._meet_rowwise_dists(lhs, [series] + args, array_dists)
+            return
+
+        is_dist_sort = (func_name in _series_sort_methods and len(args) == len(kw_names)
+                        and dist_sort_series_supported(self.typemap[series.name], kw_names))
+        if (func_name in _series_filter_methods and not args) or is_dist_sort:
+            if lhs not in array_dists:
+                array_dists[lhs] = Distribution.OneD_Var
+            in_dist = array_dists[series.name]
+            out_dist = Distribution(min(array_dists[lhs].value, in_dist.value, Distribution.OneD_Var.value))
+            array_dists[lhs] = out_dist
+            # output can cause input REP
+            if out_dist == Distribution.REP:
+                array_dists[series.name] = out_dist
+            return
+
+        # set REP if not found
+        array_dists[series.name] = Distribution.REP
+        self._analyze_call_set_REP(lhs, args, array_dists, 'series.' + func_name)
+
+    def _analyze_getattr_series_df(self, lhs, rhs, array_dists):
+        """analyze distributions of Series and DataFrame attributes like df.A, S.values and S.str
+        """
+        lhs_typ = self.typemap[lhs]
+        if (rhs.attr in _series_df_data_attrs or is_array(self.typemap, lhs)
+                or isinstance(lhs_typ, (SeriesType, DataFrameType, StringMethodsType))):
+            self._meet_array_dists(lhs, rhs.value.name, array_dists)
+            return
+
+        # methods are analyzed when called
+        if isinstance(lhs_typ, types.BoundFunction) or rhs.attr in _series_df_meta_attrs:
+            return
+
+        # attributes like shape and accessors like iloc depend on position of the data
+        self._set_REP([rhs.value], array_dists)
+
+    def _meet_rowwise_dists(self, lhs, in_vars, array_dists):
+        """lhs computed from the same rows of inputs has the same distribution as all of them
+        """
+        names = [v.name for v in in_vars
+                 if (is_array(self.typemap, v.name)
+                     or isinstance(self.typemap[v.name], (SeriesType, DataFrameType, StringMethodsType)))]
+        if not names:
+            return
+
+        new_dist = None
+        for name in names:
+            new_dist = self._meet_array_dists(lhs, name, array_dists, new_dist)
+        for name in names:
+            array_dists[name] = new_dist
 
     def _analyze_call_hpat_dist(self, lhs, func_name, args, array_dists):
         """analyze distributions of hpat distributed functions
@@ -728,12 +835,12 @@ class DistributedAnalysis(object):
         for v in args:
             if (is_array(self.typemap, v.name)
                     or is_array_container(self.typemap, v.name)
-                    or isinstance(self.typemap[v.name], DataFrameType)):
+                    or isinstance(self.typemap[v.name], (SeriesType, DataFrameType))):
                 dprint("dist setting call arg REP {} in {}".format(v.name, fdef))
                 array_dists[v.name] = Distribution.REP
         if (is_array(self.typemap, lhs)
                 or is_array_container(self.typemap, lhs)
-                or isinstance(self.typemap[lhs], DataFrameType)):
+                or isinstance(self.typemap[lhs], (SeriesType, DataFrameType))):
             dprint("dist setting call out REP {} in {}".format(lhs, fdef))
             array_dists[lhs] = Distribution.REP
 
@@ -749,6 +856,10 @@ class DistributedAnalysis(object):
                 self._meet_array_dists(lhs, arr.name, array_dists)
                 return
 
+        if isinstance(self.typemap[rhs.value.name], (SeriesType, DataFrameType)):
+            self._analyze_getitem_series_df(inst, lhs, rhs, array_dists)
+            return
+
         if rhs.op == 'static_getitem':
             if rhs.index_var is None:
                 # TODO: things like A[0] need broadcast
@@ -813,6 +924,40 @@ class DistributedAnalysis(object):
         self._set_REP(inst.list_vars(), array_dists)
         return
 
+    def _analyze_getitem_series_df(self, inst, lhs, rhs, array_dists):
+        """analyze DataFrame columns selection like df['A'] and
+        Series or DataFrame rows selection with boolean mask like S[S > 0]
+        """
+        if rhs.op == 'static_getitem':
+            index_typ = types.literal(rhs.index) if isinstance(rhs.index, str) else None
+            if isinstance(rhs.index, tuple) and all(isinstance(name, str) for name in rhs.index):
+                index_typ = types.Tuple([types.literal(name) for name in rhs.index])
+        else:
+            index_typ = self.typemap[rhs.index.name]
+
+        is_columns_index = (isinstance(index_typ, (types.StringLiteral, types.UnicodeType))
+                            or (isinstance(index_typ, types.BaseTuple)
+                                and all(isinstance(t, types.StringLiteral) for t in index_typ.types)))
+        if isinstance(self.typemap[rhs.value.name], DataFrameType) and is_columns_index:
+            self._meet_array_dists(lhs, rhs.value.name, array_dists)
+            return
+
+        is_mask_index = (isinstance(index_typ, (SeriesType, types.Array))
+                         and index_typ.dtype == types.boolean)
+        if rhs.op == 'getitem' and is_mask_index:
+            # data and mask have the same distribution
+            new_dist = self._meet_array_dists(rhs.index.name, rhs.value.name, array_dists)
+            if lhs not in array_dists:
+                array_dists[lhs] = Distribution.OneD_Var
+            out_dist = Distribution(min(array_dists[lhs].value, new_dist.value, Distribution.OneD_Var.value))
+            array_dists[lhs] = out_dist
+            # output can cause input REP
+            if out_dist == Distribution.REP:
+                self._set_REP([rhs.index, rhs.value], array_dists)
+            return
+
+        self._set_REP(inst.list_vars(), array_dists)
+
     def _analyze_setitem(self, inst, array_dists):
         if isinstance(inst, ir.SetItem):
             index_var = inst.index
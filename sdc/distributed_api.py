@@ -46,9 +46,10 @@ import sdc
 from sdc.str_arr_ext import (string_array_type, num_total_chars, StringArray,
                              pre_alloc_string_array, get_offset_ptr,
                              get_data_ptr, convert_len_arr_to_offset)
+from sdc.str_arr_type import offset_typ
 from sdc.utilities.utils import (debug_prints, empty_like_type, _numba_to_c_type_map, unliteral_all)
 
-from . import transport_seq as transport
+from .transport import transport
 
 
 ll.add_symbol('c_alltoall', transport.c_alltoall)
@@ -201,7 +202,7 @@ def gatherv_overload(data):
         return gatherv_impl
 
     if data == string_array_type:
-        int32_typ_enum = np.int32(_numba_to_c_type_map[types.int32])
+        offset_typ_enum = np.int32(_numba_to_c_type_map[offset_typ])
         char_typ_enum = np.int32(_numba_to_c_type_map[types.uint8])
 
         def gatherv_str_arr_impl(data):
@@ -210,7 +211,7 @@ def gatherv_overload(data):
             n_all_chars = num_total_chars(data)
 
             # allocate send lens arrays
-            send_arr_lens = np.empty(n_loc, np.uint32)  # XXX offset type is uint32
+            send_arr_lens = np.empty(n_loc, np.uint64)
             send_data_ptr = get_data_ptr(data)
 
             for i in range(n_loc):
@@ -240,7 +241,7 @@ def gatherv_overload(data):
                 offset_ptr,
                 recv_counts.ctypes,
                 displs.ctypes,
-                int32_typ_enum)
+                offset_typ_enum)
             c_gatherv(
                 send_data_ptr,
                 np.int32(n_all_chars),
@@ -273,7 +274,7 @@ def bcast_overload(data):
         return bcast_impl
 
     if data == string_array_type:
-        int32_typ_enum = np.int32(_numba_to_c_type_map[types.int32])
+        offset_typ_enum = np.int32(_numba_to_c_type_map[offset_typ])
         char_typ_enum = np.int32(_numba_to_c_type_map[types.uint8])
 
         def bcast_str_impl(data):
@@ -287,14 +288,14 @@ def bcast_overload(data):
             data_ptr = get_data_ptr(data)
 
             if rank == MPI_ROOT:
-                send_arr_lens = np.empty(n_loc, np.uint32)  # XXX offset type is uint32
+                send_arr_lens = np.empty(n_loc, np.uint64)
                 for i in range(n_loc):
                     _str = data[i]
                     send_arr_lens[i] = len(_str)
 
-                c_bcast(send_arr_lens.ctypes, np.int32(n_loc), int32_typ_enum)
+                c_bcast(send_arr_lens.ctypes, np.int32(n_loc), offset_typ_enum)
             else:
-                c_bcast(offset_ptr, np.int32(n_loc), int32_typ_enum)
+                c_bcast(offset_ptr, np.int32(n_loc), offset_typ_enum)
 
             c_bcast(data_ptr, np.int32(n_all_chars), char_typ_enum)
             if rank != MPI_ROOT:
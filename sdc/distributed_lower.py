@@ -49,7 +49,7 @@ from sdc.utilities.utils import _numba_to_c_type_map
 from sdc.distributed_api import mpi_req_numba_type, ReqArrayType, req_array_type
 from . import hdist
 
-from . import transport_seq as transport
+from .transport import transport
 
 
 ll.add_symbol('hpat_dist_get_rank', transport.hpat_dist_get_rank)
@@ -0,0 +1,337 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+
+| This file contains the lookup engine used for label based access to index values (.loc, .at, in, reindex).
+| Int64Index carries its own engine which is built lazily on the first lookup and cached inside the index:
+| monotonic increasing indexes are searched with binary search, otherwise index values are mapped to dense
+| codes with a hash table and positions of each code are grouped with a counting sort.
+| The engine is built by a single thread guarded by an atomic state word, so concurrent first lookups
+| (e.g. in prange) wait for it. Engines of unboxed indexes are cached for the pandas index object,
+| so that repeated calls from Python build the engine once.
+| Other indexes are searched with a parallel linear scan.
+
+"""
+
+import weakref
+
+import numpy
+
+from numba import types, prange
+from numba.core.typing.templates import signature
+from numba.extending import intrinsic
+from numba.typed import Dict, List
+
+from sdc.datatypes.int64_index_type import Int64IndexType
+from sdc.functions.groupby import group_rows_by_codes
+from sdc.utilities.prange_utils import parallel_chunks
+from sdc.utilities.utils import sdc_overload, sdc_register_jitable
+
+
+_engine_array_type = types.Array(types.int64, 1, 'C')
+
+# values of the engine state word
+_engine_empty = 0
+_engine_building = 1
+_engine_built = 2
+
+
+def int64_index_engine_empty():
+    """
+    Creates empty engine members of Int64Index struct, used when Int64Index is created or unboxed.
+    Engine data is [state, flags, offsets, positions], where state is the engine state word and flags are
+    [is_monotonic_increasing, is_unique], other items are set when the engine is built.
+    Items are only replaced afterwards, so that the list is never reallocated while it's read by other threads.
+    """
+    engine_map = Dict.empty(key_type=types.int64, value_type=types.int64)
+    engine_data = List.empty_list(_engine_array_type)
+    engine_data.append(numpy.zeros(1, dtype=numpy.int64))
+    for _ in range(3):
+        engine_data.append(numpy.zeros(2, dtype=numpy.int64))
+    return engine_map, engine_data
+
+
+# engines of unboxed indexes keyed by id of the pandas index object, removed when the object is deleted
+_int64_index_engines = {}
+
+
+def get_int64_index_engine(index):
+    """ Returns engine members cached for the pandas Int64Index object, creates empty ones on the first call """
+    key = id(index)
+    engine = _int64_index_engines.get(key)
+    if engine is None:
+        engine = int64_index_engine_empty()
+        _int64_index_engines[key] = engine
+        weakref.finalize(index, _int64_index_engines.pop, key, None)
+
+    return engine
+
+
+@intrinsic
+def _atomic_load(typingctx, arr):
+    """ Atomically loads arr[0] with acquire ordering """
+    def codegen(context, builder, sig, args):
+        ary = context.make_array(sig.args[0])(context, builder, args[0])
+        return builder.load_atomic(ary.data, 'acquire', 8)
+
+    return signature(types.int64, arr), codegen
+
+
+@intrinsic
+def _atomic_store(typingctx, arr, value):
+    """ Atomically stores value to arr[0] with release ordering """
+    def codegen(context, builder, sig, args):
+        ary = context.make_array(sig.args[0])(context, builder, args[0])
+        builder.store_atomic(args[1], ary.data, 'release', 8)
+        return context.get_dummy_value()
+
+    return signature(types.none, arr, types.int64), codegen
+
+
+@intrinsic
+def _atomic_compare_exchange(typingctx, arr, expected, desired):
+    """ Atomically replaces arr[0] with desired if it equals expected, returns True if it was replaced """
+    def codegen(context, builder, sig, args):
+        ary = context.make_array(sig.args[0])(context, builder, args[0])
+        res = builder.cmpxchg(ary.data, args[1], args[2], 'acq_rel', 'acquire')
+        return builder.extract_value(res, 1)
+
+    return signature(types.boolean, arr, types.int64, types.int64), codegen
+
+
+@sdc_register_jitable
+def _int64_index_engine_build(index):
+    """
+    Builds lookup engine of Int64Index if it was not built yet. Only the thread switching the engine state
+    from empty to building builds it, other threads wait until it's built.
+    """
+    engine_data = index._engine_data
+    state = engine_data[0]
+    if _atomic_load(state) == _engine_built:
+        return
+
+    if not _atomic_compare_exchange(state, _engine_empty, _engine_building):
+        while _atomic_load(state) != _engine_built:
+            pass
+        return
+
+    _int64_index_engine_fill(index)
+    _atomic_store(state, _engine_built)
+
+
+@sdc_register_jitable
+def _int64_index_engine_fill(index):
+    engine_data = index._engine_data
+    data = index._data
+    size = len(data)
+    chunks = parallel_chunks(size)
+    n_chunks = len(chunks)
+    chunk_is_monotonic = numpy.ones(n_chunks, dtype=numpy.bool_)
+    chunk_is_unique = numpy.ones(n_chunks, dtype=numpy.bool_)
+    for i in prange(n_chunks):
+        chunk = chunks[i]
+        for j in range(max(chunk.start, 1), chunk.stop):
+            if data[j - 1] > data[j]:
+                chunk_is_monotonic[i] = False
+                break
+            if data[j - 1] == data[j]:
+                chunk_is_unique[i] = False
+
+    flags = numpy.zeros(2, dtype=numpy.int64)
+    if chunk_is_monotonic.all():
+        flags[0] = 1
+        flags[1] = 1 if chunk_is_unique.all() else 0
+        engine_data[1] = flags
+        return
+
+    engine_map = index._engine_map
+    codes = numpy.empty(size, dtype=numpy.int64)
+    for i in range(size):
+        value = data[i]
+        code = engine_map.get(value, -1)
+        if code < 0:
+            code = len(engine_map)
+            engine_map[value] = code
+        codes[i] = code
+
+    n_codes = len(engine_map)
+    flags[1] = 1 if n_codes == size else 0
+    _, offsets, positions = group_rows_by_codes(codes, n_codes)
+
+    engine_data[1] = flags
+    engine_data[2] = offsets
+    engine_data[3] = positions
+
+
+@sdc_register_jitable
+def _int64_index_engine_is_monotonic(index):
+    return index._engine_data[1][0] == 1
+
+
+@sdc_register_jitable
+def _int64_index_engine_is_unique(index):
+    return index._engine_data[1][1] == 1
+
+
+@sdc_register_jitable
+def _int64_index_engine_get_loc(index, value):
+    """ Returns position of value in unique Int64Index or -1 if value is not found """
+    data = index._data
+    if _int64_index_engine_is_monotonic(index):
+        pos = numpy.searchsorted(data, value)
+        if pos < len(data) and data[pos] == value:
+            return pos
+        return -1
+
+    code = index._engine_map.get(value, -1)
+    if code < 0:
+        return -1
+    offsets, positions = index._engine_data[2], index._engine_data[3]
+    return positions[offsets[code]]
+
+
+def index_engine_get_locs(index, value):
+    """
+    Returns positions of all occurrences of a label in the index in increasing order.
+
+    Parameters
+    -----------
+    index: :obj:`Int64Index`, :obj:`RangeIndex`, :obj:`Array` or :obj:`StringArray`
+        Index to search in
+    value: :obj:`scalar`
+        Label to search for
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Positions of the label in the index (empty if label is not found)
+    """
+    pass
+
+
+@sdc_overload(index_engine_get_locs)
+def index_engine_get_locs_overload(index, value):
+
+    if isinstance(index, Int64IndexType) and isinstance(value, types.Integer):
+        def index_engine_get_locs_int64_index_impl(index, value):
+            _int64_index_engine_build(index)
+            if _int64_index_engine_is_monotonic(index):
+                start = numpy.searchsorted(index._data, value, side='left')
+                stop = numpy.searchsorted(index._data, value, side='right')
+                return numpy.arange(start, stop).astype(numpy.int64)
+
+            code = index._engine_map.get(value, -1)
+            if code < 0:
+                return numpy.empty(0, dtype=numpy.int64)
+            offsets, positions = index._engine_data[2], index._engine_data[3]
+            return positions[offsets[code]:offsets[code + 1]].copy()
+
+        return index_engine_get_locs_int64_index_impl
+
+    def index_engine_get_locs_impl(index, value):
+        chunks = parallel_chunks(len(index))
+        n_chunks = len(chunks)
+        chunk_counts = numpy.zeros(n_chunks, dtype=numpy.int64)
+        for i in prange(n_chunks):
+            chunk = chunks[i]
+            for j in range(chunk.start, chunk.stop):
+                if index[j] == value:
+                    chunk_counts[i] += 1
+
+        chunk_offsets = numpy.zeros(n_chunks + 1, dtype=numpy.int64)
+        for i in range(n_chunks):
+            chunk_offsets[i + 1] = chunk_offsets[i] + chunk_counts[i]
+
+        res = numpy.empty(chunk_offsets[n_chunks], dtype=numpy.int64)
+        for i in prange(n_chunks):
+            chunk = chunks[i]
+            current_pos = chunk_offsets[i]
+            for j in range(chunk.start, chunk.stop):
+                if index[j] == value:
+                    res[current_pos] = j
+                    current_pos += 1
+
+        return res
+
+    return index_engine_get_locs_impl
+
+
+def index_engine_contains(index, value):
+    """ Returns True if label is found in the index """
+    pass
+
+
+@sdc_overload(index_engine_contains)
+def index_engine_contains_overload(index, value):
+
+    if isinstance(index, Int64IndexType) and isinstance(value, types.Integer):
+        def index_engine_contains_int64_index_impl(index, value):
+            _int64_index_engine_build(index)
+            if _int64_index_engine_is_monotonic(index):
+                return _int64_index_engine_get_loc(index, value) >= 0
+            return value in index._engine_map
+
+        return index_engine_contains_int64_index_impl
+
+    def index_engine_contains_impl(index, value):
+        found = 0
+        for i in prange(len(index)):
+            if index[i] == value:
+                found += 1
+
+        return found > 0
+
+    return index_engine_contains_impl
+
+
+def index_engine_get_indexer(index, target):
+    """
+    Computes positions of target labels in the unique index, -1 marks labels that are not found.
+    Raises ValueError if the index has duplicates.
+    """
+    pass
+
+
+@sdc_overload(index_engine_get_indexer)
+def index_engine_get_indexer_overload(index, target):
+
+    if not (isinstance(index, Int64IndexType) and isinstance(target.dtype, types.Integer)):
+        return None
+
+    def index_engine_get_indexer_impl(index, target):
+        _int64_index_engine_build(index)
+        if not _int64_index_engine_is_unique(index):
+            raise ValueError("cannot reindex from a duplicate axis")
+
+        size = len(target)
+        res = numpy.empty(size, dtype=numpy.int64)
+        for i in prange(size):
+            res[i] = _int64_index_engine_get_loc(index, target[i])
+
+        return res
+
+    return index_engine_get_indexer_impl
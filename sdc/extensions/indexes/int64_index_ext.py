@@ -30,7 +30,7 @@ import numpy as np
 import operator
 import pandas as pd
 
-from numba import types, prange
+from numba import types
 from numba.core import cgutils
 from numba.extending import (typeof_impl, NativeValue, intrinsic, box, unbox, lower_builtin, )
 from numba.core.errors import TypingError
@@ -38,13 +38,23 @@ from numba.core.typing.templates import signature
 from numba.core.imputils import impl_ret_untracked, call_getiter
 
 from sdc.datatypes.range_index_type import RangeIndexType
-from sdc.datatypes.int64_index_type import Int64IndexType
+from sdc.datatypes.int64_index_type import (Int64IndexType, int64_index_engine_map_type,
+                                            int64_index_engine_data_type)
 from sdc.utilities.utils import sdc_overload, sdc_overload_attribute, sdc_overload_method
 from sdc.utilities.sdc_typing_utils import TypeChecker, check_is_numeric_array, check_signed_integer
 from sdc.functions import numpy_like
 from numba.core.boxing import box_array, unbox_array
 from sdc.hiframes.api import fix_df_index
 from sdc.extensions.indexes.indexes_generic import _check_dtype_param_type
+from sdc.extensions.indexes.index_engine import (index_engine_contains, int64_index_engine_empty,
+                                                 get_int64_index_engine)
+
+
+def _make_int64_index_engine(context, builder):
+    """ Creates empty lookup engine members of Int64Index struct, the engine itself is built lazily """
+    engine_typ = types.Tuple([int64_index_engine_map_type, int64_index_engine_data_type])
+    engine = context.compile_internal(builder, int64_index_engine_empty, signature(engine_typ), [])
+    return builder.extract_value(engine, 0), builder.extract_value(engine, 1)
 
 
 @intrinsic
@@ -64,6 +74,7 @@ def init_int64_index(typingctx, data, name=None):
             sig.return_type)(context, builder)
 
         int64_index.data = data_val
+        int64_index.engine_map, int64_index.engine_data = _make_int64_index_engine(context, builder)
 
         if is_named:
             if isinstance(name, types.StringLiteral):
@@ -181,6 +192,16 @@ def unbox_int64_index(typ, val, c):
     int64_index.data = unbox_array(typ.data, index_data, c).value
     c.pyapi.decref(index_data)
 
+    # engine is shared with other unboxed copies of the pandas index object, so it's built only once
+    engine_fn = c.pyapi.unserialize(c.pyapi.serialize_object(get_int64_index_engine))
+    engine_obj = c.pyapi.call_function_objargs(engine_fn, (val, ))
+    engine_map_obj = c.pyapi.tuple_getitem(engine_obj, 0)
+    engine_data_obj = c.pyapi.tuple_getitem(engine_obj, 1)
+    int64_index.engine_map = c.pyapi.to_native_value(int64_index_engine_map_type, engine_map_obj).value
+    int64_index.engine_data = c.pyapi.to_native_value(int64_index_engine_data_type, engine_data_obj).value
+    c.pyapi.decref(engine_obj)
+    c.pyapi.decref(engine_fn)
+
     if typ.is_named:
         name_obj = c.pyapi.object_getattr_string(val, "name")
         int64_index.name = numba.cpython.unicode.unbox_unicode_str(
@@ -254,13 +275,7 @@ def pd_int64_index_contains_overload(self, val):
         ty_checker.raise_exc(val, 'integer scalar', 'val')
 
     def pd_int64_index_contains_impl(self, val):
-        # TO-DO: add operator.contains support for arrays in Numba
-        found = 0
-        for i in prange(len(self._data)):
-            if val == self._data[i]:
-                found += 1
-
-        return found > 0
+        return index_engine_contains(self, val)
 
     return pd_int64_index_contains_impl
 
@@ -0,0 +1,677 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+
+| This file contains the hash-aggregation engine used by SDC groupby implementations.
+| Grouping keys are factorized once into dense integer codes, then every aggregation
+| is computed in a single parallel pass over the data with per-chunk partial states
+| that are merged at the end. When partial states of all chunks would take much more memory
+| than the data itself (i.e. for millions of groups), rows are grouped by codes with a parallel
+| stable sort instead and each group is aggregated by a single thread.
+
+"""
+
+import numba
+import numpy
+
+from numba import types, prange
+from numba.typed import Dict
+
+from sdc.hiframes.api import isna
+from sdc.functions.sort import parallel_stable_argsort
+from sdc.str_arr_ext import StringArrayType
+from sdc.utilities.prange_utils import parallel_chunks
+from sdc.utilities.utils import sdc_overload, sdc_register_jitable
+
+
+def factorize_keys(data):
+    """
+    Maps each element of data to a dense group code.
+
+    Parameters
+    -----------
+    data: :obj:`Array` or :obj:`StringArray`
+        Array of grouping keys
+
+    Returns
+    -------
+    :obj:`tuple` of (:obj:`Dict`, :obj:`Array` of dtype :class:`int64`)
+        Typed dict mapping each unique non-NA key to its code (codes are assigned in order of
+        first appearance and dict preserves that order) and array of codes for each element
+        of data, with -1 marking NA elements
+    """
+
+    pass
+
+
+def _gen_factorize_keys_impl(key_type, is_na):
+    """Generates factorization of an array with keys of key_type, elements checked by is_na are skipped"""
+
+    def factorize_keys_impl(data):
+        size = len(data)
+        chunks = parallel_chunks(size)
+        n_chunks = len(chunks)
+
+        # assign chunk-local codes using separate dict for each chunk of initial array
+        codes = numpy.empty(size, dtype=numpy.int64)
+        dict_parts = [Dict.empty(key_type, types.int64) for _ in range(n_chunks)]
+        for i in prange(n_chunks):
+            chunk = chunks[i]
+            local_codes = dict_parts[i]
+            for j in range(chunk.start, chunk.stop):
+                if is_na(data, j):
+                    codes[j] = -1
+                    continue
+                value = data[j]
+                code = local_codes.get(value, -1)
+                if code == -1:
+                    code = len(local_codes)
+                    local_codes[value] = code
+                codes[j] = code
+
+        # merge local dicts in chunk order, so that global codes also follow order of first appearance,
+        # and remember how each local code maps into the global one
+        parts_offsets = numpy.zeros(n_chunks + 1, dtype=numpy.int64)
+        for i in range(n_chunks):
+            parts_offsets[i + 1] = parts_offsets[i] + len(dict_parts[i])
+
+        codes_map = numpy.empty(parts_offsets[n_chunks], dtype=numpy.int64)
+        key_to_code = Dict.empty(key_type, types.int64)
+        for i in range(n_chunks):
+            map_start = parts_offsets[i]
+            for value, local_code in dict_parts[i].items():
+                code = key_to_code.get(value, -1)
+                if code == -1:
+                    code = len(key_to_code)
+                    key_to_code[value] = code
+                codes_map[map_start + local_code] = code
+
+        for i in prange(n_chunks):
+            chunk = chunks[i]
+            map_start = parts_offsets[i]
+            for j in range(chunk.start, chunk.stop):
+                local_code = codes[j]
+                if local_code >= 0:
+                    codes[j] = codes_map[map_start + local_code]
+
+        return key_to_code, codes
+
+    return factorize_keys_impl
+
+
+@sdc_overload(factorize_keys)
+def factorize_keys_overload(data):
+
+    if not isinstance(data, (types.Array, StringArrayType)):
+        return None
+
+    return _gen_factorize_keys_impl(data.dtype, isna)
+
+
+# per-chunk partial states are used while they have at most this many elements or not more than rows
+min_partial_states = 1 << 16
+
+
+@sdc_register_jitable
+def _use_partial_states(n_chunks, n_groups, n_rows):
+    return n_chunks * n_groups <= max(n_rows, min_partial_states)
+
+
+@sdc_register_jitable
+def group_rows_by_codes(codes, n_codes):
+    """
+    Groups positions of rows by codes. Returns number of rows in each group,
+    offsets of groups and positions of rows (in original order within a group). NA rows are skipped.
+    Rows are grouped with a parallel counting sort, or with a parallel stable argsort of codes
+    if per-chunk counts would take too much memory.
+    """
+    chunks = parallel_chunks(len(codes))
+    n_chunks = len(chunks)
+
+    if not _use_partial_states(n_chunks, n_codes, len(codes)):
+        order = parallel_stable_argsort(codes)
+        sorted_codes = codes[order]
+        # NA rows have negative codes and come first
+        offsets = numpy.empty(n_codes + 1, dtype=numpy.int64)
+        for k in prange(n_codes + 1):
+            offsets[k] = numpy.searchsorted(sorted_codes, k)
+        n_na = offsets[0]
+        offsets -= n_na
+        counts = offsets[1:] - offsets[:-1]
+        positions = order[n_na:].copy()
+
+        return counts, offsets, positions
+
+    partial_counts = numpy.zeros((n_chunks, n_codes), dtype=numpy.int64)
+    for i in prange(n_chunks):
+        chunk = chunks[i]
+        for j in range(chunk.start, chunk.stop):
+            code = codes[j]
+            if code >= 0:
+                partial_counts[i, code] += 1
+
+    counts = numpy.empty(n_codes, dtype=numpy.int64)
+    for k in prange(n_codes):
+        res = 0
+        for i in range(n_chunks):
+            res += partial_counts[i, k]
+        counts[k] = res
+
+    offsets = numpy.zeros(n_codes + 1, dtype=numpy.int64)
+    for k in range(n_codes):
+        offsets[k + 1] = offsets[k] + counts[k]
+
+    # turn partial counts into positions where each chunk starts writing rows of each group
+    for k in prange(n_codes):
+        write_pos = offsets[k]
+        for i in range(n_chunks):
+            chunk_count = partial_counts[i, k]
+            partial_counts[i, k] = write_pos
+            write_pos += chunk_count
+
+    positions = numpy.empty(offsets[n_codes], dtype=numpy.int64)
+    for i in prange(n_chunks):
+        chunk = chunks[i]
+        for j in range(chunk.start, chunk.stop):
+            code = codes[j]
+            if code >= 0:
+                positions[partial_counts[i, code]] = j
+                partial_counts[i, code] += 1
+
+    return counts, offsets, positions
+
+
+@sdc_register_jitable
+def count_codes(codes, n_codes):
+    """
+    Counts occurrences of each code in codes using per-chunk partial counts,
+    the extra last element of the result holds the number of NA elements (codes equal to -1)
+    """
+    chunks = parallel_chunks(len(codes))
+    n_chunks = len(chunks)
+
+    if not _use_partial_states(n_chunks, n_codes + 1, len(codes)):
+        group_counts, offsets, _ = group_rows_by_codes(codes, n_codes)
+        counts = numpy.empty(n_codes + 1, dtype=numpy.int64)
+        counts[:n_codes] = group_counts
+        counts[n_codes] = len(codes) - offsets[n_codes]
+        return counts
+
+    partial_counts = numpy.zeros((n_chunks, n_codes + 1), dtype=numpy.int64)
+    for i in prange(n_chunks):
+        chunk = chunks[i]
+        for j in range(chunk.start, chunk.stop):
+            code = codes[j]
+            if code < 0:
+                code = n_codes
+            partial_counts[i, code] += 1
+
+    counts = numpy.empty(n_codes + 1, dtype=numpy.int64)
+    for k in prange(n_codes + 1):
+        res = 0
+        for i in range(n_chunks):
+            res += partial_counts[i, k]
+        counts[k] = res
+
+    return counts
+
+
+def groupby_count(data, codes, out):
+    pass
+
+
+def groupby_sum(data, codes, out):
+    pass
+
+
+def groupby_prod(data, codes, out):
+    pass
+
+
+def groupby_min(data, codes, out):
+    pass
+
+
+def groupby_max(data, codes, out):
+    pass
+
+
+def groupby_mean(data, codes, out):
+    pass
+
+
+def groupby_var(data, codes, out, ddof=1):
+    pass
+
+
+def groupby_std(data, codes, out, ddof=1):
+    pass
+
+
+def groupby_median(data, codes, out):
+    pass
+
+
+def _check_numeric_data(data):
+    return isinstance(data, types.Array) and isinstance(data.dtype, (types.Number, types.Boolean))
+
+
+@sdc_overload(groupby_count)
+def groupby_count_overload(data, codes, out):
+    """
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Computes number of non-NA values of data in each group and stores it into out,
+    where out[k] corresponds to rows having codes equal to k.
+
+    .. only:: developer
+       Test: python -m sdc.runtests -k sdc.tests.test_groupby.TestGroupBy.test_dataframe_groupby_count*
+    """
+
+    if not isinstance(data, (types.Array, StringArrayType)):
+        return None
+
+    def groupby_count_impl(data, codes, out):
+        n_groups = len(out)
+        chunks = parallel_chunks(len(data))
+        n_chunks = len(chunks)
+
+        if not _use_partial_states(n_chunks, n_groups, len(data)):
+            _, offsets, positions = group_rows_by_codes(codes, n_groups)
+            for k in prange(n_groups):
+                res = 0
+                for p in range(offsets[k], offsets[k + 1]):
+                    if not isna(data, positions[p]):
+                        res += 1
+                out[k] = res
+            return
+
+        partial_counts = numpy.zeros((n_chunks, n_groups), dtype=numpy.int64)
+        for i in prange(n_chunks):
+            chunk = chunks[i]
+            for j in range(chunk.start, chunk.stop):
+                code = codes[j]
+                if code < 0 or isna(data, j):
+                    continue
+                partial_counts[i, code] += 1
+
+        for k in prange(n_groups):
+            res = 0
+            for i in range(n_chunks):
+                res += partial_counts[i, k]
+            out[k] = res
+
+    return groupby_count_impl
+
+
+def _gen_groupby_accumulate_overload(is_prod):
+    """Generates overload of groupby sum or prod, depending on is_prod flag"""
+
+    def groupby_accumulate_overload(data, codes, out):
+        if not _check_numeric_data(data):
+            return None
+
+        acc_dtype = types.float64 if isinstance(data.dtype, types.Float) else types.int64
+        initial_value = 1 if is_prod else 0
+
+        def groupby_accumulate_impl(data, codes, out):
+            n_groups = len(out)
+            chunks = parallel_chunks(len(data))
+            n_chunks = len(chunks)
+
+            if not _use_partial_states(n_chunks, n_groups, len(data)):
+                _, offsets, positions = group_rows_by_codes(codes, n_groups)
+                for k in prange(n_groups):
+                    res = acc_dtype(initial_value)
+                    for p in range(offsets[k], offsets[k + 1]):
+                        j = positions[p]
+                        if isna(data, j):
+                            continue
+                        if is_prod == True:  # noqa
+                            res *= data[j]
+                        else:
+                            res += data[j]
+                    out[k] = res
+                return
+
+            partial_res = numpy.full((n_chunks, n_groups), initial_value, dtype=acc_dtype)
+            for i in prange(n_chunks):
+                chunk = chunks[i]
+                for j in range(chunk.start, chunk.stop):
+                    code = codes[j]
+                    if code < 0 or isna(data, j):
+                        continue
+                    if is_prod == True:  # noqa
+                        partial_res[i, code] *= data[j]
+                    else:
+                        partial_res[i, code] += data[j]
+
+            for k in prange(n_groups):
+                res = partial_res[0, k]
+                for i in range(1, n_chunks):
+                    if is_prod == True:  # noqa
+                        res *= partial_res[i, k]
+                    else:
+                        res += partial_res[i, k]
+                out[k] = res
+
+        return groupby_accumulate_impl
+
+    return groupby_accumulate_overload
+
+
+sdc_overload(groupby_sum)(_gen_groupby_accumulate_overload(False))
+sdc_overload(groupby_prod)(_gen_groupby_accumulate_overload(True))
+
+
+def _gen_groupby_min_max_overload(reduce_op):
+    """Generates overload of groupby min or max, depending on reduce_op"""
+
+    def groupby_min_max_overload(data, codes, out):
+        if not _check_numeric_data(data):
+            return None
+
+        dtype = data.dtype
+
+        def groupby_min_max_impl(data, codes, out):
+            n_groups = len(out)
+            chunks = parallel_chunks(len(data))
+            n_chunks = len(chunks)
+
+            if not _use_partial_states(n_chunks, n_groups, len(data)):
+                _, offsets, positions = group_rows_by_codes(codes, n_groups)
+                for k in prange(n_groups):
+                    seen = False
+                    res = dtype(0)
+                    for p in range(offsets[k], offsets[k + 1]):
+                        j = positions[p]
+                        if isna(data, j):
+                            continue
+                        if seen:
+                            res = reduce_op(res, data[j])
+                        else:
+                            res = data[j]
+                            seen = True
+                    if seen:
+                        out[k] = res
+                    else:
+                        out[k] = numpy.nan
+                return
+
+            partial_res = numpy.empty((n_chunks, n_groups), dtype=dtype)
+            partial_seen = numpy.zeros((n_chunks, n_groups), dtype=numpy.bool_)
+            for i in prange(n_chunks):
+                chunk = chunks[i]
+                for j in range(chunk.start, chunk.stop):
+                    code = codes[j]
+                    value = data[j]
+                    if code < 0 or isna(data, j):
+                        continue
+                    if partial_seen[i, code]:
+                        partial_res[i, code] = reduce_op(partial_res[i, code], value)
+                    else:
+                        partial_res[i, code] = value
+                        partial_seen[i, code] = True
+
+            for k in prange(n_groups):
+                seen = False
+                res = partial_res[0, k]
+                for i in range(n_chunks):
+                    if not partial_seen[i, k]:
+                        continue
+                    if seen:
+                        res = reduce_op(res, partial_res[i, k])
+                    else:
+                        res = partial_res[i, k]
+                        seen = True
+                if seen:
+                    out[k] = res
+                else:
+                    out[k] = numpy.nan
+
+        return groupby_min_max_impl
+
+    return groupby_min_max_overload
+
+
+sdc_overload(groupby_min)(_gen_groupby_min_max_overload(min))
+sdc_overload(groupby_max)(_gen_groupby_min_max_overload(max))
+
+
+@sdc_overload(groupby_mean)
+def groupby_mean_overload(data, codes, out):
+    """
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Computes mean of non-NA values of data in each group and stores it into out.
+
+    .. only:: developer
+       Test: python -m sdc.runtests -k sdc.tests.test_groupby.TestGroupBy.test_dataframe_groupby_mean*
+    """
+
+    if not _check_numeric_data(data):
+        return None
+
+    def groupby_mean_impl(data, codes, out):
+        n_groups = len(out)
+        chunks = parallel_chunks(len(data))
+        n_chunks = len(chunks)
+
+        if not _use_partial_states(n_chunks, n_groups, len(data)):
+            _, offsets, positions = group_rows_by_codes(codes, n_groups)
+            for k in prange(n_groups):
+                _sum = 0.
+                count = 0
+                for p in range(offsets[k], offsets[k + 1]):
+                    j = positions[p]
+                    if isna(data, j):
+                        continue
+                    _sum += data[j]
+                    count += 1
+                out[k] = _sum / count if count > 0 else numpy.nan
+            return
+
+        partial_sums = numpy.zeros((n_chunks, n_groups), dtype=numpy.float64)
+        partial_counts = numpy.zeros((n_chunks, n_groups), dtype=numpy.int64)
+        for i in prange(n_chunks):
+            chunk = chunks[i]
+            for j in range(chunk.start, chunk.stop):
+                code = codes[j]
+                if code < 0 or isna(data, j):
+                    continue
+                partial_sums[i, code] += data[j]
+                partial_counts[i, code] += 1
+
+        for k in prange(n_groups):
+            _sum = 0.
+            count = 0
+            for i in range(n_chunks):
+                _sum += partial_sums[i, k]
+                count += partial_counts[i, k]
+            out[k] = _sum / count if count > 0 else numpy.nan
+
+    return groupby_mean_impl
+
+
+@sdc_register_jitable
+def _groupby_var_impl(data, codes, n_groups, ddof):
+    """
+    Computes variance of each group using Welford's online algorithm for each chunk
+    and Chan's formula to merge partial results of chunks.
+    """
+
+    chunks = parallel_chunks(len(data))
+    n_chunks = len(chunks)
+
+    if not _use_partial_states(n_chunks, n_groups, len(data)):
+        _, offsets, positions = group_rows_by_codes(codes, n_groups)
+        result = numpy.empty(n_groups, dtype=numpy.float64)
+        for k in prange(n_groups):
+            count = 0
+            mean = 0.
+            m2 = 0.
+            for p in range(offsets[k], offsets[k + 1]):
+                j = positions[p]
+                if isna(data, j):
+                    continue
+                value = numpy.float64(data[j])
+                count += 1
+                delta = value - mean
+                mean += delta / count
+                m2 += delta * (value - mean)
+            result[k] = m2 / (count - ddof) if count > ddof else numpy.nan
+
+        return result
+
+    partial_counts = numpy.zeros((n_chunks, n_groups), dtype=numpy.int64)
+    partial_means = numpy.zeros((n_chunks, n_groups), dtype=numpy.float64)
+    partial_m2 = numpy.zeros((n_chunks, n_groups), dtype=numpy.float64)
+    for i in prange(n_chunks):
+        chunk = chunks[i]
+        for j in range(chunk.start, chunk.stop):
+            code = codes[j]
+            if code < 0 or isna(data, j):
+                continue
+            value = numpy.float64(data[j])
+            partial_counts[i, code] += 1
+            delta = value - partial_means[i, code]
+            partial_means[i, code] += delta / partial_counts[i, code]
+            partial_m2[i, code] += delta * (value - partial_means[i, code])
+
+    result = numpy.empty(n_groups, dtype=numpy.float64)
+    for k in prange(n_groups):
+        count = 0
+        mean = 0.
+        m2 = 0.
+        for i in range(n_chunks):
+            chunk_count = partial_counts[i, k]
+            if chunk_count == 0:
+                continue
+            new_count = count + chunk_count
+            delta = partial_means[i, k] - mean
+            mean += delta * chunk_count / new_count
+            m2 += partial_m2[i, k] + delta * delta * count * chunk_count / new_count
+            count = new_count
+        result[k] = m2 / (count - ddof) if count > ddof else numpy.nan
+
+    return result
+
+
+@sdc_overload(groupby_var)
+def groupby_var_overload(data, codes, out, ddof=1):
+    """
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Computes unbiased variance of non-NA values of data in each group and stores it into out.
+
+    .. only:: developer
+       Test: python -m sdc.runtests -k sdc.tests.test_groupby.TestGroupBy.test_dataframe_groupby_var*
+    """
+
+    if not _check_numeric_data(data):
+        return None
+
+    def groupby_var_impl(data, codes, out, ddof=1):
+        res = _groupby_var_impl(data, codes, len(out), ddof)
+        for k in prange(len(out)):
+            out[k] = res[k]
+
+    return groupby_var_impl
+
+
+@sdc_overload(groupby_std)
+def groupby_std_overload(data, codes, out, ddof=1):
+    """
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Computes standard deviation of non-NA values of data in each group and stores it into out.
+
+    .. only:: developer
+       Test: python -m sdc.runtests -k sdc.tests.test_groupby.TestGroupBy.test_dataframe_groupby_std*
+    """
+
+    if not _check_numeric_data(data):
+        return None
+
+    def groupby_std_impl(data, codes, out, ddof=1):
+        res = _groupby_var_impl(data, codes, len(out), ddof)
+        for k in prange(len(out)):
+            out[k] = numpy.sqrt(res[k])
+
+    return groupby_std_impl
+
+
+@sdc_overload(groupby_median)
+def groupby_median_overload(data, codes, out):
+    """
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Computes median of non-NA values of data in each group and stores it into out.
+    Values are written into a single buffer ordered by group codes (see :func:`group_rows_by_codes`),
+    so that no per-group containers are allocated.
+
+    .. only:: developer
+       Test: python -m sdc.runtests -k sdc.tests.test_groupby.TestGroupBy.test_dataframe_groupby_median*
+    """
+
+    if not _check_numeric_data(data):
+        return None
+
+    def groupby_median_impl(data, codes, out):
+        n_groups = len(out)
+        _, offsets, positions = group_rows_by_codes(codes, n_groups)
+
+        # non-NA values of each group are written to the beginning of its part of the buffer
+        grouped_values = numpy.empty(len(positions), dtype=numpy.float64)
+        for k in prange(n_groups):
+            start = offsets[k]
+            stop = start
+            for p in range(offsets[k], offsets[k + 1]):
+                j = positions[p]
+                if isna(data, j):
+                    continue
+                grouped_values[stop] = data[j]
+                stop += 1
+            if start == stop:
+                out[k] = numpy.nan
+            else:
+                out[k] = numpy.median(grouped_values[start:stop])
+
+    return groupby_median_impl
+
+
+groupby_aggregations = {
+    'count': groupby_count,
+    'max': groupby_max,
+    'mean': groupby_mean,
+    'median': groupby_median,
+    'min': groupby_min,
+    'prod': groupby_prod,
+    'std': groupby_std,
+    'sum': groupby_sum,
+    'var': groupby_var,
+}
@@ -0,0 +1,537 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+
+| This file contains the parallel hash join engine used by SDC merge implementations.
+| Keys of both tables are factorized into common dense integer codes, rows of each table are
+| grouped by code (see :func:`sdc.functions.groupby.group_rows_by_codes`) and the pairs
+| of matching rows are then written in parallel into preallocated indexer arrays.
+| Pre-sorted numeric keys are factorized with a single merge pass instead of hashing.
+
+"""
+
+import numpy
+
+from numba import types, prange
+
+import sdc
+from sdc.functions.groupby import factorize_keys, group_rows_by_codes, _gen_factorize_keys_impl
+from sdc.hiframes.api import isna
+from sdc.functions.str_arr_kernels import alloc_str_arr, copy_utf8, str_arr_set_nulls, str_arr_take
+from sdc.str_arr_ext import StringArrayType, get_chars_array, get_offsets_array, str_arr_is_na
+from sdc.utilities.prange_utils import parallel_chunks
+from sdc.utilities.utils import sdc_overload, sdc_register_jitable
+from sdc.utilities.compile_cache import exec_func_text
+
+
+def join_indexers(left_keys, right_keys, how, sort):
+    """
+    Computes positions of matching rows of two tables joined on key columns.
+
+    Parameters
+    -----------
+    left_keys: :obj:`tuple` of :obj:`Array` or :obj:`StringArray`
+        Key columns of the left table
+    right_keys: :obj:`tuple` of :obj:`Array` or :obj:`StringArray`
+        Key columns of the right table, dtypes must match ones of left_keys
+    how: :obj:`str`
+        Type of join: 'inner', 'left', 'right' or 'outer'
+    sort: :obj:`bool`
+        Order result lexicographically by keys
+
+    Returns
+    -------
+    :obj:`tuple` of (:obj:`Array` of dtype :class:`int64`, :obj:`Array` of dtype :class:`int64`)
+        Positions of rows of the left and the right table for each row of the join result,
+        with -1 marking a missing row
+    """
+
+    pass
+
+
+def factorize_codes(data):
+    """Same as factorize_keys, but for arrays of integer codes where negative codes are treated as NA"""
+    pass
+
+
+def join_factorize_keys(left, right, add_right_keys, sort):
+    """
+    Maps keys of both arrays to common dense codes. Keys present only in right
+    are assigned codes only if add_right_keys is True, otherwise they get -1 as NA keys.
+    If sort is True codes follow the order of sorted keys.
+    """
+    pass
+
+
+def join_factorize_codes(left, right, add_right_keys, sort):
+    """Same as join_factorize_keys, but for arrays of integer codes"""
+    pass
+
+
+def take_with_na(data, indexer):
+    """Same as _sdc_take, but -1 in indexer produces NA value (integer and boolean data is converted to float64)"""
+    pass
+
+
+def take_join_keys(left, right, left_indexer, right_indexer):
+    """Takes values of key column of a join result from left, or from right if left row is missing"""
+    pass
+
+
+@sdc_register_jitable
+def _code_isna(codes, i):
+    return codes[i] < 0
+
+
+@sdc_overload(factorize_codes)
+def factorize_codes_overload(data):
+
+    if not (isinstance(data, types.Array) and isinstance(data.dtype, types.Integer)):
+        return None
+
+    return _gen_factorize_keys_impl(data.dtype, _code_isna)
+
+
+@sdc_register_jitable
+def _join_remap_codes(codes, codes_map):
+    for i in prange(len(codes)):
+        code = codes[i]
+        if code >= 0:
+            codes[i] = codes_map[code]
+
+
+def _gen_join_factorize_overload(factorize_func, is_na):
+    """Generates overload of joint factorization of two arrays based on given factorize_func"""
+
+    def join_factorize_overload(left, right, add_right_keys, sort):
+
+        def join_factorize_impl(left, right, add_right_keys, sort):
+            key_to_code, left_codes = factorize_func(left)
+
+            # lookups into the dict built from left keys are read only, so can be done in parallel
+            n_right = len(right)
+            right_codes = numpy.empty(n_right, dtype=numpy.int64)
+            for i in prange(n_right):
+                if is_na(right, i):
+                    right_codes[i] = -1
+                else:
+                    right_codes[i] = key_to_code.get(right[i], -1)
+
+            if add_right_keys:
+                for i in range(n_right):
+                    if right_codes[i] >= 0 or is_na(right, i):
+                        continue
+                    value = right[i]
+                    code = key_to_code.get(value, -1)
+                    if code == -1:
+                        code = len(key_to_code)
+                        key_to_code[value] = code
+                    right_codes[i] = code
+
+            n_codes = len(key_to_code)
+            if sort:
+                keys = sdc.datatypes.common_functions._sdc_asarray([key for key in key_to_code])
+                keys_sorter = sdc.datatypes.common_functions.sdc_arrays_argsort(keys, kind='mergesort')
+                codes_map = numpy.empty(n_codes, dtype=numpy.int64)
+                for i in prange(n_codes):
+                    codes_map[keys_sorter[i]] = i
+                _join_remap_codes(left_codes, codes_map)
+                _join_remap_codes(right_codes, codes_map)
+
+            return left_codes, right_codes, n_codes
+
+        return join_factorize_impl
+
+    return join_factorize_overload
+
+
+sdc_overload(join_factorize_keys)(_gen_join_factorize_overload(factorize_keys, isna))
+sdc_overload(join_factorize_codes)(_gen_join_factorize_overload(factorize_codes, _code_isna))
+
+
+@sdc_register_jitable
+def _join_combine_codes(codes, other_codes, n_other_codes):
+    """Combines codes of two key columns into a single code (it's unique, but not dense)"""
+    size = len(codes)
+    res = numpy.empty(size, dtype=numpy.int64)
+    for i in prange(size):
+        if codes[i] < 0 or other_codes[i] < 0:
+            res[i] = -1
+        else:
+            res[i] = codes[i] * n_other_codes + other_codes[i]
+
+    return res
+
+
+@sdc_register_jitable
+def _join_is_sorted(data):
+    size = len(data)
+    if size < 2:
+        # a single NaN is not sorted either, otherwise merge pass never moves past it
+        return size == 0 or data[0] == data[0]
+
+    chunks = parallel_chunks(size - 1)
+    n_chunks = len(chunks)
+    chunk_is_sorted = numpy.ones(n_chunks, dtype=numpy.bool_)
+    for i in prange(n_chunks):
+        chunk = chunks[i]
+        for j in range(chunk.start, chunk.stop):
+            # written as negation so that NaNs make the data unsorted
+            if not data[j] <= data[j + 1]:
+                chunk_is_sorted[i] = False
+                break
+
+    return chunk_is_sorted.all()
+
+
+@sdc_register_jitable
+def _join_factorize_sorted(left, right):
+    """Maps keys of two sorted arrays to common dense codes following sorted order of keys with one merge pass"""
+    n_left, n_right = len(left), len(right)
+    left_codes = numpy.empty(n_left, dtype=numpy.int64)
+    right_codes = numpy.empty(n_right, dtype=numpy.int64)
+
+    i, j, code = 0, 0, -1
+    while i < n_left or j < n_right:
+        if j == n_right or (i < n_left and left[i] <= right[j]):
+            value = left[i]
+        else:
+            value = right[j]
+        code += 1
+        while i < n_left and left[i] == value:
+            left_codes[i] = code
+            i += 1
+        while j < n_right and right[j] == value:
+            right_codes[j] = code
+            j += 1
+
+    return left_codes, right_codes, code + 1
+
+
+@sdc_register_jitable
+def _join_driver_indexers(driver_rows, driver_codes, other_codes, n_codes, keep_unmatched):
+    """
+    Computes join indexers iterating over driver table rows in order given by driver_rows,
+    each of them producing one result row per matching row of other table
+    (or a single one with other position -1 if there are no matches and keep_unmatched is True)
+    """
+    other_counts, other_offsets, other_positions = group_rows_by_codes(other_codes, n_codes)
+
+    chunks = parallel_chunks(len(driver_rows))
+    n_chunks = len(chunks)
+    chunk_offsets = numpy.zeros(n_chunks + 1, dtype=numpy.int64)
+    for i in prange(n_chunks):
+        chunk = chunks[i]
+        res = 0
+        for j in range(chunk.start, chunk.stop):
+            code = driver_codes[driver_rows[j]]
+            n_matches = other_counts[code] if code >= 0 else 0
+            if n_matches == 0 and keep_unmatched:
+                n_matches = 1
+            res += n_matches
+        chunk_offsets[i + 1] = res
+
+    for i in range(n_chunks):
+        chunk_offsets[i + 1] += chunk_offsets[i]
+
+    res_size = chunk_offsets[n_chunks]
+    driver_indexer = numpy.empty(res_size, dtype=numpy.int64)
+    other_indexer = numpy.empty(res_size, dtype=numpy.int64)
+    for i in prange(n_chunks):
+        chunk = chunks[i]
+        write_pos = chunk_offsets[i]
+        for j in range(chunk.start, chunk.stop):
+            row = driver_rows[j]
+            code = driver_codes[row]
+            n_matches = other_counts[code] if code >= 0 else 0
+            if n_matches > 0:
+                group_start = other_offsets[code]
+                for k in range(n_matches):
+                    driver_indexer[write_pos] = row
+                    other_indexer[write_pos] = other_positions[group_start + k]
+                    write_pos += 1
+            elif keep_unmatched:
+                driver_indexer[write_pos] = row
+                other_indexer[write_pos] = -1
+                write_pos += 1
+
+    return driver_indexer, other_indexer
+
+
+@sdc_register_jitable
+def _join_grouped_rows(codes, n_codes, with_na):
+    """Positions of rows grouped by codes, optionally followed by positions of NA rows"""
+    _, _, positions = group_rows_by_codes(codes, n_codes)
+    if with_na:
+        return numpy.concatenate((positions, numpy.nonzero(codes < 0)[0]))
+
+    return positions
+
+
+@sdc_register_jitable
+def _join_outer_indexers(left_codes, right_codes, n_codes):
+    left_counts, left_offsets, left_positions = group_rows_by_codes(left_codes, n_codes)
+    right_counts, right_offsets, right_positions = group_rows_by_codes(right_codes, n_codes)
+
+    chunks = parallel_chunks(n_codes)
+    n_chunks = len(chunks)
+    chunk_offsets = numpy.zeros(n_chunks + 1, dtype=numpy.int64)
+    for i in prange(n_chunks):
+        chunk = chunks[i]
+        res = 0
+        for k in range(chunk.start, chunk.stop):
+            if left_counts[k] + right_counts[k] > 0:
+                res += max(left_counts[k], 1) * max(right_counts[k], 1)
+        chunk_offsets[i + 1] = res
+
+    for i in range(n_chunks):
+        chunk_offsets[i + 1] += chunk_offsets[i]
+
+    # rows with NA keys never match and go after all groups
+    left_na_rows = numpy.nonzero(left_codes < 0)[0]
+    right_na_rows = numpy.nonzero(right_codes < 0)[0]
+    n_matched = chunk_offsets[n_chunks]
+    n_left_na, n_right_na = len(left_na_rows), len(right_na_rows)
+    res_size = n_matched + n_left_na + n_right_na
+
+    left_indexer = numpy.empty(res_size, dtype=numpy.int64)
+    right_indexer = numpy.empty(res_size, dtype=numpy.int64)
+    for i in prange(n_chunks):
+        chunk = chunks[i]
+        write_pos = chunk_offsets[i]
+        for k in range(chunk.start, chunk.stop):
+            n_left, n_right = left_counts[k], right_counts[k]
+            left_start, right_start = left_offsets[k], right_offsets[k]
+            if n_right == 0:
+                for j in range(n_left):
+                    left_indexer[write_pos] = left_positions[left_start + j]
+                    right_indexer[write_pos] = -1
+                    write_pos += 1
+            elif n_left == 0:
+                for m in range(n_right):
+                    left_indexer[write_pos] = -1
+                    right_indexer[write_pos] = right_positions[right_start + m]
+                    write_pos += 1
+            else:
+                for j in range(n_left):
+                    for m in range(n_right):
+                        left_indexer[write_pos] = left_positions[left_start + j]
+                        right_indexer[write_pos] = right_positions[right_start + m]
+                        write_pos += 1
+
+    for i in prange(n_left_na):
+        left_indexer[n_matched + i] = left_na_rows[i]
+        right_indexer[n_matched + i] = -1
+
+    for i in prange(n_right_na):
+        left_indexer[n_matched + n_left_na + i] = -1
+        right_indexer[n_matched + n_left_na + i] = right_na_rows[i]
+
+    return left_indexer, right_indexer
+
+
+@sdc_register_jitable
+def _join_indexers_from_codes(left_codes, right_codes, n_codes, how, sort):
+    """
+    Computes join indexers from common codes of left and right keys. Order of the result follows pandas:
+    left join keeps order of left rows (unless sort is True), other joins output rows grouped by codes.
+    """
+    if how == 'outer':
+        return _join_outer_indexers(left_codes, right_codes, n_codes)
+
+    if how == 'right':
+        right_rows = _join_grouped_rows(right_codes, n_codes, True)
+        right_indexer, left_indexer = _join_driver_indexers(right_rows, right_codes, left_codes, n_codes, True)
+        return left_indexer, right_indexer
+
+    if how == 'left':
+        if sort:
+            left_rows = _join_grouped_rows(left_codes, n_codes, True)
+        else:
+            left_rows = numpy.arange(len(left_codes))
+        return _join_driver_indexers(left_rows, left_codes, right_codes, n_codes, True)
+
+    if how == 'inner':
+        left_rows = _join_grouped_rows(left_codes, n_codes, False)
+        return _join_driver_indexers(left_rows, left_codes, right_codes, n_codes, False)
+
+    raise ValueError("Unrecognized type of join, expected one of: 'left', 'right', 'outer', 'inner'")
+
+
+@sdc_overload(join_indexers)
+def join_indexers_overload(left_keys, right_keys, how, sort):
+    """
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Computes join indexers of two tables by their key columns using parallel hash join.
+    A single numeric key that is already sorted in both tables is factorized with a merge pass.
+    Multiple keys are factorized one by one and their codes are combined (and refactorized)
+    pairwise, so that any number of keys is joined as a single int64 key.
+
+    .. only:: developer
+       Test: python -m sdc.runtests -k sdc.tests.test_join.TestJoin.test_merge*
+    """
+
+    if not (isinstance(left_keys, types.BaseTuple) and isinstance(right_keys, types.BaseTuple)):
+        return None
+
+    n_keys = len(left_keys)
+    single_numeric_key = (n_keys == 1 and isinstance(left_keys[0], types.Array)
+                          and isinstance(left_keys[0].dtype, types.Number))
+
+    func_lines = [
+        'def _join_indexers_impl(left_keys, right_keys, how, sort):',
+        '  add_right_keys = how == \'outer\' or how == \'right\'',
+    ]
+    if single_numeric_key:
+        # codes of merge pass follow sorted order of keys which is not an order of first appearance,
+        # so it can't be used for unsorted right and outer joins where all codes define order of rows
+        func_lines += [
+            '  use_merge = sort or how == \'inner\' or how == \'left\'',
+            '  if use_merge and _join_is_sorted(left_keys[0]) and _join_is_sorted(right_keys[0]):',
+            '    left_codes, right_codes, n_codes = _join_factorize_sorted(left_keys[0], right_keys[0])',
+            '  else:',
+            '    left_codes, right_codes, n_codes = join_factorize_keys(',
+            '      left_keys[0], right_keys[0], add_right_keys, sort)',
+        ]
+    else:
+        func_lines += [
+            '  left_codes, right_codes, n_codes = join_factorize_keys(',
+            '    left_keys[0], right_keys[0], add_right_keys, sort)',
+        ]
+    for i in range(1, n_keys):
+        func_lines += [
+            f'  left_codes_{i}, right_codes_{i}, n_codes_{i} = join_factorize_keys(',
+            f'    left_keys[{i}], right_keys[{i}], add_right_keys, sort)',
+            f'  left_codes, right_codes, n_codes = join_factorize_codes(',
+            f'    _join_combine_codes(left_codes, left_codes_{i}, n_codes_{i}),',
+            f'    _join_combine_codes(right_codes, right_codes_{i}, n_codes_{i}),',
+            f'    add_right_keys, sort)',
+        ]
+    func_lines += [
+        '  return _join_indexers_from_codes(left_codes, right_codes, n_codes, how, sort)'
+    ]
+
+    func_text = '\n'.join(func_lines)
+    global_vars = {'join_factorize_keys': join_factorize_keys,
+                   'join_factorize_codes': join_factorize_codes,
+                   '_join_combine_codes': _join_combine_codes,
+                   '_join_is_sorted': _join_is_sorted,
+                   '_join_factorize_sorted': _join_factorize_sorted,
+                   '_join_indexers_from_codes': _join_indexers_from_codes}
+
+    _impl = exec_func_text(func_text, global_vars, '_join_indexers_impl')
+
+    return _impl
+
+
+@sdc_overload(take_with_na)
+def take_with_na_overload(data, indexer):
+
+    if isinstance(data, StringArrayType):
+        def take_with_na_str_arr_impl(data, indexer):
+            return str_arr_take(data, indexer)
+
+        return take_with_na_str_arr_impl
+
+    if not isinstance(data, types.Array):
+        return None
+
+    dtype = data.dtype
+    if isinstance(dtype, (types.NPDatetime, types.NPTimedelta)):
+        res_dtype, na_value = dtype, dtype('NaT')
+    elif isinstance(dtype, types.Float):
+        res_dtype, na_value = dtype, numpy.nan
+    else:
+        res_dtype, na_value = types.float64, numpy.nan
+
+    def take_with_na_impl(data, indexer):
+        res_size = len(indexer)
+        res_arr = numpy.empty(res_size, dtype=res_dtype)
+        for i in prange(res_size):
+            pos = indexer[i]
+            if pos < 0:
+                res_arr[i] = na_value
+            else:
+                res_arr[i] = data[pos]
+
+        return res_arr
+
+    return take_with_na_impl
+
+
+@sdc_overload(take_join_keys)
+def take_join_keys_overload(left, right, left_indexer, right_indexer):
+
+    if isinstance(left, StringArrayType) and isinstance(right, StringArrayType):
+        def take_join_keys_str_arr_impl(left, right, left_indexer, right_indexer):
+            res_size = len(left_indexer)
+            left_offsets, left_chars = get_offsets_array(left), get_chars_array(left)
+            right_offsets, right_chars = get_offsets_array(right), get_chars_array(right)
+            sizes = numpy.empty(res_size, dtype=numpy.int64)
+            nan_mask = numpy.empty(res_size, dtype=numpy.bool_)
+            for i in prange(res_size):
+                left_pos, right_pos = left_indexer[i], right_indexer[i]
+                if left_pos >= 0:
+                    sizes[i] = left_offsets[left_pos + 1] - left_offsets[left_pos]
+                    nan_mask[i] = str_arr_is_na(left, left_pos)
+                else:
+                    sizes[i] = right_offsets[right_pos + 1] - right_offsets[right_pos]
+                    nan_mask[i] = str_arr_is_na(right, right_pos)
+
+            res_arr = alloc_str_arr(sizes)
+            res_offsets, res_chars = get_offsets_array(res_arr), get_chars_array(res_arr)
+            for i in prange(res_size):
+                left_pos, right_pos = left_indexer[i], right_indexer[i]
+                if left_pos >= 0:
+                    copy_utf8(left_chars, left_offsets[left_pos], sizes[i], res_chars, res_offsets[i])
+                else:
+                    copy_utf8(right_chars, right_offsets[right_pos], sizes[i], res_chars, res_offsets[i])
+            str_arr_set_nulls(res_arr, nan_mask)
+
+            return res_arr
+
+        return take_join_keys_str_arr_impl
+
+    if not (isinstance(left, types.Array) and isinstance(right, types.Array)):
+        return None
+
+    res_dtype = left.dtype
+
+    def take_join_keys_impl(left, right, left_indexer, right_indexer):
+        res_size = len(left_indexer)
+        res_arr = numpy.empty(res_size, dtype=res_dtype)
+        for i in prange(res_size):
+            left_pos = left_indexer[i]
+            if left_pos >= 0:
+                res_arr[i] = left[left_pos]
+            else:
+                res_arr[i] = right[right_indexer[i]]
+
+        return res_arr
+
+    return take_join_keys_impl
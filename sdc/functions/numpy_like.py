@@ -52,9 +52,11 @@ from sdc.utilities.sdc_typing_utils import TypeChecker, is_default
 from sdc.utilities.utils import (sdc_overload, sdc_register_jitable,
                                  min_dtype_int_val, max_dtype_int_val, min_dtype_float_val,
                                  max_dtype_float_val)
-from sdc.str_arr_ext import (StringArrayType, pre_alloc_string_array, get_utf8_size,
-                             string_array_type, create_str_arr_from_list, str_arr_set_na_by_mask,
-                             num_total_chars, str_arr_is_na)
+from sdc.str_arr_ext import (StringArrayType, get_utf8_size, string_array_type, num_total_chars, str_arr_is_na,
+                             get_offsets_array, get_chars_array)
+from sdc.str_ext import str_format_float32, str_format_float64
+from sdc.functions.str_arr_kernels import (alloc_str_arr, copy_utf8, float_utf8_max_size, str_arr_take,
+                                           write_int_utf8)
 from sdc.utilities.prange_utils import parallel_chunks
 from sdc.utilities.sdc_typing_utils import check_types_comparable
 from sdc.functions.sort import parallel_sort, parallel_stable_sort, parallel_argsort, parallel_stable_argsort
@@ -109,6 +111,32 @@ def nansum(self):
     pass
 
 
+_true_utf8 = numpy.frombuffer(b'True', dtype=numpy.uint8).copy()
+_false_utf8 = numpy.frombuffer(b'False', dtype=numpy.uint8).copy()
+
+
+@sdc_register_jitable
+def _astype_write_bool(chars, pos, value):
+    text = _true_utf8 if value else _false_utf8
+    copy_utf8(text, 0, len(text), chars, pos)
+    return len(text)
+
+
+@sdc_register_jitable
+def _astype_write_int(chars, pos, value):
+    return write_int_utf8(chars, pos, value) - pos
+
+
+@sdc_register_jitable
+def _astype_write_float32(chars, pos, value):
+    return str_format_float32(chars[pos:].ctypes, value)
+
+
+@sdc_register_jitable
+def _astype_write_float64(chars, pos, value):
+    return str_format_float64(chars[pos:].ctypes, numpy.float64(value))
+
+
 @sdc_overload(astype, inline='always')
 @sdc_overload(astype_no_inline)
 def sdc_astype_overload(self, dtype):
@@ -142,22 +170,41 @@ def sdc_astype_overload(self, dtype):
         (isinstance(dtype, types.Function) and dtype.typing_key == str) or
         (isinstance(dtype, types.StringLiteral) and dtype.literal_value == 'str')
     ):
+        if isinstance(self, StringArrayType):
+            def sdc_astype_string_to_string_impl(self, dtype):
+                return self.copy()
+
+            return sdc_astype_string_to_string_impl
+
+        if isinstance(self.dtype, types.Boolean):
+            write_item = _astype_write_bool
+        elif isinstance(self.dtype, types.Integer):
+            write_item = _astype_write_int
+        elif self.dtype == types.float32:
+            write_item = _astype_write_float32
+        elif isinstance(self.dtype, types.Float):
+            write_item = _astype_write_float64
+        else:
+            return None
+
+        # sizes of items are found by writing them into a scratch buffer, then items are written into the result,
+        # as in numpy NaNs are converted to 'nan' so that the result has no nulls
         def sdc_astype_number_to_string_impl(self, dtype):
-            num_bytes = 0
             arr_len = len(self)
-
-            # Get total bytes for new array
+            sizes = numpy.empty(arr_len, dtype=numpy.int64)
+            chunks = parallel_chunks(arr_len)
+            for k in prange(len(chunks)):
+                buf = numpy.empty(float_utf8_max_size, dtype=numpy.uint8)
+                for i in range(chunks[k].start, chunks[k].stop):
+                    sizes[i] = write_item(buf, 0, self[i])
+
+            res = alloc_str_arr(sizes)
+            res_chars = get_chars_array(res)
+            res_offsets = get_offsets_array(res)
             for i in prange(arr_len):
-                item = self[i]
-                num_bytes += get_utf8_size(str(item))
-
-            data = pre_alloc_string_array(arr_len, num_bytes)
+                write_item(res_chars, numpy.int64(res_offsets[i]), self[i])
 
-            for i in range(arr_len):
-                item = self[i]
-                data[i] = str(item)  # TODO: check NA
-
-            return data
+            return res
 
         return sdc_astype_number_to_string_impl
 
@@ -601,18 +648,18 @@ def sdc_fillna_overload(self, inplace=False, value=None):
         if isinstance(self.dtype, types.UnicodeType):
             def sdc_fillna_str_impl(self, inplace=False, value=None):
                 n = len(self)
-                num_chars = 0
-                # get total chars in new array
+                offsets = get_offsets_array(self)
+                value_size = get_utf8_size(value)
+                sizes = numpy.empty(n, dtype=numpy.int64)
                 for i in prange(n):
-                    s = self[i]
                     if sdc.hiframes.api.isna(self, i):
-                        num_chars += get_utf8_size(value)
+                        sizes[i] = value_size
                     else:
-                        num_chars += get_utf8_size(s)
+                        sizes[i] = offsets[i + 1] - offsets[i]
 
-                filled_data = pre_alloc_string_array(n, num_chars)
-                # StringArray doesn't support parallel setitem, thus no prange here
-                for i in numpy.arange(n):
+                # offsets of the new strings are set on allocation, so they are written in parallel
+                filled_data = alloc_str_arr(sizes)
+                for i in prange(n):
                     if sdc.hiframes.api.isna(self, i):
                         filled_data[i] = value
                     else:
@@ -955,6 +1002,103 @@ def np_nancumsum(arr, like_pandas=False):
         return nancumsum_impl
 
 
+def selection_by_mask(mask, size):
+    pass
+
+
+@sdc_overload(selection_by_mask)
+def selection_by_mask_overload(mask, size):
+    """
+    Creates selection vector, i.e. an array of positions of elements of Boolean mask that are True.
+    Only the first size elements of the mask are considered.
+
+    Parameters
+    -----------
+    mask: :obj:`Array` of dtype :class:`bool`
+        Boolean mask
+    size: :obj:`int`
+        Number of elements of the mask to consider
+
+    Returns
+    -------
+    :obj:`Array` of dtype :class:`int64`
+        Positions of selected elements in ascending order
+
+    """
+
+    if not isinstance(getattr(mask, 'dtype', None), types.Boolean):
+        return None
+
+    def selection_by_mask_impl(mask, size):
+        chunks = parallel_chunks(size)
+        chunk_offsets = numpy.zeros(len(chunks) + 1, dtype=numpy.int64)
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+            res = 0
+            for j in range(chunk.start, chunk.stop):
+                if mask[j]:
+                    res += 1
+            chunk_offsets[i + 1] = res
+
+        chunk_offsets = numpy.cumsum(chunk_offsets)
+        result = numpy.empty(chunk_offsets[-1], dtype=numpy.int64)
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+            current_pos = chunk_offsets[i]
+            for j in range(chunk.start, chunk.stop):
+                if mask[j]:
+                    result[current_pos] = j
+                    current_pos += 1
+
+        return result
+
+    return selection_by_mask_impl
+
+
+def take_by_selection(arr, positions):
+    pass
+
+
+@sdc_overload(take_by_selection)
+def take_by_selection_overload(arr, positions):
+    """
+    Creates a new array from arr by taking elements at positions given by selection vector,
+    strings are copied between buffers of StringArrays in parallel.
+
+    Parameters
+    -----------
+    arr: :obj:`Array` or :obj:`StringArray`
+        Input array
+    positions: :obj:`Array` of dtype :class:`int64`
+        Non-negative positions of elements to take
+
+    Returns
+    -------
+    :obj:`Array` or :obj:`StringArray` of the same dtype as arr
+
+    """
+
+    if isinstance(arr, types.Array):
+        res_dtype = arr.dtype
+
+        def take_by_selection_impl(arr, positions):
+            result = numpy.empty(len(positions), dtype=res_dtype)
+            for i in prange(len(positions)):
+                result[i] = arr[positions[i]]
+
+            return result
+
+        return take_by_selection_impl
+
+    if isinstance(arr, StringArrayType):
+        def take_by_selection_str_arr_impl(arr, positions):
+            return str_arr_take(arr, positions)
+
+        return take_by_selection_str_arr_impl
+
+    return None
+
+
 def getitem_by_mask(arr, idx):
     pass
 
@@ -988,42 +1132,15 @@ def getitem_by_mask_overload(self, idx):
     is_numeric_index = isinstance(self, (RangeIndexType, Int64IndexType))
 
     def getitem_by_mask_impl(self, idx):
-        chunks = parallel_chunks(len(self))
-        arr_len = numpy.empty(len(chunks), dtype=numpy.int64)
-        length = 0
-
-        for i in prange(len(chunks)):
-            chunk = chunks[i]
-            res = 0
-            for j in range(chunk.start, chunk.stop):
-                if idx[j]:
-                    res += 1
-            length += res
-            arr_len[i] = res
-
+        positions = selection_by_mask(idx, len(self))
         if is_str_arr == True:  # noqa
-            result_data = [''] * length
-            result_nan_mask = numpy.empty(shape=length, dtype=types.bool_)
-        else:
-            result_data = numpy.empty(shape=length, dtype=res_dtype)
-        for i in prange(len(chunks)):
-            chunk = chunks[i]
-            new_start = int(sum(arr_len[0:i]))
-            current_pos = new_start
+            return take_by_selection(self, positions)
 
-            for j in range(chunk.start, chunk.stop):
-                if idx[j]:
-                    value = self[j]
-                    result_data[current_pos] = value
-                    if is_str_arr == True:  # noqa
-                        result_nan_mask[current_pos] = isna(self, j)
-                    current_pos += 1
+        result_data = numpy.empty(len(positions), dtype=res_dtype)
+        for i in prange(len(positions)):
+            result_data[i] = self[positions[i]]
 
-        if is_str_arr == True:  # noqa
-            result_data_as_str_arr = create_str_arr_from_list(result_data)
-            str_arr_set_na_by_mask(result_data_as_str_arr, result_nan_mask)
-            return result_data_as_str_arr
-        elif is_numeric_index == True:  # noqa
+        if is_numeric_index == True:  # noqa
             return pandas.Int64Index(result_data, name=self._name)
         else:
             return result_data
@@ -1137,12 +1254,17 @@ def sdc_array_equal_overload(A, B):
             else:
                 if len(A) != len(B):
                     return False
-                # FIXME_Numba#5157: change to simple A == B when issue is resolved
-                eq_res_size = len(A)
-                eq_res = numpy.empty(eq_res_size, dtype=types.bool_)
-                for i in numba.prange(eq_res_size):
-                    eq_res[i] = A[i] == B[i]
-                return numpy.all(eq_res)
+                # compare by chunks, so that each chunk stops on first mismatch and no temporary is allocated
+                chunks = parallel_chunks(len(A))
+                n_chunks = len(chunks)
+                chunk_is_equal = numpy.ones(n_chunks, dtype=numpy.bool_)
+                for i in prange(n_chunks):
+                    chunk = chunks[i]
+                    for j in range(chunk.start, chunk.stop):
+                        if A[j] != B[j]:
+                            chunk_is_equal[i] = False
+                            break
+                return chunk_is_equal.all()
 
         return sdc_array_equal_impl
 
@@ -0,0 +1,512 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+
+"""
+
+| This file contains StringArray kernels working directly with its offsets and utf-8 encoded data.
+| Kernels producing strings calculate sizes of the new strings in a parallel pass, allocate
+| the resulting StringArray by prefix sum of them and then write the new strings into it in parallel.
+
+| The same two phases are available to other code producing strings as a builder API:
+| alloc_str_arr allocates StringArray for strings of known utf-8 sizes with all offsets already set,
+| so that its items can be assigned (res[i] = s) or copied from other arrays (copy_utf8) concurrently,
+| str_arr_set_nulls then sets null bits of all items at once, each byte of the bitmap by a single thread.
+
+"""
+
+import numpy
+
+from numba import prange
+
+from sdc.str_arr_ext import (get_chars_array, get_null_bitmap_array, get_null_bitmap_ptr, get_offsets_array,
+                             get_utf8_size, pre_alloc_string_array, str_arr_is_na, _memcpy)
+from sdc.utilities.prange_utils import parallel_chunks
+from sdc.utilities.utils import sdc_register_jitable
+
+
+@sdc_register_jitable
+def alloc_str_arr(sizes):
+    """
+    Allocates StringArray for strings of utf-8 sizes with offsets set to prefix sum of sizes,
+    which is calculated in two parallel passes over chunks of sizes. Since the position of each
+    string is known in advance, items of the array can be set in parallel afterwards
+    """
+    n = len(sizes)
+    chunks = parallel_chunks(n)
+    chunk_starts = numpy.zeros(len(chunks) + 1, dtype=numpy.int64)
+    for i in prange(len(chunks)):
+        chunk = chunks[i]
+        chunk_size = 0
+        for j in range(chunk.start, chunk.stop):
+            chunk_size += sizes[j]
+        chunk_starts[i + 1] = chunk_size
+    chunk_starts = numpy.cumsum(chunk_starts)
+
+    res = pre_alloc_string_array(n, chunk_starts[-1])
+    res_offsets = get_offsets_array(res)
+    res_offsets[0] = 0
+    for i in prange(len(chunks)):
+        chunk = chunks[i]
+        offset = chunk_starts[i]
+        for j in range(chunk.start, chunk.stop):
+            offset += sizes[j]
+            res_offsets[j + 1] = offset
+
+    return res
+
+
+@sdc_register_jitable
+def str_arr_set_nulls(str_arr, na_mask):
+    """Sets null bits of all strings of StringArray allocated with alloc_str_arr from Boolean na_mask"""
+    n = len(str_arr)
+    null_bitmap = get_null_bitmap_array(str_arr)
+    for byte_ind in prange(len(null_bitmap)):
+        byte = 0
+        for i in range(byte_ind * 8, min(byte_ind * 8 + 8, n)):
+            if not na_mask[i]:
+                byte |= 1 << (i - byte_ind * 8)
+        null_bitmap[byte_ind] = byte
+
+
+@sdc_register_jitable
+def copy_utf8(chars, start, size, res_chars, res_start):
+    """Copies size bytes of utf-8 encoded chars starting from start to res_chars starting from res_start"""
+    for k in range(size):
+        res_chars[res_start + k] = chars[start + k]
+
+
+@sdc_register_jitable
+def str_arr_from_list(str_list):
+    """Creates StringArray from list of strings computing their sizes and writing them in parallel"""
+    n = len(str_list)
+    sizes = numpy.empty(n, dtype=numpy.int64)
+    for i in prange(n):
+        sizes[i] = get_utf8_size(str_list[i])
+
+    res = alloc_str_arr(sizes)
+    for i in prange(n):
+        res[i] = str_list[i]
+
+    return res
+
+
+@sdc_register_jitable
+def str_arr_take(str_arr, positions):
+    """Creates StringArray from strings of str_arr at positions, negative positions produce nulls"""
+    n = len(positions)
+    offsets = get_offsets_array(str_arr)
+    chars = get_chars_array(str_arr)
+
+    sizes = numpy.zeros(n, dtype=numpy.int64)
+    na_mask = numpy.ones(n, dtype=numpy.bool_)
+    for i in prange(n):
+        pos = positions[i]
+        if pos >= 0:
+            sizes[i] = offsets[pos + 1] - offsets[pos]
+            na_mask[i] = str_arr_is_na(str_arr, pos)
+
+    res = alloc_str_arr(sizes)
+    res_offsets = get_offsets_array(res)
+    res_chars = get_chars_array(res)
+    for i in prange(n):
+        pos = positions[i]
+        if pos >= 0:
+            copy_utf8(chars, offsets[pos], sizes[i], res_chars, res_offsets[i])
+    str_arr_set_nulls(res, na_mask)
+
+    return res
+
+
+@sdc_register_jitable
+def str_arr_concat(str_arrs):
+    """Concatenates StringArrays of the list str_arrs into a new StringArray"""
+    n_arrs = len(str_arrs)
+    starts = numpy.zeros(n_arrs + 1, dtype=numpy.int64)
+    char_starts = numpy.zeros(n_arrs + 1, dtype=numpy.int64)
+    for k in range(n_arrs):
+        starts[k + 1] = starts[k] + len(str_arrs[k])
+        char_starts[k + 1] = char_starts[k] + len(get_chars_array(str_arrs[k]))
+
+    res = pre_alloc_string_array(starts[-1], char_starts[-1])
+    res_offsets = get_offsets_array(res)
+    res_chars = get_chars_array(res)
+    na_mask = numpy.empty(starts[-1], dtype=numpy.bool_)
+    res_offsets[0] = 0
+    for k in range(n_arrs):
+        str_arr = str_arrs[k]
+        offsets = get_offsets_array(str_arr)
+        chars = get_chars_array(str_arr)
+        start, char_start = starts[k], char_starts[k]
+        for i in prange(len(str_arr)):
+            res_offsets[start + i + 1] = char_start + offsets[i + 1]
+            na_mask[start + i] = str_arr_is_na(str_arr, i)
+        for i in prange(len(chars)):
+            res_chars[char_start + i] = chars[i]
+    str_arr_set_nulls(res, na_mask)
+
+    return res
+
+
+@sdc_register_jitable
+def str_arr_add_by_indexers(left, right, left_indexer, right_indexer):
+    """
+    Creates StringArray of concatenations of strings of left and right at positions given by indexers,
+    result is null where any of the indexers is negative or any of the strings is null
+    """
+    n = len(left_indexer)
+    left_offsets, left_chars = get_offsets_array(left), get_chars_array(left)
+    right_offsets, right_chars = get_offsets_array(right), get_chars_array(right)
+
+    sizes = numpy.zeros(n, dtype=numpy.int64)
+    na_mask = numpy.ones(n, dtype=numpy.bool_)
+    for i in prange(n):
+        left_pos, right_pos = left_indexer[i], right_indexer[i]
+        if (left_pos >= 0 and right_pos >= 0
+                and not str_arr_is_na(left, left_pos) and not str_arr_is_na(right, right_pos)):
+            na_mask[i] = False
+            sizes[i] = (left_offsets[left_pos + 1] - left_offsets[left_pos]
+                        + right_offsets[right_pos + 1] - right_offsets[right_pos])
+
+    res = alloc_str_arr(sizes)
+    res_offsets = get_offsets_array(res)
+    res_chars = get_chars_array(res)
+    for i in prange(n):
+        if not na_mask[i]:
+            left_pos, right_pos = left_indexer[i], right_indexer[i]
+            left_size = left_offsets[left_pos + 1] - left_offsets[left_pos]
+            copy_utf8(left_chars, left_offsets[left_pos], left_size, res_chars, res_offsets[i])
+            copy_utf8(right_chars, right_offsets[right_pos], sizes[i] - left_size,
+                      res_chars, res_offsets[i] + left_size)
+    str_arr_set_nulls(res, na_mask)
+
+    return res
+
+
+@sdc_register_jitable
+def str_arr_mul_by_indexers(str_arr, repeats, str_indexer, repeats_indexer):
+    """
+    Creates StringArray of strings of str_arr repeated number of times given by repeats at positions
+    given by indexers, result is null where any of the indexers is negative or the string is null
+    """
+    n = len(str_indexer)
+    offsets, chars = get_offsets_array(str_arr), get_chars_array(str_arr)
+
+    sizes = numpy.zeros(n, dtype=numpy.int64)
+    na_mask = numpy.ones(n, dtype=numpy.bool_)
+    for i in prange(n):
+        pos, repeats_pos = str_indexer[i], repeats_indexer[i]
+        if pos >= 0 and repeats_pos >= 0 and not str_arr_is_na(str_arr, pos):
+            na_mask[i] = False
+            sizes[i] = (offsets[pos + 1] - offsets[pos]) * max(0, repeats[repeats_pos])
+
+    res = alloc_str_arr(sizes)
+    res_offsets = get_offsets_array(res)
+    res_chars = get_chars_array(res)
+    for i in prange(n):
+        if not na_mask[i] and sizes[i] > 0:
+            pos = str_indexer[i]
+            size = offsets[pos + 1] - offsets[pos]
+            for k in range(sizes[i] // size):
+                copy_utf8(chars, offsets[pos], size, res_chars, res_offsets[i] + k * size)
+    str_arr_set_nulls(res, na_mask)
+
+    return res
+
+
+@sdc_register_jitable
+def str_to_utf8(s):
+    """Returns utf-8 encoded s as an array of uint8"""
+    return get_chars_array(str_arr_from_list([s]))
+
+
+@sdc_register_jitable
+def utf8_length(chars, start, stop):
+    """Returns number of characters in utf-8 encoded chars[start:stop], i.e. number of non-continuation bytes"""
+    length = 0
+    for i in range(start, stop):
+        if chars[i] & 0xC0 != 0x80:
+            length += 1
+
+    return length
+
+
+# length of the longest float representation written by str_format_float64, e.g. -2.2250738585072014e-308
+float_utf8_max_size = 24
+
+
+@sdc_register_jitable
+def _abs_uint(value):
+    if value < 0:
+        return numpy.uint64(-(value + 1)) + numpy.uint64(1)
+
+    return numpy.uint64(value)
+
+
+@sdc_register_jitable
+def _uint_utf8_size(value):
+    ten = numpy.uint64(10)
+    size = 1
+    while value >= ten:
+        value //= ten
+        size += 1
+
+    return size
+
+
+@sdc_register_jitable
+def int_utf8_size(value):
+    """Returns size of decimal representation of integer value"""
+    sign_size = 1 if value < 0 else 0
+    return sign_size + _uint_utf8_size(_abs_uint(value))
+
+
+@sdc_register_jitable
+def write_int_utf8(chars, pos, value):
+    """Writes decimal representation of integer value to chars starting from pos, returns position after it"""
+    if value < 0:
+        chars[pos] = ord('-')
+        pos += 1
+
+    ten = numpy.uint64(10)
+    zero = numpy.uint64(ord('0'))
+    u = _abs_uint(value)
+    end = pos + _uint_utf8_size(u)
+    j = end - 1
+    while u >= ten:
+        chars[j] = u % ten + zero
+        u //= ten
+        j -= 1
+    chars[j] = u + zero
+
+    return end
+
+
+@sdc_register_jitable
+def is_ascii(str_arr):
+    """Checks whether all strings of str_arr consist of ASCII characters only"""
+    chars = get_chars_array(str_arr)
+    n_non_ascii = 0
+    for i in prange(len(chars)):
+        if chars[i] >= 128:
+            n_non_ascii += 1
+
+    return n_non_ascii == 0
+
+
+@sdc_register_jitable
+def alloc_str_arr_by_sizes(str_arr, sizes):
+    """Allocates StringArray for new strings of utf-8 sizes with the same nulls as in str_arr"""
+    n = len(sizes)
+    res = alloc_str_arr(sizes)
+    _memcpy(get_null_bitmap_ptr(res), get_null_bitmap_ptr(str_arr), (n + 7) >> 3, 1)
+
+    return res
+
+
+def gen_str_arr_map_kernel(get_size, write):
+    """
+    Generate kernel transforming each string of StringArray into a new one:
+    get_size(chars, start, stop, params) returns utf-8 size of the new string for chars[start:stop] and
+    write(chars, start, stop, params, res_chars, res_start) writes it to res_chars starting from res_start
+    """
+    def kernel(str_arr, params):
+        n = len(str_arr)
+        offsets = get_offsets_array(str_arr)
+        chars = get_chars_array(str_arr)
+
+        sizes = numpy.zeros(n, dtype=numpy.int64)
+        for i in prange(n):
+            if not str_arr_is_na(str_arr, i):
+                sizes[i] = get_size(chars, offsets[i], offsets[i + 1], params)
+
+        res = alloc_str_arr_by_sizes(str_arr, sizes)
+        res_offsets = get_offsets_array(res)
+        res_chars = get_chars_array(res)
+        for i in prange(n):
+            if not str_arr_is_na(str_arr, i):
+                write(chars, offsets[i], offsets[i + 1], params, res_chars, res_offsets[i])
+
+        return res
+
+    return kernel
+
+
+def gen_str_arr_ascii_map_kernel(map_char):
+    """Generate kernel mapping each character of ASCII-only StringArray with map_char"""
+    def kernel(str_arr):
+        n = len(str_arr)
+        chars = get_chars_array(str_arr)
+        res = pre_alloc_string_array(n, len(chars))
+
+        # strings keep their sizes, so offsets and nulls are the same
+        res_chars = get_chars_array(res)
+        get_offsets_array(res)[:] = get_offsets_array(str_arr)
+        _memcpy(get_null_bitmap_ptr(res), get_null_bitmap_ptr(str_arr), (n + 7) >> 3, 1)
+        for i in prange(len(chars)):
+            res_chars[i] = map_char(chars[i])
+
+        return res
+
+    return kernel
+
+
+def gen_str_arr_check_kernel(check):
+    """Generate kernel checking each string of StringArray with check(chars, start, stop, params)"""
+    def kernel(str_arr, params):
+        n = len(str_arr)
+        offsets = get_offsets_array(str_arr)
+        chars = get_chars_array(str_arr)
+
+        res = numpy.empty(n, dtype=numpy.bool_)
+        for i in prange(n):
+            res[i] = check(chars, offsets[i], offsets[i + 1], params)
+
+        return res
+
+    return kernel
+
+
+@sdc_register_jitable
+def str_arr_len(str_arr):
+    """Returns number of characters in each string of StringArray"""
+    n = len(str_arr)
+    offsets = get_offsets_array(str_arr)
+    chars = get_chars_array(str_arr)
+
+    res = numpy.empty(n, dtype=numpy.int64)
+    for i in prange(n):
+        res[i] = utf8_length(chars, offsets[i], offsets[i + 1])
+
+    return res
+
+
+@sdc_register_jitable
+def _ascii_upper(c):
+    return c - 32 if 97 <= c <= 122 else c
+
+
+@sdc_register_jitable
+def _ascii_lower(c):
+    return c + 32 if 65 <= c <= 90 else c
+
+
+str_arr_ascii_upper = sdc_register_jitable(gen_str_arr_ascii_map_kernel(_ascii_upper))
+str_arr_ascii_lower = sdc_register_jitable(gen_str_arr_ascii_map_kernel(_ascii_lower))
+
+
+PAD_LEFT, PAD_RIGHT, PAD_BOTH, PAD_ZEROS = range(4)
+
+
+def gen_pad_funcs(side):
+    """
+    Generate size/write funcs of padding strings to width with fill (utf-8 encoded character)
+    the same way as str.rjust/ljust/center/zfill do, params are (width, fill)
+    """
+    @sdc_register_jitable
+    def pad_counts(nchars, width):
+        # get numbers of fill characters to add to the left and to the right of the string
+        margin = width - nchars
+        if margin <= 0:
+            return 0, 0
+        if side == PAD_RIGHT:
+            return 0, margin
+        if side == PAD_BOTH:
+            left = margin // 2 + (margin & width & 1)
+            return left, margin - left
+
+        return margin, 0
+
+    def get_size(chars, start, stop, params):
+        width, fill = params
+        left, right = pad_counts(utf8_length(chars, start, stop), width)
+
+        return stop - start + (left + right) * len(fill)
+
+    def write(chars, start, stop, params, res_chars, res_start):
+        width, fill = params
+        left, right = pad_counts(utf8_length(chars, start, stop), width)
+
+        pos = res_start
+        if side == PAD_ZEROS and left > 0 and stop > start and (chars[start] == 43 or chars[start] == 45):
+            # like str.zfill the padding goes after the leading sign
+            res_chars[pos] = chars[start]
+            pos += 1
+            start += 1
+        for _ in range(left):
+            for k in range(len(fill)):
+                res_chars[pos] = fill[k]
+                pos += 1
+        for j in range(start, stop):
+            res_chars[pos] = chars[j]
+            pos += 1
+        for _ in range(right):
+            for k in range(len(fill)):
+                res_chars[pos] = fill[k]
+                pos += 1
+
+    return sdc_register_jitable(get_size), sdc_register_jitable(write)
+
+
+str_arr_rjust = sdc_register_jitable(gen_str_arr_map_kernel(*gen_pad_funcs(PAD_LEFT)))
+str_arr_ljust = sdc_register_jitable(gen_str_arr_map_kernel(*gen_pad_funcs(PAD_RIGHT)))
+str_arr_center = sdc_register_jitable(gen_str_arr_map_kernel(*gen_pad_funcs(PAD_BOTH)))
+str_arr_zfill = sdc_register_jitable(gen_str_arr_map_kernel(*gen_pad_funcs(PAD_ZEROS)))
+
+
+@sdc_register_jitable
+def _utf8_equal(chars, start, pat):
+    """Checks whether chars starting from start match pat"""
+    for k in range(len(pat)):
+        if chars[start + k] != pat[k]:
+            return False
+
+    return True
+
+
+@sdc_register_jitable
+def _utf8_startswith(chars, start, stop, pat):
+    return stop - start >= len(pat) and _utf8_equal(chars, start, pat)
+
+
+@sdc_register_jitable
+def _utf8_endswith(chars, start, stop, pat):
+    return stop - start >= len(pat) and _utf8_equal(chars, stop - len(pat), pat)
+
+
+@sdc_register_jitable
+def _utf8_contains(chars, start, stop, pat):
+    # utf-8 is self-synchronizing, so matching bytes never starts in the middle of a character
+    for pos in range(start, stop - len(pat) + 1):
+        if _utf8_equal(chars, pos, pat):
+            return True
+
+    return False
+
+
+str_arr_startswith = sdc_register_jitable(gen_str_arr_check_kernel(_utf8_startswith))
+str_arr_endswith = sdc_register_jitable(gen_str_arr_check_kernel(_utf8_endswith))
+str_arr_contains = sdc_register_jitable(gen_str_arr_check_kernel(_utf8_contains))
@@ -207,9 +207,11 @@ def _infer_index_type(index):
             else:
                 return RangeIndexType(is_named=True)
 
-    # for unsupported pandas indexes we explicitly unbox to None
+    # DatetimeIndex is represented as datetime64 array, indexes with time zones are not supported
     if isinstance(index, pd.DatetimeIndex):
-        return types.none
+        if index.tz is not None:
+            return types.none
+        return types.Array(types.NPDatetime('ns'), 1, 'C')
 
     if isinstance(index, pd.Int64Index):
         index_data_type = numba.typeof(index._data)
@@ -341,10 +343,12 @@ def _unbox_index_data(index_typ, index_obj, c):
     if index_typ == string_array_type:
         return unbox_str_series(index_typ, index_obj, c)
 
-    # this is still here only because of Float64Index represented as array
-    # TO-DO: remove when it's added
+    # this is still here only because of Float64Index and DatetimeIndex represented as arrays
+    # TO-DO: remove when these are added
     if isinstance(index_typ, types.Array):
-        index_data = c.pyapi.object_getattr_string(index_obj, "_data")
+        # data of DatetimeIndex is DatetimeArray, its values are datetime64 ndarray
+        data_attr = "values" if isinstance(index_typ.dtype, types.NPDatetime) else "_data"
+        index_data = c.pyapi.object_getattr_string(index_obj, data_attr)
         res = unbox_array(index_typ, index_data, c)
         c.pyapi.decref(index_data)
         return res
@@ -25,12 +25,24 @@
 # *****************************************************************************
 
 
+import numba
 import numpy as np
 
 from numba import types
 from numba.extending import overload
 
 
+@numba.njit
+def calc_disp(arr):
+    """Returns displacements of parts which sizes are given by arr in a buffer holding all of them"""
+    disp = np.empty_like(arr)
+    if len(arr) > 0:
+        disp[0] = 0
+    for i in range(1, len(arr)):
+        disp[i] = disp[i - 1] + arr[i - 1]
+    return disp
+
+
 def setitem_arr_nan(arr, ind):
     arr[ind] = np.nan
 
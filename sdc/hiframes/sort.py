@@ -26,10 +26,24 @@
 
 
 import numba
+import numpy as np
+import pandas
+
+from numba import types
+from numba.extending import overload
+
 import sdc
 import sdc.timsort
 
+from sdc.datatypes.int64_index_type import Int64IndexType
+from sdc.datatypes.range_index_type import RangeIndexType
+from sdc.hiframes.api import get_nan_mask
+from sdc.hiframes.join import calc_disp
+from sdc.shuffle_utils import (alloc_pre_shuffle_metadata, update_shuffle_meta, finalize_shuffle_meta,
+                               alltoallv_tup)
 from sdc.str_arr_ext import (to_string_list, cp_str_list_to_array)
+from sdc.timsort import getitem_arr_tup
+from sdc.utilities.trace import get_method_id, trace_now, trace_record
 
 
 # TODO: fix cache issue
@@ -44,3 +58,196 @@ def local_sort(key_arrs, data, ascending=True):
         sdc.timsort.reverseRange(l_key_arrs, 0, n_out, l_data)
     cp_str_list_to_array(key_arrs, l_key_arrs)
     cp_str_list_to_array(data, l_data)
+
+
+# minimal total number of keys sampled to choose splitters of the distributed sort,
+# each process samples at least SAMPLE_OVERSAMPLING keys per process, more samples give more even partitions
+MIN_SAMPLES = 1024
+SAMPLE_OVERSAMPLING = 32
+
+# time of each stage of the distributed sort is recorded with sdc.utilities.trace
+# and reported in its summary under these names
+_sample_stage_id = get_method_id('dist_sort.sample')
+_partition_stage_id = get_method_id('dist_sort.partition')
+_exchange_stage_id = get_method_id('dist_sort.exchange')
+_local_sort_stage_id = get_method_id('dist_sort.local_sort')
+
+
+@numba.njit
+def _record_stage(stage_id, start):
+    now = trace_now()
+    trace_record(stage_id, now - start, 0, 0)
+    return now
+
+
+@numba.njit
+def _get_splitters(keys, n_pes):
+    """Returns n_pes - 1 keys splitting keys of all processes into parts of close size (or none if there are no keys),
+    splitters are chosen from regular samples of non-NA keys of each process"""
+    good_keys = keys[~get_nan_mask(keys)]
+    n_good = len(good_keys)
+    n_samples = min(n_good, max(SAMPLE_OVERSAMPLING * n_pes, MIN_SAMPLES // n_pes))
+    samples = np.empty(n_samples, keys.dtype)
+    for i in numba.prange(n_samples):
+        samples[i] = good_keys[(i * n_good) // n_samples]
+
+    # every process receives samples of all processes, they are sent from the same buffer
+    send_counts = np.full(n_pes, n_samples, np.int32)
+    recv_counts = np.empty(n_pes, np.int32)
+    sdc.distributed_api.alltoall(send_counts, recv_counts, 1)
+    all_samples = np.empty(recv_counts.sum(), keys.dtype)
+    sdc.distributed_api.alltoallv(samples, all_samples, send_counts, recv_counts,
+                                  np.zeros(n_pes, np.int32), calc_disp(recv_counts))
+    all_samples.sort()
+
+    n_all = len(all_samples)
+    n_splitters = n_pes - 1 if n_all > 0 else 0
+    splitters = np.empty(n_splitters, keys.dtype)
+    for i in range(n_splitters):
+        splitters[i] = all_samples[((i + 1) * n_all) // n_pes]
+
+    return splitters
+
+
+@numba.njit
+def _get_dest_ranks(keys, splitters, n_pes, ascending, na_position):
+    """Returns rank of the process each key is sent to, NA keys are sent to the first or the last process"""
+    dest = np.searchsorted(splitters, keys, side='right').astype(np.int32)
+    if not ascending:
+        dest = np.int32(len(splitters)) - dest
+    na_dest = n_pes - 1 if na_position == 'last' else 0
+    na_mask = get_nan_mask(keys)
+    for i in numba.prange(len(keys)):
+        if na_mask[i]:
+            dest[i] = na_dest
+
+    return dest
+
+
+@numba.njit
+def _get_partition_perm(dest, n_pes):
+    """Returns permutation stably grouping elements by their destination process"""
+    counts = np.zeros(n_pes, np.int32)
+    for i in range(len(dest)):
+        counts[dest[i]] += 1
+    offsets = calc_disp(counts)
+    perm = np.empty(len(dest), np.int64)
+    for i in range(len(dest)):
+        d = dest[i]
+        perm[offsets[d]] = i
+        offsets[d] += 1
+
+    return perm
+
+
+def dist_sample_sort_exchange(key_arrs, data, ascending=True, na_position='last'):  # pragma: no cover
+    return key_arrs + data
+
+
+@overload(dist_sample_sort_exchange)
+def dist_sample_sort_exchange_overload(key_arrs, data, ascending=True, na_position='last'):
+    """
+    Redistributes rows given by key_arrs and data between processes, so that keys of process i
+    precede keys of process i + 1 in the requested order, and returns tuple of received key_arrs and data.
+    Splitters are chosen by the first key only. Rows with equal keys end up on the same process
+    and keep the order of their processes and their relative order within each process.
+    """
+
+    def dist_sample_sort_exchange_impl(key_arrs, data, ascending=True, na_position='last'):
+        n_pes = sdc.distributed_api.get_size()
+        start = trace_now()
+
+        splitters = _get_splitters(key_arrs[0], n_pes)
+        start = _record_stage(_sample_stage_id, start)
+
+        dest = _get_dest_ranks(key_arrs[0], splitters, n_pes, ascending, na_position)
+        perm = _get_partition_perm(dest, n_pes)
+        part_dest = dest[perm]
+        part_keys = getitem_arr_tup(key_arrs, perm)
+        part_data = getitem_arr_tup(data, perm)
+        pre_shuffle_meta = alloc_pre_shuffle_metadata(part_keys, part_data, n_pes, True)
+        for i in range(len(part_dest)):
+            update_shuffle_meta(pre_shuffle_meta, part_dest[i], i,
+                                getitem_arr_tup(part_keys, i), getitem_arr_tup(part_data, i), True)
+        start = _record_stage(_partition_stage_id, start)
+
+        shuffle_meta = finalize_shuffle_meta(part_keys, part_data, pre_shuffle_meta, n_pes, True)
+        res = alltoallv_tup(part_keys + part_data, shuffle_meta)
+        _record_stage(_exchange_stage_id, start)
+
+        return res
+
+    return dist_sample_sort_exchange_impl
+
+
+def _dist_index_values(index, n):  # pragma: no cover
+    return index
+
+
+@overload(_dist_index_values)
+def _dist_index_values_overload(index, n):
+    """Returns values of index of a distributed Series part of length n as an array"""
+    if isinstance(index, types.NoneType):
+        def _dist_index_values_none_impl(index, n):
+            start = sdc.distributed_api.dist_exscan(n)
+            return np.arange(start, start + n)
+
+        return _dist_index_values_none_impl
+
+    if isinstance(index, (RangeIndexType, Int64IndexType)):
+        return lambda index, n: index.values
+
+    return lambda index, n: index
+
+
+def _dist_index_from_values(index, values):  # pragma: no cover
+    return index
+
+
+@overload(_dist_index_from_values)
+def _dist_index_from_values_overload(index, values):
+    """Returns index of the same kind as index made of values"""
+    if isinstance(index, types.NoneType):
+        return lambda index, values: pandas.Int64Index(values)
+
+    if isinstance(index, (RangeIndexType, Int64IndexType)):
+        return lambda index, values: pandas.Int64Index(values, name=index.name)
+
+    return lambda index, values: values
+
+
+def dist_sort_series_supported(series_typ, arg_names):
+    """Returns True if sort_values of Series of type series_typ called with arguments arg_names
+    can be made with dist_sort_series"""
+    index_typ = series_typ.index
+    return (isinstance(series_typ.dtype, types.Number)
+            and (isinstance(index_typ, (types.NoneType, RangeIndexType, Int64IndexType))
+                 or isinstance(index_typ, types.Array) and isinstance(index_typ.dtype, types.Number))
+            and all(name in ('ascending', 'kind', 'na_position') for name in arg_names))
+
+
+def dist_sort_series(S, ascending=True, kind='quicksort', na_position='last'):  # pragma: no cover
+    return S.sort_values(ascending=ascending, kind=kind, na_position=na_position)
+
+
+@overload(dist_sort_series)
+def dist_sort_series_overload(S, ascending=True, kind='quicksort', na_position='last'):
+    """
+    Distributed sample sort of Series S which parts are held by all processes:
+    values and index are redistributed with dist_sample_sort_exchange and each process
+    sorts its part with Series.sort_values, i.e. with the native parallel sort.
+    Result parts are globally sorted in the order of process ranks.
+    """
+
+    def dist_sort_series_impl(S, ascending=True, kind='quicksort', na_position='last'):
+        index_values = _dist_index_values(S._index, len(S))
+        data, index_values = dist_sample_sort_exchange((S._data, ), (index_values, ), ascending, na_position)
+        part = pandas.Series(data, index=_dist_index_from_values(S._index, index_values), name=S._name)
+
+        start = trace_now()
+        res = part.sort_values(ascending=ascending, kind=kind, na_position=na_position)
+        _record_stage(_local_sort_stage_id, start)
+
+        return res
+
+    return dist_sort_series_impl
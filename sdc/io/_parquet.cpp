@@ -34,6 +34,7 @@
 #undef timezone
 #endif
 
+#include "../_hpat_common.h"
 #include "parquet/arrow/reader.h"
 using parquet::arrow::FileReader;
 
@@ -52,20 +53,20 @@ int pq_read_parallel_single_file(
     std::shared_ptr<FileReader>, int64_t column_idx, uint8_t* out_data, int out_dtype, int64_t start, int64_t count);
 int64_t pq_read_string_single_file(std::shared_ptr<FileReader>,
                                    int64_t column_idx,
-                                   uint32_t** out_offsets,
+                                   offset_t** out_offsets,
                                    uint8_t** out_data,
                                    uint8_t** out_nulls,
-                                   std::vector<uint32_t>* offset_vec = NULL,
+                                   std::vector<offset_t>* offset_vec = NULL,
                                    std::vector<uint8_t>* data_vec = NULL,
                                    std::vector<bool>* null_vec = NULL);
 int pq_read_string_parallel_single_file(std::shared_ptr<FileReader>,
                                         int64_t column_idx,
-                                        uint32_t** out_offsets,
+                                        offset_t** out_offsets,
                                         uint8_t** out_data,
                                         uint8_t** out_nulls,
                                         int64_t start,
                                         int64_t count,
-                                        std::vector<uint32_t>* offset_vec = NULL,
+                                        std::vector<offset_t>* offset_vec = NULL,
                                         std::vector<uint8_t>* data_vec = NULL,
                                         std::vector<bool>* null_vec = NULL);
 
@@ -80,10 +81,10 @@ int64_t pq_read(FileReaderVec* readers, int64_t column_idx, uint8_t* out_data, i
 int pq_read_parallel(
     FileReaderVec* readers, int64_t column_idx, uint8_t* out_data, int out_dtype, int64_t start, int64_t count);
 int pq_read_string(
-    FileReaderVec* readers, int64_t column_idx, uint32_t** out_offsets, uint8_t** out_data, uint8_t** out_nulls);
+    FileReaderVec* readers, int64_t column_idx, offset_t** out_offsets, uint8_t** out_data, uint8_t** out_nulls);
 int pq_read_string_parallel(FileReaderVec* readers,
                             int64_t column_idx,
-                            uint32_t** out_offsets,
+                            offset_t** out_offsets,
                             uint8_t** out_data,
                             uint8_t** out_nulls,
                             int64_t start,
@@ -348,7 +349,7 @@ int pq_read_parallel(
 }
 
 int pq_read_string(
-    FileReaderVec* readers, int64_t column_idx, uint32_t** out_offsets, uint8_t** out_data, uint8_t** out_nulls)
+    FileReaderVec* readers, int64_t column_idx, offset_t** out_offsets, uint8_t** out_data, uint8_t** out_nulls)
 {
     if (readers->size() == 0)
     {
@@ -360,10 +361,10 @@ int pq_read_string(
     {
         // std::cout << "pq path is dir" << '\n';
 
-        std::vector<uint32_t> offset_vec;
+        std::vector<offset_t> offset_vec;
         std::vector<uint8_t> data_vec;
         std::vector<bool> null_vec;
-        int32_t last_offset = 0;
+        offset_t last_offset = 0;
         int64_t n_all_vals = 0;
         for (size_t i = 0; i < readers->size(); i++)
         {
@@ -374,7 +375,7 @@ int pq_read_string(
                 continue;
             }
 
-            int size = offset_vec.size();
+            int64_t size = offset_vec.size();
             for (int64_t i = 1; i <= n_vals + 1; i++)
             {
                 offset_vec[size - i] += last_offset;
@@ -385,10 +386,10 @@ int pq_read_string(
         }
         offset_vec.push_back(last_offset);
 
-        *out_offsets = new uint32_t[offset_vec.size()];
+        *out_offsets = new offset_t[offset_vec.size()];
         *out_data = new uint8_t[data_vec.size()];
 
-        memcpy(*out_offsets, offset_vec.data(), offset_vec.size() * sizeof(uint32_t));
+        memcpy(*out_offsets, offset_vec.data(), offset_vec.size() * sizeof(offset_t));
         memcpy(*out_data, data_vec.data(), data_vec.size());
         pack_null_bitmap(out_nulls, null_vec, n_all_vals);
 
@@ -407,7 +408,7 @@ int pq_read_string(
 
 int pq_read_string_parallel(FileReaderVec* readers,
                             int64_t column_idx,
-                            uint32_t** out_offsets,
+                            offset_t** out_offsets,
                             uint8_t** out_data,
                             uint8_t** out_nulls,
                             int64_t start,
@@ -437,12 +438,12 @@ int pq_read_string_parallel(FileReaderVec* readers,
         }
 
         int64_t n_all_vals = 0;
-        std::vector<uint32_t> offset_vec;
+        std::vector<offset_t> offset_vec;
         std::vector<uint8_t> data_vec;
         std::vector<bool> null_vec;
 
         // read data
-        int64_t last_offset = 0;
+        offset_t last_offset = 0;
         int64_t read_rows = 0;
         while (read_rows < count)
         {
@@ -460,7 +461,7 @@ int pq_read_string_parallel(FileReaderVec* readers,
                                                     &data_vec,
                                                     &null_vec);
 
-                int size = offset_vec.size();
+                int64_t size = offset_vec.size();
                 for (int64_t i = 1; i <= rows_to_read + 1; i++)
                 {
                     offset_vec[size - i] += last_offset;
@@ -480,10 +481,10 @@ int pq_read_string_parallel(FileReaderVec* readers,
         }
         offset_vec.push_back(last_offset);
 
-        *out_offsets = new uint32_t[offset_vec.size()];
+        *out_offsets = new offset_t[offset_vec.size()];
         *out_data = new uint8_t[data_vec.size()];
 
-        memcpy(*out_offsets, offset_vec.data(), offset_vec.size() * sizeof(uint32_t));
+        memcpy(*out_offsets, offset_vec.data(), offset_vec.size() * sizeof(offset_t));
         memcpy(*out_data, data_vec.data(), data_vec.size());
         pack_null_bitmap(out_nulls, null_vec, n_all_vals);
         return n_all_vals;
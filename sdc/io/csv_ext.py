@@ -25,7 +25,9 @@
 # *****************************************************************************
 
 import contextlib
+import ctypes
 import functools
+import itertools
 
 import llvmlite.binding as ll
 from llvmlite import ir as lir
@@ -34,11 +36,14 @@ from collections import defaultdict
 import numba
 from numba.core import typeinfer, ir, ir_utils, types
 from numba.core.typing.templates import signature
-from numba.extending import overload, intrinsic, register_model, models, box
+from numba.extending import overload, intrinsic, register_model, models, box, lower_builtin
+from numba.core import cgutils
+from numba.core.imputils import iternext_impl, RefType
 from numba.core.ir_utils import (visit_vars_inner, replace_vars_inner,
                             compile_to_numba_ir, replace_arg_nodes)
 from numba.core import analysis
 from numba.parfors import array_analysis
+from numba.np import numpy_support
 import sdc
 from sdc import distributed, distributed_analysis
 from sdc.utilities.utils import (debug_prints, alloc_arr_tup, empty_like_type,
@@ -51,7 +56,8 @@ from sdc.str_arr_ext import (string_array_type, to_string_list,
                               cp_str_list_to_array, str_list_to_array,
                               get_offset_ptr, get_data_ptr, convert_len_arr_to_offset,
                               pre_alloc_string_array, num_total_chars,
-                              getitem_str_offset, copy_str_arr_slice)
+                              getitem_str_offset, copy_str_arr_slice, str_arr_from_buffers)
+from sdc.str_arr_type import offset_typ
 from sdc.timsort import copyElement_tup, getitem_arr_tup
 from sdc import objmode
 import pandas as pd
@@ -305,6 +311,126 @@ def box_stream_reader(typ, val, c):
     return val
 
 
+class CsvChunksIteratorType(types.SimpleIteratorType):
+    """Type of the iterator returned by pandas.read_csv with chunksize,
+    yields DataFrames of df_type read by pyarrow_read_csv_next_buffers"""
+
+    def __init__(self, df_type):
+        self.df_type = df_type
+        super(CsvChunksIteratorType, self).__init__(
+            name='CsvChunksIteratorType({})'.format(df_type), yield_type=df_type)
+
+
+@register_model(CsvChunksIteratorType)
+class CsvChunksIteratorModel(models.StructModel):
+    def __init__(self, dmm, fe_type):
+        members = [
+            # meminfo holding reader_id, its dtor closes the reader when the iterator is released
+            ('meminfo', types.MemInfoPointer(types.int64)),
+            # id of the Python reader registered by pyarrow_open_csv_chunks
+            ('reader_id', types.int64),
+        ]
+        super(CsvChunksIteratorModel, self).__init__(dmm, fe_type, members)
+
+
+@ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p)
+def _dtor_csv_chunks_iterator(data_ptr, size, info):
+    """NRT dtor of CsvChunksIteratorType meminfo, closes the reader if the iterator
+    is released before the file is read (e.g. on break from the loop over chunks)"""
+    reader_id = ctypes.c_int64.from_address(data_ptr).value
+    _csv_chunk_readers.pop(reader_id, None)
+
+
+ll.add_symbol('dtor_csv_chunks_iterator', ctypes.cast(_dtor_csv_chunks_iterator, ctypes.c_void_p).value)
+
+
+@intrinsic
+def init_csv_chunks_iterator(typingctx, reader_id, iterator_type):
+
+    ret_type = iterator_type.instance_type
+
+    def codegen(context, builder, sig, args):
+        llvoidptr = context.get_value_type(types.voidptr)
+        llsize = context.get_value_type(types.uintp)
+        dtor_ftype = lir.FunctionType(lir.VoidType(), [llvoidptr, llsize, llvoidptr])
+        dtor_fn = builder.module.get_or_insert_function(dtor_ftype, name="dtor_csv_chunks_iterator")
+
+        llreader_id = context.get_value_type(types.int64)
+        meminfo = context.nrt.meminfo_alloc_dtor(
+            builder,
+            context.get_constant(types.uintp, context.get_abi_sizeof(llreader_id)),
+            dtor_fn,
+        )
+        meminfo_data_ptr = context.nrt.meminfo_data(builder, meminfo)
+        builder.store(args[0], builder.bitcast(meminfo_data_ptr, llreader_id.as_pointer()))
+
+        csv_chunks_iter = cgutils.create_struct_proxy(sig.return_type)(context, builder)
+        csv_chunks_iter.meminfo = meminfo
+        csv_chunks_iter.reader_id = args[0]
+
+        return csv_chunks_iter._getvalue()
+
+    sig = signature(ret_type, types.int64, iterator_type)
+    return sig, codegen
+
+
+@lower_builtin('iternext', CsvChunksIteratorType)
+@iternext_impl(RefType.NEW)
+def iternext_csv_chunks(context, builder, sig, args, result):
+    iter_type = sig.args[0]
+    csv_chunks_iter = cgutils.create_struct_proxy(iter_type)(context, builder, value=args[0])
+
+    read_next = _gen_csv_chunks_next_func(iter_type.df_type)
+    read_next_sig = signature(types.Tuple([types.boolean, iter_type.df_type]), types.int64)
+    res = context.compile_internal(builder, lambda reader_id: read_next(reader_id), read_next_sig,
+                                   [csv_chunks_iter.reader_id])
+    is_valid = builder.extract_value(res, 0)
+    df = builder.extract_value(res, 1)
+
+    result.set_valid(is_valid)
+    with builder.if_else(is_valid) as (then, orelse):
+        with then:
+            result.yield_(df)
+        with orelse:
+            # DataFrame of empty columns returned for exhausted reader is not used
+            context.nrt.decref(builder, iter_type.df_type, df)
+
+
+# jitted functions reading next chunk of CSV file, keyed by resulting DataFrame type
+_csv_chunks_next_funcs = {}
+
+
+def _gen_csv_chunks_next_func(df_type):
+    """Generates jitted function returning (is_valid, df) for the next chunk of CSV file
+
+    Example of generated code:
+        def csv_chunks_next(reader_id):
+          with objmode(is_valid="boolean", col_0="Array(float64, 1, 'C')"):
+            is_valid, (col_0, ) = pyarrow_read_csv_next_buffers(reader_id)
+          return is_valid, pandas.DataFrame({'A': col_0})
+    """
+    if df_type in _csv_chunks_next_funcs:
+        return _csv_chunks_next_funcs[df_type]
+
+    func_name = 'csv_chunks_next'
+    func_lines = [f"def {func_name}(reader_id):"]
+    func_lines += _gen_csv_buffers_codelines(df_type.data, "pyarrow_read_csv_next_buffers(reader_id)",
+                                             outputs=[('is_valid', 'boolean')])
+    func_lines.append(f"  return is_valid, {_gen_csv_dataframe_expr(df_type.columns)}")
+    func_text = '\n'.join(func_lines)
+
+    global_vars = {
+        'pandas': pd,
+        'objmode': objmode,
+        'pyarrow_read_csv_next_buffers': pyarrow_read_csv_next_buffers,
+        'str_arr_from_buffers': str_arr_from_buffers,
+    }
+    jit_func = numba.njit(_gen_csv_reader_py_pyarrow_py_func(func_text, func_name, global_vars))
+    _csv_chunks_next_funcs[df_type] = jit_func
+
+    return jit_func
+
+
 # XXX: temporary fix pending Numba's #3378
 # keep the compiled functions around to make sure GC doesn't delete them and
 # the reference to the dynamic function inside them
@@ -406,6 +532,206 @@ def pandas_read_csv(
     This function has the same interface as pandas.read_csv.
     """
 
+    table = _pyarrow_read_csv_table(filepath_or_buffer, sep, delimiter, names, usecols, dtype, skiprows, parse_dates)
+
+    dataframe = table.to_pandas(
+        # categories=categories or None,
+    )
+
+    if names:
+        if usecols and len(names) != len(usecols):
+            if isinstance(usecols[0], int):
+                dataframe.columns = [names[col] for col in usecols]
+            elif isinstance(usecols[0], str):
+                dataframe.columns = [name for name in names if name in usecols]
+        else:
+            dataframe.columns = names
+
+    # fix when PyArrow will support predicted categories
+    if isinstance(dtype, dict):
+        for column_name, column_type in dtype.items():
+            if isinstance(column_type, pd.CategoricalDtype):
+                dataframe[column_name] = dataframe[column_name].astype(column_type)
+
+    return dataframe
+
+
+@pyarrow_cpu_count_equal_numba_num_treads
+def pyarrow_read_csv_buffers(
+        filepath_or_buffer,
+        sep=',',
+        delimiter=None,
+        names=None,
+        usecols=None,
+        dtype=None,
+        skiprows=None,
+        parse_dates=False,
+        column_dtypes=(),
+):
+    """Reads CSV file via pyarrow.csv.read_csv into buffers of SDC column arrays.
+    Unlike pandas_read_csv no pandas.DataFrame is created: numeric columns are returned
+    as numpy arrays (zero-copy views on Arrow memory when a column is read as a single chunk
+    without nulls) and string columns as (offsets, data, null_bitmap) arrays
+    for str_arr_from_buffers. Columns are converted to column_dtypes in the order they are read.
+    """
+
+    table = _pyarrow_read_csv_table(filepath_or_buffer, sep, delimiter, names, usecols, dtype, skiprows, parse_dates)
+
+    return _arrow_table_buffers(table, column_dtypes)
+
+
+class _CsvChunkReader:
+    """Reads CSV file by tables of chunksize rows with pyarrow streaming CSV reader"""
+
+    def __init__(self, reader, chunksize, column_dtypes):
+        self.reader = reader
+        self.chunksize = chunksize
+        self.column_dtypes = column_dtypes
+        self.pending_batches = []
+        self.pending_rows = 0
+        self.exhausted = False
+
+    def read_chunk(self):
+        """Returns table with next chunksize rows or less for the last chunk, None if file is read"""
+        while not self.exhausted and self.pending_rows < self.chunksize:
+            try:
+                batch = self.reader.read_next_batch()
+            except StopIteration:
+                self.exhausted = True
+            else:
+                self.pending_batches.append(batch)
+                self.pending_rows += batch.num_rows
+
+        if self.pending_rows == 0:
+            return None
+
+        table = pyarrow.Table.from_batches(self.pending_batches, schema=self.reader.schema)
+        rest = table.slice(self.chunksize)
+        self.pending_batches = rest.to_batches()
+        self.pending_rows = rest.num_rows
+
+        return table.slice(0, self.chunksize)
+
+
+# streaming readers opened by pyarrow_open_csv_chunks, keyed by ids passed to nopython code,
+# removed when the file is read or by the dtor of the iterator
+_csv_chunk_readers = {}
+_csv_chunk_reader_ids = itertools.count()
+
+
+@pyarrow_cpu_count_equal_numba_num_treads
+def pyarrow_open_csv_chunks(
+        filepath_or_buffer,
+        sep=',',
+        delimiter=None,
+        names=None,
+        usecols=None,
+        dtype=None,
+        skiprows=None,
+        parse_dates=False,
+        chunksize=None,
+        column_dtypes=(),
+):
+    """Opens CSV file via pyarrow.csv.open_csv to be read by chunks of chunksize rows
+    with pyarrow_read_csv_next_buffers. Returns id of the opened reader.
+    """
+
+    options = _pyarrow_read_csv_options(sep, delimiter, names, usecols, dtype, skiprows, parse_dates)
+    reader = pyarrow.csv.open_csv(filepath_or_buffer, **options)
+
+    reader_id = next(_csv_chunk_reader_ids)
+    _csv_chunk_readers[reader_id] = _CsvChunkReader(reader, chunksize, column_dtypes)
+
+    return reader_id
+
+
+@pyarrow_cpu_count_equal_numba_num_treads
+def pyarrow_read_csv_next_buffers(reader_id):
+    """Reads next chunk of CSV file opened with pyarrow_open_csv_chunks.
+    Returns (is_valid, buffers), where buffers are the same as of pyarrow_read_csv_buffers.
+    When the file is read is_valid is False, buffers are empty and the reader is closed.
+    """
+
+    chunk_reader = _csv_chunk_readers[reader_id]
+    table = chunk_reader.read_chunk()
+    is_valid = table is not None
+    if not is_valid:
+        del _csv_chunk_readers[reader_id]
+        table = chunk_reader.reader.schema.empty_table()
+
+    return is_valid, _arrow_table_buffers(table, chunk_reader.column_dtypes)
+
+
+def _arrow_table_buffers(table, column_dtypes):
+    result = []
+    for column, column_dtype in zip(table.columns, column_dtypes):
+        if column_dtype is str:
+            result.append(_arrow_string_buffers(column))
+        else:
+            result.append(_arrow_numeric_buffer(column, column_dtype))
+
+    return tuple(result)
+
+
+def _arrow_numeric_buffer(column, dtype):
+    """Converts pyarrow.ChunkedArray into numpy array of dtype, avoiding copies where possible"""
+    chunks = [chunk.to_numpy(zero_copy_only=False) for chunk in column.chunks]
+    if len(chunks) == 1:
+        arr = chunks[0]
+    elif chunks:
+        arr = np.concatenate(chunks)
+    else:
+        arr = np.empty(0, dtype)
+
+    return arr.astype(dtype, copy=False)
+
+
+offset_dtype = numpy_support.as_dtype(offset_typ)
+
+
+def _arrow_string_buffers(column):
+    """Converts pyarrow.ChunkedArray of strings into offsets, data and null_bitmap
+    arrays with the layout of StringArray"""
+    offsets_chunks, data_chunks, valid_chunks = [], [], []
+    n_chars = 0
+    for chunk in column.chunks:
+        n = len(chunk)
+        validity_buf, offsets_buf, data_buf = chunk.buffers()
+        chunk_offset_dtype = np.dtype(np.int64 if chunk.type == pyarrow.large_string() else np.int32)
+        offsets = np.frombuffer(offsets_buf, chunk_offset_dtype, n + 1, chunk.offset * chunk_offset_dtype.itemsize)
+        start, stop = int(offsets[0]), int(offsets[-1])
+
+        offsets_chunks.append((offsets[:-1] - start).astype(offset_dtype) + offset_dtype.type(n_chars))
+        if stop > start:
+            data_chunks.append(np.frombuffer(data_buf, np.uint8, stop - start, start))
+        if validity_buf is None:
+            valid_chunks.append(np.ones(n, np.bool_))
+        else:
+            validity = np.unpackbits(np.frombuffer(validity_buf, np.uint8), bitorder='little')
+            valid_chunks.append(validity[chunk.offset:chunk.offset + n].astype(np.bool_))
+        n_chars += stop - start
+
+    offsets_chunks.append(np.array([n_chars], offset_dtype))
+    offsets = np.concatenate(offsets_chunks)
+    data = np.concatenate(data_chunks) if data_chunks else np.empty(0, np.uint8)
+    valid = np.concatenate(valid_chunks) if valid_chunks else np.empty(0, np.bool_)
+    null_bitmap = np.packbits(valid, bitorder='little')
+
+    return offsets, data, null_bitmap
+
+
+def _pyarrow_read_csv_table(filepath_or_buffer, sep, delimiter, names, usecols, dtype, skiprows, parse_dates):
+    """Reads CSV file into pyarrow.Table taking into account parameters of pandas.read_csv"""
+
+    options = _pyarrow_read_csv_options(sep, delimiter, names, usecols, dtype, skiprows, parse_dates)
+    table = pyarrow.csv.read_csv(filepath_or_buffer, **options)
+
+    return table
+
+
+def _pyarrow_read_csv_options(sep, delimiter, names, usecols, dtype, skiprows, parse_dates):
+    """Converts parameters of pandas.read_csv into options of pyarrow.csv readers"""
+
     if delimiter is None:
         delimiter = sep
 
@@ -489,36 +815,14 @@ def pandas_read_csv(
         include_columns=include_columns,
     )
 
-    table = pyarrow.csv.read_csv(
-        filepath_or_buffer,
-        read_options=read_options,
-        parse_options=parse_options,
-        convert_options=convert_options,
-    )
-
-    dataframe = table.to_pandas(
-        # categories=categories or None,
-    )
-
-    if names:
-        if usecols and len(names) != len(usecols):
-            if isinstance(usecols[0], int):
-                dataframe.columns = [names[col] for col in usecols]
-            elif isinstance(usecols[0], str):
-                dataframe.columns = [name for name in names if name in usecols]
-        else:
-            dataframe.columns = names
-
-    # fix when PyArrow will support predicted categories
-    if isinstance(dtype, dict):
-        for column_name, column_type in dtype.items():
-            if isinstance(column_type, pd.CategoricalDtype):
-                dataframe[column_name] = dataframe[column_name].astype(column_type)
-
-    return dataframe
+    return {
+        'read_options': read_options,
+        'parse_options': parse_options,
+        'convert_options': convert_options,
+    }
 
 
-def _gen_pandas_read_csv_func_text(col_names, col_typs, py_col_dtypes, usecols, signature=None):
+def _gen_pandas_read_csv_func_text(col_names, col_typs, py_col_dtypes, usecols, signature=None, chunked=False):
 
     func_name = 'csv_reader_py'
     return_columns = usecols if usecols and isinstance(usecols[0], str) else col_names
@@ -573,6 +877,34 @@ def _gen_pandas_read_csv_func_text(col_names, col_typs, py_col_dtypes, usecols,
     params_str = '\n'.join([
         f"      {param}={inner_call_params.get(param, param)}," for param in used_read_csv_params
     ])
+
+    global_vars = {
+        'read_as_dtypes': py_col_dtypes,
+        'objmode': objmode,
+    }
+
+    if chunked:
+        func_text = _gen_chunked_read_csv_func_text(func_name, signature, params_str)
+        global_vars.update({
+            'pyarrow_open_csv_chunks': pyarrow_open_csv_chunks,
+            'init_csv_chunks_iterator': init_csv_chunks_iterator,
+            'iterator_type': CsvChunksIteratorType(df_type),
+            'read_as_column_dtypes': list(py_col_dtypes.values()),
+        })
+        return func_text, func_name, global_vars
+
+    # columns of numpy arrays and strings are built directly from Arrow buffers,
+    # other types (e.g. Categorical) still need conversion with pandas
+    if all(is_native_csv_column_type(typ) for typ in col_typs):
+        func_text = _gen_native_read_csv_func_text(func_name, signature, col_names, col_typs, params_str)
+        global_vars.update({
+            'pandas': pd,
+            'pyarrow_read_csv_buffers': pyarrow_read_csv_buffers,
+            'str_arr_from_buffers': str_arr_from_buffers,
+            'read_as_column_dtypes': list(py_col_dtypes.values()),
+        })
+        return func_text, func_name, global_vars
+
     func_text = '\n'.join([
         f"def {func_name}({signature}):",
         f"  with objmode(df=\"{df_type_repr}\"):",
@@ -580,16 +912,118 @@ def _gen_pandas_read_csv_func_text(col_names, col_typs, py_col_dtypes, usecols,
         f"    )",
         f"  return df"
     ])
-
-    global_vars = {
-        'read_as_dtypes': py_col_dtypes,
-        'objmode': objmode,
-        'pandas_read_csv': pandas_read_csv,
-    }
+    global_vars['pandas_read_csv'] = pandas_read_csv
 
     return func_text, func_name, global_vars
 
 
+def is_native_csv_column_type(typ):
+    if typ == string_array_type:
+        return True
+
+    return (isinstance(typ, types.Array) and typ.ndim == 1 and typ.layout == 'C'
+            and isinstance(typ.dtype, (types.Number, types.Boolean)))
+
+
+def _gen_native_read_csv_func_text(func_name, signature, col_names, col_typs, params_str):
+    """Generates read_csv function that reads buffers of columns in objmode
+    and creates resulting DataFrame in nopython mode
+
+    Example of generated code:
+        def csv_reader_py(filepath_or_buffer, ...):
+          with objmode(col_0="Array(float64, 1, 'C')",
+                       col_1_offsets="Array(uint64, 1, 'C')",
+                       col_1_data="Array(uint8, 1, 'C')",
+                       col_1_null_bitmap="Array(uint8, 1, 'C')"):
+            (col_0, (col_1_offsets, col_1_data, col_1_null_bitmap), ) = pyarrow_read_csv_buffers(
+              filepath_or_buffer=filepath_or_buffer,
+              ...
+              column_dtypes=read_as_column_dtypes,
+            )
+          col_1 = str_arr_from_buffers(col_1_offsets, col_1_data, col_1_null_bitmap)
+          return pandas.DataFrame({'A': col_0, 'B': col_1})
+    """
+    read_call = '\n'.join([
+        f"pyarrow_read_csv_buffers(\n{params_str}",
+        f"      column_dtypes=read_as_column_dtypes,",
+        f"    )",
+    ])
+
+    func_lines = [f"def {func_name}({signature}):"]
+    func_lines += _gen_csv_buffers_codelines(col_typs, read_call)
+    func_lines.append(f"  return {_gen_csv_dataframe_expr(col_names)}")
+
+    return '\n'.join(func_lines)
+
+
+def _gen_chunked_read_csv_func_text(func_name, signature, params_str):
+    """Generates read_csv function that opens CSV file in objmode and returns
+    CsvChunksIteratorType iterator over DataFrames of chunksize rows
+
+    Example of generated code:
+        def csv_reader_py(filepath_or_buffer, ...):
+          with objmode(reader_id="int64"):
+            reader_id = pyarrow_open_csv_chunks(
+              filepath_or_buffer=filepath_or_buffer,
+              ...
+              chunksize=chunksize,
+              column_dtypes=read_as_column_dtypes,
+            )
+          return init_csv_chunks_iterator(reader_id, iterator_type)
+    """
+    func_lines = [
+        f"def {func_name}({signature}):",
+        f"  with objmode(reader_id=\"int64\"):",
+        f"    reader_id = pyarrow_open_csv_chunks(\n{params_str}",
+        f"      chunksize=chunksize,",
+        f"      column_dtypes=read_as_column_dtypes,",
+        f"    )",
+        f"  return init_csv_chunks_iterator(reader_id, iterator_type)",
+    ]
+
+    return '\n'.join(func_lines)
+
+
+def _gen_csv_buffers_codelines(col_typs, read_call, outputs=()):
+    """Generates code lines calling read_call in objmode to get buffers of columns
+    and creating column arrays col_0, col_1, ... from them in nopython mode.
+    outputs are pairs (name, type repr) of values returned by read_call before the buffers.
+    """
+    buffer_repr = "Array(uint8, 1, 'C')"
+    offsets_repr = f"Array({offset_typ}, 1, 'C')"
+
+    out_types = list(outputs)
+    out_targets = []
+    str_arr_lines = []
+    for i, typ in enumerate(col_typs):
+        if typ == string_array_type:
+            buffers = [f'col_{i}_offsets', f'col_{i}_data', f'col_{i}_null_bitmap']
+            out_types += [(buffers[0], offsets_repr), (buffers[1], buffer_repr), (buffers[2], buffer_repr)]
+            out_targets.append(f"({', '.join(buffers)})")
+            str_arr_lines.append(f"  col_{i} = str_arr_from_buffers({', '.join(buffers)})")
+        else:
+            dtype_repr = 'boolean' if isinstance(typ.dtype, types.Boolean) else f'{typ.dtype}'
+            out_types.append((f'col_{i}', f"Array({dtype_repr}, 1, 'C')"))
+            out_targets.append(f'col_{i}')
+
+    objmode_params = ', '.join(f'{name}="{typ_repr}"' for name, typ_repr in out_types)
+    targets = ''.join(f'{name}, ' for name, _ in outputs)
+    targets += '(' + ''.join(f'{target}, ' for target in out_targets) + ')'
+
+    func_lines = [
+        f"  with objmode({objmode_params}):",
+        f"    {targets} = {read_call}",
+    ]
+    func_lines += str_arr_lines
+
+    return func_lines
+
+
+def _gen_csv_dataframe_expr(col_names):
+    data = ', '.join(f'{col_name!r}: col_{i}' for i, col_name in enumerate(col_names))
+    return f"pandas.DataFrame({{{data}}})"
+
+
 def _gen_csv_reader_py_pyarrow_py_func(func_text, func_name, global_vars):
     locals = {}
     exec(func_text, global_vars, locals)
@@ -0,0 +1,480 @@
+# *****************************************************************************
+# Copyright (c) 2019-2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+
+"""
+
+| Writing of DataFrame and Series to CSV format from compiled code.
+| Rows are split into chunks, each chunk is formatted in parallel into its region of a byte buffer
+| which size is computed beforehand: exactly for integer, boolean and string fields and
+| as the maximum length of a float representation for float fields.
+| Formatted chunks are written to the file in parallel at offsets they have in the output,
+| or concatenated in order into a string when no path is given.
+
+"""
+
+import os
+
+import llvmlite.binding as ll
+import numpy
+
+from numba import types, prange
+from numba.core.errors import TypingError
+
+import sdc
+from sdc import hio, objmode
+from sdc.transport import transport
+from sdc.datatypes.common_functions import SDCLimitation
+from sdc.datatypes.int64_index_type import Int64IndexType
+from sdc.datatypes.range_index_type import RangeIndexType
+from sdc.functions.str_arr_kernels import float_utf8_max_size, int_utf8_size, write_int_utf8
+from sdc.io.np_io import file_write, file_write_parallel
+from sdc.str_arr_ext import StringArrayType, get_offsets_array, get_chars_array, str_arr_is_na
+from sdc.str_ext import unicode_to_char_ptr, str_format_float32, str_format_float64
+from sdc.utilities.compile_cache import exec_func_text
+from sdc.utilities.prange_utils import parallel_chunks
+from sdc.utilities.utils import sdc_register_jitable
+
+
+ll.add_symbol('file_write', hio.file_write)
+ll.add_symbol('file_write_parallel', transport.file_write_parallel)
+
+
+def is_csv_writable_type(arr_type):
+    """Checks whether column of the type can be written to CSV"""
+    if isinstance(arr_type, StringArrayType):
+        return True
+
+    return (isinstance(arr_type, types.Array) and arr_type.ndim == 1
+            and isinstance(arr_type.dtype, (types.Integer, types.Float, types.Boolean)))
+
+
+def csv_quote_field(text, sep, quotechar, line_terminator):
+    """Quotes the field as csv.QUOTE_MINIMAL does"""
+    special_chars = {sep, quotechar, '\n', '\r'} | set(line_terminator)
+    if any(c in special_chars for c in text):
+        return quotechar + text.replace(quotechar, quotechar * 2) + quotechar
+
+    return text
+
+
+def csv_header_bytes(names, sep, quotechar, line_terminator):
+    """Returns header line with given names of the fields as an uint8 array"""
+    fields = [csv_quote_field(str(name), sep, quotechar, line_terminator) for name in names]
+    if fields == ['']:
+        fields = [quotechar * 2]
+
+    return _csv_bytes(sep.join(fields) + line_terminator)
+
+
+def _csv_bytes(text):
+    return numpy.frombuffer(text.encode('utf-8'), dtype=numpy.uint8).copy()
+
+
+@sdc_register_jitable
+def _csv_write_bytes(buf, pos, data):
+    for j in range(len(data)):
+        buf[pos + j] = data[j]
+
+    return pos + len(data)
+
+
+@sdc_register_jitable
+def _csv_write_float(buf, pos, value, na_field):
+    if numpy.isnan(value):
+        return _csv_write_bytes(buf, pos, na_field)
+
+    return pos + str_format_float64(buf[pos:].ctypes, numpy.float64(value))
+
+
+@sdc_register_jitable
+def _csv_write_float32(buf, pos, value, na_field):
+    # as in pandas float32 values are written with the shortest representation reading back to the same float32
+    if numpy.isnan(value):
+        return _csv_write_bytes(buf, pos, na_field)
+
+    return pos + str_format_float32(buf[pos:].ctypes, value)
+
+
+@sdc_register_jitable
+def _csv_str_is_quoted(offsets, chars, i, special_chars, quote_empty):
+    start, stop = numpy.int64(offsets[i]), numpy.int64(offsets[i + 1])
+    if quote_empty and start == stop:
+        return True
+
+    for j in range(start, stop):
+        for c in special_chars:
+            if chars[j] == c:
+                return True
+
+    return False
+
+
+@sdc_register_jitable
+def _csv_str_size(offsets, chars, i, special_chars, quote_empty):
+    """Returns size of the string field, special_chars[0] is the quote character"""
+    start, stop = numpy.int64(offsets[i]), numpy.int64(offsets[i + 1])
+    if not _csv_str_is_quoted(offsets, chars, i, special_chars, quote_empty):
+        return stop - start
+
+    n_quotes = 0
+    for j in range(start, stop):
+        if chars[j] == special_chars[0]:
+            n_quotes += 1
+
+    return stop - start + n_quotes + 2
+
+
+@sdc_register_jitable
+def _csv_write_str(buf, pos, offsets, chars, i, special_chars, quote_empty):
+    start, stop = numpy.int64(offsets[i]), numpy.int64(offsets[i + 1])
+    if not _csv_str_is_quoted(offsets, chars, i, special_chars, quote_empty):
+        for j in range(start, stop):
+            buf[pos] = chars[j]
+            pos += 1
+        return pos
+
+    quotechar = special_chars[0]
+    buf[pos] = quotechar
+    pos += 1
+    for j in range(start, stop):
+        if chars[j] == quotechar:
+            buf[pos] = quotechar
+            pos += 1
+        buf[pos] = chars[j]
+        pos += 1
+    buf[pos] = quotechar
+
+    return pos + 1
+
+
+@sdc_register_jitable
+def csv_write_chunks(path, buf, bounds, ends):
+    """
+    Writes to path the header buf[:bounds[0]] followed by chunks buf[bounds[k]:ends[k]],
+    the first chunk is written together with the header, others are written in parallel
+    at their offsets in the file
+    """
+    n_chunks = len(ends)
+    first_end = ends[0] if n_chunks > 0 else bounds[0]
+    file_write(unicode_to_char_ptr(path), buf.ctypes, first_end)
+    if n_chunks < 2:
+        return
+
+    offsets = numpy.empty(n_chunks, numpy.int64)
+    offsets[0] = 0
+    offsets[1] = first_end
+    for k in range(2, n_chunks):
+        offsets[k] = offsets[k - 1] + ends[k - 1] - bounds[k - 1]
+
+    for k in prange(1, n_chunks):
+        file_write_parallel(path, buf[bounds[k]:ends[k]], offsets[k], ends[k] - bounds[k])
+
+
+@sdc_register_jitable
+def csv_join_chunks(buf, bounds, ends):
+    """Returns the header buf[:bounds[0]] followed by chunks buf[bounds[k]:ends[k]] in order as a string"""
+    n_chunks = len(ends)
+    offsets = numpy.empty(n_chunks + 1, numpy.int64)
+    offsets[0] = bounds[0]
+    for k in range(n_chunks):
+        offsets[k + 1] = offsets[k] + ends[k] - bounds[k]
+
+    out = numpy.empty(offsets[-1], numpy.uint8)
+    out[:bounds[0]] = buf[:bounds[0]]
+    for k in prange(n_chunks):
+        out[offsets[k]:offsets[k + 1]] = buf[bounds[k]:ends[k]]
+
+    with objmode(result='unicode_type'):
+        result = out.tobytes().decode('utf-8')
+
+    return result
+
+
+def gen_csv_write_codelines(fields, n_rows, header, path, sep, na_rep, quotechar, line_terminator):
+    """
+    Generates lines of a function formatting fields into CSV and writing them to the path
+    or returning them as a string if path is None.
+    Each field is a tuple of its array variable name, type of the array and expression
+    of the i-th value, which is used instead of the array for numeric fields if not None.
+    n_rows is an expression of the number of rows, header is a name of variable or of a global
+    with the header line as an uint8 array.
+
+    Example of generated code for an integer and a string field:
+        n = len(col_0)
+        chunks = parallel_chunks(n)
+        n_chunks = len(chunks)
+        col_1_offsets = get_offsets_array(col_1)
+        col_1_chars = get_chars_array(col_1)
+        sizes = numpy.empty(n_chunks + 1, numpy.int64)
+        sizes[0] = len(csv_header)
+        for k in prange(n_chunks):
+          size = 0
+          for i in range(chunks[k].start, chunks[k].stop):
+            size += int_utf8_size(col_0[i])
+            size += len(_csv_na_field) if str_arr_is_na(col_1, i) else _csv_str_size(col_1_offsets, ...)
+          sizes[k + 1] = size + (chunks[k].stop - chunks[k].start) * _csv_row_delimiters_size
+        bounds = numpy.cumsum(sizes)
+        buf = numpy.empty(bounds[-1], numpy.uint8)
+        _csv_write_bytes(buf, 0, csv_header)
+        ends = numpy.empty(n_chunks, numpy.int64)
+        for k in prange(n_chunks):
+          pos = bounds[k]
+          for i in range(chunks[k].start, chunks[k].stop):
+            pos = write_int_utf8(buf, pos, col_0[i])
+            pos = _csv_write_bytes(buf, pos, _csv_sep)
+            if str_arr_is_na(col_1, i):
+              pos = _csv_write_bytes(buf, pos, _csv_na_field)
+            else:
+              pos = _csv_write_str(buf, pos, col_1_offsets, col_1_chars, i, _csv_special_chars, False)
+            pos = _csv_write_bytes(buf, pos, _csv_line_terminator)
+          ends[k] = pos
+        csv_write_chunks(path_or_buf, buf, bounds, ends)
+    """
+    n_fields = len(fields)
+    # an empty single field would make an empty line
+    quote_empty = n_fields == 1
+    na_field = csv_quote_field(na_rep, sep, quotechar, line_terminator)
+    if quote_empty and na_field == '':
+        na_field = quotechar * 2
+
+    special_chars = [quotechar] + sorted({sep, '\n', '\r'} | set(line_terminator) - {quotechar})
+    global_vars = {
+        'numpy': numpy,
+        'prange': prange,
+        'parallel_chunks': parallel_chunks,
+        'get_offsets_array': get_offsets_array,
+        'get_chars_array': get_chars_array,
+        'str_arr_is_na': str_arr_is_na,
+        'int_utf8_size': int_utf8_size,
+        '_csv_str_size': _csv_str_size,
+        '_csv_write_bytes': _csv_write_bytes,
+        'write_int_utf8': write_int_utf8,
+        '_csv_write_float': _csv_write_float,
+        '_csv_write_float32': _csv_write_float32,
+        '_csv_write_str': _csv_write_str,
+        'csv_write_chunks': csv_write_chunks,
+        'csv_join_chunks': csv_join_chunks,
+        '_csv_na_field': _csv_bytes(na_field),
+        '_csv_true': _csv_bytes('True'),
+        '_csv_false': _csv_bytes('False'),
+        '_csv_special_chars': _csv_bytes(''.join(special_chars)),
+        '_csv_sep': _csv_bytes(sep),
+        '_csv_line_terminator': _csv_bytes(line_terminator),
+        '_csv_row_delimiters_size': n_fields - 1 + len(line_terminator.encode('utf-8')),
+    }
+
+    size_lines, write_lines = [], []
+    for j, (arr, arr_type, value) in enumerate(fields):
+        value = f'{arr}[i]' if value is None else value
+        if isinstance(arr_type, StringArrayType):
+            str_args = f'{arr}_offsets, {arr}_chars, i, _csv_special_chars, {quote_empty}'
+            size_lines.append(f'      size += len(_csv_na_field) if str_arr_is_na({arr}, i) '
+                              f'else _csv_str_size({str_args})')
+            write_lines += [f'      if str_arr_is_na({arr}, i):',
+                            f'        pos = _csv_write_bytes(buf, pos, _csv_na_field)',
+                            f'      else:',
+                            f'        pos = _csv_write_str(buf, pos, {str_args})']
+        elif isinstance(arr_type.dtype, types.Boolean):
+            size_lines.append(f'      size += 4 if {value} else 5')
+            write_lines.append(f'      pos = _csv_write_bytes(buf, pos, _csv_true if {value} else _csv_false)')
+        elif isinstance(arr_type.dtype, types.Integer):
+            size_lines.append(f'      size += int_utf8_size({value})')
+            write_lines.append(f'      pos = write_int_utf8(buf, pos, {value})')
+        else:
+            size_lines.append(f'      size += {max(float_utf8_max_size, len(na_field.encode("utf-8")))}')
+            write_float = '_csv_write_float32' if arr_type.dtype == types.float32 else '_csv_write_float'
+            write_lines.append(f'      pos = {write_float}(buf, pos, {value}, _csv_na_field)')
+
+        if j < n_fields - 1:
+            write_lines.append(f'      pos = _csv_write_bytes(buf, pos, _csv_sep)')
+
+    func_lines = [f'  n = {n_rows}',
+                  f'  chunks = parallel_chunks(n)',
+                  f'  n_chunks = len(chunks)']
+    for arr, arr_type, _ in fields:
+        if isinstance(arr_type, StringArrayType):
+            func_lines += [f'  {arr}_offsets = get_offsets_array({arr})',
+                           f'  {arr}_chars = get_chars_array({arr})']
+
+    func_lines += [f'  sizes = numpy.empty(n_chunks + 1, numpy.int64)',
+                   f'  sizes[0] = len({header})',
+                   f'  for k in prange(n_chunks):',
+                   f'    size = 0',
+                   f'    for i in range(chunks[k].start, chunks[k].stop):']
+    func_lines += size_lines
+    func_lines += [f'    sizes[k + 1] = size + (chunks[k].stop - chunks[k].start) * _csv_row_delimiters_size',
+                   f'  bounds = numpy.cumsum(sizes)',
+                   f'  buf = numpy.empty(bounds[-1], numpy.uint8)',
+                   f'  _csv_write_bytes(buf, 0, {header})',
+                   f'  ends = numpy.empty(n_chunks, numpy.int64)',
+                   f'  for k in prange(n_chunks):',
+                   f'    pos = bounds[k]',
+                   f'    for i in range(chunks[k].start, chunks[k].stop):']
+    func_lines += write_lines
+    func_lines += [f'      pos = _csv_write_bytes(buf, pos, _csv_line_terminator)',
+                   f'    ends[k] = pos']
+
+    if path is None:
+        func_lines.append(f'  return csv_join_chunks(buf, bounds, ends)')
+    else:
+        func_lines.append(f'  csv_write_chunks({path}, buf, bounds, ends)')
+
+    return func_lines, global_vars
+
+
+# parameters of DataFrame.to_csv() and Series.to_csv() with their defaults
+to_csv_defaults = {
+    'path_or_buf': None,
+    'sep': ',',
+    'na_rep': '',
+    'float_format': None,
+    'columns': None,
+    'header': True,
+    'index': True,
+    'index_label': None,
+    'mode': 'w',
+    'encoding': None,
+    'compression': 'infer',
+    'quoting': None,
+    'quotechar': '"',
+    'line_terminator': None,
+    'chunksize': None,
+    'date_format': None,
+    'doublequote': True,
+    'escapechar': None,
+    'decimal': '.',
+}
+
+to_csv_signature = ', '.join(f'{name}={value!r}' for name, value in to_csv_defaults.items())
+
+# parameters which only default values are supported
+_to_csv_unsupported = ['float_format', 'columns', 'mode', 'encoding', 'compression', 'quoting',
+                       'chunksize', 'date_format', 'doublequote', 'escapechar', 'decimal']
+
+
+def _get_const_value(func_name, name, ty):
+    if isinstance(ty, types.Omitted):
+        return ty.value
+    if isinstance(ty, types.Literal):
+        return ty.literal_value
+    if ty is None or isinstance(ty, types.NoneType):
+        return None
+    if not isinstance(ty, types.Type):
+        return ty
+
+    raise SDCLimitation(f'Method {func_name}(). Parameter {name} should be a constant. Given: {ty}')
+
+
+def get_to_csv_params(func_name, params):
+    """
+    Returns Python values of to_csv() parameters given as types, path_or_buf is returned
+    as None if the result is returned as a string and as True if it is written to a file
+    """
+    path_or_buf = params['path_or_buf']
+    if isinstance(path_or_buf, (types.UnicodeType, types.StringLiteral)):
+        to_file = True
+    elif isinstance(path_or_buf, (types.Omitted, types.NoneType)) or path_or_buf is None:
+        to_file = None
+    else:
+        raise TypingError(f'Method {func_name}(). The object path_or_buf\n given: {path_or_buf}\n expected: str')
+
+    values = {name: _get_const_value(func_name, name, ty) for name, ty in params.items() if name != 'path_or_buf'}
+    values['path_or_buf'] = to_file
+
+    for name in _to_csv_unsupported:
+        if values[name] != to_csv_defaults[name]:
+            raise SDCLimitation(f'Method {func_name}(). Unsupported parameter {name}={values[name]!r}')
+
+    for name in ['sep', 'quotechar']:
+        if not (isinstance(values[name], str) and len(values[name].encode('utf-8')) == 1):
+            raise TypingError(f'Method {func_name}(). Parameter {name} should be a 1-character ASCII string. '
+                              f'Given: {values[name]!r}')
+
+    for name, expected in [('na_rep', str), ('header', bool), ('index', bool),
+                           ('index_label', (str, type(None))), ('line_terminator', (str, type(None)))]:
+        if not isinstance(values[name], expected):
+            raise TypingError(f'Method {func_name}(). Unsupported parameter {name}={values[name]!r}')
+
+    if values['line_terminator'] is None:
+        values['line_terminator'] = os.linesep
+
+    return values
+
+
+def gen_index_field(index_type, index_expr):
+    """
+    Returns lines initializing variables of the index field, the field itself and
+    expression of the index name if it is known only at runtime or None if index cannot be written
+    """
+    name_expr = f'{index_expr}._name' if getattr(index_type, 'is_named', False) else None
+    if isinstance(index_type, types.NoneType):
+        return [], (None, types.Array(types.int64, 1, 'C'), 'i'), None
+
+    if isinstance(index_type, RangeIndexType):
+        lines = [f'  index_start = {index_expr}.start',
+                 f'  index_step = {index_expr}.step']
+        return lines, (None, types.Array(types.int64, 1, 'C'), 'index_start + i * index_step'), name_expr
+
+    if isinstance(index_type, Int64IndexType):
+        return [f'  index_data = {index_expr}._data'], ('index_data', index_type.data, None), name_expr
+
+    if is_csv_writable_type(index_type):
+        return [f'  index_data = {index_expr}'], ('index_data', index_type, None), None
+
+    return None
+
+
+def gen_to_csv_func_text(func_name, signature, init_lines, fields, n_rows, names, params, name_exprs=None):
+    """
+    Generates to_csv() implementation writing the fields with the header made of names,
+    name_exprs maps positions of names known only at runtime to their expressions
+    """
+    sep, na_rep, quotechar = params['sep'], params['na_rep'], params['quotechar']
+    line_terminator = params['line_terminator']
+    path = 'path_or_buf' if params['path_or_buf'] else None
+
+    func_lines = [f'def {func_name}({signature}):'] + init_lines
+    header_lines = []
+    header_vars = {}
+    if not params['header']:
+        header_vars['csv_header'] = _csv_bytes('')
+    elif not name_exprs:
+        header_vars['csv_header'] = csv_header_bytes(names, sep, quotechar, line_terminator)
+    else:
+        names_expr = ', '.join(name_exprs.get(j, repr(name)) for j, name in enumerate(names))
+        header_lines = [f"  with objmode(csv_header='uint8[::1]'):",
+                        f"    csv_header = csv_header_bytes(({names_expr}, ), {sep!r}, {quotechar!r}, "
+                        f"{line_terminator!r})"]
+    func_lines += header_lines
+
+    write_lines, global_vars = gen_csv_write_codelines(fields, n_rows, 'csv_header', path,
+                                                       sep, na_rep, quotechar, line_terminator)
+    func_lines += write_lines
+    global_vars.update(header_vars)
+    global_vars.update({'objmode': objmode, 'csv_header_bytes': csv_header_bytes})
+
+    return '\n'.join(func_lines), global_vars
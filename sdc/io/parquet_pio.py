@@ -26,6 +26,10 @@
 
 
 from sdc.config import _has_pyarrow
+import concurrent.futures
+import json
+import operator
+import os
 import llvmlite.binding as ll
 from llvmlite import ir as lir
 from numba.np.arrayobj import make_array
@@ -41,14 +45,22 @@ from numba.core.ir_utils import (mk_unique_var, replace_vars_inner, find_topo_or
                             compile_to_numba_ir, replace_arg_nodes,
                             find_callname, guard, require, get_definition)
 
+from numba.core.errors import TypingError
 from numba.core.typing.templates import infer_global, AbstractTemplate
+from numba.extending import overload
+from numba.np import numpy_support
 from numba.core.typing import signature
 from numba.core.imputils import impl_ret_new_ref, impl_ret_borrowed
 import numpy as np
+import pandas as pd
 import sdc
+from sdc import objmode
+from sdc.io.csv_ext import (_arrow_table_buffers, _gen_csv_buffers_codelines, _gen_csv_dataframe_expr,
+                            is_native_csv_column_type)
 from sdc.str_ext import string_type, unicode_to_char_ptr
-from sdc.str_arr_ext import StringArray, StringArrayPayloadType, construct_string_array
-from sdc.str_arr_ext import string_array_type
+from sdc.str_arr_ext import StringArray, StringArrayPayloadType, construct_string_array, lir_offset_typ
+from sdc.str_arr_ext import string_array_type, str_arr_from_buffers
+from sdc.utilities.compile_cache import exec_func_text
 from sdc.utilities.utils import unliteral_all
 
 
@@ -289,6 +301,388 @@ def _rm_pd_index(col_names, col_types):
         pass
 
 
+def read_parquet_pushdown(path, columns=None, filters=None):
+    """
+    Reads columns of the Parquet dataset skipping row groups and rows not satisfying filters.
+    Unlike pandas.read_parquet rows keep their positions in the dataset as index, so that
+    df[mask] gives the same result for a DataFrame read with filters implied by the mask and without them.
+    Calls of pandas.read_parquet are replaced with it by RewriteReadParquet.
+    """
+    row_positions, table = _pyarrow_read_parquet_table(path, columns, filters, with_row_positions=True)
+    df = table.to_pandas()
+    df.index = row_positions
+
+    return df
+
+
+# Parquet filter operators: pyarrow name -> (comparison, operator with swapped operands)
+_pq_filter_ops = {
+    '==': (operator.eq, '=='),
+    '=': (operator.eq, '='),
+    '!=': (operator.ne, '!='),
+    '<': (operator.lt, '>'),
+    '<=': (operator.le, '>='),
+    '>': (operator.gt, '<'),
+    '>=': (operator.ge, '<='),
+}
+
+
+def _normalize_filters(filters):
+    """Converts filters in pyarrow format, i.e. list of predicates or list of lists of them,
+    into list of conjunctions which results are combined with OR"""
+    if not filters:
+        return []
+    if isinstance(filters[0][0], str):
+        return [list(filters)]
+
+    return [list(conjunction) for conjunction in filters]
+
+
+def _stats_value(value, stats_value):
+    # string statistics may be reported as bytes
+    if isinstance(stats_value, bytes) and isinstance(value, str):
+        return value.encode()
+    return value
+
+
+def _row_group_may_match(row_group, column_indices, filters):
+    """Checks with min/max statistics of the row group that some of its rows may satisfy filters"""
+
+    def predicate_may_match(name, op, value):
+        if name not in column_indices:
+            return True
+        stats = row_group.column(column_indices[name]).statistics
+        if stats is None or not stats.has_min_max:
+            return True
+        min_value, max_value = stats.min, stats.max
+        value = _stats_value(value, min_value)
+        if op in ('==', '='):
+            return min_value <= value <= max_value
+        if op == '<':
+            return min_value < value
+        if op == '<=':
+            return min_value <= value
+        if op == '>':
+            return max_value > value
+        if op == '>=':
+            return max_value >= value
+
+        # '!=' is satisfied by NaN values which are not reflected in statistics
+        return True
+
+    return any(all(predicate_may_match(*predicate) for predicate in conjunction) for conjunction in filters)
+
+
+def _filters_mask(table, filters):
+    """Evaluates filters on rows of the table the same way as pandas compares Series with scalars"""
+    mask = np.zeros(table.num_rows, dtype=np.bool_)
+    for conjunction in filters:
+        conjunction_mask = np.ones(table.num_rows, dtype=np.bool_)
+        for name, op, value in conjunction:
+            values = np.asarray(table.column(name).to_pandas())
+            conjunction_mask &= _pq_filter_ops[op][0](values, value)
+        mask |= conjunction_mask
+
+    return mask
+
+
+def _get_parquet_files(path):
+    import pyarrow.parquet as pq
+    return [piece.path for piece in pq.ParquetDataset(path).pieces]
+
+
+def _read_row_group(file_path, row_group, columns):
+    import pyarrow.parquet as pq
+    return pq.ParquetFile(file_path).read_row_group(row_group, columns=columns, use_threads=False)
+
+
+def _pyarrow_read_parquet_table(path, columns, filters, with_row_positions=False):
+    """
+    Reads pyarrow.Table with columns of the Parquet dataset. Row groups are read in parallel by
+    NUMBA_NUM_THREADS threads, row groups which min/max statistics show no rows satisfying filters are skipped.
+    If with_row_positions is True, positions of read rows in the dataset are returned too.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    filters = _normalize_filters(filters)
+    files = _get_parquet_files(path)
+    if columns is None:
+        columns = pq.ParquetDataset(path).schema.names
+        columns = [name for name in columns if name != '__index_level_0__']
+    columns = list(columns)
+    filter_columns = {name for conjunction in filters for name, _, _ in conjunction}
+    read_columns = columns + sorted(filter_columns.difference(columns))
+
+    tasks = []
+    row_group_starts = []
+    dataset_offset = 0
+    for file_path in files:
+        metadata = pq.ParquetFile(file_path).metadata
+        column_indices = {metadata.schema.column(i).name: i for i in range(metadata.num_columns)}
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            if not filters or _row_group_may_match(row_group, column_indices, filters):
+                tasks.append((file_path, i, read_columns))
+                row_group_starts.append(dataset_offset)
+            dataset_offset += row_group.num_rows
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=numba.config.NUMBA_NUM_THREADS) as executor:
+        tables = list(executor.map(lambda task: _read_row_group(*task), tasks))
+
+    if tables:
+        table = pa.concat_tables(tables)
+    else:
+        table = pq.ParquetDataset(path).schema.to_arrow_schema().empty_table()
+
+    row_positions = None
+    if with_row_positions:
+        row_positions = np.concatenate(
+            [np.arange(start, start + t.num_rows, dtype=np.int64) for start, t in zip(row_group_starts, tables)]
+            or [np.empty(0, dtype=np.int64)])
+
+    if filters:
+        mask = _filters_mask(table, filters)
+        table = table.filter(pa.array(mask))
+        if with_row_positions:
+            row_positions = row_positions[mask]
+
+    table = pa.Table.from_arrays([table.column(name) for name in columns], names=columns)
+
+    return row_positions, table
+
+
+def pyarrow_read_parquet_buffers(path, columns, filters, column_dtypes, with_row_positions=False):
+    """Reads Parquet dataset into buffers of SDC column arrays, see pyarrow_read_csv_buffers"""
+    row_positions, table = _pyarrow_read_parquet_table(path, columns, filters, with_row_positions)
+    buffers = _arrow_table_buffers(table, column_dtypes)
+
+    return (row_positions, buffers) if with_row_positions else buffers
+
+
+def get_parquet_column_array_types(col_types):
+    """Converts types returned by parquet_file_schema into types of SDC column arrays"""
+    return [string_array_type if typ == string_type else types.Array(typ, 1, 'C') for typ in col_types]
+
+
+def get_parquet_filters(filters, strict=True):
+    """
+    Extracts filters from the type of filters argument, that is a tuple of (name, op, value) tuples
+    or a tuple of tuples of them, into a list of conjunctions of (name, op, value_expr) predicates
+    where value_expr is an expression getting the value from filters argument.
+    With strict=False unsupported predicates are dropped instead of raising an error.
+    """
+
+    def get_predicate(predicate, value_expr):
+        if not (isinstance(predicate, types.BaseTuple) and len(predicate) == 3
+                and isinstance(predicate[0], types.StringLiteral) and isinstance(predicate[1], types.StringLiteral)
+                and predicate[1].literal_value in _pq_filter_ops
+                and isinstance(types.unliteral(predicate[2]), (types.Number, types.Boolean, types.UnicodeType))):
+            if strict:
+                raise TypingError(f'read_parquet: unsupported filter {predicate}. '
+                                  f'Expected tuple of constant column name, constant operator '
+                                  f'out of {tuple(_pq_filter_ops)} and a scalar')
+            return None
+
+        return (predicate[0].literal_value, predicate[1].literal_value, value_expr)
+
+    if isinstance(filters, (types.NoneType, types.Omitted)) or filters is None:
+        return []
+    if not isinstance(filters, types.BaseTuple):
+        raise TypingError(f'read_parquet: filters should be a tuple. Given: {filters}')
+
+    if len(filters) and isinstance(filters[0], types.BaseTuple) and isinstance(filters[0][0], types.BaseTuple):
+        conjunctions = [([p for p in conjunction], f'filters[{i}]') for i, conjunction in enumerate(filters)]
+    else:
+        conjunctions = [([p for p in filters], 'filters')]
+
+    result = []
+    for conjunction, conjunction_expr in conjunctions:
+        predicates = [get_predicate(p, f'{conjunction_expr}[{j}][2]') for j, p in enumerate(conjunction)]
+        predicates = [p for p in predicates if p is not None]
+        if not predicates:
+            # conjunction without predicates does not filter anything
+            return []
+        result.append(predicates)
+
+    return result
+
+
+def gen_read_parquet_impl(func_name, signature, col_names, col_types, filters, with_row_positions=False):
+    """Generates read_parquet implementation that reads buffers of columns in objmode
+    and creates resulting DataFrame in nopython mode
+
+    Example of generated code:
+        def _read_parquet_impl(path, engine='auto', columns=None, filters=None):
+          filter_value_0 = filters[0][2]
+          with objmode(col_0="Array(float64, 1, 'C')",
+                       col_1_offsets="Array(uint64, 1, 'C')",
+                       col_1_data="Array(uint8, 1, 'C')",
+                       col_1_null_bitmap="Array(uint8, 1, 'C')"):
+            (col_0, (col_1_offsets, col_1_data, col_1_null_bitmap), ) = pyarrow_read_parquet_buffers(
+              path, read_as_columns, [[('A', '>', filter_value_0)]], read_as_column_dtypes)
+          col_1 = str_arr_from_buffers(col_1_offsets, col_1_data, col_1_null_bitmap)
+          return pandas.DataFrame({'A': col_0, 'B': col_1})
+    """
+
+    func_lines = [f"def {func_name}({signature}):"]
+    filters_text = []
+    n_values = 0
+    for conjunction in filters:
+        predicates_text = []
+        for name, op, value_expr in conjunction:
+            func_lines.append(f"  filter_value_{n_values} = {value_expr}")
+            predicates_text.append(f"({name!r}, {op!r}, filter_value_{n_values})")
+            n_values += 1
+        filters_text.append(f"[{', '.join(predicates_text)}]")
+
+    outputs = [('row_positions', "Array(int64, 1, 'C')")] if with_row_positions else []
+    read_call = (f"pyarrow_read_parquet_buffers(path, read_as_columns, [{', '.join(filters_text)}], "
+                 f"read_as_column_dtypes, with_row_positions={with_row_positions})")
+    func_lines += _gen_csv_buffers_codelines(col_types, read_call, outputs)
+
+    df_expr = _gen_csv_dataframe_expr(col_names)
+    if with_row_positions:
+        df_expr = f"{df_expr[:-1]}, index=row_positions)"
+    func_lines.append(f"  return {df_expr}")
+
+    def _get_py_col_dtype(ctype):
+        return str if ctype == string_array_type else numpy_support.as_dtype(ctype.dtype)
+
+    global_vars = {
+        'pandas': pd,
+        'objmode': objmode,
+        'pyarrow_read_parquet_buffers': pyarrow_read_parquet_buffers,
+        'str_arr_from_buffers': str_arr_from_buffers,
+        'read_as_columns': tuple(col_names),
+        'read_as_column_dtypes': tuple(_get_py_col_dtype(ctype) for ctype in col_types),
+    }
+
+    return exec_func_text('\n'.join(func_lines), global_vars, func_name)
+
+
+def get_read_parquet_columns(path, columns):
+    """Returns names and SDC array types of columns read from Parquet dataset at constant path"""
+
+    if not isinstance(path, types.StringLiteral):
+        raise TypingError(f'read_parquet: path should be a constant string to infer the schema. Given: {path}')
+
+    col_names, col_types = parquet_file_schema(path.literal_value)
+    _rm_pd_index(col_names, col_types)
+    if not (isinstance(columns, (types.NoneType, types.Omitted)) or columns is None):
+        if not (isinstance(columns, types.BaseTuple) and all(isinstance(c, types.StringLiteral) for c in columns)):
+            raise TypingError(f'read_parquet: columns should be a constant list of column names. Given: {columns}')
+        schema_types = dict(zip(col_names, col_types))
+        col_names = [c.literal_value for c in columns]
+        unknown_names = [name for name in col_names if name not in schema_types]
+        if unknown_names:
+            raise TypingError(f'read_parquet: columns {unknown_names} are not found in {path.literal_value}')
+        col_types = [schema_types[name] for name in col_names]
+
+    col_types = get_parquet_column_array_types(col_types)
+    unsupported = [(name, typ) for name, typ in zip(col_names, col_types) if not is_native_csv_column_type(typ)]
+    if unsupported:
+        raise TypingError(f'read_parquet: only numeric and string columns are supported. Given: {unsupported}')
+
+    return col_names, col_types
+
+
+def _arrow_string_array(offsets, data, null_bitmap):
+    """Creates pyarrow string array on the buffers of StringArray without creating Python strings"""
+    import pyarrow as pa
+
+    n = len(offsets) - 1
+    if n and offsets[-1] >= 2 ** 31:
+        arrow_type = pa.large_string()
+    else:
+        arrow_type = pa.string()
+        offsets = offsets.astype(np.int32)
+
+    null_count = n - int(np.unpackbits(null_bitmap, count=n, bitorder='little').sum())
+    validity = pa.py_buffer(null_bitmap) if null_count else None
+
+    return pa.Array.from_buffers(arrow_type, n, [validity, pa.py_buffer(offsets), pa.py_buffer(data)],
+                                 null_count=null_count)
+
+
+def _pandas_schema_metadata(column_names, columns, index, preserve_index):
+    """Creates pandas metadata of the table so that pandas restores column dtypes and the index on reading"""
+    import pyarrow as pa
+
+    sample = pd.DataFrame({name: np.empty(0, dtype=object if isinstance(col, tuple) else col.dtype)
+                           for name, col in zip(column_names, columns)},
+                          index=index[:0], columns=list(column_names))
+    metadata = json.loads(pa.Schema.from_pandas(sample, preserve_index=preserve_index).metadata[b'pandas'])
+
+    string_names = {str(name) for name, col in zip(column_names, columns) if isinstance(col, tuple)}
+    for column in metadata['columns']:
+        if column['name'] in string_names:
+            column['pandas_type'] = 'unicode'
+
+    for descr in metadata['index_columns']:
+        if isinstance(descr, dict) and descr['kind'] == 'range':
+            descr['start'], descr['stop'], descr['step'] = index.start, index.stop, index.step
+
+    return metadata
+
+
+def pyarrow_write_parquet(path, column_names, columns, index, preserve_index, compression, partition_cols):
+    """
+    Writes columns given as numpy arrays and (offsets, data, null_bitmap) buffers of StringArray to Parquet.
+    The table is split into NUMBA_NUM_THREADS row groups. If partition_cols is an empty list, path is
+    a directory where a file per row group is written in parallel as pandas.DataFrame.to_parquet does
+    with partition_cols=[], otherwise row groups are written to a single file.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    arrays = [_arrow_string_array(*col) if isinstance(col, tuple) else pa.array(col, from_pandas=True)
+              for col in columns]
+    n_rows = len(arrays[0]) if arrays else len(index)
+    if index is None:
+        index = pd.RangeIndex(n_rows)
+
+    metadata = _pandas_schema_metadata(column_names, columns, index, preserve_index)
+    names = [str(name) for name in column_names]
+    for descr in metadata['index_columns']:
+        if isinstance(descr, str):
+            arrays.append(pa.array(np.asarray(index), from_pandas=True))
+            names.append(descr)
+
+    table = pa.Table.from_arrays(arrays, names=names)
+    n_threads = numba.config.NUMBA_NUM_THREADS
+    row_group_size = max(1, -(-n_rows // n_threads))
+
+    if partition_cols is None:
+        table = table.replace_schema_metadata({b'pandas': json.dumps(metadata).encode()})
+        pq.write_table(table, path, row_group_size=row_group_size, compression=compression)
+        return
+
+    # range index is not restored when pieces of a dataset are read together
+    metadata['index_columns'] = [descr for descr in metadata['index_columns'] if isinstance(descr, str)]
+    table = table.replace_schema_metadata({b'pandas': json.dumps(metadata).encode()})
+
+    os.makedirs(path, exist_ok=True)
+    pieces = [(table.slice(start, row_group_size), os.path.join(path, f'part-{i:05d}.parquet'))
+              for i, start in enumerate(range(0, max(n_rows, 1), row_group_size))]
+
+    def write_piece(piece):
+        pq.write_table(piece[0], piece[1], compression=compression)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=n_threads) as executor:
+        list(executor.map(write_piece, pieces))
+
+
+@overload(read_parquet_pushdown)
+def read_parquet_pushdown_overload(path, columns=None, filters=None):
+    col_names, col_types = get_read_parquet_columns(path, columns)
+    # filters are only an optimization here since rows are filtered with the mask afterwards
+    pq_filters = get_parquet_filters(filters, strict=False)
+
+    return gen_read_parquet_impl('_read_parquet_pushdown_impl', 'path, columns=None, filters=None',
+                                 col_names, col_types, pq_filters, with_row_positions=True)
+
+
 _get_arrow_readers = types.ExternalFunction("get_arrow_readers", types.Opaque('arrow_reader')(types.voidptr))
 _del_arrow_readers = types.ExternalFunction("del_arrow_readers", types.void(types.Opaque('arrow_reader')))
 
@@ -407,7 +801,7 @@ def pq_read_string_lower(context, builder, sig, args):
 
     fnty = lir.FunctionType(lir.IntType(32),
                             [lir.IntType(8).as_pointer(), lir.IntType(64),
-                             lir.IntType(32).as_pointer().as_pointer(),
+                             lir_offset_typ.as_pointer().as_pointer(),
                              lir.IntType(8).as_pointer().as_pointer(),
                              lir.IntType(8).as_pointer().as_pointer()])
 
@@ -422,8 +816,8 @@ def pq_read_string_lower(context, builder, sig, args):
     string_array.offsets = str_arr_payload.offsets
     string_array.data = str_arr_payload.data
     string_array.null_bitmap = str_arr_payload.null_bitmap
-    string_array.num_total_chars = builder.zext(builder.load(
-        builder.gep(string_array.offsets, [string_array.num_items])), lir.IntType(64))
+    string_array.num_total_chars = builder.load(
+        builder.gep(string_array.offsets, [string_array.num_items]))
     ret = string_array._getvalue()
     return impl_ret_new_ref(context, builder, typ, ret)
 
@@ -439,7 +833,7 @@ def pq_read_string_parallel_lower(context, builder, sig, args):
 
     fnty = lir.FunctionType(lir.IntType(32),
                             [lir.IntType(8).as_pointer(), lir.IntType(64),
-                             lir.IntType(32).as_pointer().as_pointer(),
+                             lir_offset_typ.as_pointer().as_pointer(),
                              lir.IntType(8).as_pointer().as_pointer(),
                              lir.IntType(8).as_pointer().as_pointer(),
                              lir.IntType(64), lir.IntType(64)])
@@ -459,7 +853,7 @@ def pq_read_string_parallel_lower(context, builder, sig, args):
     string_array.offsets = str_arr_payload.offsets
     string_array.data = str_arr_payload.data
     string_array.null_bitmap = str_arr_payload.null_bitmap
-    string_array.num_total_chars = builder.zext(builder.load(
-        builder.gep(string_array.offsets, [string_array.num_items])), lir.IntType(64))
+    string_array.num_total_chars = builder.load(
+        builder.gep(string_array.offsets, [string_array.num_items]))
     ret = string_array._getvalue()
     return impl_ret_new_ref(context, builder, typ, ret)
@@ -0,0 +1,127 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+
+| Runs a Python script in several processes of the local machine which execute distributed
+| SDC functions together, exchanging data through POSIX shared memory (see :mod:`sdc.transport`)::
+
+|     python -m sdc.launch -n 4 script.py [args]
+
+| Options of the Python interpreter are passed after ``--``, e.g.
+| ``python -m sdc.launch -n 2 -- -m unittest sdc.tests.test_basic``.
+| Each process gets SDC_TRANSPORT_SHM=1 and its rank in the environment. If one of them fails,
+| the others are terminated and its exit code is returned.
+
+"""
+
+import argparse
+import ctypes as ct
+import os
+import subprocess
+import sys
+import time
+import uuid
+
+
+default_slot_size = 64 * 1024 ** 2
+'''
+Default size in bytes of the shared memory slot of each process, larger messages are sent in several rounds
+'''
+
+
+def bind(sym, sig):
+    # Returns ctypes binding to symbol sym of the shared memory transport with signature sig
+    from sdc import transport_shm
+
+    addr = getattr(transport_shm, sym)
+    return ct.cast(addr, sig)
+
+
+def _wait(processes):
+    running = list(processes)
+    while running:
+        for process in list(running):
+            returncode = process.poll()
+            if returncode is None:
+                continue
+            running.remove(process)
+            if returncode != 0:
+                return returncode
+        time.sleep(0.01)
+
+    return 0
+
+
+def launch(num_processes, args, slot_size=default_slot_size):
+    """
+    Runs the Python interpreter with command line arguments args in num_processes processes
+    sharing a memory segment used for communication, returns exit code of the first failed process or 0
+    """
+
+    shm_world_create = bind('shm_world_create', ct.CFUNCTYPE(ct.c_int, ct.c_char_p, ct.c_int, ct.c_int64))
+    shm_world_destroy = bind('shm_world_destroy', ct.CFUNCTYPE(ct.c_int, ct.c_char_p))
+
+    name = '/sdc_{}_{}'.format(os.getpid(), uuid.uuid4().hex[:8])
+    if shm_world_create(name.encode(), num_processes, slot_size) != 0:
+        raise RuntimeError('Could not create shared memory segment {}'.format(name))
+
+    processes = []
+    try:
+        for rank in range(num_processes):
+            env = dict(os.environ, SDC_TRANSPORT_SHM='1', SDC_SHM_NAME=name, SDC_SHM_RANK=str(rank))
+            processes.append(subprocess.Popen([sys.executable] + list(args), env=env))
+
+        return _wait(processes)
+    finally:
+        for process in processes:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+        shm_world_destroy(name.encode())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m sdc.launch',
+                                     description='Run a Python script in several processes of distributed SDC code')
+    parser.add_argument('-n', '--num-processes', type=int, default=os.cpu_count(),
+                        help='number of processes to start (default: number of CPUs)')
+    parser.add_argument('--slot-size', type=int, default=default_slot_size,
+                        help='size in bytes of the shared memory slot of each process')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='script and its arguments')
+    options = parser.parse_args(argv)
+
+    args = options.args[1:] if options.args[:1] == ['--'] else options.args
+    if not args:
+        parser.error('script is not specified')
+    if options.num_processes < 1:
+        parser.error('number of processes must be positive')
+
+    return launch(options.num_processes, args, options.slot_size)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,296 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+import operator
+from collections import defaultdict
+
+from numba.core.rewrites import register_rewrite, Rewrite
+from numba.core.ir_utils import guard, get_definition, find_const, require
+from numba import errors
+from numba.core import ir
+
+from sdc.io.parquet_pio import parquet_file_schema, read_parquet_pushdown, _rm_pd_index
+from sdc.rewrites.ir_utils import (find_operations, get_call_parameters, declare_constant, declare_global,
+                                   make_assign, insert_before)
+
+import pandas as pd
+
+
+_comparison_ops = {
+    operator.eq: ('==', '=='),
+    operator.ne: ('!=', '!='),
+    operator.lt: ('<', '>'),
+    operator.le: ('<=', '>='),
+    operator.gt: ('>', '<'),
+    operator.ge: ('>=', '<='),
+}
+
+
+class _FrameUsage:
+    """Columns of a DataFrame read by the function and boolean masks used to select its rows"""
+
+    def __init__(self):
+        self.columns = set()
+        self.column_vars = {}
+        self.masks = []
+
+
+@register_rewrite('before-inference')
+class RewriteReadParquet(Rewrite):
+    """
+    Searches for calls to Pandas read_parquet(), replaces its list arguments with tuples
+    and pushes down to the call columns selection and rows filtering made with the resulting DataFrame:
+        df = pd.read_parquet('data.pq')
+        return df[df.A > x]['B']
+    becomes
+        df = read_parquet_pushdown('data.pq', columns=('A', 'B'), filters=(('A', '>', x), ))
+        return df[df.A > x]['B']
+    Filters are pushed down only when the DataFrame and the compared columns are used
+    for nothing but the selection, and are compared with constants or function arguments.
+    """
+
+    _read_parquet_arg_names = ('path', 'engine', 'columns')
+    _read_parquet_const_args = ('columns', 'filters')
+
+    def match(self, func_ir, block, typemap, calltypes):
+        self._func_ir = func_ir
+        self._block = block
+        self._uses = None
+        self._lists = []
+        self._pushdowns = []
+
+        for stmt in find_operations(block=block, op_name='call'):
+            expr = stmt.value
+            try:
+                callee = func_ir.infer_constant(expr.func)
+            except errors.ConstantInferenceError:
+                continue
+            if callee is not pd.read_parquet:
+                continue
+
+            params = get_call_parameters(call=expr, arg_names=self._read_parquet_arg_names)
+            for name in self._read_parquet_const_args:
+                if name in params:
+                    self._lists += self._find_lists(params[name])
+
+            if any(name in params for name in self._read_parquet_const_args) or expr.vararg is not None:
+                continue
+
+            pushdown = guard(self._get_pushdown, stmt, params.get('path'))
+            if pushdown is not None:
+                self._pushdowns.append((stmt, pushdown))
+
+        return len(self._lists) > 0 or len(self._pushdowns) > 0
+
+    def apply(self):
+        for expr in self._lists:
+            expr.op = 'build_tuple'
+
+        for stmt, (columns, predicates) in self._pushdowns:
+            call = stmt.value
+            columns_var = self._make_tuple([self._make_const(name, call.loc) for name in columns], stmt)
+            if not predicates:
+                call.kws = list(call.kws) + [('columns', columns_var)]
+                continue
+
+            predicate_vars = []
+            for name, op, value in predicates:
+                value_var = value if isinstance(value, ir.Var) else self._make_const(value, call.loc)
+                items = [self._make_const(name, call.loc), self._make_const(op, call.loc), value_var]
+                predicate_vars.append(self._make_tuple(items, stmt))
+            filters_var = self._make_tuple(predicate_vars, stmt)
+
+            func_stmt = declare_global('read_parquet_pushdown', read_parquet_pushdown, self._block, self._func_ir)
+            call.func = func_stmt.target
+            call.args = call.args[:1]
+            call.kws = [(name, var) for name, var in call.kws if name == 'path']
+            call.kws += [('columns', columns_var), ('filters', filters_var)]
+
+        return self._block
+
+    def _make_const(self, value, loc):
+        return declare_constant(value, self._block, self._func_ir, loc).target
+
+    def _make_tuple(self, items, stmt):
+        assign = make_assign(ir.Expr.build_tuple(items, stmt.loc), self._block.scope, self._func_ir,
+                             stmt.loc, prefix='$_pq_tuple')
+        insert_before(self._block, assign, stmt)
+        return assign.target
+
+    def _find_lists(self, var):
+        """Returns build_list expressions defining var and nested items of var"""
+        expr = guard(get_definition, self._func_ir, var)
+        if not isinstance(expr, ir.Expr) or expr.op not in ('build_list', 'build_tuple'):
+            return []
+
+        result = [expr] if expr.op == 'build_list' else []
+        for item in expr.items:
+            result += self._find_lists(item)
+
+        return result
+
+    def _get_uses(self):
+        """Returns statements using each variable of the function"""
+        if self._uses is None:
+            self._uses = defaultdict(list)
+            for block in self._func_ir.blocks.values():
+                for stmt in block.body:
+                    if isinstance(stmt, ir.Del):
+                        continue
+                    for var in stmt.list_vars():
+                        if not (isinstance(stmt, ir.Assign) and stmt.target.name == var.name):
+                            self._uses[var.name].append(stmt)
+
+        return self._uses
+
+    def _is_single_definition(self, var_name):
+        return len(self._func_ir._definitions.get(var_name, [])) == 1
+
+    def _get_pushdown(self, stmt, path_var):
+        """Returns columns and filters which reading could be limited to for read_parquet call"""
+        require(path_var is not None)
+        path = find_const(self._func_ir, path_var)
+        require(isinstance(path, str))
+        try:
+            col_names, col_types = parquet_file_schema(path)
+        except Exception:
+            # schema will be reported unavailable during typing
+            return None
+        _rm_pd_index(col_names, col_types)
+        self._col_names = col_names
+
+        usage = _FrameUsage()
+        require(self._analyze_frame(stmt.target.name, usage))
+
+        predicates = guard(self._get_predicates, usage) or []
+        columns = [name for name in col_names if name in usage.columns]
+        require(predicates or len(columns) < len(col_names))
+
+        return columns, predicates
+
+    def _get_accessed_columns(self, expr, frame_name):
+        """Returns names of columns read from the frame by expression or None"""
+        if not (isinstance(expr, ir.Expr) and expr.op in ('getattr', 'static_getitem', 'getitem')
+                and expr.value.name == frame_name):
+            return None
+
+        if expr.op == 'getattr':
+            index = expr.attr
+        elif expr.op == 'static_getitem':
+            index = expr.index
+        else:
+            index = guard(find_const, self._func_ir, expr.index)
+            if index is None:
+                index_def = guard(get_definition, self._func_ir, expr.index)
+                if isinstance(index_def, ir.Expr) and index_def.op in ('build_list', 'build_tuple'):
+                    index = tuple(guard(find_const, self._func_ir, item) for item in index_def.items)
+
+        names = (index, ) if isinstance(index, str) else index
+        if not (isinstance(names, tuple) and all(name in self._col_names for name in names)):
+            return None
+
+        return names
+
+    def _analyze_frame(self, frame_name, usage):
+        """Collects columns of the frame read by the function into usage,
+        returns False if the frame is used otherwise than reading columns and selecting rows by a mask"""
+        if not self._is_single_definition(frame_name):
+            return False
+
+        for stmt in self._get_uses()[frame_name]:
+            if not isinstance(stmt, ir.Assign):
+                return False
+            rhs = stmt.value
+            if isinstance(rhs, ir.Var):
+                if not self._analyze_frame(stmt.target.name, usage):
+                    return False
+                continue
+
+            names = self._get_accessed_columns(rhs, frame_name)
+            if names is not None:
+                usage.columns.update(names)
+                usage.column_vars[stmt.target.name] = names
+                continue
+
+            if isinstance(rhs, ir.Expr) and rhs.op == 'getitem' and rhs.value.name == frame_name:
+                selected_usage = _FrameUsage()
+                if not self._analyze_frame(stmt.target.name, selected_usage):
+                    return False
+                usage.columns.update(selected_usage.columns)
+                usage.masks.append((stmt, rhs.index))
+                continue
+
+            return False
+
+        return True
+
+    def _get_filter_value(self, var):
+        """Returns var if it is an argument of the function or value of var if it is a scalar constant"""
+        var_def = get_definition(self._func_ir, var)
+        if isinstance(var_def, ir.Arg):
+            return var
+
+        value = find_const(self._func_ir, var)
+        require(isinstance(value, (bool, int, float, str)))
+        return value
+
+    def _collect_predicates(self, mask_var, usage, predicates, mask_vars):
+        require(self._is_single_definition(mask_var.name))
+        expr = get_definition(self._func_ir, mask_var)
+        require(isinstance(expr, ir.Expr) and expr.op == 'binop')
+        mask_vars.add(mask_var.name)
+
+        if expr.fn is operator.and_:
+            self._collect_predicates(expr.lhs, usage, predicates, mask_vars)
+            self._collect_predicates(expr.rhs, usage, predicates, mask_vars)
+            return
+
+        require(expr.fn in _comparison_ops)
+        op, swapped_op = _comparison_ops[expr.fn]
+        if expr.lhs.name in usage.column_vars:
+            column_var, value_var = expr.lhs, expr.rhs
+        else:
+            column_var, value_var, op = expr.rhs, expr.lhs, swapped_op
+        names = usage.column_vars.get(column_var.name)
+        require(names is not None and len(names) == 1)
+
+        predicates.append((names[0], op, self._get_filter_value(value_var)))
+
+    def _get_predicates(self, usage):
+        """Returns predicates of the mask selecting rows of the frame if the frame is used only
+        to select rows by this mask and columns compared in the mask are not used otherwise"""
+        require(len(usage.masks) == 1)
+        getitem_stmt, mask_var = usage.masks[0]
+
+        predicates, mask_vars = [], set()
+        self._collect_predicates(mask_var, usage, predicates, mask_vars)
+
+        uses = self._get_uses()
+        require(all(stmt is getitem_stmt for stmt in uses[mask_var.name]))
+        for var_name in list(usage.column_vars) + list(mask_vars - {mask_var.name}):
+            require(all(isinstance(stmt, ir.Assign) and stmt.target.name in mask_vars for stmt in uses[var_name]))
+
+        return predicates
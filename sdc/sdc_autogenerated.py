@@ -40,7 +40,8 @@ from numba.core.errors import TypingError
 from numba import types
 
 from sdc.utilities.sdc_typing_utils import (TypeChecker, check_index_is_numeric, check_types_comparable,
-                                            find_common_dtype_from_numpy_dtypes, find_index_common_dtype)
+                                            find_common_dtype_from_numpy_dtypes, find_index_common_dtype,
+                                            find_arithmetic_result_dtype)
 from sdc.datatypes.common_functions import (sdc_join_series_indexes, )
 from sdc.hiframes.api import isna
 from sdc.hiframes.pd_series_type import SeriesType
@@ -61,17 +62,26 @@ def sdc_add_ovld(self, other, fill_value=None):
     operands_are_series = self_is_series and other_is_series
     fill_value_is_none = isinstance(fill_value, (types.NoneType, types.Omitted)) or fill_value is None
 
+    # result dtype follows numpy promotion rules, but aligning series can introduce NaNs,
+    # so integer result is kept only when operation is done on a series and a scalar
+    array_dtypes = [ty.dtype for ty in (self, other) if isinstance(ty, SeriesType)]
+    scalar_dtypes = [ty for ty in (self, other) if not isinstance(ty, SeriesType)]
+    if not fill_value_is_none:
+        scalar_dtypes.append(fill_value)
+    result_dtype = find_arithmetic_result_dtype('add', array_dtypes, scalar_dtypes,
+                                                nans_possible=operands_are_series)
+
     # specializations for numeric series only
     if not operands_are_series:
         def sdc_add_impl(self, other, fill_value=None):
 
             series = self if self_is_series == True else other  # noqa
-            result_data = numpy.empty(len(series._data), dtype=numpy.float64)
+            result_data = numpy.empty(len(series._data), dtype=result_dtype)
             series_data = numpy_like.fillna(series._data, inplace=False, value=fill_value)
             if self_is_series == True:  # noqa
-                _self, _other = series_data, numpy.float64(other)
+                _self, _other = series_data, result_dtype(other)
             else:
-                _self, _other = numpy.float64(self), series_data
+                _self, _other = result_dtype(self), series_data
 
             result_data[:] = _self + _other
             return pandas.Series(result_data, index=series._index, name=series._name)
@@ -85,7 +95,7 @@ def sdc_add_ovld(self, other, fill_value=None):
 
                 left_size, right_size = len(self._data), len(other._data)
                 max_data_size = max(left_size, right_size)
-                result_data = numpy.empty(max_data_size, dtype=numpy.float64)
+                result_data = numpy.empty(max_data_size, dtype=result_dtype)
 
                 _fill_value = numpy.nan if fill_value_is_none == True else fill_value  # noqa
                 for i in numba.prange(max_data_size):
@@ -124,7 +134,7 @@ def sdc_add_ovld(self, other, fill_value=None):
                 # TODO: replace below with core join(how='outer', return_indexers=True) when implemented
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
                 result_size = len(joined_index)
-                result_data = numpy.empty(result_size, dtype=numpy.float64)
+                result_data = numpy.empty(result_size, dtype=result_dtype)
                 for i in numba.prange(result_size):
                     left_pos, right_pos = left_indexer[i], right_indexer[i]
                     left_nan = (left_pos == -1 or numpy.isnan(self._data[left_pos]))
@@ -229,17 +239,26 @@ def sdc_div_ovld(self, other, fill_value=None):
     operands_are_series = self_is_series and other_is_series
     fill_value_is_none = isinstance(fill_value, (types.NoneType, types.Omitted)) or fill_value is None
 
+    # result dtype follows numpy promotion rules, but aligning series can introduce NaNs,
+    # so integer result is kept only when operation is done on a series and a scalar
+    array_dtypes = [ty.dtype for ty in (self, other) if isinstance(ty, SeriesType)]
+    scalar_dtypes = [ty for ty in (self, other) if not isinstance(ty, SeriesType)]
+    if not fill_value_is_none:
+        scalar_dtypes.append(fill_value)
+    result_dtype = find_arithmetic_result_dtype('div', array_dtypes, scalar_dtypes,
+                                                nans_possible=operands_are_series)
+
     # specializations for numeric series only
     if not operands_are_series:
         def sdc_div_impl(self, other, fill_value=None):
 
             series = self if self_is_series == True else other  # noqa
-            result_data = numpy.empty(len(series._data), dtype=numpy.float64)
+            result_data = numpy.empty(len(series._data), dtype=result_dtype)
             series_data = numpy_like.fillna(series._data, inplace=False, value=fill_value)
             if self_is_series == True:  # noqa
-                _self, _other = series_data, numpy.float64(other)
+                _self, _other = series_data, result_dtype(other)
             else:
-                _self, _other = numpy.float64(self), series_data
+                _self, _other = result_dtype(self), series_data
 
             result_data[:] = _self / _other
             return pandas.Series(result_data, index=series._index, name=series._name)
@@ -253,7 +272,7 @@ def sdc_div_ovld(self, other, fill_value=None):
 
                 left_size, right_size = len(self._data), len(other._data)
                 max_data_size = max(left_size, right_size)
-                result_data = numpy.empty(max_data_size, dtype=numpy.float64)
+                result_data = numpy.empty(max_data_size, dtype=result_dtype)
 
                 _fill_value = numpy.nan if fill_value_is_none == True else fill_value  # noqa
                 for i in numba.prange(max_data_size):
@@ -292,7 +311,7 @@ def sdc_div_ovld(self, other, fill_value=None):
                 # TODO: replace below with core join(how='outer', return_indexers=True) when implemented
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
                 result_size = len(joined_index)
-                result_data = numpy.empty(result_size, dtype=numpy.float64)
+                result_data = numpy.empty(result_size, dtype=result_dtype)
                 for i in numba.prange(result_size):
                     left_pos, right_pos = left_indexer[i], right_indexer[i]
                     left_nan = (left_pos == -1 or numpy.isnan(self._data[left_pos]))
@@ -397,17 +416,26 @@ def sdc_sub_ovld(self, other, fill_value=None):
     operands_are_series = self_is_series and other_is_series
     fill_value_is_none = isinstance(fill_value, (types.NoneType, types.Omitted)) or fill_value is None
 
+    # result dtype follows numpy promotion rules, but aligning series can introduce NaNs,
+    # so integer result is kept only when operation is done on a series and a scalar
+    array_dtypes = [ty.dtype for ty in (self, other) if isinstance(ty, SeriesType)]
+    scalar_dtypes = [ty for ty in (self, other) if not isinstance(ty, SeriesType)]
+    if not fill_value_is_none:
+        scalar_dtypes.append(fill_value)
+    result_dtype = find_arithmetic_result_dtype('sub', array_dtypes, scalar_dtypes,
+                                                nans_possible=operands_are_series)
+
     # specializations for numeric series only
     if not operands_are_series:
         def sdc_sub_impl(self, other, fill_value=None):
 
             series = self if self_is_series == True else other  # noqa
-            result_data = numpy.empty(len(series._data), dtype=numpy.float64)
+            result_data = numpy.empty(len(series._data), dtype=result_dtype)
             series_data = numpy_like.fillna(series._data, inplace=False, value=fill_value)
             if self_is_series == True:  # noqa
-                _self, _other = series_data, numpy.float64(other)
+                _self, _other = series_data, result_dtype(other)
             else:
-                _self, _other = numpy.float64(self), series_data
+                _self, _other = result_dtype(self), series_data
 
             result_data[:] = _self - _other
             return pandas.Series(result_data, index=series._index, name=series._name)
@@ -421,7 +449,7 @@ def sdc_sub_ovld(self, other, fill_value=None):
 
                 left_size, right_size = len(self._data), len(other._data)
                 max_data_size = max(left_size, right_size)
-                result_data = numpy.empty(max_data_size, dtype=numpy.float64)
+                result_data = numpy.empty(max_data_size, dtype=result_dtype)
 
                 _fill_value = numpy.nan if fill_value_is_none == True else fill_value  # noqa
                 for i in numba.prange(max_data_size):
@@ -460,7 +488,7 @@ def sdc_sub_ovld(self, other, fill_value=None):
                 # TODO: replace below with core join(how='outer', return_indexers=True) when implemented
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
                 result_size = len(joined_index)
-                result_data = numpy.empty(result_size, dtype=numpy.float64)
+                result_data = numpy.empty(result_size, dtype=result_dtype)
                 for i in numba.prange(result_size):
                     left_pos, right_pos = left_indexer[i], right_indexer[i]
                     left_nan = (left_pos == -1 or numpy.isnan(self._data[left_pos]))
@@ -565,17 +593,26 @@ def sdc_mul_ovld(self, other, fill_value=None):
     operands_are_series = self_is_series and other_is_series
     fill_value_is_none = isinstance(fill_value, (types.NoneType, types.Omitted)) or fill_value is None
 
+    # result dtype follows numpy promotion rules, but aligning series can introduce NaNs,
+    # so integer result is kept only when operation is done on a series and a scalar
+    array_dtypes = [ty.dtype for ty in (self, other) if isinstance(ty, SeriesType)]
+    scalar_dtypes = [ty for ty in (self, other) if not isinstance(ty, SeriesType)]
+    if not fill_value_is_none:
+        scalar_dtypes.append(fill_value)
+    result_dtype = find_arithmetic_result_dtype('mul', array_dtypes, scalar_dtypes,
+                                                nans_possible=operands_are_series)
+
     # specializations for numeric series only
     if not operands_are_series:
         def sdc_mul_impl(self, other, fill_value=None):
 
             series = self if self_is_series == True else other  # noqa
-            result_data = numpy.empty(len(series._data), dtype=numpy.float64)
+            result_data = numpy.empty(len(series._data), dtype=result_dtype)
             series_data = numpy_like.fillna(series._data, inplace=False, value=fill_value)
             if self_is_series == True:  # noqa
-                _self, _other = series_data, numpy.float64(other)
+                _self, _other = series_data, result_dtype(other)
             else:
-                _self, _other = numpy.float64(self), series_data
+                _self, _other = result_dtype(self), series_data
 
             result_data[:] = _self * _other
             return pandas.Series(result_data, index=series._index, name=series._name)
@@ -589,7 +626,7 @@ def sdc_mul_ovld(self, other, fill_value=None):
 
                 left_size, right_size = len(self._data), len(other._data)
                 max_data_size = max(left_size, right_size)
-                result_data = numpy.empty(max_data_size, dtype=numpy.float64)
+                result_data = numpy.empty(max_data_size, dtype=result_dtype)
 
                 _fill_value = numpy.nan if fill_value_is_none == True else fill_value  # noqa
                 for i in numba.prange(max_data_size):
@@ -628,7 +665,7 @@ def sdc_mul_ovld(self, other, fill_value=None):
                 # TODO: replace below with core join(how='outer', return_indexers=True) when implemented
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
                 result_size = len(joined_index)
-                result_data = numpy.empty(result_size, dtype=numpy.float64)
+                result_data = numpy.empty(result_size, dtype=result_dtype)
                 for i in numba.prange(result_size):
                     left_pos, right_pos = left_indexer[i], right_indexer[i]
                     left_nan = (left_pos == -1 or numpy.isnan(self._data[left_pos]))
@@ -733,17 +770,26 @@ def sdc_truediv_ovld(self, other, fill_value=None):
     operands_are_series = self_is_series and other_is_series
     fill_value_is_none = isinstance(fill_value, (types.NoneType, types.Omitted)) or fill_value is None
 
+    # result dtype follows numpy promotion rules, but aligning series can introduce NaNs,
+    # so integer result is kept only when operation is done on a series and a scalar
+    array_dtypes = [ty.dtype for ty in (self, other) if isinstance(ty, SeriesType)]
+    scalar_dtypes = [ty for ty in (self, other) if not isinstance(ty, SeriesType)]
+    if not fill_value_is_none:
+        scalar_dtypes.append(fill_value)
+    result_dtype = find_arithmetic_result_dtype('truediv', array_dtypes, scalar_dtypes,
+                                                nans_possible=operands_are_series)
+
     # specializations for numeric series only
     if not operands_are_series:
         def sdc_truediv_impl(self, other, fill_value=None):
 
             series = self if self_is_series == True else other  # noqa
-            result_data = numpy.empty(len(series._data), dtype=numpy.float64)
+            result_data = numpy.empty(len(series._data), dtype=result_dtype)
             series_data = numpy_like.fillna(series._data, inplace=False, value=fill_value)
             if self_is_series == True:  # noqa
-                _self, _other = series_data, numpy.float64(other)
+                _self, _other = series_data, result_dtype(other)
             else:
-                _self, _other = numpy.float64(self), series_data
+                _self, _other = result_dtype(self), series_data
 
             result_data[:] = _self / _other
             return pandas.Series(result_data, index=series._index, name=series._name)
@@ -757,7 +803,7 @@ def sdc_truediv_ovld(self, other, fill_value=None):
 
                 left_size, right_size = len(self._data), len(other._data)
                 max_data_size = max(left_size, right_size)
-                result_data = numpy.empty(max_data_size, dtype=numpy.float64)
+                result_data = numpy.empty(max_data_size, dtype=result_dtype)
 
                 _fill_value = numpy.nan if fill_value_is_none == True else fill_value  # noqa
                 for i in numba.prange(max_data_size):
@@ -796,7 +842,7 @@ def sdc_truediv_ovld(self, other, fill_value=None):
                 # TODO: replace below with core join(how='outer', return_indexers=True) when implemented
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
                 result_size = len(joined_index)
-                result_data = numpy.empty(result_size, dtype=numpy.float64)
+                result_data = numpy.empty(result_size, dtype=result_dtype)
                 for i in numba.prange(result_size):
                     left_pos, right_pos = left_indexer[i], right_indexer[i]
                     left_nan = (left_pos == -1 or numpy.isnan(self._data[left_pos]))
@@ -901,17 +947,26 @@ def sdc_floordiv_ovld(self, other, fill_value=None):
     operands_are_series = self_is_series and other_is_series
     fill_value_is_none = isinstance(fill_value, (types.NoneType, types.Omitted)) or fill_value is None
 
+    # result dtype follows numpy promotion rules, but aligning series can introduce NaNs,
+    # so integer result is kept only when operation is done on a series and a scalar
+    array_dtypes = [ty.dtype for ty in (self, other) if isinstance(ty, SeriesType)]
+    scalar_dtypes = [ty for ty in (self, other) if not isinstance(ty, SeriesType)]
+    if not fill_value_is_none:
+        scalar_dtypes.append(fill_value)
+    result_dtype = find_arithmetic_result_dtype('floordiv', array_dtypes, scalar_dtypes,
+                                                nans_possible=operands_are_series)
+
     # specializations for numeric series only
     if not operands_are_series:
         def sdc_floordiv_impl(self, other, fill_value=None):
 
             series = self if self_is_series == True else other  # noqa
-            result_data = numpy.empty(len(series._data), dtype=numpy.float64)
+            result_data = numpy.empty(len(series._data), dtype=result_dtype)
             series_data = numpy_like.fillna(series._data, inplace=False, value=fill_value)
             if self_is_series == True:  # noqa
-                _self, _other = series_data, numpy.float64(other)
+                _self, _other = series_data, result_dtype(other)
             else:
-                _self, _other = numpy.float64(self), series_data
+                _self, _other = result_dtype(self), series_data
 
             result_data[:] = _self // _other
             return pandas.Series(result_data, index=series._index, name=series._name)
@@ -925,7 +980,7 @@ def sdc_floordiv_ovld(self, other, fill_value=None):
 
                 left_size, right_size = len(self._data), len(other._data)
                 max_data_size = max(left_size, right_size)
-                result_data = numpy.empty(max_data_size, dtype=numpy.float64)
+                result_data = numpy.empty(max_data_size, dtype=result_dtype)
 
                 _fill_value = numpy.nan if fill_value_is_none == True else fill_value  # noqa
                 for i in numba.prange(max_data_size):
@@ -964,7 +1019,7 @@ def sdc_floordiv_ovld(self, other, fill_value=None):
                 # TODO: replace below with core join(how='outer', return_indexers=True) when implemented
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
                 result_size = len(joined_index)
-                result_data = numpy.empty(result_size, dtype=numpy.float64)
+                result_data = numpy.empty(result_size, dtype=result_dtype)
                 for i in numba.prange(result_size):
                     left_pos, right_pos = left_indexer[i], right_indexer[i]
                     left_nan = (left_pos == -1 or numpy.isnan(self._data[left_pos]))
@@ -1069,17 +1124,26 @@ def sdc_mod_ovld(self, other, fill_value=None):
     operands_are_series = self_is_series and other_is_series
     fill_value_is_none = isinstance(fill_value, (types.NoneType, types.Omitted)) or fill_value is None
 
+    # result dtype follows numpy promotion rules, but aligning series can introduce NaNs,
+    # so integer result is kept only when operation is done on a series and a scalar
+    array_dtypes = [ty.dtype for ty in (self, other) if isinstance(ty, SeriesType)]
+    scalar_dtypes = [ty for ty in (self, other) if not isinstance(ty, SeriesType)]
+    if not fill_value_is_none:
+        scalar_dtypes.append(fill_value)
+    result_dtype = find_arithmetic_result_dtype('mod', array_dtypes, scalar_dtypes,
+                                                nans_possible=operands_are_series)
+
     # specializations for numeric series only
     if not operands_are_series:
         def sdc_mod_impl(self, other, fill_value=None):
 
             series = self if self_is_series == True else other  # noqa
-            result_data = numpy.empty(len(series._data), dtype=numpy.float64)
+            result_data = numpy.empty(len(series._data), dtype=result_dtype)
             series_data = numpy_like.fillna(series._data, inplace=False, value=fill_value)
             if self_is_series == True:  # noqa
-                _self, _other = series_data, numpy.float64(other)
+                _self, _other = series_data, result_dtype(other)
             else:
-                _self, _other = numpy.float64(self), series_data
+                _self, _other = result_dtype(self), series_data
 
             result_data[:] = _self % _other
             return pandas.Series(result_data, index=series._index, name=series._name)
@@ -1093,7 +1157,7 @@ def sdc_mod_ovld(self, other, fill_value=None):
 
                 left_size, right_size = len(self._data), len(other._data)
                 max_data_size = max(left_size, right_size)
-                result_data = numpy.empty(max_data_size, dtype=numpy.float64)
+                result_data = numpy.empty(max_data_size, dtype=result_dtype)
 
                 _fill_value = numpy.nan if fill_value_is_none == True else fill_value  # noqa
                 for i in numba.prange(max_data_size):
@@ -1132,7 +1196,7 @@ def sdc_mod_ovld(self, other, fill_value=None):
                 # TODO: replace below with core join(how='outer', return_indexers=True) when implemented
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
                 result_size = len(joined_index)
-                result_data = numpy.empty(result_size, dtype=numpy.float64)
+                result_data = numpy.empty(result_size, dtype=result_dtype)
                 for i in numba.prange(result_size):
                     left_pos, right_pos = left_indexer[i], right_indexer[i]
                     left_nan = (left_pos == -1 or numpy.isnan(self._data[left_pos]))
@@ -1237,17 +1301,26 @@ def sdc_pow_ovld(self, other, fill_value=None):
     operands_are_series = self_is_series and other_is_series
     fill_value_is_none = isinstance(fill_value, (types.NoneType, types.Omitted)) or fill_value is None
 
+    # result dtype follows numpy promotion rules, but aligning series can introduce NaNs,
+    # so integer result is kept only when operation is done on a series and a scalar
+    array_dtypes = [ty.dtype for ty in (self, other) if isinstance(ty, SeriesType)]
+    scalar_dtypes = [ty for ty in (self, other) if not isinstance(ty, SeriesType)]
+    if not fill_value_is_none:
+        scalar_dtypes.append(fill_value)
+    result_dtype = find_arithmetic_result_dtype('pow', array_dtypes, scalar_dtypes,
+                                                nans_possible=operands_are_series)
+
     # specializations for numeric series only
     if not operands_are_series:
         def sdc_pow_impl(self, other, fill_value=None):
 
             series = self if self_is_series == True else other  # noqa
-            result_data = numpy.empty(len(series._data), dtype=numpy.float64)
+            result_data = numpy.empty(len(series._data), dtype=result_dtype)
             series_data = numpy_like.fillna(series._data, inplace=False, value=fill_value)
             if self_is_series == True:  # noqa
-                _self, _other = series_data, numpy.float64(other)
+                _self, _other = series_data, result_dtype(other)
             else:
-                _self, _other = numpy.float64(self), series_data
+                _self, _other = result_dtype(self), series_data
 
             result_data[:] = _self ** _other
             return pandas.Series(result_data, index=series._index, name=series._name)
@@ -1261,7 +1334,7 @@ def sdc_pow_ovld(self, other, fill_value=None):
 
                 left_size, right_size = len(self._data), len(other._data)
                 max_data_size = max(left_size, right_size)
-                result_data = numpy.empty(max_data_size, dtype=numpy.float64)
+                result_data = numpy.empty(max_data_size, dtype=result_dtype)
 
                 _fill_value = numpy.nan if fill_value_is_none == True else fill_value  # noqa
                 for i in numba.prange(max_data_size):
@@ -1300,7 +1373,7 @@ def sdc_pow_ovld(self, other, fill_value=None):
                 # TODO: replace below with core join(how='outer', return_indexers=True) when implemented
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
                 result_size = len(joined_index)
-                result_data = numpy.empty(result_size, dtype=numpy.float64)
+                result_data = numpy.empty(result_size, dtype=result_dtype)
                 for i in numba.prange(result_size):
                     left_pos, right_pos = left_indexer[i], right_indexer[i]
                     left_nan = (left_pos == -1 or numpy.isnan(self._data[left_pos]))
@@ -2276,7 +2349,7 @@ def sdc_pandas_series_operator_add(self, other):
     Pandas Series operator :attr:`pandas.Series.add` implementation
 
     Note: Currently implemented for numeric Series only.
-        Differs from Pandas in returning Series with fixed dtype :obj:`float64`
+        Differs from Pandas in returning Series of float dtype when both operands are integer Series
 
     .. only:: developer
 
@@ -2341,7 +2414,7 @@ def sdc_pandas_series_operator_sub(self, other):
     Pandas Series operator :attr:`pandas.Series.sub` implementation
 
     Note: Currently implemented for numeric Series only.
-        Differs from Pandas in returning Series with fixed dtype :obj:`float64`
+        Differs from Pandas in returning Series of float dtype when both operands are integer Series
 
     .. only:: developer
 
@@ -2406,7 +2479,7 @@ def sdc_pandas_series_operator_mul(self, other):
     Pandas Series operator :attr:`pandas.Series.mul` implementation
 
     Note: Currently implemented for numeric Series only.
-        Differs from Pandas in returning Series with fixed dtype :obj:`float64`
+        Differs from Pandas in returning Series of float dtype when both operands are integer Series
 
     .. only:: developer
 
@@ -2471,7 +2544,7 @@ def sdc_pandas_series_operator_truediv(self, other):
     Pandas Series operator :attr:`pandas.Series.truediv` implementation
 
     Note: Currently implemented for numeric Series only.
-        Differs from Pandas in returning Series with fixed dtype :obj:`float64`
+        Differs from Pandas in returning Series of float dtype when both operands are integer Series
 
     .. only:: developer
 
@@ -2536,7 +2609,7 @@ def sdc_pandas_series_operator_floordiv(self, other):
     Pandas Series operator :attr:`pandas.Series.floordiv` implementation
 
     Note: Currently implemented for numeric Series only.
-        Differs from Pandas in returning Series with fixed dtype :obj:`float64`
+        Differs from Pandas in returning Series of float dtype when both operands are integer Series
 
     .. only:: developer
 
@@ -2601,7 +2674,7 @@ def sdc_pandas_series_operator_mod(self, other):
     Pandas Series operator :attr:`pandas.Series.mod` implementation
 
     Note: Currently implemented for numeric Series only.
-        Differs from Pandas in returning Series with fixed dtype :obj:`float64`
+        Differs from Pandas in returning Series of float dtype when both operands are integer Series
 
     .. only:: developer
 
@@ -2666,7 +2739,7 @@ def sdc_pandas_series_operator_pow(self, other):
     Pandas Series operator :attr:`pandas.Series.pow` implementation
 
     Note: Currently implemented for numeric Series only.
-        Differs from Pandas in returning Series with fixed dtype :obj:`float64`
+        Differs from Pandas in returning Series of float dtype when both operands are integer Series
 
     .. only:: developer
 
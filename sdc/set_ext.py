@@ -27,7 +27,7 @@
 
 from sdc.str_arr_ext import (StringArray, StringArrayType, string_array_type,
                               pre_alloc_string_array, StringArrayPayloadType,
-                              is_str_arr_typ)
+                              is_str_arr_typ, lir_offset_typ)
 from sdc.str_ext import string_type, gen_get_unicode_chars
 from sdc.utilities.utils import to_array
 import sdc
@@ -226,7 +226,7 @@ def populate_str_arr_from_set(typingctx, in_set_typ, in_str_arr_typ=None):
 
         fnty = lir.FunctionType(lir.VoidType(),
                                 [lir.IntType(8).as_pointer(),
-                                 lir.IntType(32).as_pointer(),
+                                 lir_offset_typ.as_pointer(),
                                  lir.IntType(8).as_pointer(),
                                  ])
         fn_getitem = builder.module.get_or_insert_function(fnty,
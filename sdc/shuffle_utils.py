@@ -32,12 +32,14 @@ from numba import types
 from numba.extending import overload
 
 import sdc
+from sdc.hiframes.join import calc_disp
 from sdc.utilities.utils import get_ctypes_ptr, _numba_to_c_type_map
 from sdc.timsort import getitem_arr_tup
 from sdc.str_ext import string_type
 from sdc.str_arr_ext import (string_array_type, to_string_list,
                               get_offset_ptr, get_data_ptr, convert_len_arr_to_offset,
                               pre_alloc_string_array, num_total_chars)
+from sdc.str_arr_type import offset_typ
 
 
 # metadata required for shuffle
@@ -94,10 +96,10 @@ def alloc_pre_shuffle_metadata_overload(key_arrs, data, n_pes, is_contig):
         if typ == string_array_type:
             func_text += ("  arr = key_arrs[{}]\n".format(i) if i < n_keys else "  arr = data[{}]\n".format(i - n_keys))
             func_text += "  send_counts_char_{} = np.zeros(n_pes, np.int32)\n".format(n_str)
-            func_text += "  send_arr_lens_{} = np.empty(1, np.uint32)\n".format(n_str)
+            func_text += "  send_arr_lens_{} = np.empty(1, np.uint64)\n".format(n_str)
             # needs allocation since written in update before finalize
             func_text += "  if is_contig:\n"
-            func_text += "    send_arr_lens_{} = np.empty(len(arr), np.uint32)\n".format(n_str)
+            func_text += "    send_arr_lens_{} = np.empty(len(arr), np.uint64)\n".format(n_str)
             n_str += 1
 
     count_char_tup = ", ".join("send_counts_char_{}".format(i) for i in range(n_str))
@@ -158,8 +160,8 @@ def finalize_shuffle_meta_overload(key_arrs, data, pre_shuffle_meta, n_pes, is_c
     func_text += "  sdc.distributed_api.alltoall(send_counts, recv_counts, 1)\n"
     func_text += "  n_out = recv_counts.sum()\n"
     func_text += "  n_send = send_counts.sum()\n"
-    func_text += "  send_disp = sdc.hiframes.join.calc_disp(send_counts)\n"
-    func_text += "  recv_disp = sdc.hiframes.join.calc_disp(recv_counts)\n"
+    func_text += "  send_disp = calc_disp(send_counts)\n"
+    func_text += "  recv_disp = calc_disp(recv_counts)\n"
 
     n_keys = len(key_arrs.types)
     n_all = len(key_arrs.types + data.types)
@@ -169,15 +171,13 @@ def finalize_shuffle_meta_overload(key_arrs, data, pre_shuffle_meta, n_pes, is_c
         func_text += ("  arr = key_arrs[{}]\n".format(i) if i < n_keys
                       else "  arr = data[{}]\n".format(i - n_keys))
         if isinstance(typ, types.Array):
-            func_text += "  out_arr_{} = fix_cat_array_type(np.empty(n_out, arr.dtype))\n".format(i)
+            func_text += "  out_arr_{} = np.empty(n_out, arr.dtype)\n".format(i)
             func_text += "  send_buff_{} = arr\n".format(i)
             func_text += "  if not is_contig:\n"
             if i >= n_keys and init_vals != ():
-                func_text += "    send_buff_{} = fix_cat_array_type(np.full(n_send,\n".format(i)
-                func_text += "                                              init_vals[{}],\n".format(i - n_keys)
-                func_text += "                                              arr.dtype))\n"
+                func_text += "    send_buff_{} = np.full(n_send, init_vals[{}], arr.dtype)\n".format(i, i - n_keys)
             else:
-                func_text += "    send_buff_{} = fix_cat_array_type(np.empty(n_send, arr.dtype))\n".format(i)
+                func_text += "    send_buff_{} = np.empty(n_send, arr.dtype)\n".format(i)
         else:
             assert typ == string_array_type
             # send_buff is None for strings
@@ -191,10 +191,8 @@ def finalize_shuffle_meta_overload(key_arrs, data, pre_shuffle_meta, n_pes, is_c
             func_text += "  n_all_chars = recv_counts_char_{}.sum()\n".format(n_str)
             func_text += "  out_arr_{} = pre_alloc_string_array(n_out, n_all_chars)\n".format(i)
             # send/recv disp
-            func_text += ("  send_disp_char_{} = sdc.hiframes.join."
-                          "calc_disp(send_counts_char_{})\n").format(n_str, n_str)
-            func_text += ("  recv_disp_char_{} = sdc.hiframes.join."
-                          "calc_disp(recv_counts_char_{})\n").format(n_str, n_str)
+            func_text += "  send_disp_char_{} = calc_disp(send_counts_char_{})\n".format(n_str, n_str)
+            func_text += "  recv_disp_char_{} = calc_disp(recv_counts_char_{})\n".format(n_str, n_str)
 
             # tmp_offset_char, send_arr_lens
             func_text += "  tmp_offset_char_{} = np.zeros(n_pes, np.int32)\n".format(n_str)
@@ -204,7 +202,7 @@ def finalize_shuffle_meta_overload(key_arrs, data, pre_shuffle_meta, n_pes, is_c
             func_text += "  send_arr_chars_arr_{} = np.empty(1, np.uint8)\n".format(n_str)
             func_text += "  send_arr_chars_{} = get_ctypes_ptr(get_data_ptr(arr))\n".format(n_str)
             func_text += "  if not is_contig:\n"
-            func_text += "    send_arr_lens_{} = np.empty(n_send, np.uint32)\n".format(n_str)
+            func_text += "    send_arr_lens_{} = np.empty(n_send, np.uint64)\n".format(n_str)
             func_text += "    s_n_all_chars = send_counts_char_{}.sum()\n".format(n_str)
             func_text += "    send_arr_chars_arr_{} = np.empty(s_n_all_chars, np.uint8)\n".format(n_str)
             func_text += "    send_arr_chars_{} = get_ctypes_ptr(send_arr_chars_arr_{}.ctypes)\n".format(n_str, n_str)
@@ -245,14 +243,12 @@ def finalize_shuffle_meta_overload(key_arrs, data, pre_shuffle_meta, n_pes, is_c
                                                                                              str_comma)
 
     loc_vars = {}
-    exec(func_text, {'np': np, 'sdc': sdc,
+    exec(func_text, {'np': np, 'sdc': sdc, 'calc_disp': calc_disp,
                      'pre_alloc_string_array': pre_alloc_string_array,
                      'num_total_chars': num_total_chars,
                      'get_data_ptr': get_data_ptr,
                      'ShuffleMeta': ShuffleMeta,
-                     'get_ctypes_ptr': get_ctypes_ptr,
-                     'fix_cat_array_type':
-                     sdc.hiframes.pd_categorical_ext.fix_cat_array_type}, loc_vars)
+                     'get_ctypes_ptr': get_ctypes_ptr}, loc_vars)
     finalize_impl = loc_vars['f']
     return finalize_impl
 
@@ -271,7 +267,7 @@ def alltoallv_impl(arr, metadata):
         return a2av_impl
 
     assert arr == string_array_type
-    int32_typ_enum = np.int32(_numba_to_c_type_map[types.int32])
+    offset_typ_enum = np.int32(_numba_to_c_type_map[offset_typ])
     char_typ_enum = np.int32(_numba_to_c_type_map[types.uint8])
 
     def a2av_str_impl(arr, metadata):
@@ -284,7 +280,7 @@ def alltoallv_impl(arr, metadata):
             metadata.recv_counts.ctypes,
             metadata.send_disp.ctypes,
             metadata.recv_disp.ctypes,
-            int32_typ_enum)
+            offset_typ_enum)
         sdc.distributed_api.c_alltoallv(
             metadata.send_arr_chars,
             get_data_ptr(
@@ -318,7 +314,7 @@ def alltoallv_tup_overload(arrs, meta):
             func_text += ("  sdc.distributed_api.c_alltoallv("
                           "meta.send_arr_lens_tup[{}].ctypes, offset_ptr_{}, meta.send_counts.ctypes, "
                           "meta.recv_counts.ctypes, meta.send_disp.ctypes, "
-                          "meta.recv_disp.ctypes, int32_typ_enum)\n").format(n_str, i)
+                          "meta.recv_disp.ctypes, offset_typ_enum)\n").format(n_str, i)
 
             func_text += ("  sdc.distributed_api.c_alltoallv("
                           "meta.send_arr_chars_tup[{}], get_data_ptr(meta.out_arr_tup[{}]),"
@@ -333,11 +329,11 @@ def alltoallv_tup_overload(arrs, meta):
         ','.join(['meta.out_arr_tup[{}]'.format(i) for i in range(arrs.count)]),
         "," if arrs.count == 1 else "")
 
-    int32_typ_enum = np.int32(_numba_to_c_type_map[types.int32])
+    offset_typ_enum = np.int32(_numba_to_c_type_map[offset_typ])
     char_typ_enum = np.int32(_numba_to_c_type_map[types.uint8])
     loc_vars = {}
     exec(func_text, {'sdc': sdc, 'get_offset_ptr': get_offset_ptr,
-                     'get_data_ptr': get_data_ptr, 'int32_typ_enum': int32_typ_enum,
+                     'get_data_ptr': get_data_ptr, 'offset_typ_enum': offset_typ_enum,
                      'char_typ_enum': char_typ_enum,
                      'convert_len_arr_to_offset': convert_len_arr_to_offset}, loc_vars)
     a2a_impl = loc_vars['f']
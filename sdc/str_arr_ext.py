@@ -43,6 +43,7 @@ from numba.extending import (typeof_impl, type_callable, models, register_model,
 from numba.cpython.hashing import _Py_hash_t
 from numba.core.imputils import (impl_ret_new_ref, impl_ret_borrowed, iternext_impl, RefType)
 from numba.cpython.listobj import ListInstance
+from numba.np.arrayobj import make_array, populate_array
 from numba.core.typing.templates import (infer_global, AbstractTemplate, infer,
                                          signature, AttributeTemplate, infer_getattr, bound_function)
 from numba import prange
@@ -50,10 +51,15 @@ from numba import prange
 from sdc.str_ext import string_type
 from sdc.str_arr_type import (StringArray, string_array_type, StringArrayType,
                               StringArrayPayloadType, str_arr_payload_type, StringArrayIterator,
-                              is_str_arr_typ, offset_typ, data_ctypes_type, offset_ctypes_type)
+                              is_str_arr_typ, offset_typ, char_typ, data_ctypes_type, offset_ctypes_type)
 from sdc.utilities.sdc_typing_utils import check_is_array_of_dtype
 
 
+# LLVM type of StringArray offsets, must match offset_t in _hpat_common.h
+lir_offset_typ = lir.IntType(offset_typ.bitwidth)
+offset_itemsize = offset_typ.bitwidth // 8
+
+
 @typeof_impl.register(StringArray)
 def typeof_string_array(val, c):
     return string_array_type
@@ -138,7 +144,7 @@ def get_offset_ptr(typingctx, str_arr_typ=None):
         # return string_array.offsets
         # # Create new ArrayCType structure
         ctinfo = context.make_helper(builder, offset_ctypes_type)
-        ctinfo.data = builder.bitcast(string_array.offsets, lir.IntType(32).as_pointer())
+        ctinfo.data = builder.bitcast(string_array.offsets, lir_offset_typ.as_pointer())
         ctinfo.meminfo = string_array.meminfo
         res = ctinfo._getvalue()
         return impl_ret_borrowed(context, builder, offset_ctypes_type, res)
@@ -166,6 +172,89 @@ def get_data_ptr(typingctx, str_arr_typ=None):
     return data_ctypes_type(string_array_type), codegen
 
 
+@intrinsic
+def get_null_bitmap_ptr(typingctx, str_arr_typ=None):
+    assert is_str_arr_typ(str_arr_typ)
+
+    def codegen(context, builder, sig, args):
+        in_str_arr, = args
+
+        string_array = context.make_helper(builder, string_array_type, in_str_arr)
+        ctinfo = context.make_helper(builder, data_ctypes_type)
+        ctinfo.data = string_array.null_bitmap
+        ctinfo.meminfo = string_array.meminfo
+        res = ctinfo._getvalue()
+        return impl_ret_borrowed(context, builder, data_ctypes_type, res)
+
+    return data_ctypes_type(string_array_type), codegen
+
+
+def _make_str_arr_buffer_view(context, builder, arr_typ, ptr, size, meminfo):
+    """Creates array of arr_typ on the StringArray buffer keeping the reference to the StringArray memory"""
+    ary = make_array(arr_typ)(context, builder)
+    itemsize = context.get_constant(types.intp, context.get_abi_sizeof(context.get_data_type(arr_typ.dtype)))
+    populate_array(ary,
+                   data=builder.bitcast(ptr, ary.data.type),
+                   shape=[size],
+                   strides=[itemsize],
+                   itemsize=itemsize,
+                   meminfo=builder.bitcast(meminfo, cgutils.voidptr_t))
+    return impl_ret_borrowed(context, builder, arr_typ, ary._getvalue())
+
+
+# offsets never exceed 2**63, so they are viewed as signed integers not to mix signed and unsigned arithmetic
+offsets_array_type = types.Array(types.int64, 1, 'C')
+chars_array_type = types.Array(char_typ, 1, 'C')
+
+
+@intrinsic
+def get_offsets_array(typingctx, str_arr_typ=None):
+    """Returns the offsets of the StringArray as an int64 array sharing the memory with it"""
+    assert is_str_arr_typ(str_arr_typ)
+
+    def codegen(context, builder, sig, args):
+        in_str_arr, = args
+
+        string_array = context.make_helper(builder, string_array_type, in_str_arr)
+        size = builder.add(string_array.num_items, context.get_constant(types.uint64, 1))
+        return _make_str_arr_buffer_view(context, builder, offsets_array_type, string_array.offsets,
+                                         size, string_array.meminfo)
+
+    return offsets_array_type(string_array_type), codegen
+
+
+@intrinsic
+def get_chars_array(typingctx, str_arr_typ=None):
+    """Returns the utf-8 encoded data of the StringArray as an uint8 array sharing the memory with it"""
+    assert is_str_arr_typ(str_arr_typ)
+
+    def codegen(context, builder, sig, args):
+        in_str_arr, = args
+
+        string_array = context.make_helper(builder, string_array_type, in_str_arr)
+        return _make_str_arr_buffer_view(context, builder, chars_array_type, string_array.data,
+                                         string_array.num_total_chars, string_array.meminfo)
+
+    return chars_array_type(string_array_type), codegen
+
+
+@intrinsic
+def get_null_bitmap_array(typingctx, str_arr_typ=None):
+    """Returns the null bitmap of the StringArray as an uint8 array sharing the memory with it"""
+    assert is_str_arr_typ(str_arr_typ)
+
+    def codegen(context, builder, sig, args):
+        in_str_arr, = args
+
+        string_array = context.make_helper(builder, string_array_type, in_str_arr)
+        size = builder.lshr(builder.add(string_array.num_items, context.get_constant(types.uint64, 7)),
+                            context.get_constant(types.uint64, 3))
+        return _make_str_arr_buffer_view(context, builder, chars_array_type, string_array.null_bitmap,
+                                         size, string_array.meminfo)
+
+    return chars_array_type(string_array_type), codegen
+
+
 @intrinsic
 def get_data_ptr_ind(typingctx, str_arr_typ, int_t=None):
     assert is_str_arr_typ(str_arr_typ)
@@ -192,10 +281,10 @@ def getitem_str_offset(typingctx, str_arr_typ, ind_t=None):
         in_str_arr, ind = args
 
         string_array = context.make_helper(builder, string_array_type, in_str_arr)
-        offsets = builder.bitcast(string_array.offsets, lir.IntType(32).as_pointer())
+        offsets = builder.bitcast(string_array.offsets, lir_offset_typ.as_pointer())
         return builder.load(builder.gep(offsets, [ind]))
 
-    return types.uint32(string_array_type, ind_t), codegen
+    return offset_typ(string_array_type, ind_t), codegen
 
 # TODO: fix this for join
 @intrinsic
@@ -204,11 +293,11 @@ def setitem_str_offset(typingctx, str_arr_typ, ind_t, val_t=None):
         in_str_arr, ind, val = args
 
         string_array = context.make_helper(builder, string_array_type, in_str_arr)
-        offsets = builder.bitcast(string_array.offsets, lir.IntType(32).as_pointer())
+        offsets = builder.bitcast(string_array.offsets, lir_offset_typ.as_pointer())
         builder.store(val, builder.gep(offsets, [ind]))
         return context.get_dummy_value()
 
-    return types.void(string_array_type, ind_t, types.uint32), codegen
+    return types.void(string_array_type, ind_t, offset_typ), codegen
 
 
 @intrinsic
@@ -220,8 +309,8 @@ def copy_str_arr_slice(typingctx, str_arr_typ, out_str_arr_typ, ind_t=None):
 
         out_string_array = context.make_helper(builder, string_array_type, out_str_arr)
 
-        in_offsets = builder.bitcast(in_string_array.offsets, lir.IntType(32).as_pointer())
-        out_offsets = builder.bitcast(out_string_array.offsets, lir.IntType(32).as_pointer())
+        in_offsets = builder.bitcast(in_string_array.offsets, lir_offset_typ.as_pointer())
+        out_offsets = builder.bitcast(out_string_array.offsets, lir_offset_typ.as_pointer())
 
         ind_p1 = builder.add(ind, context.get_constant(types.intp, 1))
         cgutils.memcpy(builder, out_offsets, in_offsets, ind_p1)
@@ -737,7 +826,7 @@ def pre_alloc_string_array(typingctx, num_strs_typ, num_total_chars_typ=None):
 
         # allocate string array
         fnty = lir.FunctionType(lir.VoidType(),
-                                [lir.IntType(32).as_pointer().as_pointer(),
+                                [lir_offset_typ.as_pointer().as_pointer(),
                                  lir.IntType(8).as_pointer().as_pointer(),
                                  lir.IntType(8).as_pointer().as_pointer(),
                                  lir.IntType(64),
@@ -779,9 +868,9 @@ def set_string_array_range(typingctx, out_typ, in_typ, curr_str_typ, curr_chars_
         in_string_array = context.make_helper(builder, string_array_type, in_arr)
 
         fnty = lir.FunctionType(lir.VoidType(),
-                                [lir.IntType(32).as_pointer(),
+                                [lir_offset_typ.as_pointer(),
                                  lir.IntType(8).as_pointer(),
-                                 lir.IntType(32).as_pointer(),
+                                 lir_offset_typ.as_pointer(),
                                  lir.IntType(8).as_pointer(),
                                  lir.IntType(64),
                                  lir.IntType(64),
@@ -813,7 +902,7 @@ def box_str_arr(typ, val, c):
 
     fnty = lir.FunctionType(c.context.get_argument_type(types.pyobject),  # lir.IntType(8).as_pointer(),
                             [lir.IntType(64),
-                             lir.IntType(32).as_pointer(),
+                             lir_offset_typ.as_pointer(),
                              lir.IntType(8).as_pointer(),
                              lir.IntType(8).as_pointer(),
                              ])
@@ -899,7 +988,7 @@ def setitem_str_arr(context, builder, sig, args):
         context, builder, value=val)
     string_array = context.make_helper(builder, string_array_type, arr)
     fnty = lir.FunctionType(lir.VoidType(),
-                            [lir.IntType(32).as_pointer(),
+                            [lir_offset_typ.as_pointer(),
                              lir.IntType(8).as_pointer(),
                              lir.IntType(64),
                              lir.IntType(8).as_pointer(),
@@ -929,7 +1018,7 @@ def setitem_str_arr_ptr(typingctx, str_arr_t, ind_t, ptr_t, len_t=None):
         arr, ind, ptr, length = args
         string_array = context.make_helper(builder, string_array_type, arr)
         fnty = lir.FunctionType(lir.VoidType(),
-                                [lir.IntType(32).as_pointer(),
+                                [lir_offset_typ.as_pointer(),
                                  lir.IntType(8).as_pointer(),
                                  lir.IntType(64),
                                  lir.IntType(8).as_pointer(),
@@ -1148,7 +1237,7 @@ def _str_arr_item_to_numeric(typingctx, out_ptr_t, str_arr_t, ind_t,
         fnty = lir.FunctionType(
             lir.IntType(32),
             [out_ptr.type,
-             lir.IntType(32).as_pointer(),
+             lir_offset_typ.as_pointer(),
              lir.IntType(8).as_pointer(),
              lir.IntType(64)])
         fname = 'str_arr_to_int64'
@@ -1189,7 +1278,7 @@ def unbox_str_series(typ, val, c):
     fnty = lir.FunctionType(lir.VoidType(),
                             [lir.IntType(8).as_pointer(),
                              lir.IntType(64).as_pointer(),
-                             lir.IntType(32).as_pointer().as_pointer(),
+                             lir_offset_typ.as_pointer().as_pointer(),
                              lir.IntType(8).as_pointer().as_pointer(),
                              lir.IntType(8).as_pointer().as_pointer(),
                              ])
@@ -1211,8 +1300,8 @@ def unbox_str_series(typ, val, c):
     string_array.offsets = payload.offsets
     string_array.data = payload.data
     string_array.null_bitmap = payload.null_bitmap
-    string_array.num_total_chars = c.builder.zext(c.builder.load(
-        c.builder.gep(string_array.offsets, [string_array.num_items])), lir.IntType(64))
+    string_array.num_total_chars = c.builder.load(
+        c.builder.gep(string_array.offsets, [string_array.num_items]))
 
     # FIXME how to check that the returned size is > 0?
     is_error = cgutils.is_not_null(c.builder, c.pyapi.err_occurred())
@@ -1247,7 +1336,7 @@ def lower_glob(context, builder, sig, args):
 
     # call glob in C
     fnty = lir.FunctionType(lir.VoidType(),
-                            [lir.IntType(32).as_pointer().as_pointer(),
+                            [lir_offset_typ.as_pointer().as_pointer(),
                              lir.IntType(8).as_pointer().as_pointer(),
                              lir.IntType(8).as_pointer().as_pointer(),
                              lir.IntType(64).as_pointer(),
@@ -1265,8 +1354,8 @@ def lower_glob(context, builder, sig, args):
     string_array.offsets = str_arr_payload.offsets
     string_array.data = str_arr_payload.data
     string_array.null_bitmap = str_arr_payload.null_bitmap
-    string_array.num_total_chars = builder.zext(builder.load(
-        builder.gep(string_array.offsets, [string_array.num_items])), lir.IntType(64))
+    string_array.num_total_chars = builder.load(
+        builder.gep(string_array.offsets, [string_array.num_items]))
 
     # cgutils.printf(builder, "n %d\n", string_array.num_items)
     ret = string_array._getvalue()
@@ -1302,6 +1391,20 @@ def create_str_arr_from_list(str_list):
     return str_arr
 
 
+@numba.njit(no_cpython_wrapper=True)
+def str_arr_from_buffers(offsets, data, null_bitmap):
+    # precondition: (1) offsets is an array of offset_typ values starting with 0 and ending with len(data)
+    #               (2) null_bitmap has a bit per string set for valid (non-NA) values, as in Arrow
+    n = len(offsets) - 1
+    n_chars = len(data)
+    str_arr = pre_alloc_string_array(n, n_chars)
+    _memcpy(get_offset_ptr(str_arr), offsets.ctypes, n + 1, offset_itemsize)
+    _memcpy(get_data_ptr(str_arr), data.ctypes, n_chars, 1)
+    _memcpy(get_null_bitmap_ptr(str_arr), null_bitmap.ctypes, (n + 7) >> 3, 1)
+
+    return str_arr
+
+
 @numba.njit(no_cpython_wrapper=True)
 def str_arr_set_na_by_mask(str_arr, nan_mask):
     # precondition: (1) str_arr and nan_mask have the same size
@@ -1315,6 +1418,8 @@ def str_arr_set_na_by_mask(str_arr, nan_mask):
 
 @overload(operator.add)
 def sdc_str_arr_operator_add(self, other):
+    # kernels building StringArrays in parallel depend on this module
+    from sdc.functions.str_arr_kernels import str_arr_add_by_indexers, str_arr_from_list
 
     self_is_str_arr = self == string_array_type
     other_is_str_arr = other == string_array_type
@@ -1331,56 +1436,20 @@ def sdc_str_arr_operator_add(self, other):
             if size_self != size_other:
                 raise ValueError("Mismatch of String Arrays sizes in operator.add")
 
-            res_total_chars = 0
-            for i in numba.prange(size_self):
-                if not str_arr_is_na(self, i) and not str_arr_is_na(other, i):
-                    res_total_chars += (get_utf8_size(self[i]) + get_utf8_size(other[i]))
-            res_arr = pre_alloc_string_array(size_self, res_total_chars)
-
-            for i in numba.prange(size_self):
-                if not (str_arr_is_na(self, i) or str_arr_is_na(other, i)):
-                    res_arr[i] = self[i] + other[i]
-                else:
-                    res_arr[i] = ''
-                    str_arr_set_na(res_arr, i)
-
-            return res_arr
+            indexer = np.arange(size_self)
+            return str_arr_add_by_indexers(self, other, indexer, indexer)
 
     elif self_is_str_arr:
         def _sdc_str_arr_operator_add_impl(self, other):
-            res_size = len(self)
-            res_total_chars = 0
-            for i in numba.prange(res_size):
-                if not str_arr_is_na(self, i):
-                    res_total_chars += get_utf8_size(self[i]) + get_utf8_size(other)
-            res_arr = pre_alloc_string_array(res_size, res_total_chars)
-
-            for i in numba.prange(res_size):
-                if not str_arr_is_na(self, i):
-                    res_arr[i] = self[i] + other
-                else:
-                    res_arr[i] = ''
-                    str_arr_set_na(res_arr, i)
-
-            return res_arr
+            indexer = np.arange(len(self))
+            return str_arr_add_by_indexers(self, str_arr_from_list([other]),
+                                           indexer, np.zeros(len(self), dtype=np.int64))
 
     elif other_is_str_arr:
         def _sdc_str_arr_operator_add_impl(self, other):
-            res_size = len(other)
-            res_total_chars = 0
-            for i in numba.prange(res_size):
-                if not str_arr_is_na(other, i):
-                    res_total_chars += get_utf8_size(other[i]) + get_utf8_size(self)
-            res_arr = pre_alloc_string_array(res_size, res_total_chars)
-
-            for i in numba.prange(res_size):
-                if not str_arr_is_na(other, i):
-                    res_arr[i] = self + other[i]
-                else:
-                    res_arr[i] = ''
-                    str_arr_set_na(res_arr, i)
-
-            return res_arr
+            indexer = np.arange(len(other))
+            return str_arr_add_by_indexers(str_arr_from_list([self]), other,
+                                           np.zeros(len(other), dtype=np.int64), indexer)
 
     else:
         return None
@@ -1390,6 +1459,8 @@ def sdc_str_arr_operator_add(self, other):
 
 @overload(operator.mul)
 def sdc_str_arr_operator_mul(self, other):
+    # kernels building StringArrays in parallel depend on this module
+    from sdc.functions.str_arr_kernels import str_arr_mul_by_indexers
 
     self_is_str_arr = self == string_array_type
     other_is_str_arr = other == string_array_type
@@ -1405,32 +1476,15 @@ def sdc_str_arr_operator_mul(self, other):
 
         _self, _other = (self, other) if self_is_str_arr == True else (other, self)  # noqa
         res_size = len(_self)
-        if one_operand_is_scalar != True:  # noqa
-            if res_size != len(_other):
-                raise ValueError("Mismatch of String Array and Integer array sizes in operator.mul")
-
-        res_total_chars = 0
-        for i in numba.prange(res_size):
-            if not str_arr_is_na(_self, i):
-                if one_operand_is_scalar == True:  # noqa
-                    res_total_chars += get_utf8_size(_self[i]) * max(0, _other)
-                else:
-                    res_total_chars += get_utf8_size(_self[i]) * max(0, _other[i])
-        res_arr = pre_alloc_string_array(res_size, res_total_chars)
-
-        for i in numba.prange(res_size):
-            if not str_arr_is_na(_self, i):
-                if one_operand_is_scalar == True:  # noqa
-                    set_value = _self[i] * _other
-                    res_arr[i] = _self[i] * _other
-                else:
-                    set_value = _self[i] * _other[i]
-                    res_arr[i] = _self[i] * _other[i]
-            else:
-                res_arr[i] = ''
-                str_arr_set_na(res_arr, i)
+        indexer = np.arange(res_size)
+        if one_operand_is_scalar == True:  # noqa
+            repeats = np.full(1, _other, dtype=np.int64)
+            return str_arr_mul_by_indexers(_self, repeats, indexer, np.zeros(res_size, dtype=np.int64))
+
+        if res_size != len(_other):
+            raise ValueError("Mismatch of String Array and Integer array sizes in operator.mul")
 
-        return res_arr
+        return str_arr_mul_by_indexers(_self, _other, indexer, indexer)
 
     return _sdc_str_arr_operator_mul_impl
 
@@ -31,7 +31,7 @@ from sdc.str_ext import string_type
 
 
 char_typ = types.uint8
-offset_typ = types.uint32
+offset_typ = types.uint64
 
 data_ctypes_type = types.ArrayCTypes(types.Array(char_typ, 1, 'C'))
 offset_ctypes_type = types.ArrayCTypes(types.Array(offset_typ, 1, 'C'))
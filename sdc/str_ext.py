@@ -475,12 +475,20 @@ ll.add_symbol('str_from_int32', hstr_ext.str_from_int32)
 ll.add_symbol('str_from_int64', hstr_ext.str_from_int64)
 ll.add_symbol('str_from_float32', hstr_ext.str_from_float32)
 ll.add_symbol('str_from_float64', hstr_ext.str_from_float64)
+ll.add_symbol('str_format_float64', hstr_ext.str_format_float64)
+ll.add_symbol('str_format_float32', hstr_ext.str_format_float32)
 
 get_std_str_len = types.ExternalFunction(
     "get_str_len", signature(types.intp, std_str_type))
 init_string_from_chars = types.ExternalFunction(
     "init_string_const", std_str_type(types.voidptr, types.intp))
 
+str_format_float64 = types.ExternalFunction(
+    "str_format_float64", signature(types.int64, types.voidptr, types.float64))
+
+str_format_float32 = types.ExternalFunction(
+    "str_format_float32", signature(types.int64, types.voidptr, types.float32))
+
 _str_to_int64 = types.ExternalFunction(
     "str_to_int64", signature(types.intp, types.voidptr, types.intp))
 
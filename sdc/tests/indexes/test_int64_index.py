@@ -25,6 +25,7 @@
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 # *****************************************************************************
 
+import numba
 import numpy as np
 import pandas as pd
 import unittest
@@ -194,6 +195,61 @@ class TestInt64Index(TestCase):
                 result_ref = test_impl(index, value)
                 np.testing.assert_array_equal(result, result_ref)
 
+    def test_int64_index_contains_engine(self):
+        def test_impl(index, values):
+            res = []
+            for value in values:
+                res.append(value in index)
+            return res
+        sdc_func = self.jit(test_impl)
+
+        values = [-5, 15, 1, 11, 5, 6, 0]
+        indexes = [
+            pd.Int64Index(np.arange(-3, 12)),
+            pd.Int64Index([1, 11, 2, 11, 5, -5, 1]),
+            pd.Int64Index([1, 1, 2, 5, 5, 11]),
+            pd.Int64Index([], dtype='int64'),
+        ]
+        for index in indexes:
+            with self.subTest(index=index):
+                self.assertEqual(sdc_func(index, values), test_impl(index, values))
+
+    def test_int64_index_contains_engine_cached(self):
+        from sdc.extensions.indexes.index_engine import _int64_index_engines
+
+        def test_impl(index, value):
+            return value in index
+        sdc_func = self.jit(test_impl)
+
+        index = pd.Int64Index([1, 11, 2, 11, 5, -5, 1])
+        self.assertEqual(sdc_func(index, 5), test_impl(index, 5))
+        # engine built by the first call is kept for the pandas index object and used by the next calls
+        engine_map, engine_data = _int64_index_engines[id(index)]
+        self.assertEqual(len(engine_map), 5)
+        self.assertEqual(sdc_func(index, 6), test_impl(index, 6))
+        self.assertIs(_int64_index_engines[id(index)][0], engine_map)
+
+        index_id = id(index)
+        del index
+        self.assertNotIn(index_id, _int64_index_engines)
+
+    def test_int64_index_contains_engine_prange(self):
+        def test_impl(index, values):
+            res = np.zeros(len(values), dtype=np.bool_)
+            for i in numba.prange(len(values)):
+                res[i] = values[i] in index
+            return res
+        sdc_func = self.jit(test_impl)
+
+        n = 1000
+        np.random.seed(0)
+        index = pd.Int64Index(np.random.permutation(n))
+        values = np.arange(-n // 2, 2 * n)
+        for _ in range(3):
+            # engine is built on the first call by one of the threads looking up values concurrently
+            index = pd.Int64Index(index.values)
+            np.testing.assert_array_equal(sdc_func(index, values), test_impl(index, values))
+
     def test_int64_index_copy(self):
         def test_impl(index, new_name):
             return index.copy(name=new_name)
@@ -443,6 +499,30 @@ class TestInt64Index(TestCase):
         result_ref = pyfunc(mask, index1, name, index2)
         pd.testing.assert_series_equal(result, result_ref)
 
+    def test_int64_index_support_reindexing_engine(self):
+        from sdc.datatypes.common_functions import sdc_reindex_series
+
+        def pyfunc(data, index, name, by_index):
+            S = pd.Series(data, index, name=name)
+            return S.reindex(by_index)
+
+        @self.jit
+        def sdc_func(data, index, name, by_index):
+            return sdc_reindex_series(data, index, name, by_index)
+
+        n = 11
+        np.random.seed(0)
+        data = np.random.ranf(n)
+        name = 'asdf'
+        index_values = [np.arange(n), np.random.permutation(n)]
+        for index_data, by_index_data in product(index_values, repeat=2):
+            index1 = pd.Int64Index(index_data)
+            index2 = pd.Int64Index(by_index_data[::-1])
+            with self.subTest(index=index1, by_index=index2):
+                result = sdc_func(data, index1, name, index2)
+                result_ref = pyfunc(data, index1, name, index2)
+                pd.testing.assert_series_equal(result, result_ref)
+
     def test_int64_index_support_join(self):
         from sdc.datatypes.common_functions import sdc_join_series_indexes
 
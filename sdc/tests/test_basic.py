@@ -29,6 +29,8 @@ import numba
 import numpy as np
 import pandas as pd
 import random
+import subprocess
+import sys
 import unittest
 from numba import types
 
@@ -393,6 +395,81 @@ class TestBasic(BaseTest):
         np.testing.assert_allclose(hpat_func(arr) / self.num_ranks, test_impl(arr))
         self.assertEqual(count_array_OneDs(), 1)
 
+    def test_dist_series_reductions(self):
+        def test_impl(S):
+            return len(S), S.sum(), S.count(), S.mean(), S.min(), S.max()
+
+        hpat_func = self.sdc_jit(distributed={'S'})(test_impl)
+        n = 111
+        np.random.seed(0)
+        data = np.random.ranf(n)
+        data[::7] = np.nan
+        start, end = get_start_end(n)
+        S = pd.Series(data)
+        np.testing.assert_allclose(hpat_func(S.iloc[start:end]), test_impl(S))
+
+    def test_dist_series_filter_return(self):
+        def test_impl(S):
+            res = (S[S > 0.5] * 2).abs()
+            return res
+
+        hpat_func = self.sdc_jit(distributed={'S', 'res'})(test_impl)
+        n = 111
+        np.random.seed(0)
+        start, end = get_start_end(n)
+        S = pd.Series(np.random.ranf(n) - 0.1)
+        S_part = S.iloc[start:end].reset_index(drop=True)
+        pd.testing.assert_series_equal(hpat_func(S_part), test_impl(S_part))
+        self.assertGreater(count_array_OneD_Vars(), 0)
+
+    def test_dist_series_sort_values(self):
+        def test_impl(S):
+            res = S.sort_values(ascending=False)
+            return res
+
+        hpat_func = self.sdc_jit(distributed={'S', 'res'})(test_impl)
+        n = 111
+        np.random.seed(0)
+        start, end = get_start_end(n)
+        S = pd.Series(np.random.ranf(n))
+        res = hpat_func(S.iloc[start:end])
+        # parts of the result are consecutive parts of the sorted Series
+        expected = test_impl(S)
+        offset = np.searchsorted(-expected.values, -res.values[0]) if len(res) else 0
+        pd.testing.assert_series_equal(res, expected.iloc[offset:offset + len(res)])
+        self.assertGreater(count_array_OneD_Vars(), 0)
+
+    def test_dist_df_filter_sum(self):
+        def test_impl(df):
+            df2 = df[df.A > 0.5]
+            return df2.B.str.len().sum(), len(df2)
+
+        hpat_func = self.sdc_jit(distributed={'df'})(test_impl)
+        n = 111
+        np.random.seed(0)
+        df = pd.DataFrame({'A': np.random.ranf(n),
+                           'B': ['a' * (i % 5) for i in range(n)]})
+        start, end = get_start_end(n)
+        self.assertEqual(hpat_func(df.iloc[start:end]), test_impl(df))
+
+    def test_dist_series_unsupported(self):
+        def test_impl(S):
+            return S.cumsum().sum()
+
+        hpat_func = self.sdc_jit(distributed={'S'})(test_impl)
+        with self.assertRaises(ValueError) as raises:
+            hpat_func(pd.Series(np.arange(10.)))
+        self.assertIn('distributed argument S', str(raises.exception))
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), 'shared memory transport is built on Linux only')
+    def test_dist_shm_transport(self):
+        names = ['test_dist_series_reductions', 'test_dist_series_filter_return', 'test_dist_series_sort_values',
+                 'test_dist_df_filter_sum']
+        tests = ['sdc.tests.test_basic.TestBasic.{}'.format(name) for name in names]
+        result = subprocess.run([sys.executable, '-m', 'sdc.launch', '-n', '3', '--', '-m', 'unittest'] + tests,
+                                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+        self.assertEqual(result.returncode, 0, result.stdout)
+
     @unittest.expectedFailure  # https://github.com/numba/numba/issues/4690
     def test_rebalance(self):
         def test_impl(N):
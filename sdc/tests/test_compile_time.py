@@ -24,16 +24,22 @@
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 # *****************************************************************************
 
+import json
 import numba
 import numpy as np
+import os
 import pandas as pd
 import re
+import tempfile
 import unittest
 
 from contextlib import redirect_stdout
 from io import StringIO
+from unittest import mock
 from sdc.tests.test_base import TestCase
-from sdc.decorators import debug_compile_time
+from sdc.decorators import debug_compile_time, profile_compile_time
+from numba.extending import overload
+from sdc.utilities import compile_cache, trace
 
 
 # regexp patterns for lines in @debug_compile_time output log
@@ -109,6 +115,147 @@ class TestCompileTime(TestCase):
         for m in match_iter:
             self.assertIn(searched_name, m.group(1))
 
+    def test_profile_json(self):
+        """ Verifies compile stats written in json format include all compiled functions and their passes """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'stats.json')
+
+            @profile_compile_time(file_name)
+            @self.jit
+            def test_impl(S1, S2):
+                return S1 + S2
+
+            S1, S2 = self._gen_usecase_data()
+            test_impl(S1, S2)
+
+            with open(file_name) as f:
+                stats = json.load(f)
+
+        self.assertIn('inlined_overloads', stats)
+        functions = stats['functions']
+        self.assertGreater(len(functions), 1)
+        self.assertEqual(functions[0]['function'], 'TestCompileTime.test_profile_json.<locals>.test_impl')
+        for func_stats in functions:
+            with self.subTest(function=func_stats['function']):
+                self.assertEqual(set(func_stats), {'function', 'unique_name', 'args', 'source_size',
+                                                   'pipelines', 'total_time'})
+                pass_times = [t for times in func_stats['pipelines'].values() for t in times.values()]
+                self.assertTrue(pass_times)
+                self.assertAlmostEqual(func_stats['total_time'], sum(pass_times))
+
+    def test_profile_folded(self):
+        """ Verifies compile stats written as collapsed stacks for flame graph tools """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'stats.folded')
+
+            @profile_compile_time(file_name, output_format='folded')
+            @self.jit
+            def test_impl(S1, S2):
+                return S1 + S2
+
+            S1, S2 = self._gen_usecase_data()
+            test_impl(S1, S2)
+
+            with open(file_name) as f:
+                lines = f.read().splitlines()
+
+        self.assertTrue(lines)
+        for line in lines:
+            self.assertRegex(line, r'^[^;\s]+;\w+;\w+ \d+$')
+
+
+class TestCompileCache(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        patcher = mock.patch.multiple('sdc.config',
+                                      config_compile_cache=True,
+                                      config_compile_cache_dir=self.cache_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.cache_dir.cleanup)
+
+    def test_exec_func_text_cached_source(self):
+        """ Verifies generated function is backed by a file named by its source and globals """
+        func_text = 'def _impl(a):\n  return np.sum(a) + offset\n'
+
+        impl_1 = compile_cache.exec_func_text(func_text, {'np': np, 'offset': 1}, '_impl')
+        impl_2 = compile_cache.exec_func_text(func_text, {'np': np, 'offset': 1}, '_impl')
+        impl_3 = compile_cache.exec_func_text(func_text, {'np': np, 'offset': 2}, '_impl')
+
+        file_name = impl_1.__code__.co_filename
+        self.assertTrue(os.path.isfile(file_name))
+        self.assertTrue(file_name.startswith(compile_cache.get_sources_path()))
+        self.assertEqual(impl_2.__code__.co_filename, file_name)
+        self.assertNotEqual(impl_3.__code__.co_filename, file_name)
+        self.assertEqual(impl_3(np.ones(3)), 5)
+
+    def test_exec_func_text_not_cacheable(self):
+        """ Verifies generated function is not cached if it refers to a value with no stable identity """
+        func_text = 'def _impl(a):\n  return func(a)\n'
+
+        impl = compile_cache.exec_func_text(func_text, {'func': lambda x: x + 1}, '_impl')
+        self.assertEqual(impl.__code__.co_filename, '<string>')
+        self.assertEqual(impl(1), 2)
+
+    def test_jit_cached_generated_func(self):
+        """ Verifies compile results of generated function are stored and loaded from the cache """
+        func_text = 'def _impl(a):\n  return np.sum(a) * 2\n'
+        impl = compile_cache.exec_func_text(func_text, {'np': np}, '_impl')
+
+        jit_options = {'nopython': True, 'cache': True, '_target': compile_cache.dispatcher_target}
+        cfunc = numba.jit(**jit_options)(impl)
+        self.assertEqual(cfunc(np.arange(5)), 20)
+        self.assertEqual(len(cfunc.stats.cache_misses), 1)
+
+        cfunc = numba.jit(**jit_options)(impl)
+        self.assertEqual(cfunc(np.arange(5)), 20)
+        self.assertEqual(len(cfunc.stats.cache_hits), 1)
+
+    def test_evict(self):
+        """ Verifies eviction removes oldest files of the cache until it fits into given size """
+        cache_path = compile_cache.get_cache_path()
+        os.makedirs(cache_path)
+        file_names = [os.path.join(cache_path, f'entry_{i}') for i in range(4)]
+        for i, file_name in enumerate(file_names):
+            with open(file_name, 'wb') as f:
+                f.write(b'0' * 100)
+            os.utime(file_name, (i, i))
+
+        compile_cache.evict(max_size=250)
+        self.assertEqual([os.path.exists(f) for f in file_names], [False, False, True, True])
+
+
+class TestTraceOverloads(TestCase):
+
+    def test_trace_overload(self):
+        """ Verifies calls of traced overload implementation are counted with their allocations """
+        def usecase_func(n, fill=1.0):
+            pass
+
+        def usecase_func_ovld(n, fill=1.0):
+            def usecase_func_impl(n, fill=1.0):
+                return np.full(n, fill)
+            return usecase_func_impl
+
+        overload(usecase_func)(trace.trace_overload(usecase_func_ovld, 'usecase_func', {}))
+
+        @numba.njit
+        def test_impl(n):
+            return usecase_func(n).sum() + usecase_func(n, 2.0).sum()
+
+        trace.reset_trace()
+        self.assertEqual(test_impl(10), 30.0)
+
+        summary = {s['method']: s for s in trace.get_trace_summary()}
+        self.assertEqual(summary['usecase_func']['calls'], 2)
+        self.assertGreaterEqual(summary['usecase_func']['allocations'], 2)
+        self.assertGreaterEqual(summary['usecase_func']['allocated_bytes'], 2 * 10 * 8)
+
+        trace.reset_trace()
+        self.assertEqual(trace.get_trace_summary(), [])
+
 
 if __name__ == "__main__":
     unittest.main()
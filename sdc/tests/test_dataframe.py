@@ -244,6 +244,24 @@ class TestDataFrame(TestCase):
         df = pd.DataFrame({'A': np.arange(n), 'B': np.random.ranf(n)})
         pd.testing.assert_frame_equal(hpat_func(df), test_impl(df))
 
+    def test_unbox_datetime_index(self):
+        """Verifies DataFrames with DatetimeIndex are unboxed and boxed back by common operations"""
+        def test_impl_box(df):
+            return df
+
+        def test_impl_column(df):
+            return df['A'] + df['B']
+
+        def test_impl_index(df):
+            return df.index
+
+        index = pd.DatetimeIndex(np.array(['2020-01-03', '2020-01-01', '2020-01-05 12:00',
+                                           '2019-12-31', '2020-01-02'], dtype='datetime64[ns]'))
+        df = pd.DataFrame({'A': np.arange(5), 'B': [1., 3., 5., 2., 4.]}, index=index)
+        pd.testing.assert_frame_equal(self.jit(test_impl_box)(df), test_impl_box(df))
+        pd.testing.assert_series_equal(self.jit(test_impl_column)(df), test_impl_column(df))
+        np.testing.assert_array_equal(self.jit(test_impl_index)(df), test_impl_index(df).values)
+
     @unittest.skip("needs properly refcounted dataframes")
     def test_unbox2(self):
         def test_impl(df, cond):
@@ -2155,6 +2173,25 @@ class TestDataFrame(TestCase):
         sdc_func = self.jit(test_impl)
         pd.testing.assert_frame_equal(sdc_func(arr), test_impl(arr))
 
+    def test_df_getitem_bool_array_str_columns_and_index(self):
+        def test_impl(df, arr):
+            return df[arr]
+
+        sdc_func = self.jit(test_impl)
+        n = 17
+        indexes = [None, np.arange(n) * 3 + 1, ['l', 'm', '', 'n', 'o', 'p', 'q', 'r', 's',
+                                                'tt', 'u', 'v', 'w', 'x', 'y', 'z', 'zz']]
+        for index in indexes:
+            df = pd.DataFrame({
+                'A': np.arange(n, dtype=np.float64),
+                'B': ['a', None, 'ccc', '', 'dd', None, 'eeee', 'f', 'g',
+                      'hh', None, 'i', 'jjj', 'k', '', 'll', 'm'],
+                'C': np.arange(n) % 3,
+            }, index=index)
+            for arr in [np.arange(n) % 3 == 0, np.zeros(n, dtype=np.bool_), np.ones(n, dtype=np.bool_)]:
+                with self.subTest(index=index, arr=arr):
+                    pd.testing.assert_frame_equal(sdc_func(df, arr), test_impl(df, arr))
+
     def test_df_getitem_str_literal_idx_exception_key_error(self):
         def test_impl(df):
             return df['ABC']
@@ -120,6 +120,76 @@ class TestGroupBy(TestCase):
                 # TODO: implement index classes, as current indexes do not have names
                 pd.testing.assert_frame_equal(result, result_ref, check_names=False)
 
+    def test_dataframe_groupby_many_groups(self):
+        test_impls = {
+            'count': lambda df: df.groupby('A').count(),
+            'max': lambda df: df.groupby('A').max(),
+            'mean': lambda df: df.groupby('A').mean(),
+            'median': lambda df: df.groupby('A').median(),
+            'min': lambda df: df.groupby('A').min(),
+            'std': lambda df: df.groupby('A').std(),
+            'var': lambda df: df.groupby('A').var(),
+        }
+
+        n, m = 10000, 1000
+        np.random.seed(0)
+        df = pd.DataFrame({
+                    'A': np.random.choice(np.arange(m), n),
+                    'B': np.random.randint(-100, 100, n),
+                    'C': gen_frand_array(n, nancount=n // 4),
+        })
+
+        for method, test_impl in test_impls.items():
+            with self.subTest(method=method):
+                hpat_func = self.jit(test_impl)
+                result = hpat_func(df)
+                result_ref = test_impl(df)
+                # TODO: implement index classes, as current indexes do not have names
+                pd.testing.assert_frame_equal(result, result_ref, check_names=False)
+
+    def test_dataframe_groupby_sparse_groups(self):
+        """Verifies aggregations when there are more groups than rows per thread, so that per-thread
+        partial results are not allocated and rows are grouped by sorting instead"""
+        test_impls = {
+            'count': lambda df: df.groupby('A').count(),
+            'max': lambda df: df.groupby('A').max(),
+            'mean': lambda df: df.groupby('A').mean(),
+            'median': lambda df: df.groupby('A').median(),
+            'min': lambda df: df.groupby('A').min(),
+            'prod': lambda df: df.groupby('A').prod(),
+            'sum': lambda df: df.groupby('A').sum(),
+            'var': lambda df: df.groupby('A').var(),
+        }
+
+        n, m = 200000, 1000000
+        np.random.seed(0)
+        df = pd.DataFrame({
+                    'A': np.random.choice(np.arange(m), n),
+                    'B': np.random.randint(-100, 100, n),
+                    'C': gen_frand_array(n, nancount=n // 4),
+        })
+
+        for method, test_impl in test_impls.items():
+            with self.subTest(method=method):
+                hpat_func = self.jit(test_impl)
+                result = hpat_func(df)
+                result_ref = test_impl(df)
+                pd.testing.assert_frame_equal(result, result_ref, check_names=False)
+
+    def test_dataframe_groupby_all_nan_group(self):
+        def test_impl(df):
+            return df.groupby('A').max()
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame({
+                    'A': [2, 1, 2, 1, 0, 2],
+                    'B': [np.nan, 2., np.nan, -1.3, np.nan, np.nan],
+        })
+        result = hpat_func(df)
+        result_ref = test_impl(df)
+        # TODO: implement index classes, as current indexes do not have names
+        pd.testing.assert_frame_equal(result, result_ref, check_names=False)
+
     def test_dataframe_groupby_count(self):
         def test_impl(df):
             return df.groupby('A').count()
@@ -28,6 +28,7 @@ import numpy as np
 import os
 import pandas as pd
 import platform
+import pyarrow as pa
 import pyarrow.parquet as pq
 import unittest
 import numba
@@ -72,6 +73,24 @@ class TestIO(TestCase):
             with open("csv_data_dtype1.csv", "w") as f:
                 f.write(data)
 
+            # test_csv_str_na1
+            data = ("1,,abc\n"
+                    "2,2.5,\n"
+                    "3,,dé\n"
+                    ",4.5,\n"
+                    "5,1.5,xyz\n")
+
+            with open("csv_data_str_na1.csv", "w", encoding="utf-8") as f:
+                f.write(data)
+
+            # test_pd_read_parquet_filters
+            n = 100
+            df = pd.DataFrame({'A': np.arange(n),
+                               'B': np.arange(n) * 0.5,
+                               'C': [str(i) if i % 7 else None for i in range(n)]})
+            pq.write_table(pa.Table.from_pandas(df, preserve_index=False), 'pq_data_row_groups.pq',
+                           row_group_size=10)
+
             # test_np_io1
             n = 111
             A = np.random.ranf(n)
@@ -229,6 +248,49 @@ class TestParquet(TestIO):
         hpat_func = self.jit(test_impl)
         pd.testing.assert_frame_equal(hpat_func(), test_impl())
 
+    def test_pd_read_parquet_filters(self):
+        def test_impl():
+            return pd.read_parquet('pq_data_row_groups.pq', columns=['A', 'C'], filters=[('A', '>=', 45)])
+
+        df = pd.read_parquet('pq_data_row_groups.pq', columns=['A', 'C'])
+        expected = df[df.A >= 45].reset_index(drop=True)
+        hpat_func = self.jit(test_impl)
+        pd.testing.assert_frame_equal(hpat_func(), expected)
+
+    def test_pd_read_parquet_pushdown(self):
+        def test_impl(x):
+            df = pd.read_parquet('pq_data_row_groups.pq')
+            return df[df.A > x]['C']
+
+        hpat_func = self.jit(test_impl)
+        for x in [-1, 37, 99]:
+            with self.subTest(x=x):
+                pd.testing.assert_series_equal(hpat_func(x), test_impl(x))
+
+    def test_df_to_parquet(self):
+        def test_impl(df, path):
+            df.to_parquet(path, compression='gzip')
+
+        n = 33
+        df = pd.DataFrame({'A': np.arange(n),
+                           'B': np.arange(n) * 0.5,
+                           'C': [str(i) if i % 7 else None for i in range(n)]})
+        hpat_func = self.jit(test_impl)
+        hpat_func(df, 'pq_data_to_parquet.pq')
+        pd.testing.assert_frame_equal(pd.read_parquet('pq_data_to_parquet.pq'), df)
+
+    def test_df_to_parquet_partitioned(self):
+        def test_impl(df, path):
+            df.to_parquet(path, index=False, partition_cols=())
+
+        n = 33
+        df = pd.DataFrame({'A': np.arange(n),
+                           'C': [str(i) if i % 7 else None for i in range(n)]})
+        hpat_func = self.jit(test_impl)
+        hpat_func(df, 'pq_data_to_parquet_dir')
+        result = pd.read_parquet('pq_data_to_parquet_dir')
+        pd.testing.assert_frame_equal(result.sort_values('A').reset_index(drop=True), df)
+
 
 class TestCSV(TestIO):
 
@@ -599,6 +661,51 @@ class TestCSV(TestIO):
         hpat_func = self.jit(test_impl)
         pd.testing.assert_frame_equal(hpat_func(), test_impl())
 
+    def test_csv_chunksize1(self):
+        def test_impl(chunksize):
+            total, n_chunks = 0., 0
+            for chunk in pd.read_csv("csv_data_str_na1.csv",
+                                     names=['A', 'B', 'C'],
+                                     dtype={'A': np.float64, 'B': np.float64, 'C': str},
+                                     chunksize=chunksize):
+                total += chunk['A'].sum() + chunk['B'].sum()
+                n_chunks += 1
+            return total, n_chunks
+
+        hpat_func = self.jit(test_impl)
+        for chunksize in [1, 2, 5, 10]:
+            with self.subTest(chunksize=chunksize):
+                self.assertEqual(hpat_func(chunksize), test_impl(chunksize))
+
+    def test_csv_chunksize_break(self):
+        def test_impl(chunksize):
+            total = 0.
+            for chunk in pd.read_csv("csv_data_str_na1.csv",
+                                     names=['A', 'B', 'C'],
+                                     dtype={'A': np.float64, 'B': np.float64, 'C': str},
+                                     chunksize=chunksize):
+                total += chunk['A'].sum()
+                break
+            return total
+
+        from sdc.io.csv_ext import _csv_chunk_readers
+
+        hpat_func = self.jit(test_impl)
+        for chunksize in [1, 2]:
+            with self.subTest(chunksize=chunksize):
+                self.assertEqual(hpat_func(chunksize), test_impl(chunksize))
+                # reader left on break is closed when the iterator is released
+                self.assertEqual(len(_csv_chunk_readers), 0)
+
+    def test_csv_str_na1(self):
+        def test_impl():
+            return pd.read_csv("csv_data_str_na1.csv",
+                               names=['A', 'B', 'C'],
+                               dtype={'A': np.float64, 'B': np.float64, 'C': str})
+
+        hpat_func = self.jit(test_impl)
+        pd.testing.assert_frame_equal(hpat_func(), test_impl())
+
     def pd_csv_parallel1(self, use_pyarrow=False):
         read_csv = self._read_csv(use_pyarrow)
 
@@ -709,7 +816,6 @@ class TestCSV(TestIO):
         hpat_func = self.jit(test_impl)
         pd.testing.assert_frame_equal(hpat_func(), test_impl())
 
-    @skip_numba_jit
     def test_write_csv1(self):
         def test_impl(df, fname):
             df.to_csv(fname)
@@ -743,6 +849,41 @@ class TestCSV(TestIO):
             pd.testing.assert_frame_equal(
                 pd.read_csv(hp_fname), pd.read_csv(pd_fname))
 
+    def test_df_to_csv(self):
+        def test_impl(df, fname):
+            df.to_csv(fname)
+
+        n = 1001
+        df = pd.DataFrame({'A': np.arange(n) - 500,
+                           'B': np.arange(n) / 7,
+                           'C': [None if i % 7 == 0 else f'{i},"{i}"' if i % 3 == 0 else str(i) for i in range(n)],
+                           'D': np.arange(n) % 2 == 0,
+                           'E': (np.arange(n) / 3).astype(np.float32)})
+        df.iloc[::11, 1] = np.nan
+        df.iloc[::13, 4] = np.nan
+        hpat_func = self.jit(test_impl)
+        hpat_func(df, 'test_df_to_csv_sdc.csv')
+        test_impl(df, 'test_df_to_csv_pd.csv')
+        with open('test_df_to_csv_sdc.csv') as f_sdc, open('test_df_to_csv_pd.csv') as f_pd:
+            self.assertEqual(f_sdc.read(), f_pd.read())
+
+    def test_df_to_csv_str(self):
+        def test_impl(df):
+            return df.to_csv(sep=';', na_rep='NA', index=False)
+
+        df = pd.DataFrame({'A': [1.0, np.nan, 1e16, 1e-5, -0.0, np.inf],
+                           'B': ['a;b', '', None, 'x', 'y\nz', 'w']})
+        hpat_func = self.jit(test_impl)
+        self.assertEqual(hpat_func(df), test_impl(df))
+
+    def test_series_to_csv(self):
+        def test_impl(S):
+            return S.to_csv(header=False)
+
+        S = pd.Series(np.arange(17, dtype=np.int32) * -3, index=np.arange(17) * 2)
+        hpat_func = self.jit(test_impl)
+        self.assertEqual(hpat_func(S), test_impl(S))
+
 
 class TestNumpy(TestIO):
 
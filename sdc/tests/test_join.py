@@ -64,7 +64,6 @@ class TestJoin(TestCase):
         n = 11111
         self.assertEqual(hpat_func(n), test_impl(n))
 
-    @skip_numba_jit
     def test_join1_seq(self):
         def test_impl(df1, df2):
             df3 = df1.merge(df2, left_on='key1', right_on='key2')
@@ -80,6 +79,107 @@ class TestJoin(TestCase):
         df2 = pd.DataFrame({'key2': 2 * np.arange(n) + 1, 'B': n + np.arange(n) + 1.0})
         pd.testing.assert_frame_equal(hpat_func(df1, df2), test_impl(df1, df2))
 
+    def test_merge_how(self):
+        def test_impl(df1, df2, how):
+            return df1.merge(df2, how=how, on='key')
+
+        hpat_func = self.jit(test_impl)
+        df1 = pd.DataFrame({'key': [2., 3., 5., 1., 2., 8.], 'A': [4, 6, 3, 9, 9, -1]})
+        df2 = pd.DataFrame({'key': [1., 2., 9., 3., 2.], 'B': [1., 7., 2., 6., 5.]})
+        for how in ['inner', 'left', 'right', 'outer']:
+            with self.subTest(how=how):
+                pd.testing.assert_frame_equal(hpat_func(df1, df2, how), test_impl(df1, df2, how))
+
+    def test_merge_sort(self):
+        def test_impl(df1, df2, how):
+            return df1.merge(df2, how=how, on='key', sort=True)
+
+        hpat_func = self.jit(test_impl)
+        df1 = pd.DataFrame({'key': [2., 3., 5., 1., 2., 8.], 'A': [4., 6., 3., 9., 9., -1.]})
+        df2 = pd.DataFrame({'key': [1., 2., 9., 3., 2.], 'B': [1., 7., 2., 6., 5.]})
+        for how in ['inner', 'left', 'right', 'outer']:
+            with self.subTest(how=how):
+                pd.testing.assert_frame_equal(hpat_func(df1, df2, how), test_impl(df1, df2, how))
+
+    def test_merge_sorted_keys(self):
+        def test_impl(df1, df2, how):
+            return df1.merge(df2, how=how, on='key')
+
+        hpat_func = self.jit(test_impl)
+        n = 1001
+        df1 = pd.DataFrame({'key': np.arange(n) // 3, 'A': np.arange(n) + 1.0})
+        df2 = pd.DataFrame({'key': np.arange(n) // 2 + 10, 'B': np.arange(n) - 1.0})
+        for how in ['inner', 'left']:
+            with self.subTest(how=how):
+                pd.testing.assert_frame_equal(hpat_func(df1, df2, how), test_impl(df1, df2, how))
+
+    def test_merge_single_nan_key(self):
+        def test_impl(df1, df2, how):
+            return df1.merge(df2, how=how, on='key', sort=True)
+
+        hpat_func = self.jit(test_impl)
+        for left, right in [([np.nan], [1.]), ([1.], [np.nan]), ([np.nan], [np.nan])]:
+            df1 = pd.DataFrame({'key': left, 'A': [1.]})
+            df2 = pd.DataFrame({'key': right, 'B': [2.]})
+            for how in ['inner', 'left', 'right', 'outer']:
+                with self.subTest(left=left, right=right, how=how):
+                    pd.testing.assert_frame_equal(hpat_func(df1, df2, how), test_impl(df1, df2, how))
+
+    def test_merge_str_keys(self):
+        def test_impl(df1, df2, how):
+            return pd.merge(df1, df2, how=how, on='key')
+
+        hpat_func = self.jit(test_impl)
+        df1 = pd.DataFrame({'key': ['foo', 'bar', 'baz', 'foo'], 'A': [1., 2., 3., 4.]})
+        df2 = pd.DataFrame({'key': ['baz', 'bar', 'qux', 'baz'], 'B': ['b', 'zzz', 'ss', 'q']})
+        for how in ['inner', 'left', 'right', 'outer']:
+            with self.subTest(how=how):
+                pd.testing.assert_frame_equal(hpat_func(df1, df2, how), test_impl(df1, df2, how))
+
+    def test_merge_left_on_right_on(self):
+        def test_impl(df1, df2):
+            return df1.merge(df2, how='outer', left_on='key1', right_on='key2')
+
+        hpat_func = self.jit(test_impl)
+        df1 = pd.DataFrame({'key1': [2, 3, 5, 1], 'A': [4., 6., 3., 9.]})
+        df2 = pd.DataFrame({'key2': [1, 2, 9, 3, 2], 'A': [1., 7., 2., 6., 5.]})
+        pd.testing.assert_frame_equal(hpat_func(df1, df2), test_impl(df1, df2))
+
+    def test_merge_suffixes(self):
+        def test_impl(df1, df2):
+            return df1.merge(df2, on='key', suffixes=('_left', '_right'))
+
+        hpat_func = self.jit(test_impl)
+        df1 = pd.DataFrame({'key': [2, 3, 5, 1], 'A': [4., 6., 3., 9.], 'B': [1, 2, 3, 4]})
+        df2 = pd.DataFrame({'key': [1, 2, 9, 3, 2], 'A': [1., 7., 2., 6., 5.]})
+        pd.testing.assert_frame_equal(hpat_func(df1, df2), test_impl(df1, df2))
+
+    def test_merge_multiple_keys(self):
+        def test_impl(df1, df2, how):
+            return df1.merge(df2, how=how, on=['A', 'B'])
+
+        hpat_func = self.jit(test_impl)
+        n = 1000
+        np.random.seed(0)
+        df1 = pd.DataFrame({'A': np.random.randint(0, 10, n),
+                            'B': np.random.randint(0, 10, n),
+                            'C': np.arange(n) + 1.0})
+        df2 = pd.DataFrame({'A': np.random.randint(0, 12, n // 2),
+                            'B': np.random.randint(0, 12, n // 2),
+                            'D': np.arange(n // 2) - 1.0})
+        for how in ['inner', 'left']:
+            with self.subTest(how=how):
+                pd.testing.assert_frame_equal(hpat_func(df1, df2, how), test_impl(df1, df2, how))
+
+    def test_merge_nan_keys(self):
+        def test_impl(df1, df2):
+            return df1.merge(df2, how='left', on='key')
+
+        hpat_func = self.jit(test_impl)
+        df1 = pd.DataFrame({'key': [2., np.nan, 5., 1.], 'A': [4., 6., 3., 9.]})
+        df2 = pd.DataFrame({'key': [1., 2., 9., 3., 2.], 'B': [1., 7., 2., 6., 5.]})
+        pd.testing.assert_frame_equal(hpat_func(df1, df2), test_impl(df1, df2))
+
     @skip_numba_jit
     def test_join1_seq_str(self):
         def test_impl():
@@ -103,7 +203,6 @@ class TestJoin(TestCase):
         hpat_func = self.jit(test_impl)
         self.assertEqual(set(hpat_func()), set(test_impl()))
 
-    @skip_numba_jit
     def test_join_mutil_seq1(self):
         def test_impl(df1, df2):
             return df1.merge(df2, on=['A', 'B'])
@@ -260,7 +359,6 @@ class TestJoin(TestCase):
         hpat_func = self.jit(test_impl)
         self.assertEqual(hpat_func(), test_impl())
 
-    @skip_numba_jit
     def test_join_left_seq1(self):
         def test_impl(df1, df2):
             return pd.merge(df1, df2, how='left', on='key')
@@ -278,7 +376,6 @@ class TestJoin(TestCase):
         self.assertEqual(
             set(h_res.B.dropna().values), set(res.B.dropna().values))
 
-    @skip_numba_jit
     def test_join_left_seq2(self):
         def test_impl(df1, df2):
             return pd.merge(df1, df2, how='left', on='key')
@@ -297,7 +394,6 @@ class TestJoin(TestCase):
         self.assertEqual(
             set(h_res.B.dropna().values), set(res.B.dropna().values))
 
-    @skip_numba_jit
     def test_join_right_seq1(self):
         def test_impl(df1, df2):
             return pd.merge(df1, df2, how='right', on='key')
@@ -315,7 +411,6 @@ class TestJoin(TestCase):
         self.assertEqual(
             set(h_res.A.dropna().values), set(res.A.dropna().values))
 
-    @skip_numba_jit
     def test_join_outer_seq1(self):
         def test_impl(df1, df2):
             return pd.merge(df1, df2, how='outer', on='key')
@@ -334,7 +429,6 @@ class TestJoin(TestCase):
         self.assertEqual(
             set(h_res.A.dropna().values), set(res.A.dropna().values))
 
-    @skip_numba_jit
     def test_join1_seq_key_change1(self):
         # make sure const list typing doesn't replace const key values
         def test_impl(df1, df2, df3, df4):
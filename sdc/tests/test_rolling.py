@@ -484,9 +484,9 @@ class TestRolling(TestCase):
 
         method_name = 'Method rolling().'
         assert_raises_ty_checker(self,
-                                 [method_name, 'window', 'unicode_type', 'int'],
+                                 [method_name, 'window', 'float64', 'int, str'],
                                  hpat_func,
-                                 obj, '1', None, False, None, None, 0, None)
+                                 obj, 1., None, False, None, None, 0, None)
 
         assert_raises_ty_checker(self,
                                  [method_name, 'min_periods', 'unicode_type', 'None, int'],
@@ -894,6 +894,56 @@ class TestRolling(TestCase):
 
         self._test_rolling_unsupported_types(df)
 
+    def test_df_rolling_time_window_on(self):
+        def test_impl(df, window):
+            rolling = df.rolling(window, on='time')
+            return (rolling.count(), rolling.sum(), rolling.mean(), rolling.std(),
+                    rolling.var(), rolling.min(), rolling.max())
+
+        hpat_func = self.jit(test_impl)
+        n = 101
+        rng = np.random.RandomState(0)
+        times = pd.Timestamp('2020-01-01') + pd.to_timedelta(np.cumsum(rng.randint(0, 3000, n)), unit='ms')
+        data = rng.randint(0, 50, n).astype(np.float64)
+        data[::7] = np.nan
+        df = pd.DataFrame({'A': data, 'time': times, 'B': np.arange(n)})
+        for window in ['1ms', '2s', '5500ms', '1min']:
+            with self.subTest(window=window):
+                for jit_result, ref_result in zip(hpat_func(df, window), test_impl(df, window)):
+                    pd.testing.assert_frame_equal(jit_result, ref_result)
+
+    def test_df_rolling_time_window_datetime_index(self):
+        def test_impl(df, window):
+            return df.rolling(window).sum()
+
+        hpat_func = self.jit(test_impl)
+        n = 101
+        rng = np.random.RandomState(0)
+        times = pd.Timestamp('2020-01-01') + pd.to_timedelta(np.cumsum(rng.randint(0, 3000, n)), unit='ms')
+        df = pd.DataFrame({'A': rng.randint(0, 50, n).astype(np.float64), 'B': np.arange(n)},
+                          index=pd.DatetimeIndex(times))
+        pd.testing.assert_frame_equal(hpat_func(df, '5s'), test_impl(df, '5s'))
+
+    def test_df_rolling_time_window_unsupported(self):
+        def test_impl(df, window, on):
+            return df.rolling(window, on=on).sum()
+
+        hpat_func = self.jit(test_impl)
+        times = pd.date_range('2020-01-01', periods=5, freq='s')
+        df = pd.DataFrame({'A': np.arange(5.), 'time': times})
+
+        with self.assertRaises(TypingError) as raises:
+            hpat_func(df, '1M', 'time')
+        self.assertIn('Unsupported window', str(raises.exception))
+
+        with self.assertRaises(TypingError) as raises:
+            hpat_func(df, '2s', 'A')
+        self.assertIn('array of datetime64', str(raises.exception))
+
+        with self.assertRaises(ValueError) as raises:
+            hpat_func(df.iloc[::-1].reset_index(drop=True), '2s', 'time')
+        self.assertIn('must be monotonic', str(raises.exception))
+
     def test_df_rolling_apply_mean(self):
         all_data = [
             list(range(10)), [1., -1., 0., 0.1, -0.1],
@@ -1677,6 +1727,75 @@ class TestRolling(TestCase):
             series = pd.Series(data, index, name='A')
             self._test_rolling_max(series)
 
+    def test_series_rolling_minmax_monotonic(self):
+        def test_impl(series, window):
+            rolling = series.rolling(window)
+            return rolling.min(), rolling.max()
+
+        hpat_func = self.jit(test_impl)
+        n = 1001
+        all_data = [np.arange(n, dtype=np.float64), np.arange(n, 0, -1, dtype=np.float64),
+                    np.sin(np.arange(n) / 50.)]
+        for data, window in product(all_data, [1, 7, 100, n]):
+            series = pd.Series(data)
+            with self.subTest(data=data, window=window):
+                jit_min, jit_max = hpat_func(series, window)
+                ref_min, ref_max = test_impl(series, window)
+                pd.testing.assert_series_equal(jit_min, ref_min)
+                pd.testing.assert_series_equal(jit_max, ref_max)
+
+    def test_series_rolling_median_quantile_long(self):
+        def test_impl(series, window, min_periods, quantile):
+            rolling = series.rolling(window, min_periods)
+            return rolling.median(), rolling.quantile(quantile)
+
+        hpat_func = self.jit(test_impl)
+        n = 1001
+        data = np.random.RandomState(0).randint(0, 50, n).astype(np.float64)
+        data[::13] = np.nan
+        series = pd.Series(data)
+        for window, quantile in product([1, 8, 101, n], [0, 0.3, 0.5, 1]):
+            with self.subTest(window=window, quantile=quantile):
+                jit_median, jit_quantile = hpat_func(series, window, window // 2, quantile)
+                ref_median, ref_quantile = test_impl(series, window, window // 2, quantile)
+                pd.testing.assert_series_equal(jit_median, ref_median)
+                pd.testing.assert_series_equal(jit_quantile, ref_quantile)
+
+    def test_series_rolling_time_window(self):
+        def test_impl(data, times, window):
+            rolling = pd.Series(data, index=times).rolling(window)
+            return (rolling.count().values, rolling.sum().values, rolling.mean().values,
+                    rolling.std().values, rolling.min().values, rolling.max().values)
+
+        hpat_func = self.jit(test_impl)
+        n = 1001
+        rng = np.random.RandomState(0)
+        times = np.datetime64('2020-01-01') + np.cumsum(rng.randint(0, 3000, n)).astype('timedelta64[ms]')
+        times = times.astype('datetime64[ns]')
+        data = np.sin(np.arange(n) / 50.)
+        data[::11] = np.nan
+        for window in ['1s', '3s', '1h']:
+            with self.subTest(window=window):
+                for jit_result, ref_result in zip(hpat_func(data, times, window), test_impl(data, times, window)):
+                    np.testing.assert_allclose(jit_result, ref_result)
+
+    def test_series_rolling_time_window_datetime_index(self):
+        def test_impl(series, window):
+            rolling = series.rolling(window)
+            return rolling.count(), rolling.sum(), rolling.mean(), rolling.min(), rolling.max()
+
+        hpat_func = self.jit(test_impl)
+        n = 101
+        rng = np.random.RandomState(0)
+        times = pd.Timestamp('2020-01-01') + pd.to_timedelta(np.cumsum(rng.randint(0, 3000, n)), unit='ms')
+        data = rng.randint(0, 50, n).astype(np.float64)
+        data[::7] = np.nan
+        series = pd.Series(data, index=pd.DatetimeIndex(times))
+        for window in ['2s', '5s']:
+            with self.subTest(window=window):
+                for jit_result, ref_result in zip(hpat_func(series, window), test_impl(series, window)):
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
     def test_series_rolling_mean(self):
         all_data = [
             list(range(10)), [1., -1., 0., 0.1, -0.1],
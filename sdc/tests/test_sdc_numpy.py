@@ -97,10 +97,14 @@ class TestArrays(TestCase):
 
         sdc_func = self.jit(sdc_impl)
 
-        a = np.array([2, 3, 0])
-        np.testing.assert_array_equal(sdc_func(a), ref_impl(a))
+        cases = [np.array([2, 3, 0]),
+                 np.array([np.iinfo(np.int64).min, -10, 9, np.iinfo(np.int64).max]),
+                 np.array([7, 0, 255], dtype=np.uint8),
+                 np.array([True, False, True])]
+        for a in cases:
+            with self.subTest(data=a):
+                np.testing.assert_array_equal(sdc_func(a), ref_impl(a))
 
-    @unittest.skip('Numba converts float to string with incorrect precision')
     def test_astype_float_to_str(self):
         def ref_impl(a):
             return a.astype(str)
@@ -110,8 +114,12 @@ class TestArrays(TestCase):
 
         sdc_func = self.jit(sdc_impl)
 
-        a = np.array([4., 5.6, np.nan])
-        np.testing.assert_array_equal(sdc_func(a), ref_impl(a))
+        cases = [np.array([4., 5.6, np.nan]),
+                 np.array([-0., 1e16, 1e-5, 0.1, np.inf, -np.inf, 2.2250738585072014e-308]),
+                 np.array([0.1, 5.6, np.nan, 3e38], dtype=np.float32)]
+        for a in cases:
+            with self.subTest(data=a):
+                np.testing.assert_array_equal(sdc_func(a), ref_impl(a))
 
     def test_astype_num_to_str(self):
         def ref_impl(a):
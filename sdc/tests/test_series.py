@@ -1146,6 +1146,19 @@ class TestSeries(
             S = pd.Series(data, index, name='A')
             np.testing.assert_array_equal(jit_impl(S, key).values, np.array(test_impl(S, key)))
 
+    def test_series_loc_int64_index_engine(self):
+        def test_impl(S, key):
+            return S.loc[key]
+
+        jit_impl = self.jit(test_impl)
+
+        indices = [[1, 2, 2, 2, 5, 7, 9], [9, 2, 7, 2, 1, 5, 2], [1, 2, 3, 4, 5, 6, 7]]
+        for index in indices:
+            S = pd.Series(np.arange(len(index), dtype=np.float64), index, name='A')
+            for key in [1, 2, 5]:
+                with self.subTest(index=index, key=key):
+                    np.testing.assert_array_equal(jit_impl(S, key).values, np.array(test_impl(S, key)))
+
     def test_series_loc_str(self):
         def test_impl(A):
             return A.loc['1']
@@ -1284,6 +1297,33 @@ class TestSeries(
 
         pd.testing.assert_series_equal(hpat_func(), test_impl())
 
+    def test_series_datetime_index_box_unbox(self):
+        """Verifies Series with DatetimeIndex are unboxed and boxed back by common operations"""
+        def test_impl_box(S):
+            return S
+
+        def test_impl_ops(S):
+            return S * 2, S.head(3), S[S > 2]
+
+        def test_impl_index(S):
+            return S.index
+
+        def test_impl_sum(S):
+            return S.sum()
+
+        index = pd.DatetimeIndex(np.array(['2020-01-03', '2020-01-01', '2020-01-05 12:00',
+                                           '2019-12-31', '2020-01-02'], dtype='datetime64[ns]'))
+        S = pd.Series([1., 3., 5., 2., 4.], index=index, name='A')
+        pd.testing.assert_series_equal(self.jit(test_impl_box)(S), test_impl_box(S))
+        for result, result_ref in zip(self.jit(test_impl_ops)(S), test_impl_ops(S)):
+            pd.testing.assert_series_equal(result, result_ref)
+        np.testing.assert_array_equal(self.jit(test_impl_index)(S), test_impl_index(S).values)
+        self.assertEqual(self.jit(test_impl_sum)(S), test_impl_sum(S))
+
+        # indexes with time zones are still unboxed as the default index
+        S_tz = pd.Series([1., 3., 5.], index=pd.date_range('2020-01-01', periods=3, tz='UTC'))
+        self.assertEqual(self.jit(test_impl_sum)(S_tz), test_impl_sum(S_tz))
+
     def test_series_list_str_unbox1(self):
         def test_impl(A):
             return A.iloc[0]
@@ -2200,6 +2240,71 @@ class TestSeries(
                 result_ref = test_impl(S)
                 pd.testing.assert_series_equal(result.sort_index(), result_ref.sort_index())
 
+    def test_series_value_counts_normalize(self):
+        def test_impl(S, normalize, dropna):
+            return S.value_counts(normalize=normalize, dropna=dropna)
+
+        hpat_func = self.jit(test_impl)
+
+        data_to_test = [[1, 2, 3, 1, 1, 3],
+                        [0.1, 3., np.nan, 3., 0.1, 3., np.nan, np.inf, 0.1, 0.1],
+                        ['dog', None, 'cat', 'cat', None, 'dog', 'cat']]
+        for data, normalize, dropna in product(data_to_test, [False, True], [False, True]):
+            with self.subTest(series_data=data, normalize=normalize, dropna=dropna):
+                S = pd.Series(data)
+                # use sort_index() due to possible different order of values with the same counts in results
+                result_ref = test_impl(S, normalize, dropna).sort_index()
+                result = hpat_func(S, normalize, dropna).sort_index()
+                pd.testing.assert_series_equal(result, result_ref)
+
+    def test_series_value_counts_bins(self):
+        def test_impl(S, bins, sort):
+            return S.value_counts(bins=bins, sort=sort)
+
+        hpat_func = self.jit(test_impl)
+
+        data_to_test = [[1, 2, 3, 1, 1, 3, 10],
+                        [0.1, 3., np.nan, 3., 0.1, -3., np.nan, 0.1, 0.1],
+                        [5., 5., 5.]]
+        for data, bins in product(data_to_test, [1, 3, 4]):
+            with self.subTest(series_data=data, bins=bins):
+                S = pd.Series(data)
+                result_ref = test_impl(S, bins, False)
+                result = hpat_func(S, bins, False)
+                # pandas returns IntervalIndex, so right edges of the bins are compared
+                np.testing.assert_array_equal(result.values, result_ref.values)
+                np.testing.assert_allclose(result.index.values, result_ref.index.right.values)
+
+    def test_series_value_counts_bins_normalize(self):
+        def test_impl(S, bins, dropna):
+            return S.value_counts(normalize=True, sort=False, bins=bins, dropna=dropna)
+
+        hpat_func = self.jit(test_impl)
+
+        S = pd.Series([0.1, 3., np.nan, 3., 0.1, -3., np.nan, 0.1, 0.1, np.nan])
+        for bins, dropna in product([1, 3, 7], [False, True]):
+            with self.subTest(bins=bins, dropna=dropna):
+                result_ref = test_impl(S, bins, dropna)
+                result = hpat_func(S, bins, dropna)
+                # pandas returns IntervalIndex, so right edges of the bins are compared
+                np.testing.assert_allclose(result.values, result_ref.values)
+                np.testing.assert_allclose(result.index.values, result_ref.index.right.values)
+
+    def test_series_value_counts_long(self):
+        def test_impl(S):
+            return S.value_counts()
+
+        hpat_func = self.jit(test_impl)
+
+        n = 10 ** 5
+        rng = np.random.RandomState(0)
+        for data in [rng.randint(0, 1000, n), np.floor(rng.standard_normal(n) * 10)]:
+            with self.subTest(dtype=data.dtype):
+                S = pd.Series(data)
+                result_ref = test_impl(S).sort_index()
+                result = hpat_func(S).sort_index()
+                pd.testing.assert_series_equal(result, result_ref)
+
     def test_series_value_counts_no_unboxing(self):
         def test_impl():
             S = pd.Series([1, 2, 3, 1, 1, 3])
@@ -2478,6 +2583,18 @@ class TestSeries(
         s = pd.Series(['New_York', 'Lisbon', np.nan, 'Tokyo', 'Paris', None, 'Munich', None], index=idx)
         pd.testing.assert_series_equal(cfunc(s, width=13, fillchar='*'), test_impl(s, width=13, fillchar='*'))
 
+    def test_series_str_pad_non_ascii(self):
+        def test_impl(series, width, fillchar):
+            return (series.str.center(width, fillchar), series.str.ljust(width, fillchar),
+                    series.str.rjust(width, fillchar), series.str.zfill(width))
+
+        cfunc = self.jit(test_impl)
+        s = pd.Series(['Ünïcödé', '-12', None, '日本語', '', 'ascii', np.nan, '+ä'])
+        for width, fillchar in product([0, 4, 9, 10], ['*', 'ß', '語']):
+            with self.subTest(width=width, fillchar=fillchar):
+                for jit_result, ref_result in zip(cfunc(s, width, fillchar), test_impl(s, width, fillchar)):
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
     def test_series_str_endswith(self):
         def test_impl(series, pat):
             return series.str.endswith(pat)
@@ -34,6 +34,7 @@ from itertools import combinations, combinations_with_replacement, product
 from numba.core.config import IS_32BITS
 from numba.core.errors import TypingError
 
+from sdc.datatypes.series.expr import evaluate, lazy
 from sdc.tests.test_base import TestCase
 from sdc.tests.test_utils import (skip_numba_jit,
                                   _make_func_from_text,
@@ -81,7 +82,7 @@ class TestSeries_ops(TestCase):
                 with self.subTest(left=data_left, right=data_right, operator=operator):
                     S1 = pd.Series(data_left)
                     S2 = pd.Series(data_right)
-                    # check_dtype=False because SDC implementation always returns float64 Series
+                    # check_dtype=False because SDC implementation returns float64 Series for integer Series operands
                     pd.testing.assert_series_equal(hpat_func(S1, S2), test_impl(S1, S2), check_dtype=False)
 
     def test_series_operators_int_scalar(self):
@@ -108,7 +109,7 @@ class TestSeries_ops(TestCase):
                     right = abs(right)
 
                 with self.subTest(left=left, right=right, operator=operator):
-                    # check_dtype=False because SDC implementation always returns float64 Series
+                    # check_dtype=False because SDC implementation returns float64 Series for integer //, % and **
                     pd.testing.assert_series_equal(hpat_func(left, right), test_impl(left, right), check_dtype=False)
 
     def test_series_operators_float(self):
@@ -127,7 +128,6 @@ class TestSeries_ops(TestCase):
                 with self.subTest(left=data_left, right=data_right, operator=operator):
                     S1 = pd.Series(data_left)
                     S2 = pd.Series(data_right)
-                    # check_dtype=False because SDC implementation always returns float64 Series
                     pd.testing.assert_series_equal(hpat_func(S1, S2), test_impl(S1, S2), check_dtype=False)
 
     def test_series_operators_float_scalar(self):
@@ -150,6 +150,50 @@ class TestSeries_ops(TestCase):
                 with self.subTest(left=left, right=right, operator=operator):
                     pd.testing.assert_series_equal(hpat_func(S, scalar), test_impl(S, scalar), check_dtype=False)
 
+    def test_series_operators_result_dtype(self):
+        """Verifies Series arithmetic binary operators keep integer and float32 dtypes as pandas does"""
+        def test_impl(S):
+            return S + 3, 3 - S, S * 3, S / 3
+        hpat_func = self.jit(test_impl)
+
+        n = 11
+        for S in [pd.Series(np.arange(-5, -5 + n, dtype=np.int64) + 2 ** 53),
+                  pd.Series(np.arange(-5, -5 + n, dtype=np.int32)),
+                  pd.Series(np.arange(-5, -5 + n, dtype=np.float32))]:
+            with self.subTest(series=S):
+                for result, result_ref in zip(hpat_func(S), test_impl(S)):
+                    pd.testing.assert_series_equal(result, result_ref)
+
+        S = pd.Series(np.arange(-5, -5 + n, dtype=np.float32))
+        scalar = 0.5
+        for operator in ('+', '-', '*', '/'):
+            test_impl = _make_func_use_binop1(operator)
+            hpat_func = self.jit(test_impl)
+            with self.subTest(series=S, scalar=scalar, operator=operator):
+                pd.testing.assert_series_equal(hpat_func(S, scalar), test_impl(S, scalar))
+                pd.testing.assert_series_equal(hpat_func(scalar, S), test_impl(scalar, S))
+
+        test_impl = _make_func_use_binop1('+')
+        hpat_func = self.jit(test_impl)
+        S1 = pd.Series(np.arange(n, dtype=np.float32))
+        S2 = pd.Series(np.ones(n + 3, dtype=np.float32))
+        pd.testing.assert_series_equal(hpat_func(S1, S2), test_impl(S1, S2))
+
+    def test_series_operators_result_dtype_scalar_out_of_range(self):
+        """Verifies Series arithmetic binary operators upcast narrow integer dtypes for scalars not fitting into them"""
+        def test_impl_literal(S):
+            return S + 2 ** 40
+
+        def test_impl(S, scalar):
+            return S + scalar
+        hpat_func_literal = self.jit(test_impl_literal)
+        hpat_func = self.jit(test_impl)
+
+        n = 11
+        S = pd.Series(np.arange(-5, -5 + n, dtype=np.int32))
+        pd.testing.assert_series_equal(hpat_func_literal(S), test_impl_literal(S))
+        pd.testing.assert_series_equal(hpat_func(S, 2 ** 40), test_impl(S, 2 ** 40))
+
     @skip_numba_jit('Not implemented in new-pipeline yet')
     def test_series_operators_inplace(self):
         arithmetic_binops = ('+=', '-=', '*=', '/=', '//=', '%=', '**=')
@@ -280,6 +324,50 @@ class TestSeries_ops(TestCase):
         pd.testing.assert_series_equal(hpat_func(A, B), test_impl(A, B), check_dtype=False)
         # self.assertEqual(count_parfor_REPs(), 3)
 
+    def test_series_lazy_expr(self):
+        """Verifies chained operators on lazy Series expression computed by evaluate()"""
+        def test_impl(A, B, C, D, E):
+            return (evaluate((lazy(A) * B + C) / D),
+                    evaluate((lazy(A) * B + C) / D > E),
+                    evaluate(2 ** lazy(A) - 0.5 * B))
+        hpat_func = self.jit(test_impl)
+
+        n = 17
+        np.random.seed(0)
+        data = [np.arange(n, dtype=np.int32), np.random.ranf(n), np.random.ranf(n),
+                np.random.randint(1, 5, n), np.random.ranf(n)]
+        data[2][3] = np.nan
+        for index in [None, np.arange(n)[::-1]]:
+            A, B, C, D, E = [pd.Series(values, index=index) for values in data]
+            for other in [0.5, E]:
+                with self.subTest(index=index, other=other):
+                    for result, result_ref in zip(hpat_func(A, B, C, D, other), test_impl(A, B, C, D, other)):
+                        pd.testing.assert_series_equal(result, result_ref, check_dtype=False)
+
+    def test_series_lazy_expr_zero_division(self):
+        """Verifies division operators of lazy Series expression with zeros and NaNs in divisor"""
+        def test_impl(A, B):
+            return (evaluate(lazy(A) / B), evaluate(lazy(A) // B), evaluate(lazy(A) % B))
+        hpat_func = self.jit(test_impl)
+
+        A = pd.Series([1., -2., 0., np.nan, 3., 0., 5.])
+        B = pd.Series([0., 0., 0., 0., np.nan, np.nan, 2.])
+        for A_values, B_values in product([A, A.fillna(0).astype(np.int64)], [B, B.fillna(0).astype(np.int64)]):
+            with self.subTest(A=A_values.dtype, B=B_values.dtype):
+                for result, result_ref in zip(hpat_func(A_values, B_values), test_impl(A_values, B_values)):
+                    pd.testing.assert_series_equal(result, result_ref, check_dtype=False)
+
+    def test_series_lazy_expr_not_aligned(self):
+        def test_impl(A, B):
+            return evaluate(lazy(A) + B)
+        hpat_func = self.jit(test_impl)
+
+        A = pd.Series(np.arange(5), index=np.arange(5))
+        B = pd.Series(np.arange(5), index=np.arange(5)[::-1])
+        with self.assertRaises(ValueError) as raises:
+            hpat_func(A, B)
+        self.assertIn('Can only evaluate expressions of identically-labeled Series objects', str(raises.exception))
+
     def test_series_operator_add_numeric_scalar(self):
         """Verifies Series.operator.add implementation for numeric series and scalar second operand"""
         def test_impl(A, B):
@@ -434,6 +522,44 @@ class TestSeries_ops(TestCase):
         B = pd.Series(np.arange(3*n)**2, index=np.arange(0, 3*n, 1, dtype=np.float64))
         pd.testing.assert_series_equal(hpat_func(A, B), test_impl(A, B), check_dtype=False, check_names=False)
 
+    def test_series_operator_add_numeric_align_index_int_large(self):
+        """Verifies implementation of Series.operator.add between two numeric Series with large
+        shuffled integer indexes having duplicates and non-matching values"""
+        def test_impl(A, B):
+            return A + B
+        hpat_func = self.jit(test_impl)
+
+        n = 10000
+        np.random.seed(0)
+        index_A = np.random.randint(0, n // 2, n)
+        index_B = np.random.randint(n // 4, n, n // 2)
+        A = pd.Series(gen_frand_array(n), index=index_A)
+        B = pd.Series(gen_frand_array(n // 2), index=index_B)
+        pd.testing.assert_series_equal(hpat_func(A, B), test_impl(A, B), check_dtype=False, check_names=False)
+
+    def test_series_operator_add_numeric_align_index_sorted(self):
+        """Verifies implementation of Series.operator.add between two numeric Series with sorted non-equal indexes"""
+        def test_impl(A, B):
+            return A + B
+        hpat_func = self.jit(test_impl)
+
+        n = 1001
+        A = pd.Series(np.arange(n, dtype=np.float64), index=np.arange(n) // 3)
+        B = pd.Series(np.arange(n, dtype=np.float64) ** 2, index=np.arange(n) // 2 + 10)
+        pd.testing.assert_series_equal(hpat_func(A, B), test_impl(A, B), check_dtype=False, check_names=False)
+
+    def test_series_operator_add_numeric_align_index_single_nan(self):
+        """Verifies implementation of Series.operator.add between two numeric Series
+        with single element float indexes one of which is NaN"""
+        def test_impl(A, B):
+            return A + B
+        hpat_func = self.jit(test_impl)
+
+        A = pd.Series([1.], index=[np.nan])
+        B = pd.Series([2.], index=[1.])
+        pd.testing.assert_series_equal(hpat_func(A, B), test_impl(A, B), check_dtype=False, check_names=False)
+        pd.testing.assert_series_equal(hpat_func(B, A), test_impl(B, A), check_dtype=False, check_names=False)
+
     def test_series_operator_add_numeric_diff_series_sizes(self):
         """Verifies implementation of Series.operator.add between two numeric Series with different sizes"""
         def test_impl(A, B):
@@ -487,6 +613,20 @@ class TestSeries_ops(TestCase):
         B = pd.Series(['b', 'aa', '', 'b', 'o', None, 'oo'])
         pd.testing.assert_series_equal(hpat_func(A, B), test_impl(A, B), check_dtype=False, check_names=False)
 
+    def test_series_operator_add_str_different_size_default(self):
+        """Verifies implementation of Series.operator.add between two string Series
+        with default indexes and different sizes"""
+        def test_impl(A, B):
+            return A + B
+        hpat_func = self.jit(test_impl)
+
+        A = pd.Series(['a', '', 'ae', 'б', 'cccc', 'oo', None, 'ыы', 'z'])
+        B = pd.Series(['b', 'aa', '', 'bж', None, 'o'])
+        for left, right in [(A, B), (B, A)]:
+            with self.subTest(left=left, right=right):
+                pd.testing.assert_series_equal(hpat_func(left, right), test_impl(left, right),
+                                               check_dtype=False, check_names=False)
+
     def test_series_operator_add_str_align_index_int(self):
         """Verifies implementation of Series.operator.add between two string Series with non-equal integer indexes"""
         def test_impl(A, B):
@@ -515,7 +655,7 @@ class TestSeries_ops(TestCase):
             S1 = pd.Series(np.arange(n), name=left_name)
             S2 = pd.Series(np.arange(n, 0, -1), name=right_name)
             with self.subTest(left_series_name=left_name, right_series_name=right_name):
-                # check_dtype=False because SDC implementation always returns float64 Series
+                # check_dtype=False because SDC implementation returns float64 Series for integer Series operands
                 pd.testing.assert_series_equal(hpat_func(S1, S2), test_impl(S1, S2), check_dtype=False)
 
         # also verify case when second operator is scalar
@@ -537,7 +677,7 @@ class TestSeries_ops(TestCase):
         S2 = pd.Series(np.arange(n, 0, -1), name='A')
         result = hpat_func(S1, S2)
         result_ref = test_impl(S1, S2)
-        # check_dtype=False because SDC implementation always returns float64 Series
+        # check_dtype=False because SDC implementation returns float64 Series for integer Series operands
         pd.testing.assert_series_equal(result, result_ref, check_dtype=False)
 
     @unittest.expectedFailure
@@ -57,6 +57,8 @@ def gen_arr_of_dtype(data_length, dtype='float', random=True, limits=None, nuniq
 
     if dtype == 'float':
         return np.random.ranf(data_length)
+    if dtype == 'float32':
+        return np.random.ranf(data_length).astype(dtype)
     if dtype == 'int':
         default_limits = (np.iinfo(dtype).min, np.iinfo(dtype).max)
         min_value, max_value = limits or default_limits
@@ -29,6 +29,8 @@ import numpy as np
 import time
 import random
 
+from functools import partial
+
 import sdc
 
 from .test_perf_base import TestBase
@@ -84,6 +86,13 @@ cases = [
     TC(name='operator.pow', size=[10 ** 7], call_expr='A ** B', usecase_params='A, B', data_num=2),
     TC(name='operator.sub', size=[10 ** 7], call_expr='A - B', usecase_params='A, B', data_num=2),
     TC(name='operator.truediv', size=[10 ** 7], call_expr='A / B', usecase_params='A, B', data_num=2),
+    TC(name='operator.add_float32', size=[10 ** 7], call_expr='A + B', usecase_params='A, B',
+       data_gens=(partial(gen_series, dtype='float32'), partial(gen_series, dtype='float32')),
+       input_data=[None, None]),
+    TC(name='operator.mul_float32_scalar', size=[10 ** 7], call_expr='A * 2.0', usecase_params='A',
+       data_gens=(partial(gen_series, dtype='float32'), ), input_data=[None]),
+    TC(name='operator.mul_int_scalar', size=[10 ** 7], call_expr='A * 2', usecase_params='A',
+       data_gens=(partial(gen_series, dtype='int', limits=(-1000, 1000)), ), input_data=[None]),
 ]
 
 generate_test_cases(cases, TestSeriesOperatorMethods, 'series')
@@ -0,0 +1,136 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+import itertools
+
+import numpy as np
+
+from sdc.tests.test_utils import test_global_input_data_unicode_kind4
+from sdc.tests.tests_perf.test_perf_base import TestBase
+from sdc.tests.tests_perf.test_perf_utils import TestResultsStr
+from .data_generator import gen_series_fixed_str
+
+
+def usecase_box_unbox(S):
+    return S
+
+
+def usecase_copy(S):
+    return S.copy()
+
+
+def usecase_getitem_slice(S):
+    return S[1:-1]
+
+
+def usecase_str_len(S):
+    return S.str.len()
+
+
+def usecase_build_offsets(lengths):
+    offsets = np.empty(len(lengths) + 1, lengths.dtype)
+    offsets[0] = 0
+    for i in range(len(lengths)):
+        offsets[i + 1] = offsets[i] + lengths[i]
+    return offsets
+
+
+def usecase_copy_offsets(offsets):
+    return offsets.copy()
+
+
+# python -m sdc.runtests sdc.tests.tests_perf.test_perf_str_arr.TestStringArray
+class TestStringArray(TestBase):
+    """
+    Measures StringArray operations which touch offsets of every string (unboxing/boxing, copying, slicing).
+    StringArray offsets are 64-bit, 32-bit offsets are used as the baseline: memory of both is logged
+    for every data width and building/copying offsets arrays of both types is timed.
+    """
+    iter_number = 5
+    results_class = TestResultsStr
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.width = [4, 16, 64, 512]
+
+    def _test_case(self, pyfunc, name, total_data_length, data_widths=None):
+        test_name = 'StringArray.{}'.format(name)
+
+        for data_length, data_width in itertools.product(total_data_length, data_widths or self.width):
+            base = {
+                "test_name": test_name,
+                "data_size": data_length,
+                "data_width": data_width,
+            }
+
+            args = gen_series_fixed_str(1, data_length, test_global_input_data_unicode_kind4, data_width)
+            data_bytes = sum(len(s.encode('utf8')) for s in args[0])
+            for offset_dtype in [np.uint32, np.uint64]:
+                offsets_bytes = (data_length + 1) * np.dtype(offset_dtype).itemsize
+                self.test_results.logger.info('%s width=%d: %s offsets %d bytes (%.1f%% of StringArray memory)',
+                                              test_name, data_width, np.dtype(offset_dtype).name, offsets_bytes,
+                                              100. * offsets_bytes / (offsets_bytes + data_bytes))
+
+            self._test_jit(pyfunc, base, *args)
+            self._test_py(pyfunc, base, *args)
+
+    def test_str_arr_box_unbox(self):
+        self._test_case(usecase_box_unbox, 'box_unbox', [10 ** 6])
+
+    def test_str_arr_copy(self):
+        self._test_case(usecase_copy, 'copy', [10 ** 6])
+
+    def test_str_arr_getitem_slice(self):
+        self._test_case(usecase_getitem_slice, 'getitem_slice', [10 ** 6])
+
+    def test_str_arr_str_len(self):
+        self._test_case(usecase_str_len, 'str_len', [10 ** 6])
+
+    def test_str_arr_box_unbox_large_offsets(self):
+        # total data length exceeds 2 ** 32 chars, so offsets do not fit 32-bit integers
+        self._test_case(usecase_box_unbox, 'box_unbox_large_offsets', [2 ** 22], [1100])
+
+    def test_str_arr_copy_large_offsets(self):
+        self._test_case(usecase_copy, 'copy_large_offsets', [2 ** 22], [1100])
+
+    def _test_offsets_case(self, pyfunc, name, total_data_length, make_arg):
+        offset_dtypes = [np.uint32, np.uint64]
+        for data_length, data_width, offset_dtype in itertools.product(total_data_length, self.width, offset_dtypes):
+            base = {
+                "test_name": 'StringArray.{}_{}'.format(name, np.dtype(offset_dtype).name),
+                "data_size": data_length,
+                "data_width": data_width,
+            }
+
+            lengths = np.full(data_length, data_width, dtype=offset_dtype)
+            self._test_jit(pyfunc, base, make_arg(lengths))
+
+    def test_str_arr_build_offsets(self):
+        self._test_offsets_case(usecase_build_offsets, 'build_offsets', [10 ** 6], lambda lengths: lengths)
+
+    def test_str_arr_copy_offsets(self):
+        self._test_offsets_case(usecase_copy_offsets, 'copy_offsets', [10 ** 6], usecase_build_offsets)
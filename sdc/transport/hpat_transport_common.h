@@ -0,0 +1,288 @@
+//*****************************************************************************
+// Copyright (c) 2019-2020, Intel Corporation All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+//    Redistributions of source code must retain the above copyright notice,
+//    this list of conditions and the following disclaimer.
+//
+//    Redistributions in binary form must reproduce the above copyright notice,
+//    this list of conditions and the following disclaimer in the documentation
+//    and/or other materials provided with the distribution.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+// OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+// WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+// OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+// EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//*****************************************************************************
+
+// Functions shared by transports which do not depend on the way processes communicate
+
+#ifndef SDC_TRANSPORT_COMMON_H_
+#define SDC_TRANSPORT_COMMON_H_
+
+#include <algorithm>
+#include <cstring>
+#include <fstream>
+#include <iostream>
+#include <stdexcept>
+#include <vector>
+
+#ifdef _WIN32 // MSC_VER
+#include <Windows.h>
+
+// no gettimeofday on Win32/Win64
+int gettimeofday(struct timeval* tp, void* tzp)
+{
+    static const uint64_t EPOCH = ((uint64_t)116444736000000000ULL);
+
+    SYSTEMTIME nSystemTime;
+    FILETIME nFileTime;
+    uint64_t nTime;
+
+    GetSystemTime(&nSystemTime);
+    SystemTimeToFileTime(&nSystemTime, &nFileTime);
+    nTime = ((uint64_t)nFileTime.dwLowDateTime);
+    nTime += ((uint64_t)nFileTime.dwHighDateTime) << 32;
+
+    tp->tv_sec = (long)((nTime - EPOCH) / 10000000L);
+    tp->tv_usec = (long)(nSystemTime.wMilliseconds * 1000);
+    return 0;
+}
+#else
+#include <sys/time.h>
+#endif // _WIN32
+
+#include "../_hpat_common.h"
+
+using namespace std;
+
+typedef int MPI_Request;
+#define MPI_REQUEST_NULL ((MPI_Request)0x2c000000)
+
+static size_t get_type_size_bytes(int typ_enum)
+{
+    switch (typ_enum)
+    {
+    case SDC_CTypes::INT8:
+    case SDC_CTypes::UINT8:
+    {
+        return 1;
+    }
+    case SDC_CTypes::INT16:
+    case SDC_CTypes::UINT16:
+    {
+        return 2;
+    }
+    case SDC_CTypes::INT32:
+    case SDC_CTypes::UINT32:
+    case SDC_CTypes::FLOAT32:
+    {
+        return 4;
+    }
+    case SDC_CTypes::INT64:
+    case SDC_CTypes::UINT64:
+    case SDC_CTypes::FLOAT64:
+    {
+        return 8;
+    }
+    default:
+    {
+        throw out_of_range("Invalid data type in transport::get_type_size_bytes()");
+    }
+    }
+
+    return 0;
+}
+
+static MPI_Request* comm_req_alloc(int size)
+{
+    return new MPI_Request[size];
+}
+
+static void comm_req_dealloc(MPI_Request* req_arr)
+{
+    delete[] req_arr;
+}
+
+static void file_write_parallel(char* file_name, char* buff, int64_t start, int64_t count, int64_t elem_size)
+{
+    // the file is not truncated since other parts of it can be written concurrently
+    fstream user_file(file_name, ios::binary | ios::in | ios::out);
+    if (!user_file.good())
+    {
+        user_file.open(file_name, ios::binary | ios::out);
+    }
+    if (!user_file.good())
+    {
+        throw runtime_error(__FUNCTION__ + string(": Could not open file: ") + file_name);
+    }
+
+    user_file.seekp(start * elem_size);
+    user_file.write(buff, count * elem_size);
+
+    user_file.close();
+}
+
+static uint64_t get_file_size(const char* file_name)
+{
+    ifstream user_file(file_name, ifstream::binary);
+    if (!user_file.good())
+    {
+        throw runtime_error(__FUNCTION__ + string(": Could not open file: ") + file_name);
+    }
+
+    user_file.seekg(0, ios::beg);
+    const iostream::pos_type begin = user_file.tellg();
+    user_file.seekg(0, ios::end);
+    const iostream::pos_type end = user_file.tellg();
+
+    user_file.close();
+
+    if ((begin < 0) || (end < 0))
+    {
+        throw runtime_error(__FUNCTION__ + string(": Could not read from file: ") + file_name);
+    }
+
+    return end - begin;
+}
+
+static double hpat_dist_get_time()
+{
+    timeval result;
+    gettimeofday(&result, nullptr);
+    double sec = result.tv_sec;
+    double usec = result.tv_usec;
+
+    return sec + (usec / 1E6);
+}
+
+/// return vector of offsets of newlines in first n bytes of given stream
+static vector<size_t> count_lines(istream* f, size_t n)
+{
+    vector<size_t> pos;
+    char c;
+    size_t i = 0;
+
+    while (i < n && f->get(c))
+    {
+        if (c == '\n')
+        {
+            pos.push_back(i);
+        }
+        ++i;
+    }
+
+    if (i < n)
+    {
+        cerr << "Warning, read only " << i << " bytes out of " << n << "requested\n";
+    }
+
+    return pos;
+}
+
+static void hpat_mpi_csv_get_offsets(
+    istream* f, size_t fsz, bool is_parallel, int64_t skiprows, int64_t nrows, size_t& my_off_start, size_t& my_off_end)
+{
+    if (skiprows > 0 || nrows != -1)
+    {
+        vector<size_t> line_offset = count_lines(f, fsz);
+
+        if (skiprows > 0)
+        {
+            my_off_start = line_offset[skiprows - 1] + 1;
+        }
+
+        if (nrows != -1)
+        {
+            my_off_end = line_offset[nrows - 1] + 1;
+        }
+    }
+
+    return;
+}
+
+static size_t get_mpi_req_num_bytes()
+{
+    return sizeof(MPI_Request);
+}
+
+template <typename T>
+void get_nth(void* result_out, void* data_in, int64_t size, int64_t k)
+{
+    T* result = reinterpret_cast<T*>(result_out);
+    const T* data = reinterpret_cast<T*>(data_in);
+
+    vector<T> my_array(data, data + size);
+
+    nth_element(my_array.begin(), my_array.begin() + k, my_array.end());
+
+    *result = my_array.at(k);
+}
+
+static void nth_sequential(void* res, void* data, int64_t local_size, int64_t k, int type_enum)
+{
+    switch (type_enum)
+    {
+    case SDC_CTypes::INT8:
+    {
+        get_nth<char>(res, data, local_size, k);
+        break;
+    }
+    case SDC_CTypes::UINT8:
+    {
+        get_nth<unsigned char>(res, data, local_size, k);
+        break;
+    }
+    case SDC_CTypes::INT32:
+    {
+        get_nth<int>(res, data, local_size, k);
+        break;
+    }
+    case SDC_CTypes::UINT32:
+    {
+        get_nth<uint32_t>(res, data, local_size, k);
+        break;
+    }
+    case SDC_CTypes::INT64:
+    {
+        get_nth<int64_t>(res, data, local_size, k);
+        break;
+    }
+    case SDC_CTypes::UINT64:
+    {
+        get_nth<uint64_t>(res, data, local_size, k);
+        break;
+    }
+    case SDC_CTypes::FLOAT32:
+    {
+        get_nth<float>(res, data, local_size, k);
+        break;
+    }
+    case SDC_CTypes::FLOAT64:
+    {
+        get_nth<double>(res, data, local_size, k);
+        break;
+    }
+    default:
+    {
+        throw out_of_range("Invalid data type in transport::nth_sequential()");
+    }
+    }
+}
+
+static void req_array_setitem(MPI_Request* req_arr, int64_t ind, MPI_Request req)
+{
+    req_arr[ind] = req;
+    return;
+}
+
+#endif /* SDC_TRANSPORT_COMMON_H_ */
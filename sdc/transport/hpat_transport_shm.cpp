@@ -0,0 +1,819 @@
+//*****************************************************************************
+// Copyright (c) 2020, Intel Corporation All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+//    Redistributions of source code must retain the above copyright notice,
+//    this list of conditions and the following disclaimer.
+//
+//    Redistributions in binary form must reproduce the above copyright notice,
+//    this list of conditions and the following disclaimer in the documentation
+//    and/or other materials provided with the distribution.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+// OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+// WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+// OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+// EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//*****************************************************************************
+
+// Transport for processes of one machine started with "python -m sdc.launch".
+// The launcher creates a POSIX shared memory segment consisting of a header with a process-shared barrier,
+// a small slot per process for scalars and a data slot of the same capacity per process.
+// Every process maps the whole segment, so a collective operation is done by each process copying its data
+// to its own slot and other processes copying it from there directly into their buffers, without
+// serialization and with no other intermediate copies. Data larger than a slot is exchanged in several rounds.
+
+#include <Python.h>
+
+#include <fcntl.h>
+#include <pthread.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include "../_distributed.h"
+#include "hpat_transport_common.h"
+
+#define SHM_MAGIC 0x53444353484d3031ULL
+#define SHM_ALIGN 64
+#define SHM_SCALAR_BYTES 64
+#define SHM_LOCAL_CAPACITY (1 << 20)
+
+struct shm_header
+{
+    uint64_t magic;
+    int64_t size;
+    int64_t slot_capacity;
+    pthread_barrier_t barrier;
+};
+
+// values reduced by argmin/argmax have the layout of Numba IndexValue
+template <typename T>
+struct IndexValue
+{
+    int64_t index;
+    T value;
+};
+
+static char* shm_world = nullptr;
+static int shm_rank = 0;
+static int shm_size = 1;
+static int64_t shm_capacity = 0;
+
+static int64_t shm_align(int64_t n)
+{
+    return (n + SHM_ALIGN - 1) / SHM_ALIGN * SHM_ALIGN;
+}
+
+static int64_t shm_scalars_offset()
+{
+    return shm_align(sizeof(shm_header));
+}
+
+static int64_t shm_slots_offset(int64_t size)
+{
+    return shm_scalars_offset() + size * SHM_SCALAR_BYTES;
+}
+
+static int64_t shm_total_bytes(int64_t size, int64_t capacity)
+{
+    return shm_slots_offset(size) + size * capacity;
+}
+
+static shm_header* shm_get_header()
+{
+    return reinterpret_cast<shm_header*>(shm_world);
+}
+
+static char* shm_scalar(int rank)
+{
+    return shm_world + shm_scalars_offset() + rank * SHM_SCALAR_BYTES;
+}
+
+static char* shm_slot(int rank)
+{
+    return shm_world + shm_slots_offset(shm_size) + rank * shm_capacity;
+}
+
+static void shm_barrier()
+{
+    pthread_barrier_wait(&shm_get_header()->barrier);
+}
+
+/// number of bytes of the chunk starting at offset in data of total bytes
+static int64_t shm_chunk_bytes(int64_t total, int64_t offset, int64_t chunk)
+{
+    return max<int64_t>(0, min(chunk, total - offset));
+}
+
+static int shm_init_header(char* world, int64_t size, int64_t capacity, int pshared)
+{
+    shm_header* header = reinterpret_cast<shm_header*>(world);
+    pthread_barrierattr_t attr;
+    pthread_barrierattr_init(&attr);
+    pthread_barrierattr_setpshared(&attr, pshared);
+    int err = pthread_barrier_init(&header->barrier, &attr, size);
+    pthread_barrierattr_destroy(&attr);
+    if (err != 0)
+    {
+        return -1;
+    }
+
+    header->size = size;
+    header->slot_capacity = capacity;
+    header->magic = SHM_MAGIC;
+
+    return 0;
+}
+
+/// creates the segment used by size processes, called by the launcher before starting them
+static int shm_world_create(const char* name, int size, int64_t capacity)
+{
+    capacity = shm_align(max<int64_t>(capacity, size * SHM_ALIGN));
+    int fd = shm_open(name, O_CREAT | O_EXCL | O_RDWR, 0600);
+    if (fd < 0)
+    {
+        return -1;
+    }
+
+    int64_t total = shm_total_bytes(size, capacity);
+    if (ftruncate(fd, total) != 0)
+    {
+        close(fd);
+        shm_unlink(name);
+        return -1;
+    }
+
+    void* addr = mmap(nullptr, total, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+    close(fd);
+    if (addr == MAP_FAILED)
+    {
+        shm_unlink(name);
+        return -1;
+    }
+
+    int err = shm_init_header(reinterpret_cast<char*>(addr), size, capacity, PTHREAD_PROCESS_SHARED);
+    munmap(addr, total);
+    if (err != 0)
+    {
+        shm_unlink(name);
+    }
+
+    return err;
+}
+
+static int shm_world_destroy(const char* name)
+{
+    return shm_unlink(name);
+}
+
+/// maps the segment created by the launcher or allocates a private one for a single process
+static bool shm_attach()
+{
+    const char* name = getenv("SDC_SHM_NAME");
+    const char* rank = getenv("SDC_SHM_RANK");
+    if (name == nullptr || rank == nullptr)
+    {
+        char* world = reinterpret_cast<char*>(calloc(shm_total_bytes(1, SHM_LOCAL_CAPACITY), 1));
+        if (world == nullptr || shm_init_header(world, 1, SHM_LOCAL_CAPACITY, PTHREAD_PROCESS_PRIVATE) != 0)
+        {
+            PyErr_SetString(PyExc_RuntimeError, "transport_shm: could not initialize transport");
+            return false;
+        }
+        shm_world = world;
+        shm_capacity = SHM_LOCAL_CAPACITY;
+        return true;
+    }
+
+    int fd = shm_open(name, O_RDWR, 0600);
+    struct stat st;
+    if (fd < 0 || fstat(fd, &st) != 0 || st.st_size < shm_scalars_offset())
+    {
+        if (fd >= 0)
+        {
+            close(fd);
+        }
+        PyErr_Format(PyExc_RuntimeError, "transport_shm: could not open shared memory segment %s", name);
+        return false;
+    }
+
+    void* addr = mmap(nullptr, st.st_size, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+    close(fd);
+    if (addr == MAP_FAILED)
+    {
+        PyErr_Format(PyExc_RuntimeError, "transport_shm: could not map shared memory segment %s", name);
+        return false;
+    }
+
+    shm_world = reinterpret_cast<char*>(addr);
+    shm_header* header = shm_get_header();
+    shm_rank = atoi(rank);
+    if (header->magic != SHM_MAGIC || shm_rank < 0 || shm_rank >= header->size ||
+        st.st_size < shm_total_bytes(header->size, header->slot_capacity))
+    {
+        PyErr_Format(PyExc_RuntimeError, "transport_shm: invalid shared memory segment %s or rank %s", name, rank);
+        munmap(addr, st.st_size);
+        shm_world = nullptr;
+        return false;
+    }
+
+    shm_size = header->size;
+    shm_capacity = header->slot_capacity;
+
+    return true;
+}
+
+static int64_t shm_allreduce_max(int64_t value)
+{
+    memcpy(shm_scalar(shm_rank), &value, sizeof(value));
+    shm_barrier();
+    int64_t result = value;
+    for (int rank = 0; rank < shm_size; ++rank)
+    {
+        result = max(result, *reinterpret_cast<int64_t*>(shm_scalar(rank)));
+    }
+    shm_barrier();
+
+    return result;
+}
+
+static void shm_alltoallv_bytes(const char* send_data,
+                                char* recv_data,
+                                const vector<int64_t>& send_bytes,
+                                const vector<int64_t>& send_offsets,
+                                const vector<int64_t>& recv_bytes,
+                                const vector<int64_t>& recv_offsets)
+{
+    memcpy(recv_data + recv_offsets[shm_rank],
+           send_data + send_offsets[shm_rank],
+           min(send_bytes[shm_rank], recv_bytes[shm_rank]));
+
+    int64_t max_bytes = 0;
+    for (int rank = 0; rank < shm_size; ++rank)
+    {
+        if (rank != shm_rank)
+        {
+            max_bytes = max(max_bytes, send_bytes[rank]);
+        }
+    }
+    max_bytes = shm_allreduce_max(max_bytes);
+
+    // the slot of each process is divided into parts for each receiver
+    int64_t part = shm_capacity / shm_size;
+    char* my_slot = shm_slot(shm_rank);
+    for (int64_t offset = 0; offset < max_bytes; offset += part)
+    {
+        for (int rank = 0; rank < shm_size; ++rank)
+        {
+            if (rank != shm_rank)
+            {
+                memcpy(my_slot + rank * part,
+                       send_data + send_offsets[rank] + offset,
+                       shm_chunk_bytes(send_bytes[rank], offset, part));
+            }
+        }
+        shm_barrier();
+        for (int rank = 0; rank < shm_size; ++rank)
+        {
+            if (rank != shm_rank)
+            {
+                memcpy(recv_data + recv_offsets[rank] + offset,
+                       shm_slot(rank) + shm_rank * part,
+                       shm_chunk_bytes(recv_bytes[rank], offset, part));
+            }
+        }
+        shm_barrier();
+    }
+}
+
+template <typename T>
+static void reduce_typed(char* result_ptr, const char* values_ptr, int64_t count, int op_enum)
+{
+    T* result = reinterpret_cast<T*>(result_ptr);
+    const T* values = reinterpret_cast<const T*>(values_ptr);
+
+    switch (op_enum)
+    {
+    case SDC_ReduceOps::SUM:
+    {
+        for (int64_t i = 0; i < count; ++i)
+        {
+            result[i] += values[i];
+        }
+        break;
+    }
+    case SDC_ReduceOps::PROD:
+    {
+        for (int64_t i = 0; i < count; ++i)
+        {
+            result[i] *= values[i];
+        }
+        break;
+    }
+    case SDC_ReduceOps::MIN:
+    {
+        for (int64_t i = 0; i < count; ++i)
+        {
+            result[i] = min(result[i], values[i]);
+        }
+        break;
+    }
+    case SDC_ReduceOps::MAX:
+    {
+        for (int64_t i = 0; i < count; ++i)
+        {
+            result[i] = max(result[i], values[i]);
+        }
+        break;
+    }
+    case SDC_ReduceOps::OR:
+    {
+        for (int64_t i = 0; i < count; ++i)
+        {
+            result[i] = result[i] || values[i];
+        }
+        break;
+    }
+    case SDC_ReduceOps::ARGMIN:
+    case SDC_ReduceOps::ARGMAX:
+    {
+        IndexValue<T>* result_iv = reinterpret_cast<IndexValue<T>*>(result_ptr);
+        const IndexValue<T>* values_iv = reinterpret_cast<const IndexValue<T>*>(values_ptr);
+        for (int64_t i = 0; i < count; ++i)
+        {
+            const T& res = result_iv[i].value;
+            const T& val = values_iv[i].value;
+            bool better = op_enum == SDC_ReduceOps::ARGMIN ? val < res : res < val;
+            // the first position is taken for equal values as in a sequential argmin/argmax
+            if (better || (val == res && values_iv[i].index < result_iv[i].index))
+            {
+                result_iv[i] = values_iv[i];
+            }
+        }
+        break;
+    }
+    default:
+    {
+        throw out_of_range("Invalid reduce operation in transport_shm::reduce_typed()");
+    }
+    }
+}
+
+/// reduces count values of type type_enum into result, values are IndexValue structs for argmin/argmax
+static void reduce_values(char* result, const char* values, int64_t count, int op_enum, int type_enum)
+{
+    switch (type_enum)
+    {
+    case SDC_CTypes::INT8:
+    {
+        reduce_typed<int8_t>(result, values, count, op_enum);
+        break;
+    }
+    case SDC_CTypes::UINT8:
+    {
+        reduce_typed<uint8_t>(result, values, count, op_enum);
+        break;
+    }
+    case SDC_CTypes::INT16:
+    {
+        reduce_typed<int16_t>(result, values, count, op_enum);
+        break;
+    }
+    case SDC_CTypes::UINT16:
+    {
+        reduce_typed<uint16_t>(result, values, count, op_enum);
+        break;
+    }
+    case SDC_CTypes::INT32:
+    {
+        reduce_typed<int32_t>(result, values, count, op_enum);
+        break;
+    }
+    case SDC_CTypes::UINT32:
+    {
+        reduce_typed<uint32_t>(result, values, count, op_enum);
+        break;
+    }
+    case SDC_CTypes::INT64:
+    {
+        reduce_typed<int64_t>(result, values, count, op_enum);
+        break;
+    }
+    case SDC_CTypes::UINT64:
+    {
+        reduce_typed<uint64_t>(result, values, count, op_enum);
+        break;
+    }
+    case SDC_CTypes::FLOAT32:
+    {
+        reduce_typed<float>(result, values, count, op_enum);
+        break;
+    }
+    case SDC_CTypes::FLOAT64:
+    {
+        reduce_typed<double>(result, values, count, op_enum);
+        break;
+    }
+    default:
+    {
+        throw out_of_range("Invalid data type in transport_shm::reduce_values()");
+    }
+    }
+}
+
+template <typename T>
+static T shm_exscan(T value)
+{
+    memcpy(shm_scalar(shm_rank), &value, sizeof(value));
+    shm_barrier();
+    T result = 0;
+    for (int rank = 0; rank < shm_rank; ++rank)
+    {
+        result += *reinterpret_cast<T*>(shm_scalar(rank));
+    }
+    shm_barrier();
+
+    return result;
+}
+
+static void allgather(void* out_data, int size, void* in_data, int type_enum)
+{
+    int64_t bytes = size * get_type_size_bytes(type_enum);
+    char* out = reinterpret_cast<char*>(out_data);
+    for (int64_t offset = 0; offset < bytes; offset += shm_capacity)
+    {
+        int64_t chunk = shm_chunk_bytes(bytes, offset, shm_capacity);
+        memcpy(shm_slot(shm_rank), reinterpret_cast<char*>(in_data) + offset, chunk);
+        shm_barrier();
+        for (int rank = 0; rank < shm_size; ++rank)
+        {
+            memcpy(out + rank * bytes + offset, shm_slot(rank), chunk);
+        }
+        shm_barrier();
+    }
+}
+
+static void c_alltoall(void* send_data, void* recv_data, int count, int typ_enum)
+{
+    int64_t bytes = count * get_type_size_bytes(typ_enum);
+    vector<int64_t> counts(shm_size, bytes);
+    vector<int64_t> offsets(shm_size);
+    for (int rank = 0; rank < shm_size; ++rank)
+    {
+        offsets[rank] = rank * bytes;
+    }
+
+    shm_alltoallv_bytes(
+        reinterpret_cast<char*>(send_data), reinterpret_cast<char*>(recv_data), counts, offsets, counts, offsets);
+}
+
+static void c_alltoallv(
+    void* send_data, void* recv_data, int* send_counts, int* recv_counts, int* send_disp, int* recv_disp, int typ_enum)
+{
+    int64_t type_size_bytes = get_type_size_bytes(typ_enum);
+    vector<int64_t> send_bytes(shm_size), send_offsets(shm_size), recv_bytes(shm_size), recv_offsets(shm_size);
+    for (int rank = 0; rank < shm_size; ++rank)
+    {
+        send_bytes[rank] = send_counts[rank] * type_size_bytes;
+        send_offsets[rank] = send_disp[rank] * type_size_bytes;
+        recv_bytes[rank] = recv_counts[rank] * type_size_bytes;
+        recv_offsets[rank] = recv_disp[rank] * type_size_bytes;
+    }
+
+    shm_alltoallv_bytes(reinterpret_cast<char*>(send_data),
+                        reinterpret_cast<char*>(recv_data),
+                        send_bytes,
+                        send_offsets,
+                        recv_bytes,
+                        recv_offsets);
+}
+
+static void c_bcast(void* send_data, int sendcount, int typ_enum)
+{
+    int64_t bytes = sendcount * get_type_size_bytes(typ_enum);
+    char* data = reinterpret_cast<char*>(send_data);
+    for (int64_t offset = 0; offset < bytes; offset += shm_capacity)
+    {
+        int64_t chunk = shm_chunk_bytes(bytes, offset, shm_capacity);
+        if (shm_rank == ROOT_PE)
+        {
+            memcpy(shm_slot(ROOT_PE), data + offset, chunk);
+        }
+        shm_barrier();
+        if (shm_rank != ROOT_PE)
+        {
+            memcpy(data + offset, shm_slot(ROOT_PE), chunk);
+        }
+        shm_barrier();
+    }
+}
+
+static void c_gather_scalar(void* send_data, void* recv_data, int typ_enum)
+{
+    size_t type_size_bytes = get_type_size_bytes(typ_enum);
+    memcpy(shm_scalar(shm_rank), send_data, type_size_bytes);
+    shm_barrier();
+    if (shm_rank == ROOT_PE)
+    {
+        for (int rank = 0; rank < shm_size; ++rank)
+        {
+            memcpy(reinterpret_cast<char*>(recv_data) + rank * type_size_bytes, shm_scalar(rank), type_size_bytes);
+        }
+    }
+    shm_barrier();
+}
+
+static void c_gatherv(void* send_data, int sendcount, void* recv_data, int* recv_counts, int* displs, int typ_enum)
+{
+    int64_t type_size_bytes = get_type_size_bytes(typ_enum);
+    int64_t bytes = sendcount * type_size_bytes;
+    char* send = reinterpret_cast<char*>(send_data);
+    char* recv = reinterpret_cast<char*>(recv_data);
+    if (shm_rank == ROOT_PE)
+    {
+        memcpy(recv + displs[ROOT_PE] * type_size_bytes, send, min(bytes, recv_counts[ROOT_PE] * type_size_bytes));
+    }
+
+    int64_t max_bytes = shm_allreduce_max(shm_rank == ROOT_PE ? 0 : bytes);
+    for (int64_t offset = 0; offset < max_bytes; offset += shm_capacity)
+    {
+        if (shm_rank != ROOT_PE)
+        {
+            memcpy(shm_slot(shm_rank), send + offset, shm_chunk_bytes(bytes, offset, shm_capacity));
+        }
+        shm_barrier();
+        if (shm_rank == ROOT_PE)
+        {
+            for (int rank = 0; rank < shm_size; ++rank)
+            {
+                if (rank != ROOT_PE)
+                {
+                    memcpy(recv + displs[rank] * type_size_bytes + offset,
+                           shm_slot(rank),
+                           shm_chunk_bytes(recv_counts[rank] * type_size_bytes, offset, shm_capacity));
+                }
+            }
+        }
+        shm_barrier();
+    }
+}
+
+static void file_read_parallel(char* file_name, char* buff, int64_t start, int64_t count)
+{
+    ifstream user_file(file_name, ios::binary);
+    if (!user_file.good())
+    {
+        throw runtime_error(__FUNCTION__ + string(": Could not open file: ") + file_name);
+    }
+
+    user_file.seekg(start);
+    user_file.read(buff, count);
+    if (user_file.gcount() != count)
+    {
+        throw runtime_error(__FUNCTION__ + string(": Could not read from file: ") + file_name);
+    }
+}
+
+static int64_t get_join_sendrecv_counts(int** p_send_counts,
+                                        int** p_recv_counts,
+                                        int** p_send_disp,
+                                        int** p_recv_disp,
+                                        int64_t arr_len,
+                                        int type_enum,
+                                        void* data)
+{
+    throw runtime_error(__FUNCTION__ + string(": Is not implemented"));
+}
+
+static int hpat_barrier()
+{
+    shm_barrier();
+    return 0;
+}
+
+static int hpat_dist_arr_reduce(void* out, int64_t* shapes, int ndims, int op_enum, int type_enum)
+{
+    if (op_enum == SDC_ReduceOps::ARGMIN || op_enum == SDC_ReduceOps::ARGMAX)
+    {
+        throw runtime_error(__FUNCTION__ + string(": argmin/argmax are not supported for arrays"));
+    }
+
+    int64_t type_size_bytes = get_type_size_bytes(type_enum);
+    int64_t count = 1;
+    for (int i = 0; i < ndims; ++i)
+    {
+        count *= shapes[i];
+    }
+
+    // every process reduces the slots in the same order to get equal results
+    int64_t bytes = count * type_size_bytes;
+    int64_t chunk_capacity = shm_capacity / type_size_bytes * type_size_bytes;
+    char* data = reinterpret_cast<char*>(out);
+    for (int64_t offset = 0; offset < bytes; offset += chunk_capacity)
+    {
+        int64_t chunk = shm_chunk_bytes(bytes, offset, chunk_capacity);
+        memcpy(shm_slot(shm_rank), data + offset, chunk);
+        shm_barrier();
+        memcpy(data + offset, shm_slot(0), chunk);
+        for (int rank = 1; rank < shm_size; ++rank)
+        {
+            reduce_values(data + offset, shm_slot(rank), chunk / type_size_bytes, op_enum, type_enum);
+        }
+        shm_barrier();
+    }
+
+    return 0;
+}
+
+static float hpat_dist_exscan_f4(float value)
+{
+    return shm_exscan(value);
+}
+
+static double hpat_dist_exscan_f8(double value)
+{
+    return shm_exscan(value);
+}
+
+static int hpat_dist_exscan_i4(int value)
+{
+    return shm_exscan(value);
+}
+
+static int64_t hpat_dist_exscan_i8(int64_t value)
+{
+    return shm_exscan(value);
+}
+
+static int hpat_dist_get_rank()
+{
+    return shm_rank;
+}
+
+static int hpat_dist_get_size()
+{
+    return shm_size;
+}
+
+static MPI_Request hpat_dist_irecv(void* out, int size, int type_enum, int pe, int tag, bool cond)
+{
+    throw runtime_error(__FUNCTION__ + string(": Is not implemented"));
+}
+
+static MPI_Request hpat_dist_isend(void* out, int size, int type_enum, int pe, int tag, bool cond)
+{
+    throw runtime_error(__FUNCTION__ + string(": Is not implemented"));
+}
+
+static void hpat_dist_recv(void* out, int size, int type_enum, int pe, int tag)
+{
+    throw runtime_error(__FUNCTION__ + string(": Is not implemented"));
+}
+
+static void hpat_dist_reduce(char* in_ptr, char* out_ptr, int op_enum, int type_enum)
+{
+    size_t value_bytes = get_type_size_bytes(type_enum);
+    if (op_enum == SDC_ReduceOps::ARGMIN || op_enum == SDC_ReduceOps::ARGMAX)
+    {
+        // index and value padded to 8 bytes
+        value_bytes = 2 * sizeof(int64_t);
+    }
+
+    // every process reduces the values in the same order to get equal results
+    memcpy(shm_scalar(shm_rank), in_ptr, value_bytes);
+    shm_barrier();
+    memcpy(out_ptr, shm_scalar(0), value_bytes);
+    for (int rank = 1; rank < shm_size; ++rank)
+    {
+        reduce_values(out_ptr, shm_scalar(rank), 1, op_enum, type_enum);
+    }
+    shm_barrier();
+}
+
+static void hpat_dist_send(void* out, int size, int type_enum, int pe, int tag)
+{
+    throw runtime_error(__FUNCTION__ + string(": Is not implemented"));
+}
+
+static int hpat_dist_wait(MPI_Request req, bool cond)
+{
+    throw runtime_error(__FUNCTION__ + string(": Is not implemented"));
+}
+
+static void hpat_dist_waitall(int size, MPI_Request* req_arr)
+{
+    throw runtime_error(__FUNCTION__ + string(": Is not implemented"));
+}
+
+static int hpat_finalize()
+{
+    return 0;
+}
+
+static double hpat_get_time()
+{
+    return hpat_dist_get_time();
+}
+
+static void nth_parallel(void* res, void* data, int64_t local_size, int64_t k, int type_enum)
+{
+    throw runtime_error(__FUNCTION__ + string(": Is not implemented"));
+}
+
+static void oneD_reshape_shuffle(char* output,
+                                 char* input,
+                                 int64_t new_0dim_global_len,
+                                 int64_t old_0dim_global_len,
+                                 int64_t out_lower_dims_size,
+                                 int64_t in_lower_dims_size)
+{
+    throw runtime_error(__FUNCTION__ + string(": Is not implemented"));
+}
+
+static void permutation_array_index(
+    unsigned char* lhs, int64_t len, int64_t elem_size, unsigned char* rhs, int64_t* p, int64_t p_len)
+{
+    throw runtime_error(__FUNCTION__ + string(": Is not implemented"));
+}
+
+static void permutation_int(int64_t* output, int n)
+{
+    throw runtime_error(__FUNCTION__ + string(": Is not implemented"));
+}
+
+static double quantile_parallel(void* data, int64_t local_size, int64_t total_size, double quantile, int type_enum)
+{
+    throw runtime_error(__FUNCTION__ + string(": Is not implemented"));
+
+    return -1.0;
+}
+
+PyMODINIT_FUNC PyInit_transport_shm(void)
+{
+    static struct PyModuleDef moduledef = {
+        PyModuleDef_HEAD_INIT,
+        "transport_shm",
+        "Transport functions for processes of one machine exchanging data through shared memory",
+        -1,
+        NULL,
+    };
+
+    if (!shm_attach())
+        return NULL;
+
+    PyObject* m = PyModule_Create(&moduledef);
+    if (m == NULL)
+        return NULL;
+
+    PyObject_SetAttrString(m, "allgather", PyLong_FromVoidPtr((void*)(&allgather)));
+    PyObject_SetAttrString(m, "c_alltoall", PyLong_FromVoidPtr((void*)(&c_alltoall)));
+    PyObject_SetAttrString(m, "c_alltoallv", PyLong_FromVoidPtr((void*)(&c_alltoallv)));
+    PyObject_SetAttrString(m, "c_bcast", PyLong_FromVoidPtr((void*)(&c_bcast)));
+    PyObject_SetAttrString(m, "c_gather_scalar", PyLong_FromVoidPtr((void*)(&c_gather_scalar)));
+    PyObject_SetAttrString(m, "c_gatherv", PyLong_FromVoidPtr((void*)(&c_gatherv)));
+    PyObject_SetAttrString(m, "comm_req_alloc", PyLong_FromVoidPtr((void*)(&comm_req_alloc)));
+    PyObject_SetAttrString(m, "comm_req_dealloc", PyLong_FromVoidPtr((void*)(&comm_req_dealloc)));
+    PyObject_SetAttrString(m, "file_read_parallel", PyLong_FromVoidPtr((void*)(&file_read_parallel)));
+    PyObject_SetAttrString(m, "file_write_parallel", PyLong_FromVoidPtr((void*)(&file_write_parallel)));
+    PyObject_SetAttrString(m, "get_file_size", PyLong_FromVoidPtr((void*)(&get_file_size)));
+    PyObject_SetAttrString(m, "get_join_sendrecv_counts", PyLong_FromVoidPtr((void*)(&get_join_sendrecv_counts)));
+    PyObject_SetAttrString(m, "hpat_barrier", PyLong_FromVoidPtr((void*)(&hpat_barrier)));
+    PyObject_SetAttrString(m, "hpat_dist_arr_reduce", PyLong_FromVoidPtr((void*)(&hpat_dist_arr_reduce)));
+    PyObject_SetAttrString(m, "hpat_dist_exscan_f4", PyLong_FromVoidPtr((void*)(&hpat_dist_exscan_f4)));
+    PyObject_SetAttrString(m, "hpat_dist_exscan_f8", PyLong_FromVoidPtr((void*)(&hpat_dist_exscan_f8)));
+    PyObject_SetAttrString(m, "hpat_dist_exscan_i4", PyLong_FromVoidPtr((void*)(&hpat_dist_exscan_i4)));
+    PyObject_SetAttrString(m, "hpat_dist_exscan_i8", PyLong_FromVoidPtr((void*)(&hpat_dist_exscan_i8)));
+    PyObject_SetAttrString(m, "hpat_dist_get_rank", PyLong_FromVoidPtr((void*)(&hpat_dist_get_rank)));
+    PyObject_SetAttrString(m, "hpat_dist_get_size", PyLong_FromVoidPtr((void*)(&hpat_dist_get_size)));
+    PyObject_SetAttrString(m, "hpat_dist_get_time", PyLong_FromVoidPtr((void*)(&hpat_dist_get_time)));
+    PyObject_SetAttrString(m, "hpat_dist_irecv", PyLong_FromVoidPtr((void*)(&hpat_dist_irecv)));
+    PyObject_SetAttrString(m, "hpat_dist_isend", PyLong_FromVoidPtr((void*)(&hpat_dist_isend)));
+    PyObject_SetAttrString(m, "hpat_dist_recv", PyLong_FromVoidPtr((void*)(&hpat_dist_recv)));
+    PyObject_SetAttrString(m, "hpat_dist_reduce", PyLong_FromVoidPtr((void*)(&hpat_dist_reduce)));
+    PyObject_SetAttrString(m, "hpat_dist_send", PyLong_FromVoidPtr((void*)(&hpat_dist_send)));
+    PyObject_SetAttrString(m, "hpat_dist_wait", PyLong_FromVoidPtr((void*)(&hpat_dist_wait)));
+    PyObject_SetAttrString(m, "hpat_dist_waitall", PyLong_FromVoidPtr((void*)(&hpat_dist_waitall)));
+    PyObject_SetAttrString(m, "hpat_finalize", PyLong_FromVoidPtr((void*)(&hpat_finalize)));
+    PyObject_SetAttrString(m, "hpat_get_time", PyLong_FromVoidPtr((void*)(&hpat_get_time)));
+    PyObject_SetAttrString(m, "hpat_mpi_csv_get_offsets", PyLong_FromVoidPtr((void*)(&hpat_mpi_csv_get_offsets)));
+    PyObject_SetAttrString(m, "mpi_req_num_bytes", PyLong_FromSize_t(get_mpi_req_num_bytes()));
+    PyObject_SetAttrString(m, "nth_parallel", PyLong_FromVoidPtr((void*)(&nth_parallel)));
+    PyObject_SetAttrString(m, "nth_sequential", PyLong_FromVoidPtr((void*)(&nth_sequential)));
+    PyObject_SetAttrString(m, "oneD_reshape_shuffle", PyLong_FromVoidPtr((void*)(&oneD_reshape_shuffle)));
+    PyObject_SetAttrString(m, "permutation_array_index", PyLong_FromVoidPtr((void*)(&permutation_array_index)));
+    PyObject_SetAttrString(m, "permutation_int", PyLong_FromVoidPtr((void*)(&permutation_int)));
+    PyObject_SetAttrString(m, "quantile_parallel", PyLong_FromVoidPtr((void*)(&quantile_parallel)));
+    PyObject_SetAttrString(m, "req_array_setitem", PyLong_FromVoidPtr((void*)(&req_array_setitem)));
+    PyObject_SetAttrString(m, "shm_world_create", PyLong_FromVoidPtr((void*)(&shm_world_create)));
+    PyObject_SetAttrString(m, "shm_world_destroy", PyLong_FromVoidPtr((void*)(&shm_world_destroy)));
+
+    return m;
+}
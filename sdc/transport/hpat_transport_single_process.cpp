@@ -25,78 +25,8 @@
 //*****************************************************************************
 
 #include <Python.h>
-#include <algorithm>
-#include <fstream>
-#include <iostream>
-#include <stdexcept>
-#include <vector>
 
-#ifdef _WIN32 // MSC_VER
-#include <Windows.h>
-
-// no gettimeofday on Win32/Win64
-int gettimeofday(struct timeval* tp, void* tzp)
-{
-    static const uint64_t EPOCH = ((uint64_t)116444736000000000ULL);
-
-    SYSTEMTIME nSystemTime;
-    FILETIME nFileTime;
-    uint64_t nTime;
-
-    GetSystemTime(&nSystemTime);
-    SystemTimeToFileTime(&nSystemTime, &nFileTime);
-    nTime = ((uint64_t)nFileTime.dwLowDateTime);
-    nTime += ((uint64_t)nFileTime.dwHighDateTime) << 32;
-
-    tp->tv_sec = (long)((nTime - EPOCH) / 10000000L);
-    tp->tv_usec = (long)(nSystemTime.wMilliseconds * 1000);
-    return 0;
-}
-#else
-#include <sys/time.h>
-#endif // _WIN32
-
-#include "../_hpat_common.h"
-
-using namespace std;
-
-typedef int MPI_Request;
-#define MPI_REQUEST_NULL ((MPI_Request)0x2c000000)
-
-static size_t get_type_size_bytes(int typ_enum)
-{
-    switch (typ_enum)
-    {
-    case SDC_CTypes::INT8:
-    case SDC_CTypes::UINT8:
-    {
-        return 1;
-    }
-    case SDC_CTypes::INT16:
-    case SDC_CTypes::UINT16:
-    {
-        return 2;
-    }
-    case SDC_CTypes::INT32:
-    case SDC_CTypes::UINT32:
-    case SDC_CTypes::FLOAT32:
-    {
-        return 4;
-    }
-    case SDC_CTypes::INT64:
-    case SDC_CTypes::UINT64:
-    case SDC_CTypes::FLOAT64:
-    {
-        return 8;
-    }
-    default:
-    {
-        throw out_of_range("Invalid data type in transport_seq::get_type_size_bytes()");
-    }
-    }
-
-    return 0;
-}
+#include "hpat_transport_common.h"
 
 static void allgather(void* out_data, int size, void* in_data, int type_enum)
 {
@@ -135,58 +65,11 @@ static void c_gatherv(void* send_data, int sendcount, void* recv_data, int* recv
     memcpy((char*)recv_data + displs[0], send_data, type_size_bytes * min(sendcount, recv_counts[0]));
 }
 
-static MPI_Request* comm_req_alloc(int size)
-{
-    return new MPI_Request[size];
-}
-
-static void comm_req_dealloc(MPI_Request* req_arr)
-{
-    delete[] req_arr;
-}
-
 static void file_read_parallel(char* file_name, char* buff, int64_t start, int64_t count)
 {
     throw runtime_error(__FUNCTION__ + string(": Is not implemented"));
 }
 
-static void file_write_parallel(char* file_name, char* buff, int64_t start, int64_t count, int64_t elem_size)
-{
-    ofstream user_file(file_name, ios::binary | ios::out);
-    if (!user_file.good())
-    {
-        throw runtime_error(__FUNCTION__ + string(": Could not open file: ") + file_name);
-    }
-
-    user_file.seekp(start * elem_size);
-    user_file.write(buff, count * elem_size);
-
-    user_file.close();
-}
-
-static uint64_t get_file_size(const char* file_name)
-{
-    ifstream user_file(file_name, ifstream::binary);
-    if (!user_file.good())
-    {
-        throw runtime_error(__FUNCTION__ + string(": Could not open file: ") + file_name);
-    }
-
-    user_file.seekg(0, ios::beg);
-    const iostream::pos_type begin = user_file.tellg();
-    user_file.seekg(0, ios::end);
-    const iostream::pos_type end = user_file.tellg();
-
-    user_file.close();
-
-    if ((begin < 0) || (end < 0))
-    {
-        throw runtime_error(__FUNCTION__ + string(": Could not read from file: ") + file_name);
-    }
-
-    return end - begin;
-}
-
 static int64_t get_join_sendrecv_counts(int** p_send_counts,
                                         int** p_recv_counts,
                                         int** p_send_disp,
@@ -238,16 +121,6 @@ static int hpat_dist_get_size()
     return 1;
 }
 
-static double hpat_dist_get_time()
-{
-    timeval result;
-    gettimeofday(&result, nullptr);
-    double sec = result.tv_sec;
-    double usec = result.tv_usec;
-
-    return sec + (usec / 1E6);
-}
-
 static MPI_Request hpat_dist_irecv(void* out, int size, int type_enum, int pe, int tag, bool cond)
 {
     throw runtime_error(__FUNCTION__ + string(": Is not implemented"));
@@ -294,125 +167,11 @@ static double hpat_get_time()
     return hpat_dist_get_time();
 }
 
-/// return vector of offsets of newlines in first n bytes of given stream
-static vector<size_t> count_lines(istream* f, size_t n)
-{
-    vector<size_t> pos;
-    char c;
-    size_t i = 0;
-
-    while (i < n && f->get(c))
-    {
-        if (c == '\n')
-        {
-            pos.push_back(i);
-        }
-        ++i;
-    }
-
-    if (i < n)
-    {
-        cerr << "Warning, read only " << i << " bytes out of " << n << "requested\n";
-    }
-
-    return pos;
-}
-
-static void hpat_mpi_csv_get_offsets(
-    istream* f, size_t fsz, bool is_parallel, int64_t skiprows, int64_t nrows, size_t& my_off_start, size_t& my_off_end)
-{
-    if (skiprows > 0 || nrows != -1)
-    {
-        vector<size_t> line_offset = count_lines(f, fsz);
-
-        if (skiprows > 0)
-        {
-            my_off_start = line_offset[skiprows - 1] + 1;
-        }
-
-        if (nrows != -1)
-        {
-            my_off_end = line_offset[nrows - 1] + 1;
-        }
-    }
-
-    return;
-}
-
-static size_t get_mpi_req_num_bytes()
-{
-    return sizeof(MPI_Request);
-}
-
 static void nth_parallel(void* res, void* data, int64_t local_size, int64_t k, int type_enum)
 {
     throw runtime_error(__FUNCTION__ + string(": Should not be called"));
 }
 
-template <typename T>
-void get_nth(void* result_out, void* data_in, int64_t size, int64_t k)
-{
-    T* result = reinterpret_cast<T*>(result_out);
-    const T* data = reinterpret_cast<T*>(data_in);
-
-    vector<T> my_array(data, data + size);
-
-    nth_element(my_array.begin(), my_array.begin() + k, my_array.end());
-
-    *result = my_array.at(k);
-}
-
-static void nth_sequential(void* res, void* data, int64_t local_size, int64_t k, int type_enum)
-{
-    switch (type_enum)
-    {
-    case SDC_CTypes::INT8:
-    {
-        get_nth<char>(res, data, local_size, k);
-        break;
-    }
-    case SDC_CTypes::UINT8:
-    {
-        get_nth<unsigned char>(res, data, local_size, k);
-        break;
-    }
-    case SDC_CTypes::INT32:
-    {
-        get_nth<int>(res, data, local_size, k);
-        break;
-    }
-    case SDC_CTypes::UINT32:
-    {
-        get_nth<uint32_t>(res, data, local_size, k);
-        break;
-    }
-    case SDC_CTypes::INT64:
-    {
-        get_nth<int64_t>(res, data, local_size, k);
-        break;
-    }
-    case SDC_CTypes::UINT64:
-    {
-        get_nth<uint64_t>(res, data, local_size, k);
-        break;
-    }
-    case SDC_CTypes::FLOAT32:
-    {
-        get_nth<float>(res, data, local_size, k);
-        break;
-    }
-    case SDC_CTypes::FLOAT64:
-    {
-        get_nth<double>(res, data, local_size, k);
-        break;
-    }
-    default:
-    {
-        throw out_of_range("Invalid data type in transport_seq::nth_sequential()");
-    }
-    }
-}
-
 static void oneD_reshape_shuffle(char* output,
                                  char* input,
                                  int64_t new_0dim_global_len,
@@ -441,12 +200,6 @@ static double quantile_parallel(void* data, int64_t local_size, int64_t total_si
     return -1.0;
 }
 
-static void req_array_setitem(MPI_Request* req_arr, int64_t ind, MPI_Request req)
-{
-    req_arr[ind] = req;
-    return;
-}
-
 PyMODINIT_FUNC PyInit_transport_seq(void)
 {
     static struct PyModuleDef moduledef = {
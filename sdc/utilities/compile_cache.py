@@ -0,0 +1,301 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+
+| Persistent on-disk cache for compiled SDC overloads.
+| Enabled with SDC_COMPILE_CACHE=1, location and size are controlled with
+| SDC_COMPILE_CACHE_DIR and SDC_COMPILE_CACHE_SIZE (see :mod:`sdc.config`).
+
+| Implementations of SDC overloads are compiled by dispatchers of a separate target that
+| stores compile results with Numba caching machinery under a directory specific to SDC version
+| and configuration flags, so that changing any of them invalidates cached entries.
+| Implementations generated from source text are written to files named by a hash of this
+| text and of values the text refers to, which makes them cacheable like regular functions.
+
+"""
+
+import hashlib
+import os
+import shutil
+import types as pytypes
+import weakref
+
+import numba
+import numpy
+
+from numba.core import types
+from numba.core.caching import (CompileResultCacheImpl, FunctionCache, _CacheLocator,
+                                _SourceFileBackedLocatorMixin)
+from numba.core.dispatcher import Dispatcher
+from numba.core.registry import CPUDispatcher, dispatcher_registry
+from numba.core.serialize import dumps
+
+from sdc import config
+
+
+dispatcher_target = 'sdc_cached_cpu'
+'''
+Name of the target which dispatchers cache compiled functions on disk
+'''
+
+_sdc_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_cache_tag = None
+_generated_sources = weakref.WeakKeyDictionary()
+
+
+def get_cache_tag():
+    """Returns name of the cache subdirectory specific to SDC version and configuration flags"""
+    global _cache_tag
+    if _cache_tag is None:
+        from sdc._version import get_versions
+
+        version = get_versions()['version']
+        flags = (config.config_use_parallel_overloads,
+                 config.config_inline_overloads,
+                 config.config_transport_mpi,
+                 config.config_transport_shm,
+                 config.config_trace_overloads,
+                 numba.config.NUMBA_NUM_THREADS,
+                 numba.__version__)
+        flags_hash = hashlib.sha1(repr(flags).encode()).hexdigest()[:12]
+        _cache_tag = '{}-{}'.format(version.replace('+', '_'), flags_hash)
+
+    return _cache_tag
+
+
+def get_cache_path():
+    """Returns directory where compile results for current SDC version and configuration are stored"""
+    return os.path.join(config.config_compile_cache_dir, get_cache_tag())
+
+
+def get_sources_path():
+    return os.path.join(get_cache_path(), 'sources')
+
+
+def _is_within(path, directory):
+    path, directory = os.path.abspath(path), os.path.abspath(directory)
+    return os.path.commonpath([path, directory]) == directory
+
+
+class _SdcCacheLocator(_SourceFileBackedLocatorMixin, _CacheLocator):
+    """
+    A locator for SDC functions and functions generated by exec_func_text,
+    places cache files under the directory returned by get_cache_path
+    """
+
+    def __init__(self, py_func, py_file):
+        self._py_file = py_file
+        self._lineno = py_func.__code__.co_firstlineno
+        if _is_within(py_file, _sdc_root):
+            cache_subpath = os.path.relpath(os.path.dirname(os.path.abspath(py_file)), _sdc_root)
+        else:
+            cache_subpath = 'sources'
+        self._cache_path = os.path.join(get_cache_path(), 'index', cache_subpath)
+
+    def get_cache_path(self):
+        return self._cache_path
+
+    @classmethod
+    def from_function(cls, py_func, py_file):
+        if not (_is_within(py_file, _sdc_root) or _is_within(py_file, get_sources_path())):
+            return None
+
+        return super(_SdcCacheLocator, cls).from_function(py_func, py_file)
+
+
+class _SdcCacheImpl(CompileResultCacheImpl):
+    _locator_classes = [_SdcCacheLocator]
+
+
+class _SdcFunctionCache(FunctionCache):
+    """
+    Function cache which is disabled instead of failing for functions
+    with closure variables that cannot be serialized into the index key
+    """
+    _impl_class = _SdcCacheImpl
+
+    def __init__(self, py_func):
+        super().__init__(py_func)
+        if py_func.__closure__ is not None:
+            try:
+                dumps(tuple(x.cell_contents for x in py_func.__closure__))
+            except Exception:
+                self.disable()
+
+
+class SdcCachingDispatcher(CPUDispatcher):
+    """
+    CPU dispatcher that caches compile results on disk when the function is
+    defined in SDC sources or was generated with exec_func_text and does nothing otherwise
+    """
+
+    def enable_caching(self):
+        try:
+            self._cache = _SdcFunctionCache(self.py_func)
+        except RuntimeError:
+            # no locator is available, e.g. function was generated with plain exec
+            pass
+
+
+dispatcher_registry[dispatcher_target] = SdcCachingDispatcher
+
+
+def _value_cache_key(value):
+    """
+    Returns text identifying value referred by generated source across processes
+    or None if value cannot be identified so and generated function must not be cached
+    """
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return repr(value)
+    if isinstance(value, tuple):
+        keys = [_value_cache_key(v) for v in value]
+        return None if None in keys else '({})'.format(', '.join(keys))
+    if isinstance(value, pytypes.ModuleType):
+        return 'module:{}'.format(value.__name__)
+    if isinstance(value, (types.Type, numpy.dtype)):
+        return '{}:{}'.format(type(value).__name__, value)
+    if isinstance(value, Dispatcher):
+        value = value.py_func
+    if isinstance(value, (pytypes.FunctionType, pytypes.BuiltinFunctionType, type)):
+        module, qualname = getattr(value, '__module__', None), getattr(value, '__qualname__', '')
+        if module is None or '<locals>' in qualname:
+            return None
+        return '{}.{}'.format(module, qualname)
+
+    return None
+
+
+def get_func_text_key(func_text, global_vars):
+    """Returns hash identifying function generated from func_text or None if it is not cacheable"""
+
+    global_keys = []
+    for name in sorted(global_vars):
+        if name.startswith('__'):
+            continue
+        value_key = _value_cache_key(global_vars[name])
+        if value_key is None:
+            return None
+        global_keys.append('{}={}'.format(name, value_key))
+
+    key_text = '\n'.join([func_text] + global_keys)
+    return hashlib.sha256(key_text.encode()).hexdigest()
+
+
+def _write_source(file_path, func_text):
+    if os.path.exists(file_path):
+        # keep the file untouched since its timestamp identifies cache entries
+        return
+
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    tmp_path = '{}.{}.tmp'.format(file_path, os.getpid())
+    with open(tmp_path, 'w') as f:
+        f.write(func_text)
+    os.replace(tmp_path, file_path)
+
+
+def exec_func_text(func_text, global_vars, func_name):
+    """
+    Executes func_text with global_vars as globals and returns the function named func_name
+    defined in it. With compilation cache enabled the source is first written to a file named by
+    a hash of func_text and global_vars, so that compile results of the function can be cached
+    """
+
+    file_name = '<string>'
+    if config.config_compile_cache:
+        key = get_func_text_key(func_text, global_vars)
+        if key is not None:
+            file_path = os.path.join(get_sources_path(), 'sdc_generated_{}.py'.format(key))
+            try:
+                _write_source(file_path, func_text)
+            except OSError:
+                pass
+            else:
+                file_name = file_path
+
+    loc_vars = {}
+    exec(compile(func_text, file_name, 'exec'), global_vars, loc_vars)
+    func = loc_vars[func_name]
+    _generated_sources[func] = func_text
+
+    return func
+
+
+def get_generated_source(func):
+    """Returns source text of the function created by exec_func_text or None for other functions"""
+    return _generated_sources.get(func)
+
+
+def _cache_files():
+    files = []
+    for root, _, file_names in os.walk(config.config_compile_cache_dir):
+        for file_name in file_names:
+            file_path = os.path.join(root, file_name)
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            files.append((file_path, st))
+
+    return files
+
+
+def evict(max_size=None):
+    """
+    Removes least recently used files from the compilation cache until its size is below max_size,
+    files of other SDC versions and configurations are removed first
+    """
+
+    max_size = config.config_compile_cache_size if max_size is None else max_size
+    files = _cache_files()
+    total_size = sum(st.st_size for _, st in files)
+    if total_size <= max_size:
+        return
+
+    current_path = get_cache_path()
+
+    def eviction_order(item):
+        file_path, st = item
+        return _is_within(file_path, current_path), max(st.st_atime, st.st_mtime)
+
+    for file_path, st in sorted(files, key=eviction_order):
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(file_path)
+        except OSError:
+            continue
+        total_size -= st.st_size
+
+
+def clear():
+    """Removes all entries of the compilation cache"""
+    shutil.rmtree(config.config_compile_cache_dir, ignore_errors=True)
+
+
+if config.config_compile_cache:
+    evict()
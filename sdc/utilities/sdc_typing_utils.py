@@ -42,6 +42,7 @@ from sdc.str_arr_type import string_array_type
 from sdc.datatypes.range_index_type import RangeIndexType
 from sdc.datatypes.int64_index_type import Int64IndexType
 from sdc.str_arr_ext import StringArrayType
+from sdc.utilities.compile_cache import exec_func_text
 
 
 sdc_pandas_index_types = (
@@ -193,6 +194,34 @@ def find_common_dtype_from_numpy_dtypes(array_types, scalar_types):
     return numba_common_dtype
 
 
+def find_arithmetic_result_dtype(op_name, array_types, scalar_types, nans_possible=False):
+    """Used to find numba dtype of the result of arithmetic operation on arrays and scalars of given numba dtypes.
+    Integer result is kept only for operations closed on integers and when no NaNs can be introduced,
+    otherwise result is promoted to float dtype of the smallest size that can hold operands values.
+    As in numpy, values of literal scalars only need to fit into the result dtype and float scalars
+    do not upcast float arrays, e.g. float32 array and float64 scalar give float32. Integer scalars with values
+    unknown at compile time are promoted with their types, e.g. int32 array and int64 scalar give int64"""
+    np_dtypes = [numpy_support.as_dtype(dtype) for dtype in array_types]
+    has_float_arrays = any(isinstance(dtype, types.Float) for dtype in array_types)
+    literal_values = []
+    for ty in scalar_types:
+        if isinstance(ty, types.Literal) and isinstance(ty.literal_value, (bool, int)):
+            literal_values.append(ty.literal_value)
+        elif isinstance(ty, types.Float) and has_float_arrays:
+            continue
+        else:
+            np_dtypes.append(numpy_support.as_dtype(types.unliteral(ty)))
+
+    np_common_dtype = numpy.result_type(*np_dtypes, *literal_values)
+    common_dtype = numpy_support.from_dtype(np_common_dtype)
+    if (isinstance(common_dtype, types.Float)
+            or (isinstance(common_dtype, types.Integer)
+                and op_name in ('add', 'sub', 'mul') and not nans_possible)):
+        return common_dtype
+
+    return numpy_support.from_dtype(numpy.promote_types(np_common_dtype, numpy.float64))
+
+
 def find_index_common_dtype(self, other):
     """Used to find common dtype for indexes of two series and verify if index dtypes are equal"""
 
@@ -213,9 +242,7 @@ def gen_impl_generator(codegen, impl_name):
     def _df_impl_generator(*args, **kwargs):
         func_text, global_vars = codegen(*args, **kwargs)
 
-        loc_vars = {}
-        exec(func_text, global_vars, loc_vars)
-        _impl = loc_vars[impl_name]
+        _impl = exec_func_text(func_text, global_vars, impl_name)
 
         return _impl
 
@@ -0,0 +1,208 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+
+| Runtime tracing of SDC overload methods.
+| Enabled with SDC_TRACE_OVERLOADS=1 (see :mod:`sdc.config`), in this mode implementation of each
+| overload method is called from a wrapper that measures time spent in it and number and size of
+| NRT allocations made meanwhile. Results are accumulated on the native side per method.
+
+| Times are inclusive, i.e. time of a method includes time of other traced methods it calls.
+| Allocation counters are process wide, so allocations made concurrently by other threads
+| are attributed to the method running at the same time.
+
+| Stages of the distributed sort (see :mod:`sdc.hiframes.sort`) are always recorded the same way
+| under ``dist_sort.*`` names, without allocation counters.
+
+"""
+
+import atexit
+import ctypes as ct
+import inspect
+import sys
+
+import llvmlite.binding as ll
+import numba
+
+from numba.core.registry import cpu_target
+from numba.core.runtime import _nrt_python, rtsys
+
+from sdc import config, htrace_ext
+from sdc.utilities.compile_cache import exec_func_text
+
+
+def bind(sym, sig):
+    # Returns ctypes binding to symbol sym with signature sig
+    addr = getattr(htrace_ext, sym)
+    return ct.cast(addr, sig)
+
+
+trace_now = bind('trace_now', ct.CFUNCTYPE(ct.c_uint64))
+trace_alloc_count = bind('trace_alloc_count', ct.CFUNCTYPE(ct.c_uint64))
+trace_alloc_bytes = bind('trace_alloc_bytes', ct.CFUNCTYPE(ct.c_uint64))
+trace_record = bind('trace_record',
+                    ct.CFUNCTYPE(None, ct.c_uint64, ct.c_uint64, ct.c_uint64, ct.c_uint64))
+
+_trace_get_stats = bind('trace_get_stats', ct.CFUNCTYPE(ct.c_bool, ct.c_uint64, ct.POINTER(ct.c_uint64)))
+_trace_reset = bind('trace_reset', ct.CFUNCTYPE(None))
+_trace_set_nrt_allocators = bind('trace_set_nrt_allocators',
+                                 ct.CFUNCTYPE(None, *[ct.c_void_p] * 5))
+
+# NRT allocation functions called from compiled code that are replaced with counting ones
+_nrt_allocators = ['MemInfo_alloc_safe', 'MemInfo_alloc_safe_aligned', 'MemInfo_alloc_dtor_safe',
+                   'MemInfo_new_varsize', 'MemInfo_new_varsize_dtor']
+
+_method_ids = {}
+_allocators_installed = False
+
+
+def _install_allocation_counters():
+    """
+    Makes code compiled from now on call counting wrappers of NRT allocation functions,
+    code that was already compiled keeps calling the original ones
+    """
+    global _allocators_installed
+    if _allocators_installed:
+        return
+
+    # NRT registers its symbols on initialization, they must not override the wrappers afterwards
+    rtsys.initialize(cpu_target.target_context)
+    _trace_set_nrt_allocators(*[_nrt_python.c_helpers[name] for name in _nrt_allocators])
+    for name in _nrt_allocators:
+        ll.add_symbol('NRT_' + name, getattr(htrace_ext, 'trace_' + name))
+
+    _allocators_installed = True
+
+
+def get_method_id(method_name):
+    """Returns id under which calls of the method are recorded"""
+    return _method_ids.setdefault(method_name, len(_method_ids))
+
+
+def _gen_traced_impl(impl, method_id, jit_options):
+    """Generates function with the same signature as impl that calls compiled impl and records its stats"""
+
+    params, call_args = [], []
+    global_vars = {'_impl': numba.njit(**jit_options)(impl),
+                   '_trace_now': trace_now,
+                   '_trace_alloc_count': trace_alloc_count,
+                   '_trace_alloc_bytes': trace_alloc_bytes,
+                   '_trace_record': trace_record}
+    for name, param in inspect.signature(impl).parameters.items():
+        if param.kind == param.VAR_POSITIONAL:
+            params.append(f'*{name}')
+            call_args.append(f'*{name}')
+        elif param.default is not param.empty:
+            global_vars[f'_default_{name}'] = param.default
+            params.append(f'{name}=_default_{name}')
+            call_args.append(name)
+        else:
+            params.append(name)
+            call_args.append(name)
+
+    func_text = '\n'.join([
+        f"def _traced_impl({', '.join(params)}):",
+        f"  _start_allocs = _trace_alloc_count()",
+        f"  _start_bytes = _trace_alloc_bytes()",
+        f"  _start = _trace_now()",
+        f"  _res = _impl({', '.join(call_args)})",
+        f"  _trace_record({method_id}, _trace_now() - _start,",
+        f"                _trace_alloc_count() - _start_allocs, _trace_alloc_bytes() - _start_bytes)",
+        f"  return _res",
+    ])
+
+    return exec_func_text(func_text, global_vars, '_traced_impl')
+
+
+def trace_overload(ovld, method_name, jit_options):
+    """Returns overload function which implementations record time and allocations of each call"""
+
+    method_id = get_method_id(method_name)
+
+    def traced_ovld(*args, **kwargs):
+        _install_allocation_counters()
+        impl = ovld(*args, **kwargs)
+        if impl is None:
+            return impl
+
+        return _gen_traced_impl(impl, method_id, jit_options)
+
+    # keeps signature of ovld visible to numba signatures validation
+    traced_ovld.__wrapped__ = ovld
+    traced_ovld.__name__ = ovld.__name__
+    traced_ovld.__qualname__ = ovld.__qualname__
+    traced_ovld.__module__ = ovld.__module__
+
+    return traced_ovld
+
+
+def get_trace_summary():
+    """
+    Returns list of dicts with number of calls, total time in seconds, number of allocations and
+    allocated bytes recorded for each called overload method, sorted by total time
+    """
+
+    summary = []
+    out = (ct.c_uint64 * 4)()
+    for method_name, method_id in _method_ids.items():
+        if not _trace_get_stats(method_id, out):
+            continue
+        calls, time_ns, allocs, alloc_bytes = out
+        summary.append({
+            'method': method_name,
+            'calls': calls,
+            'time': time_ns / 1e9,
+            'allocations': allocs,
+            'allocated_bytes': alloc_bytes,
+        })
+
+    return sorted(summary, key=lambda s: s['time'], reverse=True)
+
+
+def print_trace_summary(file=None):
+    file = sys.stdout if file is None else file
+    print(f"{'Method':50s}{'Calls':>10s}{'Time, s':>15s}{'Per call, s':>15s}{'Allocs':>10s}{'Bytes':>15s}",
+          file=file)
+    for s in get_trace_summary():
+        print(f"{s['method']:50s}{s['calls']:>10d}{s['time']:>15.6f}{s['time'] / s['calls']:>15.6f}"
+              f"{s['allocations']:>10d}{s['allocated_bytes']:>15d}", file=file)
+
+
+def reset_trace():
+    """Clears all recorded stats"""
+    _trace_reset()
+
+
+def _print_trace_at_exit():
+    if get_trace_summary():
+        print('*' * 40, 'OVERLOADS TRACE', '*' * 40)
+        print_trace_summary()
+        print('*' * 97)
+
+
+if config.config_trace_overloads:
+    atexit.register(_print_trace_at_exit)
@@ -45,13 +45,17 @@ import numpy as np
 import sdc
 from sdc.str_ext import string_type, list_string_array_type
 from sdc.str_arr_ext import string_array_type, num_total_chars, pre_alloc_string_array
-from sdc.config import (config_use_parallel_overloads, config_inline_overloads)
+from sdc.config import (config_use_parallel_overloads, config_inline_overloads, config_compile_cache,
+                        config_trace_overloads)
+from sdc.utilities import compile_cache, trace
 from enum import Enum
 import types as pytypes
 from numba.extending import overload, overload_method, overload_attribute
 from numba.extending import register_jitable, register_model
 from numba.core.datamodel.registry import register_default
 from functools import wraps
+import inspect
+import json
 from itertools import filterfalse, chain
 
 
@@ -623,6 +627,9 @@ def update_jit_options(jit_options, parallel, config_flag):
         jit_options = jit_options.copy()
         jit_options.update({'parallel': config_use_parallel_overloads})
 
+    if config_compile_cache and '_target' not in jit_options:
+        jit_options.update({'_target': compile_cache.dispatcher_target, 'cache': True})
+
     return jit_options
 
 
@@ -658,6 +665,8 @@ def sdc_register_jitable(*args, **kwargs):
     updated_kwargs = kwargs.copy()
     updated_kwargs['parallel'] = updated_kwargs.get('parallel', config_use_parallel_overloads)
     updated_kwargs['inline'] = updated_kwargs.get('inline', 'always' if config_inline_overloads else 'never')
+    if config_compile_cache and '_target' not in updated_kwargs:
+        updated_kwargs.update({'_target': compile_cache.dispatcher_target, 'cache': True})
 
     def wrap(fn):
         return patched_register_jitable(**updated_kwargs)(fn)
@@ -674,10 +683,20 @@ def sdc_overload_method(typ, name, jit_options={}, parallel=None, strict=True, i
     if inline is None:
         inline = 'always' if config_inline_overloads else 'never'
 
-    return overload_method(
+    decorate = overload_method(
         typ, name, jit_options=jit_options, strict=strict, inline=inline, prefer_literal=prefer_literal
     )
 
+    if not config_trace_overloads:
+        return decorate
+
+    def traced_decorate(overload_func):
+        method_name = f'{getattr(typ, "__name__", typ)}.{name}'
+        decorate(trace.trace_overload(overload_func, method_name, jit_options))
+        return overload_func
+
+    return traced_decorate
+
 
 def sdc_overload_attribute(typ, name, jit_options={}, parallel=None, strict=True, inline=None, prefer_literal=True):
     jit_options = update_jit_options(jit_options, parallel, config_use_parallel_overloads)
@@ -690,26 +709,8 @@ def sdc_overload_attribute(typ, name, jit_options={}, parallel=None, strict=True
     )
 
 
-def print_compile_times(disp, level, func_names=None):
-
-    def print_times(cres, args):
-        print(f'Function: {cres.fndesc.unique_name}')
-        pad = '  ' * 2
-        if level:
-            print(f'{pad * 1}Args: {args}')
-        times = cres.metadata['pipeline_times']
-        for pipeline, pass_times in times.items():
-            print(f'{pad * 1}Pipeline: {pipeline}')
-            if level:
-                for name, timings in pass_times.items():
-                    print(f'{pad * 2}{name:50s}{timings.run:.13f}')
-
-            pipeline_total = sum(t.init + t.run + t.finalize for t in pass_times.values())
-            print(f'{pad * 1}Time: {pipeline_total}\n')
-
-    # print times for compiled function indicated by disp
-    for args, cres in disp.overloads.items():
-        print_times(cres, args)
+def _get_compiled_templates(disp, func_names=None):
+    """Returns overload templates which implementations were compiled by disp typing context"""
 
     def has_no_cache(ovld):
         return not (getattr(ovld, '_impl_cache', False) and ovld._impl_cache)
@@ -725,8 +726,14 @@ def print_compile_times(disp, level, func_names=None):
                                 compiled_templs
                             )
 
+    return compiled_templs
+
+
+def _iter_compiled_overloads(disp, func_names=None):
+    """Yields tuples of (dispatcher, args, compile result) for overload implementations compiled along with disp"""
+
     dispatchers_list = []
-    for template in compiled_templs:
+    for template in _get_compiled_templates(disp, func_names=func_names):
         tmpl_cached_impls = template._impl_cache.values()
         dispatchers_list.extend(tmpl_cached_impls)
 
@@ -743,4 +750,105 @@ def print_compile_times(disp, level, func_names=None):
             continue
 
         cres, = list(fndisp.overloads.values())
+        yield fndisp, args, cres
+
+
+def print_compile_times(disp, level, func_names=None):
+
+    def print_times(cres, args):
+        print(f'Function: {cres.fndesc.unique_name}')
+        pad = '  ' * 2
+        if level:
+            print(f'{pad * 1}Args: {args}')
+        times = cres.metadata['pipeline_times']
+        for pipeline, pass_times in times.items():
+            print(f'{pad * 1}Pipeline: {pipeline}')
+            if level:
+                for name, timings in pass_times.items():
+                    print(f'{pad * 2}{name:50s}{timings.run:.13f}')
+
+            pipeline_total = sum(t.init + t.run + t.finalize for t in pass_times.values())
+            print(f'{pad * 1}Time: {pipeline_total}\n')
+
+    # print times for compiled function indicated by disp
+    for args, cres in disp.overloads.items():
+        print_times(cres, args)
+
+    for fndisp, args, cres in _iter_compiled_overloads(disp, func_names=func_names):
         print_times(cres, args)
+
+
+def _get_source_size(py_func):
+    source = compile_cache.get_generated_source(py_func)
+    if source is None:
+        try:
+            source = inspect.getsource(py_func)
+        except (OSError, TypeError):
+            return None
+
+    return len(source)
+
+
+def get_compile_stats(disp, func_names=None):
+    """
+    Collects compile statistics of the function compiled by Numba dispatcher disp and of all
+    overload implementations compiled along with it.
+
+    Returns a dict with the following items:
+        functions: list of dicts, one per compiled function, with its name, args, size of its
+            source text in characters, time of each pass of each pipeline and total time in seconds
+        inlined_overloads: dict mapping names of overloads inlined into compiled functions
+            to the number of signatures they were inlined for
+    """
+
+    def function_stats(fndisp, args, cres):
+        pipelines = {}
+        for pipeline, pass_times in cres.metadata['pipeline_times'].items():
+            pipelines[pipeline] = {name: t.init + t.run + t.finalize for name, t in pass_times.items()}
+
+        return {
+            'function': cres.fndesc.qualname,
+            'unique_name': cres.fndesc.unique_name,
+            'args': str(args),
+            'source_size': _get_source_size(fndisp.py_func),
+            'pipelines': pipelines,
+            'total_time': sum(sum(times.values()) for times in pipelines.values()),
+        }
+
+    functions = [function_stats(disp, args, cres) for args, cres in disp.overloads.items()]
+    functions.extend(function_stats(*ovld) for ovld in _iter_compiled_overloads(disp, func_names=func_names))
+
+    inlined_overloads = {}
+    all_templs = chain.from_iterable(disp.typingctx._functions.values())
+    for template in all_templs:
+        inlined = getattr(template, '_inline_overloads', None)
+        if not inlined:
+            continue
+        ovld_func = getattr(template, '_overload_func', None)
+        name = ovld_func.__qualname__ if ovld_func is not None else str(template)
+        if func_names and not any(f in name for f in func_names):
+            continue
+        inlined_overloads[name] = inlined_overloads.get(name, 0) + len(inlined)
+
+    return {'functions': functions, 'inlined_overloads': inlined_overloads}
+
+
+def write_compile_stats(stats, file_name, output_format='json'):
+    """
+    Writes compile statistics returned by get_compile_stats to a file in one of formats:
+        json: stats as is
+        folded: collapsed stacks of form 'function;pipeline;pass microseconds' per line,
+            accepted by flame graph tools such as flamegraph.pl or speedscope
+    """
+
+    if output_format == 'json':
+        with open(file_name, 'w') as f:
+            json.dump(stats, f, indent=2)
+    elif output_format == 'folded':
+        with open(file_name, 'w') as f:
+            for func_stats in stats['functions']:
+                for pipeline, pass_times in func_stats['pipelines'].items():
+                    for name, pass_time in pass_times.items():
+                        f.write(f"{func_stats['unique_name']};{pipeline};{name} {int(pass_time * 1e6)}\n")
+    else:
+        raise ValueError(f'Unsupported output format: {output_format}, expected "json" or "folded"')
@@ -130,7 +130,18 @@ ext_io = Extension(name="sdc.hio",
 
 ext_transport_seq = Extension(name="sdc.transport_seq",
                               sources=["sdc/transport/hpat_transport_single_process.cpp"],
-                              depends=["sdc/_distributed.h"],
+                              depends=["sdc/_distributed.h", "sdc/transport/hpat_transport_common.h"],
+                              include_dirs=ind,
+                              library_dirs=lid,
+                              extra_compile_args=eca,
+                              extra_link_args=ela,
+                              language="c++"
+                              )
+
+ext_transport_shm = Extension(name="sdc.transport_shm",
+                              sources=["sdc/transport/hpat_transport_shm.cpp"],
+                              depends=["sdc/_distributed.h", "sdc/transport/hpat_transport_common.h"],
+                              libraries=['rt', 'pthread'],
                               include_dirs=ind,
                               library_dirs=lid,
                               extra_compile_args=eca,
@@ -156,8 +167,18 @@ ext_chiframes = Extension(name="sdc.chiframes",
                           library_dirs=lid,
                           )
 
+ext_trace = Extension(name="sdc.htrace_ext",
+                      sources=["sdc/_trace_ext.cpp"],
+                      extra_compile_args=eca,
+                      extra_link_args=ela,
+                      include_dirs=ind,
+                      library_dirs=lid,
+                      language="c++"
+                      )
+
 ext_set = Extension(name="sdc.hset_ext",
                     sources=["sdc/_set_ext.cpp"],
+                    depends=["sdc/_hpat_common.h"],
                     extra_compile_args=eca,
                     extra_link_args=ela,
                     include_dirs=ind,
@@ -190,6 +211,7 @@ numba_include_path = numba.extending.include_path()
 
 ext_str = Extension(name="sdc.hstr_ext",
                     sources=["sdc/_str_ext.cpp"],
+                    depends=["sdc/_hpat_common.h"],
                     libraries=str_libs,
                     define_macros=np_compile_args['define_macros'],
                     extra_compile_args=eca,
@@ -213,6 +235,7 @@ pq_libs = ['arrow', 'parquet']
 
 ext_parquet = Extension(name="sdc.parquet_cpp",
                         sources=["sdc/io/_parquet.cpp"],
+                        depends=["sdc/_hpat_common.h"],
                         libraries=pq_libs,
                         include_dirs=['.'] + ind,
                         define_macros=[('BUILTIN_PARQUET_READER', None)],
@@ -221,7 +244,12 @@ ext_parquet = Extension(name="sdc.parquet_cpp",
                         library_dirs=lid,
                         )
 
-_ext_mods = [ext_hdist, ext_chiframes, ext_set, ext_str, ext_dt, ext_io, ext_transport_seq, ext_sort]
+_ext_mods = [ext_hdist, ext_chiframes, ext_set, ext_str, ext_dt, ext_io, ext_transport_seq, ext_sort,
+             ext_trace]
+
+# shared memory transport relies on POSIX shared memory and process-shared barriers missing on MacOS
+if sys.platform.startswith('linux'):
+    _ext_mods.append(ext_transport_shm)
 
 # Support of Parquet is disabled because HPAT pipeline does not work now
 # if _has_pyarrow: